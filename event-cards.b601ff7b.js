@@ -0,0 +1,45 @@
+const CARD_PRESET = {
+"width": 400,
+"height": 300,
+"params": "c_fit,q_auto,f_auto,b_white",
+"widths": [
+300,
+400,
+600,
+800
+],
+"sizes": "(max-width: 700px) 90vw, (max-width: 1100px) 45vw, 400px",
+"eager": "cover"
+};
+function cardUrl(url, width) {
+const height = Math.round(width * CARD_PRESET.height / CARD_PRESET.width);
+return url.replace('/upload/', `/upload/w_${width},h_${height},${CARD_PRESET.params}/`);
+}
+function createCard() {
+const card = document.createElement('a');
+card.className = 'event-card';
+card.innerHTML = `
+<div class="card-image">
+<span class="date-badge"></span>
+<img sizes="${CARD_PRESET.sizes}" width="${CARD_PRESET.width}" height="${CARD_PRESET.height}" loading="lazy">
+</div>
+<div class="card-content">
+<h3></h3>
+<div class="event-meta">
+<div><i class="fas fa-calendar-alt"></i> <span class="photo-count"></span></div>
+</div>
+</div>`;
+return card;
+}
+function updateCard(card, row) {
+const [link, date, image, name, photos, color] = row;
+const img = card.querySelector('img');
+card.href = link;
+card.querySelector('.card-image').style.backgroundColor = color || '';
+card.querySelector('.date-badge').textContent = date;
+card.querySelector('h3').textContent = name;
+card.querySelector('.photo-count').textContent = `${photos} photos`;
+img.alt = name;
+img.srcset = CARD_PRESET.widths.map(width => `${cardUrl(image, width)} ${width}w`).join(', ');
+img.src = cardUrl(image, CARD_PRESET.width);
+}
\ No newline at end of file
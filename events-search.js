@@ -0,0 +1,101 @@
+const SEARCH_INDEX_URL = 'search-index.json';
+const SEARCH_RESULT_LIMIT = 60;
+function searchWords(text) {
+return text.normalize('NFKD').replace(/\p{M}/gu, '').toLowerCase().match(/[\p{L}\p{N}]+/gu) || [];
+}
+(function () {
+const search = document.getElementById('events-search');
+const input = document.getElementById('events-search-input');
+const status = document.getElementById('events-search-status');
+const results = document.getElementById('events-search-results');
+if (!search || !input || !status || !results) return;
+const archive = document.querySelectorAll('.events-grid:not(#events-search-results), .archive-pagination');
+let index = null;
+let loading = null;
+function loadIndex() {
+if (!loading) {
+loading = fetch(SEARCH_INDEX_URL)
+.then(response => {
+if (!response.ok) throw new Error(`HTTP ${response.status}`);
+return response.json();
+})
+.then(data => {
+data.postings = data.postings.map(deltas => {
+let number = 0;
+return deltas.map(delta => (number += delta));
+});
+index = data;
+})
+.catch(error => {
+loading = null;
+throw error;
+});
+}
+return loading;
+}
+function firstTerm(word) {
+let low = 0;
+let high = index.terms.length;
+while (low < high) {
+const middle = (low + high) >> 1;
+if (index.terms[middle] < word) low = middle + 1;
+else high = middle;
+}
+return low;
+}
+function eventsStartingWith(word) {
+const found = new Set();
+for (let i = firstTerm(word); i < index.terms.length && index.terms[i].startsWith(word); i++) {
+index.postings[i].forEach(number => found.add(number));
+}
+return found;
+}
+function find(words) {
+let matches = eventsStartingWith(words[0]);
+for (const word of words.slice(1)) {
+const found = eventsStartingWith(word);
+matches = new Set([...matches].filter(number => found.has(number)));
+}
+return [...matches].sort((a, b) => a - b);
+}
+function showArchive(visible) {
+archive.forEach(element => { element.hidden = !visible; });
+results.hidden = visible;
+if (visible) window.dispatchEvent(new Event('resize'));
+}
+function render() {
+const words = searchWords(input.value);
+if (!words.length) {
+status.textContent = '';
+results.replaceChildren();
+showArchive(true);
+return;
+}
+const matches = find(words);
+const shown = matches.slice(0, SEARCH_RESULT_LIMIT);
+results.replaceChildren(...shown.map(number => {
+const card = createCard();
+updateCard(card, index.events[number]);
+return card;
+}));
+if (matches.length > shown.length) {
+status.textContent = `Showing the newest ${shown.length} of ${matches.length} matching events`;
+} else {
+status.textContent = `${matches.length} matching event${matches.length === 1 ? '' : 's'}`;
+}
+showArchive(false);
+}
+function update() {
+if (index || !searchWords(input.value).length) {
+render();
+return;
+}
+status.textContent = 'Searching...';
+loadIndex().then(render, () => {
+status.textContent = 'Search is not available right now.';
+});
+}
+input.addEventListener('focus', () => loadIndex().catch(() => {}), { once: true });
+input.addEventListener('input', update);
+search.hidden = false;
+})();
\ No newline at end of file
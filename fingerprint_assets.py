@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Asset Fingerprinter
+
+Copies the site's stylesheets and scripts to content-hashed names
+(gallery.js -> gallery.3f9a1c5e.js) and points every page at the copies.
+A changed file gets a new name, so browsers and CDNs can cache the copies
+for as long as they like without ever serving a stale mix after a deploy.
+
+The originals are kept: the generators keep writing them, and pages that
+were not rewritten keep working. With --minify only the copies are
+minified, so style.css and include.js stay readable. asset-manifest.json
+maps each original to its current copy. Run the script after
+update_website.py or after editing an asset; copies that are no longer
+referenced are removed.
+
+    python fingerprint_assets.py
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "scripts"))
+from build_manifest import BUILD_MANIFEST_FILE, load_manifest, refresh_outputs, save_manifest
+from minify import minify_css, minify_js
+from site_render import open_output
+
+# Assets to fingerprint (missing ones, like events-archive.js outside
+# --virtual-archive builds, are skipped)
+ASSETS = (
+    "style.css",
+    "gallery.css",
+    "include.js",
+    "gallery.js",
+    "virtual-grid.js",
+    "events-archive.js",
+    "event-cards.js",
+    "events-search.js",
+)
+ASSET_MANIFEST_FILE = "asset-manifest.json"
+HASH_LENGTH = 8
+
+# Minifier per asset type, for --minify
+MINIFIERS = {".css": minify_css, ".js": minify_js}
+
+# Pages whose references are rewritten (static gallery pages use ../)
+PAGE_PATTERNS = ("*.html", "gallery/*.html")
+
+
+def fingerprint_pattern(asset):
+    """Match the asset's file name, with or without a fingerprint."""
+    path = Path(asset)
+    return re.escape(path.stem) + r'(?:\.[0-9a-f]{%d})?' % HASH_LENGTH + re.escape(path.suffix)
+
+
+def reference_pattern(asset):
+    """Match a src/href attribute pointing at the asset or one of its copies."""
+    return re.compile(r'(\b(?:src|href)="(?:\.\./)?)' + fingerprint_pattern(asset) + '"')
+
+
+def asset_content(asset, minify=False):
+    """Return the content of an asset's copy."""
+    content = Path(asset).read_bytes()
+    if minify:
+        content = MINIFIERS[Path(asset).suffix](content.decode('utf-8')).encode('utf-8')
+    return content
+
+
+def fingerprinted_name(asset, content):
+    """Return the content-hashed name for an asset."""
+    path = Path(asset)
+    return f"{path.stem}.{hashlib.sha256(content).hexdigest()[:HASH_LENGTH]}{path.suffix}"
+
+
+def fingerprint_assets(check=False, minify=False):
+    """Copy each asset to its hashed name. Returns {asset: hashed name}."""
+    names = {}
+    for asset in ASSETS:
+        if not Path(asset).exists():
+            continue
+        content = asset_content(asset, minify)
+        name = fingerprinted_name(asset, content)
+        if not check and not Path(name).exists():
+            Path(name).write_bytes(content)
+        names[asset] = name
+    return names
+
+
+def remove_stale_copies(names):
+    """Delete hashed copies that are not the current one. Returns their names."""
+    removed = []
+    for asset in ASSETS:
+        path = Path(asset)
+        copy_pattern = re.compile(fingerprint_pattern(asset))
+        for copy in sorted(Path('.').glob(f"{path.stem}.*{path.suffix}")):
+            if copy.name in (asset, names.get(asset)) or not copy_pattern.fullmatch(copy.name):
+                continue
+            copy.unlink()
+            removed.append(copy.name)
+    return removed
+
+
+def rewrite_page(text, names):
+    """Point a page's asset references at the hashed copies."""
+    for asset, name in names.items():
+        text = reference_pattern(asset).sub(lambda match: f'{match.group(1)}{name}"', text)
+    return text
+
+
+def site_pages():
+    """Return every page whose asset references are rewritten."""
+    pages = set()
+    for pattern in PAGE_PATTERNS:
+        pages.update(Path('.').glob(pattern))
+    return sorted(pages)
+
+
+def rewrite_pages(names, check=False):
+    """Rewrite every page's references. Returns the pages that changed."""
+    changed = []
+    for page in site_pages():
+        text = page.read_text(encoding='utf-8')
+        rewritten = rewrite_page(text, names)
+        if rewritten == text:
+            continue
+        changed.append(page)
+        if not check:
+            with open_output(page) as f:
+                f.write(rewritten)
+    return changed
+
+
+def load_asset_manifest(path=ASSET_MANIFEST_FILE):
+    """Load the asset manifest, or an empty one."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_asset_manifest(names, path=ASSET_MANIFEST_FILE):
+    """Write the asset manifest with sorted keys so diffs stay small."""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(names, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description="Give the site's CSS and JS files content-hashed names.")
+    parser.add_argument(
+        '--check',
+        action='store_true',
+        help="only report pages that are not up to date, and exit with status 1 if there are any"
+    )
+    parser.add_argument(
+        '--minify',
+        action='store_true',
+        help="minify the copies (the originals are left as they are)"
+    )
+    args = parser.parse_args()
+
+    print("🔖 Fingerprinting assets...\n")
+
+    names = fingerprint_assets(check=args.check, minify=args.minify)
+    changed = rewrite_pages(names, check=args.check)
+
+    if args.check:
+        stale = changed if names == load_asset_manifest() else changed + [Path(ASSET_MANIFEST_FILE)]
+        for page in stale:
+            print(f"   ❌ {page} is not up to date")
+        if stale:
+            print("\n   Run: python fingerprint_assets.py")
+            sys.exit(1)
+        print("   ✅ All pages are up to date")
+        return
+
+    for asset, name in names.items():
+        print(f"   {asset} -> {name}")
+
+    save_asset_manifest(names)
+    removed = remove_stale_copies(names)
+
+    manifest = load_manifest(BUILD_MANIFEST_FILE)
+    if refresh_outputs(manifest, changed):
+        save_manifest(manifest, BUILD_MANIFEST_FILE)
+
+    print()
+    for page in changed:
+        print(f"   ✅ Updated {page}")
+    if removed:
+        print(f"   🗑️  Removed {len(removed)} stale cop{'y' if len(removed) == 1 else 'ies'}")
+    print(f"\n✨ {len(changed)} page(s) updated, manifest saved to {ASSET_MANIFEST_FILE}")
+
+
+if __name__ == "__main__":
+    main()
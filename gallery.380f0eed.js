@@ -0,0 +1,281 @@
+if ('serviceWorker' in navigator && document.currentScript) {
+const serviceWorkerUrl = new URL('sw.js', document.currentScript.src);
+window.addEventListener('load', () => {
+navigator.serviceWorker.register(serviceWorkerUrl).catch(() => {});
+});
+}
+const CLOUDINARY_CLOUD_NAME = 'du0lumtob';
+const CLOUDINARY_BASE_URL = `https://res.cloudinary.com/${CLOUDINARY_CLOUD_NAME}/image/upload`;
+function formatDate(dateStr) {
+try {
+const months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'];
+const parts = dateStr.split('-');
+const year = parts[0].slice(2); // Get last 2 digits of year
+const monthIndex = parseInt(parts[1]) - 1;
+return `${months[monthIndex]}'${year}`;
+} catch (error) {
+return dateStr;
+}
+}
+function photoUrl(index) {
+const photo = eventData.photos[index];
+if (typeof photo === 'string') return photo;
+return `${eventData.base_url}/v${photo[0]}/${eventData.base_path}/${photo[1]}`;
+}
+function photoDetails(index) {
+const photo = eventData.photos[index];
+if (Array.isArray(photo)) return { width: photo[2], height: photo[3], color: photo[4] };
+return (eventData.details && eventData.details[index]) || {};
+}
+const IMAGE_PRESETS = {
+"card": {
+"width": 400,
+"height": 300,
+"params": "c_fit,q_auto,f_auto,b_white",
+"widths": [
+300,
+400,
+600,
+800
+],
+"sizes": "(max-width: 700px) 90vw, (max-width: 1100px) 45vw, 400px",
+"eager": "cover"
+},
+"thumb": {
+"width": 350,
+"height": 260,
+"params": "c_fill,g_auto,q_auto,f_auto",
+"widths": [
+175,
+350,
+525,
+700
+],
+"sizes": "(max-width: 768px) 50vw, 350px",
+"eager": "all"
+},
+"lightbox": {
+"width": 1920,
+"height": null,
+"params": "c_limit,q_auto:good,f_auto",
+"widths": [
+640,
+960,
+1280,
+1920,
+2560
+],
+"sizes": "90vw",
+"eager": "all",
+"limit": true
+}
+};
+function presetUrl(url, name, width) {
+const preset = IMAGE_PRESETS[name];
+width = width || preset.width;
+const parts = [`w_${width}`];
+if (preset.height) {
+parts.push(`h_${Math.round(width * preset.height / preset.width)}`);
+}
+parts.push(preset.params);
+return url.replace('/upload/', `/upload/${parts.join(',')}/`);
+}
+function presetWidths(name, sourceWidth) {
+const preset = IMAGE_PRESETS[name];
+const widths = preset.widths;
+if (!preset.limit || !sourceWidth || sourceWidth >= widths[widths.length - 1]) return widths;
+return widths.filter(width => width < sourceWidth).concat(sourceWidth);
+}
+function presetSrcset(url, name, sourceWidth) {
+return presetWidths(name, sourceWidth)
+.map(width => `${presetUrl(url, name, width)} ${width}w`)
+.join(', ');
+}
+const GALLERY_DATA_DIR = 'gallery-data';
+const urlParams = new URLSearchParams(window.location.search);
+const folderName = urlParams.get('folder');
+const eventName = urlParams.get('name');
+const eventDate = urlParams.get('date');
+let eventData = null;
+function showNotFound() {
+document.getElementById('event-title').textContent = 'Event not found';
+document.getElementById('gallery-grid').innerHTML = '<div class="loading">Event not found</div>';
+}
+function renderGallery() {
+document.getElementById('event-title').textContent = eventData.event_name;
+document.getElementById('event-date').textContent = `📅 ${formatDate(eventData.event_date)}`;
+document.getElementById('photo-count').textContent = `📷 ${eventData.photo_count} photos`;
+document.title = `${eventData.event_name} - Gallery`;
+galleryGrid.innerHTML = '';
+mountGalleryItems();
+}
+const VIRTUAL_GRID_MIN_PHOTOS = 60;
+let virtualGrid = null;
+function createGalleryItem() {
+const item = document.createElement('div');
+item.className = 'gallery-item';
+const img = document.createElement('img');
+img.sizes = IMAGE_PRESETS.thumb.sizes;
+img.width = IMAGE_PRESETS.thumb.width;
+img.height = IMAGE_PRESETS.thumb.height;
+img.loading = 'lazy';
+item.appendChild(img);
+return item;
+}
+function updateGalleryItem(item, index) {
+const url = photoUrl(index);
+const img = item.querySelector('img');
+item.dataset.index = index;
+item.style.backgroundColor = photoDetails(index).color || '';
+img.dataset.index = index;
+img.dataset.full = url;
+img.alt = `Photo ${index + 1}`;
+img.srcset = presetSrcset(url, 'thumb');
+img.src = presetUrl(url, 'thumb');
+}
+function mountGalleryItems() {
+const count = eventData.photos.length;
+if (count >= VIRTUAL_GRID_MIN_PHOTOS && typeof createVirtualGrid === 'function') {
+virtualGrid = createVirtualGrid(galleryGrid, {
+count,
+create: createGalleryItem,
+update: updateGalleryItem
+});
+return;
+}
+const fragment = document.createDocumentFragment();
+for (let index = 0; index < count; index++) {
+const item = createGalleryItem();
+updateGalleryItem(item, index);
+fragment.appendChild(item);
+}
+galleryGrid.appendChild(fragment);
+}
+const galleryGrid = document.getElementById('gallery-grid');
+galleryGrid.addEventListener('click', (e) => {
+const item = e.target.closest('.gallery-item');
+if (item) openLightbox(Number(item.dataset.index));
+});
+if (galleryGrid.hasAttribute('data-prerendered')) {
+const images = Array.from(galleryGrid.querySelectorAll('.gallery-item img'));
+eventData = {
+photos: images.map(img => img.dataset.full),
+details: images.map(img => ({
+width: Number(img.dataset.width) || undefined,
+height: Number(img.dataset.height) || undefined,
+color: img.parentElement.style.backgroundColor || undefined
+}))
+};
+if (eventData.photos.length >= VIRTUAL_GRID_MIN_PHOTOS) {
+mountGalleryItems();
+}
+} else if (!folderName) {
+showNotFound();
+} else {
+fetch(`${GALLERY_DATA_DIR}/${encodeURIComponent(folderName)}.json`)
+.then(response => {
+if (!response.ok) throw new Error(`HTTP ${response.status}`);
+return response.json();
+})
+.then(data => {
+eventData = data;
+renderGallery();
+})
+.catch(showNotFound);
+}
+let currentIndex = 0;
+const lightbox = document.getElementById('lightbox');
+const lightboxImg = document.getElementById('lightbox-img');
+function openLightbox(index) {
+currentIndex = index;
+showImage(index);
+lightbox.classList.add('active');
+document.body.style.overflow = 'hidden';
+}
+function closeLightbox() {
+lightbox.classList.remove('active');
+document.body.style.overflow = 'auto';
+cancelPrefetch();
+}
+function setLightboxSource(img, index) {
+const url = photoUrl(index);
+const { width, height, color } = photoDetails(index);
+if (width && height) {
+img.width = IMAGE_PRESETS.lightbox.width;
+img.height = Math.round(IMAGE_PRESETS.lightbox.width * height / width);
+} else {
+img.removeAttribute('width');
+img.removeAttribute('height');
+}
+img.style.backgroundColor = color || '';
+img.sizes = IMAGE_PRESETS.lightbox.sizes;
+img.srcset = presetSrcset(url, 'lightbox', width);
+img.src = presetUrl(url, 'lightbox');
+}
+function showImage(index) {
+if (!eventData || index < 0 || index >= eventData.photos.length) return;
+setLightboxSource(lightboxImg, index);
+document.querySelector('.lightbox-caption').textContent = `${index + 1} / ${eventData.photos.length}`;
+const ready = lightboxImg.decode ? lightboxImg.decode() : Promise.resolve();
+ready.catch(() => {}).then(() => {
+if (index === currentIndex) lightboxImg.style.backgroundColor = '';
+if (index === currentIndex && lightbox.classList.contains('active')) {
+prefetchAround(index);
+}
+});
+}
+const PREFETCH_DISTANCE = 2;
+const prefetched = new Map(); // photo index -> Image
+function prefetchDistance() {
+const connection = navigator.connection;
+if (!connection) return PREFETCH_DISTANCE;
+if (connection.saveData) return 0;
+if (connection.effectiveType === 'slow-2g' || connection.effectiveType === '2g') return 0;
+if (connection.effectiveType === '3g') return 1;
+return PREFETCH_DISTANCE;
+}
+function cancelPrefetch(keep = new Set()) {
+prefetched.forEach((img, i) => {
+if (keep.has(i)) return;
+img.removeAttribute('srcset');
+img.removeAttribute('src');
+prefetched.delete(i);
+});
+}
+function prefetchAround(index) {
+const count = eventData.photos.length;
+const wanted = new Set();
+for (let offset = 1; offset <= prefetchDistance(); offset++) {
+wanted.add((index + offset) % count);
+wanted.add((index - offset + count) % count);
+}
+wanted.delete(index);
+cancelPrefetch(new Set([...wanted, index]));
+wanted.forEach(i => {
+if (prefetched.has(i)) return;
+const img = new Image();
+setLightboxSource(img, i);
+if (img.decode) img.decode().catch(() => {});
+prefetched.set(i, img);
+});
+}
+function nextImage() {
+currentIndex = (currentIndex + 1) % eventData.photos.length;
+showImage(currentIndex);
+}
+function prevImage() {
+currentIndex = (currentIndex - 1 + eventData.photos.length) % eventData.photos.length;
+showImage(currentIndex);
+}
+document.querySelector('.lightbox-close').addEventListener('click', closeLightbox);
+document.querySelector('.lightbox-next').addEventListener('click', nextImage);
+document.querySelector('.lightbox-prev').addEventListener('click', prevImage);
+document.addEventListener('keydown', (e) => {
+if (!lightbox.classList.contains('active')) return;
+if (e.key === 'Escape') closeLightbox();
+if (e.key === 'ArrowRight') nextImage();
+if (e.key === 'ArrowLeft') prevImage();
+});
+lightbox.addEventListener('click', (e) => {
+if (e.target === lightbox) closeLightbox();
+});
\ No newline at end of file
@@ -1,2651 +1,281 @@
-// Cloudinary configuration
+if ('serviceWorker' in navigator && document.currentScript) {
+const serviceWorkerUrl = new URL('sw.js', document.currentScript.src);
+window.addEventListener('load', () => {
+navigator.serviceWorker.register(serviceWorkerUrl).catch(() => {});
+});
+}
 const CLOUDINARY_CLOUD_NAME = 'du0lumtob';
 const CLOUDINARY_BASE_URL = `https://res.cloudinary.com/${CLOUDINARY_CLOUD_NAME}/image/upload`;
-
-// Format date from YYYY-MM-DD to MMM'YY
 function formatDate(dateStr) {
-    try {
-        const months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'];
-        const parts = dateStr.split('-');
-        const year = parts[0].slice(2); // Get last 2 digits of year
-        const monthIndex = parseInt(parts[1]) - 1;
-        return `${months[monthIndex]}'${year}`;
-    } catch (error) {
-        return dateStr;
-    }
+try {
+const months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'];
+const parts = dateStr.split('-');
+const year = parts[0].slice(2); // Get last 2 digits of year
+const monthIndex = parseInt(parts[1]) - 1;
+return `${months[monthIndex]}'${year}`;
+} catch (error) {
+return dateStr;
+}
+}
+function photoUrl(index) {
+const photo = eventData.photos[index];
+if (typeof photo === 'string') return photo;
+return `${eventData.base_url}/v${photo[0]}/${eventData.base_path}/${photo[1]}`;
+}
+function photoDetails(index) {
+const photo = eventData.photos[index];
+if (Array.isArray(photo)) return { width: photo[2], height: photo[3], color: photo[4] };
+return (eventData.details && eventData.details[index]) || {};
+}
+const IMAGE_PRESETS = {
+"card": {
+"width": 400,
+"height": 300,
+"params": "c_fit,q_auto,f_auto,b_white",
+"widths": [
+300,
+400,
+600,
+800
+],
+"sizes": "(max-width: 700px) 90vw, (max-width: 1100px) 45vw, 400px",
+"eager": "cover"
+},
+"thumb": {
+"width": 350,
+"height": 260,
+"params": "c_fill,g_auto,q_auto,f_auto",
+"widths": [
+175,
+350,
+525,
+700
+],
+"sizes": "(max-width: 768px) 50vw, 350px",
+"eager": "all"
+},
+"lightbox": {
+"width": 1920,
+"height": null,
+"params": "c_limit,q_auto:good,f_auto",
+"widths": [
+640,
+960,
+1280,
+1920,
+2560
+],
+"sizes": "90vw",
+"eager": "all",
+"limit": true
+}
+};
+function presetUrl(url, name, width) {
+const preset = IMAGE_PRESETS[name];
+width = width || preset.width;
+const parts = [`w_${width}`];
+if (preset.height) {
+parts.push(`h_${Math.round(width * preset.height / preset.width)}`);
+}
+parts.push(preset.params);
+return url.replace('/upload/', `/upload/${parts.join(',')}/`);
 }
-
-// Event mapping data
-const EVENT_MAPPING = [
-  {
-    "event_id": "6124",
-    "event_name": "'Vrouwen Middag' @Uithoorn",
-    "event_date": "2025-06-09",
-    "cloudinary_folder": "2025-05-Vrouwen-Middag-Uithoorn",
-    "photo_count": 24,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921977/archived-events/2025-05-Vrouwen-Middag-Uithoorn/491401220_646575848202872_5474214813678152852_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921980/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0047.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921968/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0048.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921969/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0049.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921982/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0050.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921983/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0051.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921981/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0052.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921977/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0055.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921975/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0059.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921967/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0060.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921970/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0061.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921973/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0062.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921971/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0063.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921976/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0065.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921979/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0068.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921978/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0069.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921973/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0072.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921975/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0073.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921967/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0074.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921970/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0075.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921972/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0076.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921971/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0077.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921981/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0078.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921983/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0079.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/2025-05-Vrouwen-Middag-Uithoorn/"
-  },
-  {
-    "event_id": "6096",
-    "event_name": "Literary Fest 2025 @Almere",
-    "event_date": "2025-05-04",
-    "cloudinary_folder": "Literary-Fest-2025-Almere",
-    "photo_count": 39,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912685/archived-events/Literary-Fest-2025-Almere/20250614_155658.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912678/archived-events/Literary-Fest-2025-Almere/20250614_155701.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912673/archived-events/Literary-Fest-2025-Almere/20250614_155702.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912694/archived-events/Literary-Fest-2025-Almere/20250614_155706.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912687/archived-events/Literary-Fest-2025-Almere/20250614_155707.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912666/archived-events/Literary-Fest-2025-Almere/20250614_155735.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912661/archived-events/Literary-Fest-2025-Almere/20250614_155737.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912683/archived-events/Literary-Fest-2025-Almere/20250614_155738.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912696/archived-events/Literary-Fest-2025-Almere/20250614_155749.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912660/archived-events/Literary-Fest-2025-Almere/20250614_155750.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912659/archived-events/Literary-Fest-2025-Almere/20250614_155814.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912671/archived-events/Literary-Fest-2025-Almere/20250614_155914.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912666/archived-events/Literary-Fest-2025-Almere/20250614_155916.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912674/archived-events/Literary-Fest-2025-Almere/20250614_155925.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912679/archived-events/Literary-Fest-2025-Almere/20250614_155926.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912676/archived-events/Literary-Fest-2025-Almere/20250614_160343.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912692/archived-events/Literary-Fest-2025-Almere/20250614_160346.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912690/archived-events/Literary-Fest-2025-Almere/20250614_160347.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912664/archived-events/Literary-Fest-2025-Almere/20250614_160349.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912686/archived-events/Literary-Fest-2025-Almere/20250614_160350.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912677/archived-events/Literary-Fest-2025-Almere/20250614_160425.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912681/archived-events/Literary-Fest-2025-Almere/20250614_160427.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912669/archived-events/Literary-Fest-2025-Almere/20250614_160428.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912697/archived-events/Literary-Fest-2025-Almere/20250614_160525.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912696/archived-events/Literary-Fest-2025-Almere/20250614_160526.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912695/archived-events/Literary-Fest-2025-Almere/20250614_160527.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912684/archived-events/Literary-Fest-2025-Almere/20250614_160740.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912688/archived-events/Literary-Fest-2025-Almere/20250614_160743.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912663/archived-events/Literary-Fest-2025-Almere/20250614_161240.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912665/archived-events/Literary-Fest-2025-Almere/20250614_161241.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912682/archived-events/Literary-Fest-2025-Almere/20250614_161248.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912680/archived-events/Literary-Fest-2025-Almere/20250614_161249.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912667/archived-events/Literary-Fest-2025-Almere/20250614_161251.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912658/archived-events/Literary-Fest-2025-Almere/20250614_163632.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912655/archived-events/Literary-Fest-2025-Almere/20250614_163634.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912699/archived-events/Literary-Fest-2025-Almere/20250614_164037.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912698/archived-events/Literary-Fest-2025-Almere/20250614_1640370.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912657/archived-events/Literary-Fest-2025-Almere/20250614_164038.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912691/archived-events/Literary-Fest-2025-Almere/20250614_164121.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/Literary-Fest-2025-Almere/"
-  },
-  {
-    "event_id": "6059",
-    "event_name": "'The Future of Eindhoven' @Eindhoven",
-    "event_date": "2025-05-04",
-    "cloudinary_folder": "The-Future-of-Eindhoven-Eindhoven",
-    "photo_count": 21,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912852/archived-events/The-Future-of-Eindhoven-Eindhoven/6db1eb5b-f237-4fff-bc38-c72685533c27-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912855/archived-events/The-Future-of-Eindhoven-Eindhoven/744f792a-81b7-4a93-875c-d6a591b7d64c-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912867/archived-events/The-Future-of-Eindhoven-Eindhoven/7573a6dc-fe79-416c-aa33-33bb44e219e0-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912871/archived-events/The-Future-of-Eindhoven-Eindhoven/760f0278-ce81-45e9-bb68-c9921537db28-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912859/archived-events/The-Future-of-Eindhoven-Eindhoven/bedf970f-e7ee-4e23-9a35-e4383eb76ae2-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912870/archived-events/The-Future-of-Eindhoven-Eindhoven/IMG_2976.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912869/archived-events/The-Future-of-Eindhoven-Eindhoven/IMG_2977.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912851/archived-events/The-Future-of-Eindhoven-Eindhoven/IMG_2978.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912851/archived-events/The-Future-of-Eindhoven-Eindhoven/IMG_2979.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912854/archived-events/The-Future-of-Eindhoven-Eindhoven/IMG_2980.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912853/archived-events/The-Future-of-Eindhoven-Eindhoven/IMG_2981.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912866/archived-events/The-Future-of-Eindhoven-Eindhoven/IMG_3002.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912864/archived-events/The-Future-of-Eindhoven-Eindhoven/IMG_3004.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912864/archived-events/The-Future-of-Eindhoven-Eindhoven/IMG_3005.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912863/archived-events/The-Future-of-Eindhoven-Eindhoven/IMG_3006.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912861/archived-events/The-Future-of-Eindhoven-Eindhoven/IMG_3007.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912858/archived-events/The-Future-of-Eindhoven-Eindhoven/IMG_3008.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912856/archived-events/The-Future-of-Eindhoven-Eindhoven/IMG_3018.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912859/archived-events/The-Future-of-Eindhoven-Eindhoven/IMG_3024-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912855/archived-events/The-Future-of-Eindhoven-Eindhoven/IMG_3026.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912868/archived-events/The-Future-of-Eindhoven-Eindhoven/IMG_3104.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/The-Future-of-Eindhoven-Eindhoven/"
-  },
-  {
-    "event_id": "5975",
-    "event_name": "'Vrouwen Middag' @Uithoorn",
-    "event_date": "2025-05-04",
-    "cloudinary_folder": "2025-05-Vrouwen-Middag-Uithoorn",
-    "photo_count": 24,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921977/archived-events/2025-05-Vrouwen-Middag-Uithoorn/491401220_646575848202872_5474214813678152852_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921980/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0047.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921968/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0048.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921969/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0049.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921982/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0050.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921983/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0051.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921981/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0052.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921977/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0055.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921975/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0059.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921967/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0060.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921970/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0061.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921973/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0062.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921971/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0063.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921976/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0065.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921979/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0068.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921978/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0069.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921973/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0072.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921975/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0073.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921967/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0074.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921970/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0075.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921972/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0076.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921971/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0077.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921981/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0078.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765921983/archived-events/2025-05-Vrouwen-Middag-Uithoorn/IMG-20250429-WA0079.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/2025-05-Vrouwen-Middag-Uithoorn/"
-  },
-  {
-    "event_id": "5557",
-    "event_name": "'Bura Na Mano, Holi Hai' @Uithoorn",
-    "event_date": "2025-01-23",
-    "cloudinary_folder": "2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn",
-    "photo_count": 90,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922143/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/100.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922102/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/103-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922087/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/104-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922126/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/107-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922076/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/11-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922121/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/12-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922091/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/13-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922101/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/14-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922073/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/15-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922066/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/17-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922138/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/18-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922150/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/2.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922159/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/20-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922133/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/21-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922142/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/25-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922165/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/26-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922136/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/27-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922075/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/28-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922098/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/29-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922095/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/30-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922069/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/31-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922110/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/32-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922068/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/33-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922129/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/34-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922082/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/35-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922118/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/36-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922083/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/37-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922131/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/38-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922156/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/39-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922137/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/4-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922135/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/42-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922097/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/48-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922074/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/50-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922077/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/54-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922154/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/57.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922132/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/59-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922139/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/6-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922062/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/63.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922078/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/65.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922134/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/66-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922151/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/67-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922090/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/70-2.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922117/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/73-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922094/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/75-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922146/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/79-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922103/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/8-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922155/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/81-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922152/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/83-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922162/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/85-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922164/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/87-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922100/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/91-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922064/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/92-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922105/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/93-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922086/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/96-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922121/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/97-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922158/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/98-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922088/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/Holi_Website.png",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922153/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/Image_000_4089.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922079/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/Image_000_4093.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922071/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/Image_000_4108.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922161/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/Image_000_4110.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922107/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/Image_000_4157.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922130/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/Image_000_4160.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922144/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/Image_000_4170.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922104/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/Image_000_4181.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922124/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/Image_000_4187.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922115/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/Image_000_4190.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922128/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/Image_000_4192.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922099/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/Image_000_4197.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922147/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/Image_000_4206.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922111/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/Image_000_4209.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922113/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/Image_000_4219.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922123/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/Image_000_4224.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922112/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/Image_000_4231.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922148/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/Image_000_4249.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922092/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/Image_000_4250.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922166/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/Image_000_4265.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922159/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/Image_000_4267.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922163/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/Image_000_4270.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922085/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/Image_000_4279.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922119/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/Image_000_4350.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922106/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/Image_000_4355.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922096/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/Image_000_4419.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922081/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/Image_000_4440.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922067/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/Image_000_4446.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922138/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/Image_000_4575.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922141/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/Image_000_4617.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922108/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/Image_000_4625.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922064/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/Image_000_4678.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922161/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/Image_000_4703.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/2025-01-Bura-Na-Mano-Holi-Hai-Uithoorn/"
-  },
-  {
-    "event_id": "5401",
-    "event_name": "'World Hindi Day' @ Eindhoven",
-    "event_date": "2025-01-14",
-    "cloudinary_folder": "World-Hindi-Day-Eindhoven",
-    "photo_count": 109,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913493/archived-events/World-Hindi-Day-Eindhoven/1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913407/archived-events/World-Hindi-Day-Eindhoven/10.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913385/archived-events/World-Hindi-Day-Eindhoven/100.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913382/archived-events/World-Hindi-Day-Eindhoven/101.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913390/archived-events/World-Hindi-Day-Eindhoven/102.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913392/archived-events/World-Hindi-Day-Eindhoven/103.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913401/archived-events/World-Hindi-Day-Eindhoven/104.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913404/archived-events/World-Hindi-Day-Eindhoven/105.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913396/archived-events/World-Hindi-Day-Eindhoven/106.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913395/archived-events/World-Hindi-Day-Eindhoven/107.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913400/archived-events/World-Hindi-Day-Eindhoven/11.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913394/archived-events/World-Hindi-Day-Eindhoven/12.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913397/archived-events/World-Hindi-Day-Eindhoven/13.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913379/archived-events/World-Hindi-Day-Eindhoven/14.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913387/archived-events/World-Hindi-Day-Eindhoven/15.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913393/archived-events/World-Hindi-Day-Eindhoven/16.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913388/archived-events/World-Hindi-Day-Eindhoven/17.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913427/archived-events/World-Hindi-Day-Eindhoven/18.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913437/archived-events/World-Hindi-Day-Eindhoven/19u.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913467/archived-events/World-Hindi-Day-Eindhoven/2.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913414/archived-events/World-Hindi-Day-Eindhoven/20.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913410/archived-events/World-Hindi-Day-Eindhoven/21.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913417/archived-events/World-Hindi-Day-Eindhoven/22.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913418/archived-events/World-Hindi-Day-Eindhoven/23.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913429/archived-events/World-Hindi-Day-Eindhoven/24.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913433/archived-events/World-Hindi-Day-Eindhoven/25.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913424/archived-events/World-Hindi-Day-Eindhoven/26.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913423/archived-events/World-Hindi-Day-Eindhoven/27.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913381/archived-events/World-Hindi-Day-Eindhoven/28.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913386/archived-events/World-Hindi-Day-Eindhoven/29.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913482/archived-events/World-Hindi-Day-Eindhoven/3.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913430/archived-events/World-Hindi-Day-Eindhoven/30.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913432/archived-events/World-Hindi-Day-Eindhoven/31.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913426/archived-events/World-Hindi-Day-Eindhoven/32.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913421/archived-events/World-Hindi-Day-Eindhoven/33.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913413/archived-events/World-Hindi-Day-Eindhoven/34.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913411/archived-events/World-Hindi-Day-Eindhoven/35.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913415/archived-events/World-Hindi-Day-Eindhoven/36.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913420/archived-events/World-Hindi-Day-Eindhoven/37.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913408/archived-events/World-Hindi-Day-Eindhoven/38.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913398/archived-events/World-Hindi-Day-Eindhoven/39.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913435/archived-events/World-Hindi-Day-Eindhoven/4.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913461/archived-events/World-Hindi-Day-Eindhoven/40.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913451/archived-events/World-Hindi-Day-Eindhoven/41.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913435/archived-events/World-Hindi-Day-Eindhoven/42.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913446/archived-events/World-Hindi-Day-Eindhoven/43.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913472/archived-events/World-Hindi-Day-Eindhoven/44.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913480/archived-events/World-Hindi-Day-Eindhoven/45.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913501/archived-events/World-Hindi-Day-Eindhoven/46.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913489/archived-events/World-Hindi-Day-Eindhoven/47.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913346/archived-events/World-Hindi-Day-Eindhoven/48.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913349/archived-events/World-Hindi-Day-Eindhoven/49.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913444/archived-events/World-Hindi-Day-Eindhoven/5.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913470/archived-events/World-Hindi-Day-Eindhoven/50.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913485/archived-events/World-Hindi-Day-Eindhoven/51.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913500/archived-events/World-Hindi-Day-Eindhoven/52.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913490/archived-events/World-Hindi-Day-Eindhoven/53.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913463/archived-events/World-Hindi-Day-Eindhoven/54.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913447/archived-events/World-Hindi-Day-Eindhoven/55.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913436/archived-events/World-Hindi-Day-Eindhoven/56.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913365/archived-events/World-Hindi-Day-Eindhoven/58.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913353/archived-events/World-Hindi-Day-Eindhoven/59.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913465/archived-events/World-Hindi-Day-Eindhoven/6.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913345/archived-events/World-Hindi-Day-Eindhoven/60.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913350/archived-events/World-Hindi-Day-Eindhoven/61.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913341/archived-events/World-Hindi-Day-Eindhoven/62.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913368/archived-events/World-Hindi-Day-Eindhoven/66.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913376/archived-events/World-Hindi-Day-Eindhoven/67.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913460/archived-events/World-Hindi-Day-Eindhoven/68.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913452/archived-events/World-Hindi-Day-Eindhoven/69.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913448/archived-events/World-Hindi-Day-Eindhoven/7.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913363/archived-events/World-Hindi-Day-Eindhoven/70.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913361/archived-events/World-Hindi-Day-Eindhoven/70-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913355/archived-events/World-Hindi-Day-Eindhoven/71.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913370/archived-events/World-Hindi-Day-Eindhoven/72.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913375/archived-events/World-Hindi-Day-Eindhoven/73.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913343/archived-events/World-Hindi-Day-Eindhoven/74.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913351/archived-events/World-Hindi-Day-Eindhoven/75.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913336/archived-events/World-Hindi-Day-Eindhoven/76.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913330/archived-events/World-Hindi-Day-Eindhoven/77.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913466/archived-events/World-Hindi-Day-Eindhoven/78.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913487/archived-events/World-Hindi-Day-Eindhoven/79.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913366/archived-events/World-Hindi-Day-Eindhoven/8.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913443/archived-events/World-Hindi-Day-Eindhoven/80.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913438/archived-events/World-Hindi-Day-Eindhoven/81.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913454/archived-events/World-Hindi-Day-Eindhoven/82.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913456/archived-events/World-Hindi-Day-Eindhoven/83.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913494/archived-events/World-Hindi-Day-Eindhoven/84.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913498/archived-events/World-Hindi-Day-Eindhoven/85.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913478/archived-events/World-Hindi-Day-Eindhoven/86.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913475/archived-events/World-Hindi-Day-Eindhoven/87.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913332/archived-events/World-Hindi-Day-Eindhoven/88.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913334/archived-events/World-Hindi-Day-Eindhoven/89.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913378/archived-events/World-Hindi-Day-Eindhoven/9.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913495/archived-events/World-Hindi-Day-Eindhoven/90.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913496/archived-events/World-Hindi-Day-Eindhoven/91.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913479/archived-events/World-Hindi-Day-Eindhoven/92.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913474/archived-events/World-Hindi-Day-Eindhoven/93.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913442/archived-events/World-Hindi-Day-Eindhoven/94.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913440/archived-events/World-Hindi-Day-Eindhoven/95.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913453/archived-events/World-Hindi-Day-Eindhoven/96.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913458/archived-events/World-Hindi-Day-Eindhoven/97.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913373/archived-events/World-Hindi-Day-Eindhoven/98.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913371/archived-events/World-Hindi-Day-Eindhoven/99.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913347/archived-events/World-Hindi-Day-Eindhoven/DSC07097.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913358/archived-events/World-Hindi-Day-Eindhoven/DSC07119.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913356/archived-events/World-Hindi-Day-Eindhoven/DSC07125.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913333/archived-events/World-Hindi-Day-Eindhoven/DSC07136.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913384/archived-events/World-Hindi-Day-Eindhoven/DSC07140.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/World-Hindi-Day-Eindhoven/"
-  },
-  {
-    "event_id": "5088",
-    "event_name": "'The Rythms of India' @Eindhoven",
-    "event_date": "2024-12-12",
-    "cloudinary_folder": "The-Rythms-of-India-Eindhoven",
-    "photo_count": 164,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913001/archived-events/The-Rythms-of-India-Eindhoven/20241215_151409.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912985/archived-events/The-Rythms-of-India-Eindhoven/20241215_151646.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912943/archived-events/The-Rythms-of-India-Eindhoven/20241215_151708.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912952/archived-events/The-Rythms-of-India-Eindhoven/20241215_152413.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912938/archived-events/The-Rythms-of-India-Eindhoven/20241215_152813.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912918/archived-events/The-Rythms-of-India-Eindhoven/20241215_153707.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912978/archived-events/The-Rythms-of-India-Eindhoven/20241215_153858.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912873/archived-events/The-Rythms-of-India-Eindhoven/20241215_155128.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913016/archived-events/The-Rythms-of-India-Eindhoven/20241215_161245.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913030/archived-events/The-Rythms-of-India-Eindhoven/20241215_161903.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912896/archived-events/The-Rythms-of-India-Eindhoven/20241215_161937.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913004/archived-events/The-Rythms-of-India-Eindhoven/20241215_163653.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913021/archived-events/The-Rythms-of-India-Eindhoven/20241215_163720.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912913/archived-events/The-Rythms-of-India-Eindhoven/469264442_550008587859599_8492874824778514265_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913005/archived-events/The-Rythms-of-India-Eindhoven/IMG_0197.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912889/archived-events/The-Rythms-of-India-Eindhoven/IMG_0200.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912883/archived-events/The-Rythms-of-India-Eindhoven/IMG_0201.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912881/archived-events/The-Rythms-of-India-Eindhoven/IMG_0203.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912898/archived-events/The-Rythms-of-India-Eindhoven/IMG_0205.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913011/archived-events/The-Rythms-of-India-Eindhoven/IMG_0208.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913019/archived-events/The-Rythms-of-India-Eindhoven/IMG_0209.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912911/archived-events/The-Rythms-of-India-Eindhoven/IMG_0212.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912884/archived-events/The-Rythms-of-India-Eindhoven/IMG_0215.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912872/archived-events/The-Rythms-of-India-Eindhoven/IMG_0216.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913038/archived-events/The-Rythms-of-India-Eindhoven/IMG_0218.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913009/archived-events/The-Rythms-of-India-Eindhoven/IMG_0220.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913020/archived-events/The-Rythms-of-India-Eindhoven/IMG_0221.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913037/archived-events/The-Rythms-of-India-Eindhoven/IMG_0224.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912884/archived-events/The-Rythms-of-India-Eindhoven/IMG_0229.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913036/archived-events/The-Rythms-of-India-Eindhoven/IMG_0230.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913043/archived-events/The-Rythms-of-India-Eindhoven/IMG_0232.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912899/archived-events/The-Rythms-of-India-Eindhoven/IMG_0239.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912957/archived-events/The-Rythms-of-India-Eindhoven/IMG_0241.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912965/archived-events/The-Rythms-of-India-Eindhoven/IMG_0243.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912999/archived-events/The-Rythms-of-India-Eindhoven/IMG_0244.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912993/archived-events/The-Rythms-of-India-Eindhoven/IMG_0251.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912959/archived-events/The-Rythms-of-India-Eindhoven/IMG_0255.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912942/archived-events/The-Rythms-of-India-Eindhoven/IMG_0259.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912930/archived-events/The-Rythms-of-India-Eindhoven/IMG_0264.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912947/archived-events/The-Rythms-of-India-Eindhoven/IMG_0268.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912930/archived-events/The-Rythms-of-India-Eindhoven/IMG_0270.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912940/archived-events/The-Rythms-of-India-Eindhoven/IMG_0271.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912916/archived-events/The-Rythms-of-India-Eindhoven/IMG_0274.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912992/archived-events/The-Rythms-of-India-Eindhoven/IMG_0279.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912963/archived-events/The-Rythms-of-India-Eindhoven/IMG_0280.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912961/archived-events/The-Rythms-of-India-Eindhoven/IMG_0282.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912946/archived-events/The-Rythms-of-India-Eindhoven/IMG_0283.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912990/archived-events/The-Rythms-of-India-Eindhoven/IMG_0284.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912992/archived-events/The-Rythms-of-India-Eindhoven/IMG_0286.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913000/archived-events/The-Rythms-of-India-Eindhoven/IMG_0287.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912964/archived-events/The-Rythms-of-India-Eindhoven/IMG_0294.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912945/archived-events/The-Rythms-of-India-Eindhoven/IMG_0297.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912921/archived-events/The-Rythms-of-India-Eindhoven/IMG_0298.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912928/archived-events/The-Rythms-of-India-Eindhoven/IMG_0299.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912915/archived-events/The-Rythms-of-India-Eindhoven/IMG_0300.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912912/archived-events/The-Rythms-of-India-Eindhoven/IMG_0301.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912919/archived-events/The-Rythms-of-India-Eindhoven/IMG_0303.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912951/archived-events/The-Rythms-of-India-Eindhoven/IMG_0308.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912934/archived-events/The-Rythms-of-India-Eindhoven/IMG_0310.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912935/archived-events/The-Rythms-of-India-Eindhoven/IMG_0311.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912924/archived-events/The-Rythms-of-India-Eindhoven/IMG_0313.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912913/archived-events/The-Rythms-of-India-Eindhoven/IMG_0314.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912918/archived-events/The-Rythms-of-India-Eindhoven/IMG_0316.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912997/archived-events/The-Rythms-of-India-Eindhoven/IMG_0318.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912950/archived-events/The-Rythms-of-India-Eindhoven/IMG_0320.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912956/archived-events/The-Rythms-of-India-Eindhoven/IMG_0321.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912972/archived-events/The-Rythms-of-India-Eindhoven/IMG_0322.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912970/archived-events/The-Rythms-of-India-Eindhoven/IMG_0323.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912983/archived-events/The-Rythms-of-India-Eindhoven/IMG_0326.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912995/archived-events/The-Rythms-of-India-Eindhoven/IMG_0331.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912981/archived-events/The-Rythms-of-India-Eindhoven/IMG_0332.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912974/archived-events/The-Rythms-of-India-Eindhoven/IMG_0336.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912967/archived-events/The-Rythms-of-India-Eindhoven/IMG_0337.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912932/archived-events/The-Rythms-of-India-Eindhoven/IMG_0338.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912940/archived-events/The-Rythms-of-India-Eindhoven/IMG_0339.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913013/archived-events/The-Rythms-of-India-Eindhoven/IMG_0340.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913018/archived-events/The-Rythms-of-India-Eindhoven/IMG_0341.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913006/archived-events/The-Rythms-of-India-Eindhoven/IMG_0342.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913032/archived-events/The-Rythms-of-India-Eindhoven/IMG_0344.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913026/archived-events/The-Rythms-of-India-Eindhoven/IMG_0345.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913046/archived-events/The-Rythms-of-India-Eindhoven/IMG_0347.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913032/archived-events/The-Rythms-of-India-Eindhoven/IMG_0350.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913025/archived-events/The-Rythms-of-India-Eindhoven/IMG_0351.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913045/archived-events/The-Rythms-of-India-Eindhoven/IMG_0352.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912875/archived-events/The-Rythms-of-India-Eindhoven/IMG_0362.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912893/archived-events/The-Rythms-of-India-Eindhoven/IMG_0364.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912901/archived-events/The-Rythms-of-India-Eindhoven/IMG_0367.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913015/archived-events/The-Rythms-of-India-Eindhoven/IMG_0368.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912892/archived-events/The-Rythms-of-India-Eindhoven/IMG_0370.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912905/archived-events/The-Rythms-of-India-Eindhoven/IMG_0372.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912902/archived-events/The-Rythms-of-India-Eindhoven/IMG_0373.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912888/archived-events/The-Rythms-of-India-Eindhoven/IMG_0374.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912886/archived-events/The-Rythms-of-India-Eindhoven/IMG_0375.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912876/archived-events/The-Rythms-of-India-Eindhoven/IMG_0376.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912878/archived-events/The-Rythms-of-India-Eindhoven/IMG_0377.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913033/archived-events/The-Rythms-of-India-Eindhoven/IMG_0387.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912879/archived-events/The-Rythms-of-India-Eindhoven/IMG_0388.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912874/archived-events/The-Rythms-of-India-Eindhoven/IMG_0389.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913047/archived-events/The-Rythms-of-India-Eindhoven/IMG_0390.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913023/archived-events/The-Rythms-of-India-Eindhoven/IMG_0392.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913035/archived-events/The-Rythms-of-India-Eindhoven/IMG_0393.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913008/archived-events/The-Rythms-of-India-Eindhoven/IMG_0395.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913012/archived-events/The-Rythms-of-India-Eindhoven/IMG_0397.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912900/archived-events/The-Rythms-of-India-Eindhoven/IMG_0398.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912910/archived-events/The-Rythms-of-India-Eindhoven/IMG_0399.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912908/archived-events/The-Rythms-of-India-Eindhoven/IMG_0400.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912895/archived-events/The-Rythms-of-India-Eindhoven/IMG_0402.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912897/archived-events/The-Rythms-of-India-Eindhoven/IMG_0403.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912887/archived-events/The-Rythms-of-India-Eindhoven/IMG_0407.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913044/archived-events/The-Rythms-of-India-Eindhoven/IMG_0408.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912906/archived-events/The-Rythms-of-India-Eindhoven/IMG_0414.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913029/archived-events/The-Rythms-of-India-Eindhoven/IMG_0423.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913007/archived-events/The-Rythms-of-India-Eindhoven/IMG_0424.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913002/archived-events/The-Rythms-of-India-Eindhoven/IMG_0425.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912909/archived-events/The-Rythms-of-India-Eindhoven/IMG_0428.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913003/archived-events/The-Rythms-of-India-Eindhoven/IMG_0431.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913024/archived-events/The-Rythms-of-India-Eindhoven/IMG_0437.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912982/archived-events/The-Rythms-of-India-Eindhoven/IMG_0440.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912985/archived-events/The-Rythms-of-India-Eindhoven/IMG_0441.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912995/archived-events/The-Rythms-of-India-Eindhoven/IMG_0442.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912994/archived-events/The-Rythms-of-India-Eindhoven/IMG_0443.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912970/archived-events/The-Rythms-of-India-Eindhoven/IMG_0445.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912955/archived-events/The-Rythms-of-India-Eindhoven/IMG_0447.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912923/archived-events/The-Rythms-of-India-Eindhoven/IMG_0449.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913042/archived-events/The-Rythms-of-India-Eindhoven/IMG_0449-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912973/archived-events/The-Rythms-of-India-Eindhoven/IMG_0450.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912967/archived-events/The-Rythms-of-India-Eindhoven/IMG_0451.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912953/archived-events/The-Rythms-of-India-Eindhoven/IMG_0453.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912933/archived-events/The-Rythms-of-India-Eindhoven/IMG_0462.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912937/archived-events/The-Rythms-of-India-Eindhoven/IMG_0463.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912920/archived-events/The-Rythms-of-India-Eindhoven/IMG_0465.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912914/archived-events/The-Rythms-of-India-Eindhoven/IMG_0466.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912927/archived-events/The-Rythms-of-India-Eindhoven/IMG_0474.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912998/archived-events/The-Rythms-of-India-Eindhoven/IMG_0481.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912931/archived-events/The-Rythms-of-India-Eindhoven/IMG_0489.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912980/archived-events/The-Rythms-of-India-Eindhoven/IMG_0497.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912927/archived-events/The-Rythms-of-India-Eindhoven/IMG_0500.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912922/archived-events/The-Rythms-of-India-Eindhoven/IMG_0501.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912979/archived-events/The-Rythms-of-India-Eindhoven/IMG_0508.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912989/archived-events/The-Rythms-of-India-Eindhoven/IMG_0509.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912976/archived-events/The-Rythms-of-India-Eindhoven/IMG_0518.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912986/archived-events/The-Rythms-of-India-Eindhoven/IMG_0521.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912958/archived-events/The-Rythms-of-India-Eindhoven/IMG_0527.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912921/archived-events/The-Rythms-of-India-Eindhoven/IMG_0529.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912977/archived-events/The-Rythms-of-India-Eindhoven/IMG_0530.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913022/archived-events/The-Rythms-of-India-Eindhoven/IMG_0557.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912891/archived-events/The-Rythms-of-India-Eindhoven/IMG_0576.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913041/archived-events/The-Rythms-of-India-Eindhoven/IMG_0581.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913041/archived-events/The-Rythms-of-India-Eindhoven/IMG_0583.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913039/archived-events/The-Rythms-of-India-Eindhoven/IMG_0595.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912904/archived-events/The-Rythms-of-India-Eindhoven/IMG_0603.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912877/archived-events/The-Rythms-of-India-Eindhoven/IMG_0613.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912905/archived-events/The-Rythms-of-India-Eindhoven/IMG_0617.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912944/archived-events/The-Rythms-of-India-Eindhoven/IMG_0617-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912925/archived-events/The-Rythms-of-India-Eindhoven/IMG_20241215_151037.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912903/archived-events/The-Rythms-of-India-Eindhoven/IMG_20241215_151042.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912974/archived-events/The-Rythms-of-India-Eindhoven/IMG_20241215_152724.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912880/archived-events/The-Rythms-of-India-Eindhoven/WhatsApp-Image-2024-12-16-at-17.25.39_0d802cbb.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912890/archived-events/The-Rythms-of-India-Eindhoven/WhatsApp-Image-2024-12-16-at-17.25.39_1da10b0e.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912935/archived-events/The-Rythms-of-India-Eindhoven/WhatsApp-Image-2024-12-16-at-17.25.39_44ce2186.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912899/archived-events/The-Rythms-of-India-Eindhoven/WhatsApp-Image-2024-12-16-at-17.25.39_48a694e4.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912971/archived-events/The-Rythms-of-India-Eindhoven/WhatsApp-Image-2024-12-16-at-17.25.39_936224d6.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913016/archived-events/The-Rythms-of-India-Eindhoven/WhatsApp-Image-2024-12-16-at-17.25.39_9ee0e17e.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912882/archived-events/The-Rythms-of-India-Eindhoven/WhatsApp-Image-2024-12-16-at-17.25.39_b276760e.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/The-Rythms-of-India-Eindhoven/"
-  },
-  {
-    "event_id": "4852",
-    "event_name": "Unity Festival of Lights @Eindhoven",
-    "event_date": "2024-12-09",
-    "cloudinary_folder": "Unity-Festival-of-Lights-Eindhoven",
-    "photo_count": 148,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913150/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC04932.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913202/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC04938.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913283/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC04948.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913062/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC04991.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913199/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05011.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913182/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05035.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913122/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05043.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913277/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05048.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913287/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05049.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913089/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05051.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913084/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05051-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913250/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05106.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913230/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05106-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913106/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05108.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913256/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05113.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913087/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05119.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913197/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05119-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913068/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05126.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913095/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05135.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913264/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05139.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913138/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05145.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913245/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05161.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913204/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05170.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913156/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05185.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913227/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05188.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913155/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05191.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913136/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05192.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913191/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05197.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913065/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05197-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913161/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05208.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913232/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05214.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913225/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05215.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913163/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05220.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913178/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05221.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913129/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05226.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913233/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05228.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913223/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05229.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913160/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05230.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913142/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05231.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913179/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05235.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913196/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05236.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913208/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05238.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913113/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05242.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913092/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05243.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913289/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05249.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913073/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05250.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913053/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05251.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913302/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05260.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913247/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05264.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913261/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05265.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913127/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05269.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913257/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05271.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913071/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05278.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913111/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05281.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913070/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05293.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913172/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05293-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913114/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05297.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913279/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05302.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913254/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05305.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913269/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05313.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913295/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05314.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913293/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05315.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913281/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05316.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913099/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05323.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913091/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05323_Resized.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913086/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05327.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913063/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05330.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913118/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05334.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913103/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05337.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913189/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05343.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913154/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05344.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913148/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05351.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913135/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05352.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913214/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05358.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913239/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05362.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913168/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05368.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913152/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05378.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913151/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05393.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913174/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05397.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913241/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05405.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913237/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05410.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913212/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05416.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913147/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05423.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913188/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05431.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913079/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05440.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913101/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05445.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913060/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05457.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913294/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05466.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913271/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05474.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913252/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05476.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913120/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05485.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913104/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05492.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913083/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05496.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913081/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05497.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913260/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05503.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913074/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05508.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913052/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05523.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913112/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05524.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913193/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05626.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913067/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05640.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913093/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05647.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913249/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05674.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913075/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05681.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913058/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05682.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913266/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05688.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913056/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05696.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913300/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05710.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913275/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05716.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913262/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05717.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913130/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05742.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913215/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05753-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913220/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05761.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913228/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05764.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913158/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05768.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913144/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05769.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913222/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05775.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913139/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05780.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913194/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05785.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913184/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05790.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913176/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05802.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913167/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05803.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913133/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05805.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913235/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05809.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913132/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05811.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913145/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05812.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913124/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05814-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913243/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05820.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913217/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05826.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913211/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05833.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913097/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05848.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913268/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05850.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913272/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05851.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913077/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05871.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913117/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05888.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913121/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05889.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913285/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05897.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913109/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05901.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913116/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05903.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913298/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05923.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913274/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05925.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913290/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05925-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913205/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05945.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913209/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05953.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913165/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05963.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913207/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05979.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913296/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05979-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913218/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05985.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913201/archived-events/Unity-Festival-of-Lights-Eindhoven/DSC05987.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/Unity-Festival-of-Lights-Eindhoven/"
-  },
-  {
-    "event_id": "4736",
-    "event_name": "Consular Camp @Eindhoven",
-    "event_date": "2024-12-05",
-    "cloudinary_folder": "Consular-Camp-Eindhoven",
-    "photo_count": 46,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927508/archived-events/Consular-Camp-Eindhoven/IMG_4222.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927501/archived-events/Consular-Camp-Eindhoven/IMG_4225.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927503/archived-events/Consular-Camp-Eindhoven/IMG_4227.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927496/archived-events/Consular-Camp-Eindhoven/IMG_4228.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927493/archived-events/Consular-Camp-Eindhoven/IMG_4238.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927529/archived-events/Consular-Camp-Eindhoven/IMG_4251.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927534/archived-events/Consular-Camp-Eindhoven/IMG_4254.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927533/archived-events/Consular-Camp-Eindhoven/IMG_4255.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927540/archived-events/Consular-Camp-Eindhoven/IMG_4256.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927479/archived-events/Consular-Camp-Eindhoven/IMG_4258.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927485/archived-events/Consular-Camp-Eindhoven/IMG_4262.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927476/archived-events/Consular-Camp-Eindhoven/IMG_4265.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927472/archived-events/Consular-Camp-Eindhoven/IMG_4267.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927481/archived-events/Consular-Camp-Eindhoven/IMG_4270.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927474/archived-events/Consular-Camp-Eindhoven/IMG_4273.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927486/archived-events/Consular-Camp-Eindhoven/IMG_4276.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927528/archived-events/Consular-Camp-Eindhoven/IMG_4279.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927543/archived-events/Consular-Camp-Eindhoven/IMG_4280.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927538/archived-events/Consular-Camp-Eindhoven/IMG_4283.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927517/archived-events/Consular-Camp-Eindhoven/IMG_4284.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927521/archived-events/Consular-Camp-Eindhoven/IMG_4285.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927522/archived-events/Consular-Camp-Eindhoven/IMG_4287.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927546/archived-events/Consular-Camp-Eindhoven/IMG_4294.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927536/archived-events/Consular-Camp-Eindhoven/IMG_4297.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927482/archived-events/Consular-Camp-Eindhoven/IMG_4301.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927484/archived-events/Consular-Camp-Eindhoven/IMG_4302.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927469/archived-events/Consular-Camp-Eindhoven/IMG_4306.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927477/archived-events/Consular-Camp-Eindhoven/IMG_4311.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927471/archived-events/Consular-Camp-Eindhoven/IMG_4312.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927524/archived-events/Consular-Camp-Eindhoven/IMG_4325.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927523/archived-events/Consular-Camp-Eindhoven/IMG_4330.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927526/archived-events/Consular-Camp-Eindhoven/IMG_4331.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927519/archived-events/Consular-Camp-Eindhoven/IMG_4333.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927541/archived-events/Consular-Camp-Eindhoven/IMG_4337.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927506/archived-events/Consular-Camp-Eindhoven/IMG_4337-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927510/archived-events/Consular-Camp-Eindhoven/IMG_4342.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927498/archived-events/Consular-Camp-Eindhoven/IMG_4349.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927516/archived-events/Consular-Camp-Eindhoven/IMG_4349-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927505/archived-events/Consular-Camp-Eindhoven/IMG_4353.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927514/archived-events/Consular-Camp-Eindhoven/IMG_4354.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927499/archived-events/Consular-Camp-Eindhoven/IMG_4354-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927512/archived-events/Consular-Camp-Eindhoven/IMG_4357.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927491/archived-events/Consular-Camp-Eindhoven/IMG_4358.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927489/archived-events/Consular-Camp-Eindhoven/IMG_4359.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927495/archived-events/Consular-Camp-Eindhoven/IMG_4363.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927488/archived-events/Consular-Camp-Eindhoven/IMG_4365.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/Consular-Camp-Eindhoven/"
-  },
-  {
-    "event_id": "4721",
-    "event_name": "Prasadam distribution @TTD",
-    "event_date": "2024-12-05",
-    "cloudinary_folder": "Prasadam-distribution-TTD",
-    "photo_count": 13,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912744/archived-events/Prasadam-distribution-TTD/467397186_538803928980065_270277980308167114_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912743/archived-events/Prasadam-distribution-TTD/467403683_538803762313415_1194791610628560050_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912734/archived-events/Prasadam-distribution-TTD/467425510_538803775646747_3751612088455197287_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912742/archived-events/Prasadam-distribution-TTD/467432279_538804105646714_8013889360153789936_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912746/archived-events/Prasadam-distribution-TTD/467434363_538803978980060_1956315521740836181_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912744/archived-events/Prasadam-distribution-TTD/467487057_538803792313412_4864181777718889675_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912737/archived-events/Prasadam-distribution-TTD/467487059_538804065646718_2977507205226866824_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912736/archived-events/Prasadam-distribution-TTD/467511317_538804005646724_6963694171069027687_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912745/archived-events/Prasadam-distribution-TTD/467517216_538804035646721_4343603649708907810_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912741/archived-events/Prasadam-distribution-TTD/467520768_538803872313404_6668105008673718766_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912738/archived-events/Prasadam-distribution-TTD/467533308_538804125646712_5948019884567505341_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912740/archived-events/Prasadam-distribution-TTD/467533495_538803905646734_6218675697068070366_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912739/archived-events/Prasadam-distribution-TTD/467550188_538803955646729_3862052737963782031_n.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/Prasadam-distribution-TTD/"
-  },
-  {
-    "event_id": "4639",
-    "event_name": "Het Hoge Heem @Uithoorn",
-    "event_date": "2024-12-05",
-    "cloudinary_folder": "Het-Hoge-Heem-Uithoorn",
-    "photo_count": 70,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927403/archived-events/Het-Hoge-Heem-Uithoorn/1a6461ca-0487-434d-a021-7c16354c06c6.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927371/archived-events/Het-Hoge-Heem-Uithoorn/DSC03999.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927461/archived-events/Het-Hoge-Heem-Uithoorn/DSC04008.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927417/archived-events/Het-Hoge-Heem-Uithoorn/DSC04008-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927460/archived-events/Het-Hoge-Heem-Uithoorn/DSC04020.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927464/archived-events/Het-Hoge-Heem-Uithoorn/DSC04022.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927466/archived-events/Het-Hoge-Heem-Uithoorn/DSC04036.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927410/archived-events/Het-Hoge-Heem-Uithoorn/DSC04049.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927430/archived-events/Het-Hoge-Heem-Uithoorn/DSC04053.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927449/archived-events/Het-Hoge-Heem-Uithoorn/DSC04055.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927408/archived-events/Het-Hoge-Heem-Uithoorn/DSC04075.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927422/archived-events/Het-Hoge-Heem-Uithoorn/DSC04079.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927400/archived-events/Het-Hoge-Heem-Uithoorn/DSC04099.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927404/archived-events/Het-Hoge-Heem-Uithoorn/DSC04102.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927393/archived-events/Het-Hoge-Heem-Uithoorn/DSC04113.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927441/archived-events/Het-Hoge-Heem-Uithoorn/DSC04122.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927418/archived-events/Het-Hoge-Heem-Uithoorn/DSC04128.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927443/archived-events/Het-Hoge-Heem-Uithoorn/DSC04136.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927434/archived-events/Het-Hoge-Heem-Uithoorn/DSC04137.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927456/archived-events/Het-Hoge-Heem-Uithoorn/DSC04187.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927457/archived-events/Het-Hoge-Heem-Uithoorn/DSC04197.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927450/archived-events/Het-Hoge-Heem-Uithoorn/DSC04230.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927444/archived-events/Het-Hoge-Heem-Uithoorn/DSC04242.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927420/archived-events/Het-Hoge-Heem-Uithoorn/DSC04247.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927412/archived-events/Het-Hoge-Heem-Uithoorn/DSC04289.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927414/archived-events/Het-Hoge-Heem-Uithoorn/DSC04302.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927391/archived-events/Het-Hoge-Heem-Uithoorn/DSC04307.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927426/archived-events/Het-Hoge-Heem-Uithoorn/DSC04318.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927447/archived-events/Het-Hoge-Heem-Uithoorn/DSC04344-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927463/archived-events/Het-Hoge-Heem-Uithoorn/DSC04357.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927389/archived-events/Het-Hoge-Heem-Uithoorn/DSC04375.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927383/archived-events/Het-Hoge-Heem-Uithoorn/DSC04389.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927458/archived-events/Het-Hoge-Heem-Uithoorn/DSC04395.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927387/archived-events/Het-Hoge-Heem-Uithoorn/DSC04412.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927379/archived-events/Het-Hoge-Heem-Uithoorn/DSC04414.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927377/archived-events/Het-Hoge-Heem-Uithoorn/DSC04428.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927455/archived-events/Het-Hoge-Heem-Uithoorn/DSC04434.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927439/archived-events/Het-Hoge-Heem-Uithoorn/DSC04452.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927413/archived-events/Het-Hoge-Heem-Uithoorn/DSC04470.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927398/archived-events/Het-Hoge-Heem-Uithoorn/DSC04488.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927405/archived-events/Het-Hoge-Heem-Uithoorn/DSC04498.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927454/archived-events/Het-Hoge-Heem-Uithoorn/DSC04510-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927446/archived-events/Het-Hoge-Heem-Uithoorn/DSC04518.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927390/archived-events/Het-Hoge-Heem-Uithoorn/DSC04529.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927459/archived-events/Het-Hoge-Heem-Uithoorn/DSC04544.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927380/archived-events/Het-Hoge-Heem-Uithoorn/DSC04548.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927382/archived-events/Het-Hoge-Heem-Uithoorn/DSC04571.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927374/archived-events/Het-Hoge-Heem-Uithoorn/DSC04589.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927467/archived-events/Het-Hoge-Heem-Uithoorn/DSC04591.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927395/archived-events/Het-Hoge-Heem-Uithoorn/DSC04609.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927452/archived-events/Het-Hoge-Heem-Uithoorn/DSC04609-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927385/archived-events/Het-Hoge-Heem-Uithoorn/DSC04610.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927375/archived-events/Het-Hoge-Heem-Uithoorn/DSC04614.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927377/archived-events/Het-Hoge-Heem-Uithoorn/DSC04628.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927370/archived-events/Het-Hoge-Heem-Uithoorn/DSC04629.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927425/archived-events/Het-Hoge-Heem-Uithoorn/DSC04697.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927431/archived-events/Het-Hoge-Heem-Uithoorn/DSC04709.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927407/archived-events/Het-Hoge-Heem-Uithoorn/DSC04713.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927436/archived-events/Het-Hoge-Heem-Uithoorn/DSC04718.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927428/archived-events/Het-Hoge-Heem-Uithoorn/DSC04720.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927423/archived-events/Het-Hoge-Heem-Uithoorn/DSC04723.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927381/archived-events/Het-Hoge-Heem-Uithoorn/e4f4c40a-45ef-4f5c-9944-f30e10a5c1b0.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927399/archived-events/Het-Hoge-Heem-Uithoorn/IMG_9468.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927435/archived-events/Het-Hoge-Heem-Uithoorn/IMG_9470.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927438/archived-events/Het-Hoge-Heem-Uithoorn/IMG_9471.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927450/archived-events/Het-Hoge-Heem-Uithoorn/IMG_9472.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927447/archived-events/Het-Hoge-Heem-Uithoorn/IMG_9473.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927433/archived-events/Het-Hoge-Heem-Uithoorn/IMG_9474.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927402/archived-events/Het-Hoge-Heem-Uithoorn/WhatsApp-Image-2024-12-05-at-13.12.20.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765927386/archived-events/Het-Hoge-Heem-Uithoorn/WhatsApp-Image-2024-12-05-at-13.12.27.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/Het-Hoge-Heem-Uithoorn/"
-  },
-  {
-    "event_id": "4550",
-    "event_name": "Women Hormonal Health Session @Uithoorn",
-    "event_date": "2024-11-07",
-    "cloudinary_folder": "Women-Hormonal-Health-Session-Uithoorn",
-    "photo_count": 11,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913326/archived-events/Women-Hormonal-Health-Session-Uithoorn/465404855_530527493141042_6532125997675173468_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913327/archived-events/Women-Hormonal-Health-Session-Uithoorn/465588877_530527576474367_1765152205158617910_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913329/archived-events/Women-Hormonal-Health-Session-Uithoorn/465696919_530528043140987_4668979549312427905_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913324/archived-events/Women-Hormonal-Health-Session-Uithoorn/465705913_530527339807724_3168599636796389720_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913323/archived-events/Women-Hormonal-Health-Session-Uithoorn/465718350_530598386467286_2362592496563874597_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913328/archived-events/Women-Hormonal-Health-Session-Uithoorn/465731683_530528243140967_2247933427441038597_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913324/archived-events/Women-Hormonal-Health-Session-Uithoorn/465776451_530527966474328_8909935175257045626_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913329/archived-events/Women-Hormonal-Health-Session-Uithoorn/465778931_530527916474333_6928981564973656457_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913328/archived-events/Women-Hormonal-Health-Session-Uithoorn/465795967_530528203140971_1321302522214150469_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913325/archived-events/Women-Hormonal-Health-Session-Uithoorn/465840246_530528263140965_1078174108182305462_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913322/archived-events/Women-Hormonal-Health-Session-Uithoorn/465907361_530598356467289_1302132857888901521_n.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/Women-Hormonal-Health-Session-Uithoorn/"
-  },
-  {
-    "event_id": "4494",
-    "event_name": "Deepawali in Philips @Eindhoven",
-    "event_date": "2024-11-07",
-    "cloudinary_folder": "Deepawali-in-Philips-Eindhoven",
-    "photo_count": 53,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911885/archived-events/Deepawali-in-Philips-Eindhoven/20241107_184328.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911911/archived-events/Deepawali-in-Philips-Eindhoven/IMG_8069.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911860/archived-events/Deepawali-in-Philips-Eindhoven/IMG_8070.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911861/archived-events/Deepawali-in-Philips-Eindhoven/IMG_8071.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911900/archived-events/Deepawali-in-Philips-Eindhoven/IMG_8091.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911895/archived-events/Deepawali-in-Philips-Eindhoven/IMG_8093.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911912/archived-events/Deepawali-in-Philips-Eindhoven/IMG_8096.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911864/archived-events/Deepawali-in-Philips-Eindhoven/IMG_8098.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911884/archived-events/Deepawali-in-Philips-Eindhoven/IMG_8100.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911882/archived-events/Deepawali-in-Philips-Eindhoven/IMG_8101.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911877/archived-events/Deepawali-in-Philips-Eindhoven/IMG_8102.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911910/archived-events/Deepawali-in-Philips-Eindhoven/IMG_8108.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911858/archived-events/Deepawali-in-Philips-Eindhoven/IMG_8110.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911908/archived-events/Deepawali-in-Philips-Eindhoven/IMG_8120.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911904/archived-events/Deepawali-in-Philips-Eindhoven/IMG_8122.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911897/archived-events/Deepawali-in-Philips-Eindhoven/IMG_8124.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911894/archived-events/Deepawali-in-Philips-Eindhoven/IMG_8125.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911899/archived-events/Deepawali-in-Philips-Eindhoven/IMG_8126.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911883/archived-events/Deepawali-in-Philips-Eindhoven/IMG_8129.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911898/archived-events/Deepawali-in-Philips-Eindhoven/IMG_8130.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911906/archived-events/Deepawali-in-Philips-Eindhoven/IMG_8134.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911890/archived-events/Deepawali-in-Philips-Eindhoven/IMG_8140.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911856/archived-events/Deepawali-in-Philips-Eindhoven/IMG-20241030-WA00241.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911888/archived-events/Deepawali-in-Philips-Eindhoven/IMG-20241030-WA0027.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911884/archived-events/Deepawali-in-Philips-Eindhoven/IMG-20241030-WA00331.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911892/archived-events/Deepawali-in-Philips-Eindhoven/IMG-20241030-WA0035.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911891/archived-events/Deepawali-in-Philips-Eindhoven/IMG-20241030-WA0037.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911887/archived-events/Deepawali-in-Philips-Eindhoven/IMG-20241030-WA00391.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911902/archived-events/Deepawali-in-Philips-Eindhoven/IMG-20241030-WA0045.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911879/archived-events/Deepawali-in-Philips-Eindhoven/IMG-20241030-WA0048.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911880/archived-events/Deepawali-in-Philips-Eindhoven/IMG-20241030-WA0049.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911901/archived-events/Deepawali-in-Philips-Eindhoven/IMG-20241030-WA0051.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911873/archived-events/Deepawali-in-Philips-Eindhoven/IMG-20241030-WA00521.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911868/archived-events/Deepawali-in-Philips-Eindhoven/IMG-20241030-WA00531.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911886/archived-events/Deepawali-in-Philips-Eindhoven/IMG-20241030-WA00541.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911902/archived-events/Deepawali-in-Philips-Eindhoven/IMG-20241030-WA0055.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911893/archived-events/Deepawali-in-Philips-Eindhoven/IMG-20241030-WA00561.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911886/archived-events/Deepawali-in-Philips-Eindhoven/IMG-20241030-WA00581.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911881/archived-events/Deepawali-in-Philips-Eindhoven/IMG-20241030-WA0061.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911858/archived-events/Deepawali-in-Philips-Eindhoven/IMG-20241030-WA0066.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911862/archived-events/Deepawali-in-Philips-Eindhoven/IMG-20241030-WA0067.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911903/archived-events/Deepawali-in-Philips-Eindhoven/IMG-20241030-WA0069.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911867/archived-events/Deepawali-in-Philips-Eindhoven/IMG-20241030-WA0070.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911898/archived-events/Deepawali-in-Philips-Eindhoven/IMG-20241030-WA00711.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911857/archived-events/Deepawali-in-Philips-Eindhoven/IMG-20241030-WA0072.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911863/archived-events/Deepawali-in-Philips-Eindhoven/IMG-20241030-WA0073.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911869/archived-events/Deepawali-in-Philips-Eindhoven/IMG-20241101-WA0050.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911854/archived-events/Deepawali-in-Philips-Eindhoven/IMG-20241101-WA0056.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911910/archived-events/Deepawali-in-Philips-Eindhoven/Screenshot_20241107-184548_Video-Player.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911891/archived-events/Deepawali-in-Philips-Eindhoven/Screenshot_20241107-184602_Video-Player.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911879/archived-events/Deepawali-in-Philips-Eindhoven/Screenshot_20241107-184650_Video-Player.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911859/archived-events/Deepawali-in-Philips-Eindhoven/Screenshot_20241107-184747_Video-Player.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911888/archived-events/Deepawali-in-Philips-Eindhoven/Screenshot_20241107-184809_Video-Player.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/Deepawali-in-Philips-Eindhoven/"
-  },
-  {
-    "event_id": "4414",
-    "event_name": "2024 EU-UK Indian Poetry  Idol",
-    "event_date": "2024-11-07",
-    "cloudinary_folder": "2024-EU-UK-Indian-Poetry-Idol",
-    "photo_count": 78,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911391/archived-events/2024-EU-UK-Indian-Poetry-Idol/112.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911389/archived-events/2024-EU-UK-Indian-Poetry-Idol/462783342_938950831607870_4137144332433861889_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911392/archived-events/2024-EU-UK-Indian-Poetry-Idol/462783342_938950831607870_4137144332433861889_n-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911378/archived-events/2024-EU-UK-Indian-Poetry-Idol/562.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911369/archived-events/2024-EU-UK-Indian-Poetry-Idol/772.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911390/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241006-132931_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911417/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241006-134916_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911412/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241006-135522_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911379/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241006-140803_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911402/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241006-141221_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911399/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241006-141317_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911395/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241006-141444_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911393/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241006-141528_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911375/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241006-141716_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911407/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241006-141744_Meet2.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911413/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241006-142125_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911403/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241006-142250_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911408/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241006-142317_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911390/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241006-142426_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911416/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241006-142504_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911393/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241006-142734_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911417/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241006-143234_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911398/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241006-143234_Meet-Copy.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911369/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241006-144119_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911415/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241006-144119_Meet-Copy.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911397/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241006-144736_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911380/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241006-145359_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911414/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241006-145522_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911398/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241006-150007_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911387/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241006-150704_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911377/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241006-150911_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911388/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241006-151529_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911394/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241006-151618_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911386/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241006-153004_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911397/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241006-153517_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911404/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241006-153947_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911375/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241006-154010_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911373/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241006-155051_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911386/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241006-161355_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911414/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241006-161950_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911372/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241006-162709_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911404/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241006-162842_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911409/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241006-163558_Meet2.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911400/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241006-164552_Meet2.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911378/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241006-164852_Meet2.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911402/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241019-120124_Meet2.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911374/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241019-120214_Meet3.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911370/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241019-120246_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911399/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241019-120246_Meet2.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911376/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241019-121402_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911377/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241019-122845_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911408/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241019-122845_Meet2.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911368/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241019-123329_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911412/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241019-123346_Meet2.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911389/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241019-123737_Meet2.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911367/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241019-124028_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911382/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241019-124045_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911367/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241019-124154_Meet2.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911384/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241019-124228_Meet2.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911374/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241019-124620_Meet2.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911382/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241019-125020_Meet2.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911411/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241019-125625_Meet2.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911406/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241019-130151_Meet2.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911396/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241019-130211_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911371/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241019-130211_Meet2.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911410/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241019-131526_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911396/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241019-131605_Meet2.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911405/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241019-131631_Meet2.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911381/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241019-131649_Meet2.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911405/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241019-131908_Meet2.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911373/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241019-131942_Meet2.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911415/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241019-132003_Meet.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911413/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241019-132550_Meet2.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911407/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241019-133109_Meet2.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911401/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241019-133225_Meet2.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911401/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241019-133518_Meet2.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911409/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241019-133657_Meet3.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911383/archived-events/2024-EU-UK-Indian-Poetry-Idol/Screenshot_20241019-133715_Meet4.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/2024-EU-UK-Indian-Poetry-Idol/"
-  },
-  {
-    "event_id": "4376",
-    "event_name": "Yoga Day @Philips",
-    "event_date": "2024-11-07",
-    "cloudinary_folder": "Yoga-Day-Philips",
-    "photo_count": 34,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913518/archived-events/Yoga-Day-Philips/29a1f5e3-0e3b-40a7-b59d-698454535639.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913537/archived-events/Yoga-Day-Philips/2e4fe170-365a-4f38-bb7e-4c57510e7682.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913518/archived-events/Yoga-Day-Philips/2ff2b08a-e6a7-45f5-a31f-aedc3020d86d.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913544/archived-events/Yoga-Day-Philips/30215c34-fde6-4535-bc96-559d3e64c646.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913525/archived-events/Yoga-Day-Philips/34952ece-4286-4c93-920a-d85afda20329.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913545/archived-events/Yoga-Day-Philips/3c7fab1f-d2ec-44ae-a577-28396eca556b.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913536/archived-events/Yoga-Day-Philips/3df38d59-75f1-439f-bd37-73e521b37cb4.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913547/archived-events/Yoga-Day-Philips/48f9094b-e08b-4937-8549-624c9e13d991.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913548/archived-events/Yoga-Day-Philips/4d95aa0e-fed4-4e5f-a928-848183fca461.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913527/archived-events/Yoga-Day-Philips/56ae040e-7fa6-42fd-8adb-5602a0a75248.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913528/archived-events/Yoga-Day-Philips/57d999d8-571c-4dc0-8626-1b95d6b750f2.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913532/archived-events/Yoga-Day-Philips/63de5ab3-bd4c-49f3-ad08-ebe52a332db4.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913529/archived-events/Yoga-Day-Philips/6a3466a9-66ae-4d54-944f-aef2c2cad769.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913532/archived-events/Yoga-Day-Philips/713b85e0-6fde-48ec-ac5a-3e04383a9e0e.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913546/archived-events/Yoga-Day-Philips/73d5bbb7-acfd-4b1c-a634-e5c168c364ef.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913517/archived-events/Yoga-Day-Philips/7e8b386a-2179-403d-a65c-087a2ad041ac.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913530/archived-events/Yoga-Day-Philips/95a9cbb6-12ac-45d3-add6-561d7f9b2415.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913543/archived-events/Yoga-Day-Philips/a02529fe-b7e1-493d-bd83-a358a3226273.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913524/archived-events/Yoga-Day-Philips/b13fbbc2-4d77-4738-95b0-59569eebbb27.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913530/archived-events/Yoga-Day-Philips/c818f429-8074-4e7e-9dc6-90e282fb2bf1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913528/archived-events/Yoga-Day-Philips/cb032b3a-2347-4d99-8931-af6ad25457e9.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913525/archived-events/Yoga-Day-Philips/d1c8e5a4-1c31-49dc-94ad-6838d34ea3df.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913549/archived-events/Yoga-Day-Philips/db20eb60-cf03-4003-9319-700631c2760a.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913546/archived-events/Yoga-Day-Philips/db56d9dc-e932-4e03-935e-592274fcc11e.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913535/archived-events/Yoga-Day-Philips/dcdd5f31-8e4d-4406-9782-54164f53b9d2.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913540/archived-events/Yoga-Day-Philips/df8d83d6-8bf6-4102-a51c-e9a802889fb2.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913520/archived-events/Yoga-Day-Philips/e03a5d84-4127-4065-b263-fc6f61b8046e.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913522/archived-events/Yoga-Day-Philips/e03a5d84-4127-4065-b263-fc6f61b8046e1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913521/archived-events/Yoga-Day-Philips/f27c9917-0c70-45ab-999a-463823b76e1b.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913544/archived-events/Yoga-Day-Philips/f27c9917-0c70-45ab-999a-463823b76e1b1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913533/archived-events/Yoga-Day-Philips/fd2220df-d567-4289-96a7-bd4f88351bfd.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913534/archived-events/Yoga-Day-Philips/ff1825a9-a5f2-4efb-b43a-725357d2f6fd.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913538/archived-events/Yoga-Day-Philips/ff1825a9-a5f2-4efb-b43a-725357d2f6fd1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913541/archived-events/Yoga-Day-Philips/IMG_7700.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/Yoga-Day-Philips/"
-  },
-  {
-    "event_id": "4164",
-    "event_name": "Hindi Diwas @The Gandhi Centre (Embassy of India)",
-    "event_date": "2024-09-13",
-    "cloudinary_folder": "Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India",
-    "photo_count": 44,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912238/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/459638311_928317295996154_2222041924057979313_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912236/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/459811992_497105979816527_8458898763173389975_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912258/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/459834625_497093886484403_7036884494540583286_n-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912234/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/460477859_497105899816535_5939053402499139433_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912243/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/460647013_497097886484003_3963754237709884624_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912246/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/460648284_497097859817339_6902513327500412739_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912235/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/460712328_497094073151051_389704009828504811_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912263/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/460714918_497094436484348_3234443169163455778_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912249/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/460716406_497106756483116_3951894615350618361_n-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912264/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/460718822_497094583151000_8676875055430651372_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912246/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/460718979_497094293151029_3513444947594492189_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912255/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/460726561_497105963149862_1794556779889106960_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912253/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/460745715_497093789817746_636279657921210462_n-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912261/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/460797876_497092969817828_8470441702198237043_n-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912267/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/460798741_497094379817687_969503662656764855_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912248/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/460806294_497094129817712_5029374626860276316_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912237/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/460806294_497105863149872_1395347915767764821_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912265/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/460830476_497092656484526_7403810434731863787_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912253/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/460848497_497093966484395_4710462554321487204_n-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912260/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/460870279_497092936484498_837929436658866348_n-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912238/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/460885466_497094149817710_7511409521908932140_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912240/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/460888681_497094513151007_2528405066684204394_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912239/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/460890563_497094259817699_7669355409827704561_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912259/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/460921052_497094106484381_7132974522133586644_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912242/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/460926330_497105786483213_8663908437037096184_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912262/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/460927635_497094546484337_701092058788579991_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912252/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/460927637_497094216484370_4226809210034681316_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912241/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/460928356_497094469817678_8271896541772921943_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912254/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/460930244_497093933151065_6744103250355917490_n-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912245/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/460938235_497094173151041_3269292275946293447_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912250/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/460951444_497094229817702_8273268926495267878_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912243/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/460951761_497094033151055_5261492684125712007_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912244/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/460965310_497094356484356_2721243986884734146_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912247/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/460972365_497094269817698_7082453995099074053_n-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912241/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/461018664_497097793150679_1241758370630919891_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912235/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/461028741_497093726484419_6113302561117225489_n-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912249/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/461041508_497096373150821_1285506687535716084_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912257/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/461051840_497094416484350_2119230849180433747_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912252/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/461060812_497094243151034_4904977126473201_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912256/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/461064139_497105929816532_4829288920218326625_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912265/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/461088539_497094006484391_332344168966055525_n-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912251/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/461089802_497105796483212_5694922370222948311_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912260/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/461129866_499839522876506_2486424516114489038_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912257/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/461268620_499839489543176_4224368237465326637_n.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/Hindi-Diwas-The-Gandhi-Centre-Embassy-of-India/"
-  },
-  {
-    "event_id": "4105",
-    "event_name": "HE Mrs Reenat Sandhu, Ambassador's Farewell @Den Haag",
-    "event_date": "2024-07-03",
-    "cloudinary_folder": "HE-Mrs-Reenat-Sandhu-Ambassadors-Farewell-Den-Haag",
-    "photo_count": 9,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912120/archived-events/HE-Mrs-Reenat-Sandhu-Ambassadors-Farewell-Den-Haag/eb9e371e-b476-4474-a5fb-8ce4e816a275.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912119/archived-events/HE-Mrs-Reenat-Sandhu-Ambassadors-Farewell-Den-Haag/IMG_4913.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912121/archived-events/HE-Mrs-Reenat-Sandhu-Ambassadors-Farewell-Den-Haag/IMG_4916.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912116/archived-events/HE-Mrs-Reenat-Sandhu-Ambassadors-Farewell-Den-Haag/IMG_4926.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912123/archived-events/HE-Mrs-Reenat-Sandhu-Ambassadors-Farewell-Den-Haag/IMG_4929.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912119/archived-events/HE-Mrs-Reenat-Sandhu-Ambassadors-Farewell-Den-Haag/PXL_20240623_135552847_Original.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912118/archived-events/HE-Mrs-Reenat-Sandhu-Ambassadors-Farewell-Den-Haag/PXL_20240623_142404738_Original.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912117/archived-events/HE-Mrs-Reenat-Sandhu-Ambassadors-Farewell-Den-Haag/PXL_20240623_142456870_Original.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912122/archived-events/HE-Mrs-Reenat-Sandhu-Ambassadors-Farewell-Den-Haag/PXL_20240623_142624971_Original.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/HE-Mrs-Reenat-Sandhu-Ambassadors-Farewell-Den-Haag/"
-  },
-  {
-    "event_id": "4082",
-    "event_name": "International Day of Yoga @Eindhoven",
-    "event_date": "2024-07-03",
-    "cloudinary_folder": "International-Day-of-Yoga-Eindhoven",
-    "photo_count": 18,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912520/archived-events/International-Day-of-Yoga-Eindhoven/012449dc-f8d5-4951-8023-dc89dc0fc9ea.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912512/archived-events/International-Day-of-Yoga-Eindhoven/18df55a2-30d8-4709-8790-913f163e3ccc.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912521/archived-events/International-Day-of-Yoga-Eindhoven/35bd32e1-a4a6-4526-83b6-4070f4aa01da.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912522/archived-events/International-Day-of-Yoga-Eindhoven/423adc9b-7b64-4ab0-9431-7c7a10df1e79.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912517/archived-events/International-Day-of-Yoga-Eindhoven/5e285740-d686-4424-ac25-46afd5d94b39.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912513/archived-events/International-Day-of-Yoga-Eindhoven/7d5e1590-0a29-4b2d-9edd-2dbeb9522849.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912516/archived-events/International-Day-of-Yoga-Eindhoven/8a64c0c2-f2b7-4a36-a8cc-2082359a4edb.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912525/archived-events/International-Day-of-Yoga-Eindhoven/8a7ed104-e7cc-4713-879b-a1f1f21cff8b.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912523/archived-events/International-Day-of-Yoga-Eindhoven/b00db554-5263-4298-b164-9e6f7f42f4a1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912524/archived-events/International-Day-of-Yoga-Eindhoven/f168e8ff-0a64-4a6d-b0f5-bcef22e6b86d.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912513/archived-events/International-Day-of-Yoga-Eindhoven/f32c4c5d-3a28-4ab1-a4cb-c1684d8fd4b7.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912523/archived-events/International-Day-of-Yoga-Eindhoven/fa1db31d-5f52-4e58-961c-e103dd84f10c.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912518/archived-events/International-Day-of-Yoga-Eindhoven/IMG_2099_Original.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912521/archived-events/International-Day-of-Yoga-Eindhoven/IMG_2106_Original.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912517/archived-events/International-Day-of-Yoga-Eindhoven/IMG_2116_Original.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912519/archived-events/International-Day-of-Yoga-Eindhoven/IMG_2122_Original.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912515/archived-events/International-Day-of-Yoga-Eindhoven/IMG_2142_Original.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912514/archived-events/International-Day-of-Yoga-Eindhoven/IMG_2174_Original.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/International-Day-of-Yoga-Eindhoven/"
-  },
-  {
-    "event_id": "3999",
-    "event_name": "Kalam, Mic & Muskurahat (Literary Fest)",
-    "event_date": "2024-05-13",
-    "cloudinary_folder": "Kalam-Mic-Muskurahat-Literary-Fest",
-    "photo_count": 49,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912596/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/10.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912592/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/12.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912594/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/13.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912584/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/14.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912609/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/2.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912604/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/20240413_173912.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912575/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/20240413_174126.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912599/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/20240413_1743452.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912611/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/20240413_174459.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912602/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/20240413_180221.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912578/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/20240413_181032.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912609/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/20240413_182523.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912589/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/20240413_183732.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912600/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/20240413_184324.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912583/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/20240413_184827.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912577/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/20240413_185532.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912605/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/20240413_190243.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912582/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/20240413_190728.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912589/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/20240413_191652.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912601/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/20240413_192142.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912603/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/20240413_192802.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912586/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/20240413_193720.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912591/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/20240413_193859.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912573/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/20240413_194212.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912580/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/20240413_194628.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912590/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/20240413_195347.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912613/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/20240413_200216.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912597/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/20240413_200918.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912599/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/20240413_200921.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912594/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/20240413_200929.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912613/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/20240413_200940.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912587/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/20240413_201012.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912610/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/20240413_202600.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912606/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/20240413_205752.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912593/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/20240413_205845.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912612/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/3.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912604/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/4.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912580/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/435265268_446819007878983_7559777023955655902_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912595/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/435283461_446818947878989_5912971574377097047_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912581/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/435283461_446818947878989_5912971574377097047_n-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912582/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/435303475_446819021212315_2058615655324984211_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912611/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/435316840_446819094545641_9034012859890061897_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912588/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/435317559_446819051212312_7916016624743869386_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912576/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/435321785_446819054545645_3408349634804084255_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912607/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/435926442_396409853219474_1020678329872150453_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912597/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/436953591_446826167878267_7253198610821159413_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912606/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/5.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912608/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/6.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912607/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/7.png"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/Kalam-Mic-Muskurahat-Literary-Fest/"
-  },
-  {
-    "event_id": "3719",
-    "event_name": "Holi Festival 2024 @The Gandhi Centre",
-    "event_date": "2024-03-25",
-    "cloudinary_folder": "Holi-Festival-2024-The-Gandhi-Centre",
-    "photo_count": 94,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912294/archived-events/Holi-Festival-2024-The-Gandhi-Centre/2b8ea283-ab95-48f7-856b-e5fe36ee1657.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912308/archived-events/Holi-Festival-2024-The-Gandhi-Centre/3d2eb2ed-d475-4cca-b807-8572bc0a9829.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912299/archived-events/Holi-Festival-2024-The-Gandhi-Centre/471f6e20-a6ff-4042-b795-de8b35cd868b.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912310/archived-events/Holi-Festival-2024-The-Gandhi-Centre/6a010ccf-8a10-4723-98a8-707a24ec99da.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912300/archived-events/Holi-Festival-2024-The-Gandhi-Centre/8c94a016-378d-4bb2-b855-dd2161eba5b0.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912333/archived-events/Holi-Festival-2024-The-Gandhi-Centre/97c2f1e8-60c0-4f68-881b-ba2cc5968947.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912309/archived-events/Holi-Festival-2024-The-Gandhi-Centre/abe196f7-b387-4c2d-87b4-0a94ca48a7bf.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912288/archived-events/Holi-Festival-2024-The-Gandhi-Centre/c923addb-7c88-4ea5-964f-914531609a04.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912351/archived-events/Holi-Festival-2024-The-Gandhi-Centre/e9eccd56-e8e7-4780-861a-f0364aba09f9.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912289/archived-events/Holi-Festival-2024-The-Gandhi-Centre/ecec67e4-1d77-4d23-a17e-89820872d26a.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912355/archived-events/Holi-Festival-2024-The-Gandhi-Centre/Image_000_10.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912341/archived-events/Holi-Festival-2024-The-Gandhi-Centre/Image_000_12.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912347/archived-events/Holi-Festival-2024-The-Gandhi-Centre/Image_000_13.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912321/archived-events/Holi-Festival-2024-The-Gandhi-Centre/Image_000_14.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912333/archived-events/Holi-Festival-2024-The-Gandhi-Centre/Image_000_17.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912285/archived-events/Holi-Festival-2024-The-Gandhi-Centre/Image_000_19.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912269/archived-events/Holi-Festival-2024-The-Gandhi-Centre/Image_000_20.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912335/archived-events/Holi-Festival-2024-The-Gandhi-Centre/Image_1_11.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912324/archived-events/Holi-Festival-2024-The-Gandhi-Centre/Image_1_12.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912348/archived-events/Holi-Festival-2024-The-Gandhi-Centre/Image_1_17.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912278/archived-events/Holi-Festival-2024-The-Gandhi-Centre/Image_1_20.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912275/archived-events/Holi-Festival-2024-The-Gandhi-Centre/Image_1_21.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912316/archived-events/Holi-Festival-2024-The-Gandhi-Centre/Image_1_8.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912315/archived-events/Holi-Festival-2024-The-Gandhi-Centre/Image_200_Original.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912284/archived-events/Holi-Festival-2024-The-Gandhi-Centre/Image_202_2.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912292/archived-events/Holi-Festival-2024-The-Gandhi-Centre/Image_202_Original.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912331/archived-events/Holi-Festival-2024-The-Gandhi-Centre/Image_212.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912325/archived-events/Holi-Festival-2024-The-Gandhi-Centre/Image_213.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912344/archived-events/Holi-Festival-2024-The-Gandhi-Centre/Image_214.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912349/archived-events/Holi-Festival-2024-The-Gandhi-Centre/Image_216.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912272/archived-events/Holi-Festival-2024-The-Gandhi-Centre/Image_218.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912312/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0125.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912293/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0129.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912318/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0133.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912311/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0134.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912330/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0140.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912337/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0142.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912328/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0154.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912327/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0155.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912282/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0158.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912280/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0159.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912281/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0164.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912350/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0178.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912331/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0183.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912348/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0232.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912339/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0235.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912304/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0254.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912302/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0259.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912295/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0267.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912308/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0309.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912319/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0318.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912289/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0512.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912298/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0514.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912296/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0515.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912301/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0517.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912320/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0522.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912311/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0531.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912303/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0532.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912345/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0542.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912322/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0545.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912334/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0546.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912335/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0552.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912279/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0563.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912268/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0565.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912270/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0567.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912273/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0572.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912283/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0574.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912279/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0577.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912353/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0582.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912274/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0589.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912339/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0590.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912354/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0596.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912274/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0599.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912271/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0611.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912276/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0614.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912343/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0620.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912342/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0621.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912352/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0623.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912277/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0629.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912338/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0631.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912327/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0633.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912305/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0650.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912297/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0662.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912287/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0664.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912286/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0665.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912292/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0666.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912318/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0668.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912317/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0669.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912287/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0671.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912305/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0678.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912313/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_0680.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912295/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_9904.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912298/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_9917.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912314/archived-events/Holi-Festival-2024-The-Gandhi-Centre/IMG_9922.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/Holi-Festival-2024-The-Gandhi-Centre/"
-  },
-  {
-    "event_id": "3679",
-    "event_name": "Embassy Consular Camp @Eindhoven",
-    "event_date": "2024-03-03",
-    "cloudinary_folder": "Embassy-Consular-Camp-Eindhoven",
-    "photo_count": 36,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911947/archived-events/Embassy-Consular-Camp-Eindhoven/d8b42fb1-dea1-48fa-8dd6-c7fe4a58da82.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911950/archived-events/Embassy-Consular-Camp-Eindhoven/IMG_9069.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911962/archived-events/Embassy-Consular-Camp-Eindhoven/IMG_9070.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911966/archived-events/Embassy-Consular-Camp-Eindhoven/IMG_9076.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911949/archived-events/Embassy-Consular-Camp-Eindhoven/IMG_9079.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911942/archived-events/Embassy-Consular-Camp-Eindhoven/IMG_9079-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911946/archived-events/Embassy-Consular-Camp-Eindhoven/IMG_9087.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911944/archived-events/Embassy-Consular-Camp-Eindhoven/IMG_9090.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911955/archived-events/Embassy-Consular-Camp-Eindhoven/IMG_9094.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911963/archived-events/Embassy-Consular-Camp-Eindhoven/IMG_9101.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911959/archived-events/Embassy-Consular-Camp-Eindhoven/IMG_9104.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911954/archived-events/Embassy-Consular-Camp-Eindhoven/IMG_9108.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911960/archived-events/Embassy-Consular-Camp-Eindhoven/IMG_9110.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911957/archived-events/Embassy-Consular-Camp-Eindhoven/IMG_9111.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911956/archived-events/Embassy-Consular-Camp-Eindhoven/IMG_9112.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911963/archived-events/Embassy-Consular-Camp-Eindhoven/IMG_9114.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911965/archived-events/Embassy-Consular-Camp-Eindhoven/IMG_9117.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911947/archived-events/Embassy-Consular-Camp-Eindhoven/IMG_9118.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911952/archived-events/Embassy-Consular-Camp-Eindhoven/IMG_9120.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911948/archived-events/Embassy-Consular-Camp-Eindhoven/IMG_9125.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911964/archived-events/Embassy-Consular-Camp-Eindhoven/IMG_9129.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911971/archived-events/Embassy-Consular-Camp-Eindhoven/IMG_9129-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911945/archived-events/Embassy-Consular-Camp-Eindhoven/IMG_9132.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911951/archived-events/Embassy-Consular-Camp-Eindhoven/IMG_9135.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911958/archived-events/Embassy-Consular-Camp-Eindhoven/IMG_9138.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911939/archived-events/Embassy-Consular-Camp-Eindhoven/IMG_9142.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911972/archived-events/Embassy-Consular-Camp-Eindhoven/IMG_9161.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911967/archived-events/Embassy-Consular-Camp-Eindhoven/IMG_9165.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911943/archived-events/Embassy-Consular-Camp-Eindhoven/IMG_9169.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911940/archived-events/Embassy-Consular-Camp-Eindhoven/IMG_9180.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911938/archived-events/Embassy-Consular-Camp-Eindhoven/IMG_9184.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911937/archived-events/Embassy-Consular-Camp-Eindhoven/IMG_9186.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911969/archived-events/Embassy-Consular-Camp-Eindhoven/IMG_9188.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911941/archived-events/Embassy-Consular-Camp-Eindhoven/IMG_9209.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911968/archived-events/Embassy-Consular-Camp-Eindhoven/IMG_9211.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911970/archived-events/Embassy-Consular-Camp-Eindhoven/IMG_9216.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/Embassy-Consular-Camp-Eindhoven/"
-  },
-  {
-    "event_id": "3657",
-    "event_name": "International Women's Day",
-    "event_date": "2024-03-03",
-    "cloudinary_folder": "International-Womens-Day",
-    "photo_count": 13,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912534/archived-events/International-Womens-Day/17.png",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912536/archived-events/International-Womens-Day/34.png",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912535/archived-events/International-Womens-Day/39.png",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912541/archived-events/International-Womens-Day/44.png",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912542/archived-events/International-Womens-Day/52.png",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912539/archived-events/International-Womens-Day/7.png",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912533/archived-events/International-Womens-Day/8.png",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912540/archived-events/International-Womens-Day/Brown-Beige-Minimalist-Fall-Leaves-Photo-Collage-Facebook-Post-3.png",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912531/archived-events/International-Womens-Day/ParticipantList.png",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912532/archived-events/International-Womens-Day/PhotoCard-Collage.png",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912530/archived-events/International-Womens-Day/Womens-Day-Prose-Poetry.png",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912535/archived-events/International-Womens-Day/Womens-Day-Prose-Poetry-FOR-WEBSITE_FINAL.png",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912537/archived-events/International-Womens-Day/Womens-Day-Prose-Poetry-FOR-WEBSITE_FINAL-1.png"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/International-Womens-Day/"
-  },
-  {
-    "event_id": "3607",
-    "event_name": "'Bura Na Mano, 'HOLI' hai! @Uithoorn",
-    "event_date": "2024-02-09",
-    "cloudinary_folder": "2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn",
-    "photo_count": 150,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922283/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/136d7de5-0436-4a2f-a495-477a1822c637.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922331/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/136d7de5-0436-4a2f-a495-477a1822c637-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922321/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/20240323_193818.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922319/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/20240323_193818-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922262/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/28fcef94-fbfd-46e9-b671-7507a1af7216.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922287/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/28fcef94-fbfd-46e9-b671-7507a1af7216-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922327/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/35b9b70f-b82a-4329-8584-12cb94e704cd.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922313/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/35b9b70f-b82a-4329-8584-12cb94e704cd-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922346/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/427936302_360425180151275_564656730176584510_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922332/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/46c6da13-654b-4409-9a13-93da7c2f2295.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922285/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/46c6da13-654b-4409-9a13-93da7c2f2295-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922366/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/6a481306-d5e0-4c3e-a421-ff66fdf8f56d.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922301/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/6a481306-d5e0-4c3e-a421-ff66fdf8f56d-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922364/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/6e47815c-329a-4a07-89b1-26b95fe9631c.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922316/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/6e47815c-329a-4a07-89b1-26b95fe9631c-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922318/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/b37eba39-378b-4ab7-a956-7712768b698f.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922307/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/b37eba39-378b-4ab7-a956-7712768b698f-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922311/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/b8fd0daf-6cb4-464f-a6a3-9039a519211b.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922345/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/b8fd0daf-6cb4-464f-a6a3-9039a519211b-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922267/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/cc68ce9c-9d3f-4e3f-977a-ceecc20966c3.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922350/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/cc68ce9c-9d3f-4e3f-977a-ceecc20966c3-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922347/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/dcf03838-19d6-4dd1-9937-e21708a66b68.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922264/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/dcf03838-19d6-4dd1-9937-e21708a66b68-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922296/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/e80507f2-85b5-4e92-a360-aae76e73fd4d.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922263/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/e80507f2-85b5-4e92-a360-aae76e73fd4d-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922255/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/f23591b0-1d1e-41ab-9287-9a7c307292fb.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922344/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/f23591b0-1d1e-41ab-9287-9a7c307292fb-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922292/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Flyer_Website.png",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922300/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Flyer_Website_FINAL.png",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922315/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Flyer_Website_FINAL-1.png",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922324/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Flyer_Website_FINAL-2.png",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922324/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Flyer_Website_FINAL-3.png",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922284/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Holi-Flyer_FINAL.png",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922379/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Holi-Flyer_Sold-Out.png",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922381/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_000_10.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922356/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_000_12.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922368/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_000_13.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922329/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_000_14.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922343/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_000_17.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922288/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_000_19.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922260/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_000_22.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922279/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_000_24.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922290/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_000_25.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922269/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_000_27.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922280/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_000_30.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922289/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_000_31.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922278/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_000_32.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922268/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_000_33.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922257/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_000_34.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922253/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_000_35.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922258/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_000_36.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922380/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_000_38.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922371/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_000_39.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922305/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_1_0.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922315/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_1_0-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922302/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_1_1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922374/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_1_1-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922350/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_1_11.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922317/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_1_11-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922334/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_1_12.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922365/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_1_12-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922341/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_1_13.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922325/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_1_13-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922359/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_1_14.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922339/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_1_14-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922362/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_1_15.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922312/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_1_15-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922373/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_1_17.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922306/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_1_17-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922299/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_1_2.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922328/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_1_2-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922276/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_1_20.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922297/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_1_20-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922272/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_1_21.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922256/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_1_21-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922299/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_1_3.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922361/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_1_3-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922292/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_1_4.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922311/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_1_4-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922293/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_1_5.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922342/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_1_5-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922296/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_1_7.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922345/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_1_7-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922323/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_1_8.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922298/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_1_8-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922326/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_1_9.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922281/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_1_9-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922368/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_185_199_Original.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922308/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_185_199_Original-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922357/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_187_1_Original.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922355/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_187_1_Original-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922331/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_188_Original.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922314/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_188_Original-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922313/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_191_Original.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922370/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_191_Original-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922304/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_193_Original.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922309/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_193_Original-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922303/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_194_Original.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922309/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_194_Original-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922294/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_195_Original.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922318/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_195_Original-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922322/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_197_Original.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922351/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_197_Original-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922274/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_198_Original.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922335/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_198_Original-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922254/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_199_Original.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922320/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_200_Original.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922295/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_202_Original.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922376/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_203.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922353/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_205.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922337/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_206.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922337/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_207.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922264/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/Image_207-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922358/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/IMG-20240324-WA0040.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922363/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/IMG-20240324-WA0041.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922377/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/IMG-20240324-WA0042.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922374/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/IMG-20240324-WA0043.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922354/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/IMG-20240324-WA0044.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922348/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/IMG-20240324-WA0045.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922336/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/IMG-20240324-WA0046.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922340/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/IMG-20240324-WA0047.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922276/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/IMG-20240324-WA0048.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922274/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/IMG-20240324-WA0049.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922353/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/IMG-20240324-WA0050.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922349/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/IMG-20240324-WA0051.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922333/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/IMG-20240324-WA0052.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922342/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/IMG-20240324-WA0053.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922358/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/IMG-20240324-WA0054.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922363/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/IMG-20240324-WA0055.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922378/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/IMG-20240324-WA0056.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922371/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/IMG-20240324-WA0057.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922261/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/IMG-20240324-WA0058.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922266/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/IMG-20240324-WA0059.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922277/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/IMG-20240324-WA0060.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922271/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/IMG-20240324-WA0061.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922282/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/IMG-20240324-WA0062.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922288/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/IMG-20240324-WA0063.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922262/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/IMG-20240324-WA0064.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922265/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/IMG-20240324-WA0065.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922256/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/IMG-20240324-WA0066.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922254/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/IMG-20240324-WA0067.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922291/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/IMG-20240324-WA0067-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922360/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/IMG-20240324-WA0068.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922376/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/IMG-20240324-WA0068-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922263/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/IMG-20240324-WA0070.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922284/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/WhatsApp-Image-2024-03-25-at-22.29.27.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922348/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/WhatsApp-Image-2024-03-25-at-22.29.28.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922286/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/WhatsApp-Image-2024-03-25-at-22.29.28-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922282/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/WhatsApp-Image-2024-03-26-at-16.07.27.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765922330/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/WhatsApp-Image-2024-03-26-at-16.07.27-1.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/2024-02-Bura-Na-Mano-HOLI-hai-Uithoorn/"
-  },
-  {
-    "event_id": "3368",
-    "event_name": "Shri Ram Mandir 'Pran Prathistha' @Den Haag",
-    "event_date": "2024-01-22",
-    "cloudinary_folder": "Shri-Ram-Mandir-Pran-Prathistha-Den-Haag",
-    "photo_count": 58,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912779/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/1d1c2954-eeac-465b-9e62-77915799cb4e.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912790/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/78718993-ef73-4164-bfbe-bed2299e9d11.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912827/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/78b17b82-0baf-4803-ae82-ebd4f5182be7.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912770/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/7e413b41-8dbc-4d6a-af8c-132b980dae81.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912822/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/93ace764-d7f0-4afc-bfad-84d5eca9af09.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912775/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/c208ad95-7f75-44e0-a128-f952ce1e5d74.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912798/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/ebcd6279-ef25-4267-8efd-81c5e176b10a.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912787/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/ecf06988-b23a-42d4-a4ce-51f34edc76d3.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912805/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/f52c9579-73ef-472a-861e-de0925ad725c.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912792/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/ff02d590-feb3-4fd6-a33d-47f4bfc09c8b.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912800/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8153.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912807/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8154.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912809/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8155.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912811/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8156.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912810/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8157.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912791/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8162.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912784/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8173.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912795/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8185.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912802/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8186.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912782/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8198.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912792/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8200.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912793/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8201.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912789/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8202.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912789/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8203.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912786/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8212.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912786/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8213.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912788/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8217.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912808/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8223.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912797/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8224.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912826/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8243.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912819/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8244.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912820/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8245.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912816/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8247.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912776/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8249.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912821/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8251.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912817/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8252.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912825/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8257.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912775/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8258.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912781/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8263.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912772/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8264.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912771/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8265.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912774/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8270.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912777/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8275.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912821/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8286.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912780/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8288.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912814/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8290.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912819/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8291.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912824/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8296.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912778/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8301.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912813/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8333.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912824/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8334.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912823/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8335.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912794/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8344.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912804/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8346.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912800/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8347.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912803/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8352.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912801/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8353.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912812/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/IMG_8354.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/Shri-Ram-Mandir-Pran-Prathistha-Den-Haag/"
-  },
-  {
-    "event_id": "3030",
-    "event_name": "Gita Mahotsav 2023 @The Gandhi Centre",
-    "event_date": "2023-12-02",
-    "cloudinary_folder": "Gita-Mahotsav-2023-The-Gandhi-Centre",
-    "photo_count": 107,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912063/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/20231216_162510.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912070/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/20231216_162856.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912051/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/20231216_163959.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912085/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/20231216_171439.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912108/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/20231216_173923.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912059/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/IMG_6414.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912079/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/IMG_6430.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912071/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/IMG_6433.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912040/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/IMG_6448.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912109/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/IMG_6452.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912104/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/IMG_6453.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912028/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/IMG_6506.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912032/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/IMG_6516.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912046/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/IMG_6567.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912055/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/IMG_6570.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912073/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/IMG_6590.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912080/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/IMG_6592.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912045/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/IMG_6599.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912060/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/IMG_6602.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912052/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/IMG_6607.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912096/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/IMG_6609.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912069/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/IMG_6614.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912067/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/IMG_6615.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912035/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/IMG_6660.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912030/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/IMG_6665.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912028/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/IMG_6739.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912072/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/IMG_6745.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912076/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/IMG_6750.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912092/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/IMG_6754.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912047/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/IMG_6771.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912068/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/IMG_6774.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912062/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/IMG_6776.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912081/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/IMG_6790.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912105/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/IMG_6862.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912027/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/IMG_6923.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912044/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/IMG_6924.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912034/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/IMG_6927.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912033/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/IMG_6933.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912019/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/IMG_6934.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912021/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231217-100247_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912082/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231217-100604_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912099/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231217-100732_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912102/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231217-101711_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912101/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231217-101832_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912043/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231217-101923_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912090/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231217-102055_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912018/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231217-102211_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912097/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231217-102328_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912100/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231217-102523_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912026/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231217-102543_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912091/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231217-102653_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912075/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231217-102753_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912066/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231217-102804_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912074/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231217-102952_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912111/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231217-103155_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912049/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231217-103210_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912067/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231217-103433_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912050/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231217-103444_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912036/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231217-103508_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912063/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231217-103535_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912098/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231217-103628_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912065/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231217-103738_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912084/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231217-103818_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912110/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231217-104000_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912049/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231217-104108_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912103/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231217-112959_Facebook2.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912044/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231217-113348_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912029/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231217-113505_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912115/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231217-113547_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912093/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231218-131953_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912039/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231218-132152_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912041/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231218-132318_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912083/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231218-132350_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912094/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231218-132410_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912115/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231218-132705_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912053/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231218-133940_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912100/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231218-133957_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912072/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231218-134035_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912056/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231218-134047_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912060/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231218-134112_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912078/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231218-134150_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912109/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231218-134326_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912111/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231218-134434_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912031/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231218-134454_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912020/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231218-134530_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912098/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231218-134611_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912037/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231218-134818_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912045/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231218-135018_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912076/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231218-135018_Facebook2.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912083/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231218-135202_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912058/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231218-135530_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912112/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231218-135610_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912113/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231218-135642_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912104/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231218-135651_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912114/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231218-135921_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912019/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231218-140001_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912025/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231218-140022_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912106/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231218-140033_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912031/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231218-140047_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912057/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231218-140118_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912023/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231218-140131_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912079/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231218-140216_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912095/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231218-140250_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912107/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231218-140349_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912054/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231218-140413_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912042/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231218-140428_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912095/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/Screenshot_20231218-140521_Facebook.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/Gita-Mahotsav-2023-The-Gandhi-Centre/"
-  },
-  {
-    "event_id": "2481",
-    "event_name": "India's Independence Day @The India House",
-    "event_date": "2023-10-29",
-    "cloudinary_folder": "Indias-Independence-Day-The-India-House",
-    "photo_count": 26,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912512/archived-events/Indias-Independence-Day-The-India-House/962e7862-56bb-4b52-9d8b-f6736e1bd295.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912488/archived-events/Indias-Independence-Day-The-India-House/d485433b-a6c3-4d42-840e-92e1d63df1a1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912490/archived-events/Indias-Independence-Day-The-India-House/e0d16d25-3a14-4f88-bde5-94a4e490747f.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912506/archived-events/Indias-Independence-Day-The-India-House/IMG_2686.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912500/archived-events/Indias-Independence-Day-The-India-House/IMG_2687.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912495/archived-events/Indias-Independence-Day-The-India-House/IMG_2695.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912493/archived-events/Indias-Independence-Day-The-India-House/IMG_2696.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912492/archived-events/Indias-Independence-Day-The-India-House/IMG_2705.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912491/archived-events/Indias-Independence-Day-The-India-House/IMG_2711.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912489/archived-events/Indias-Independence-Day-The-India-House/IMG_2715.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912505/archived-events/Indias-Independence-Day-The-India-House/IMG_2719.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912496/archived-events/Indias-Independence-Day-The-India-House/IMG_2723.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912502/archived-events/Indias-Independence-Day-The-India-House/IMG_2725.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912499/archived-events/Indias-Independence-Day-The-India-House/IMG_2726.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912501/archived-events/Indias-Independence-Day-The-India-House/IMG_2730.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912504/archived-events/Indias-Independence-Day-The-India-House/IMG_2731.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912498/archived-events/Indias-Independence-Day-The-India-House/IMG_2732.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912497/archived-events/Indias-Independence-Day-The-India-House/IMG_2733.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912494/archived-events/Indias-Independence-Day-The-India-House/IMG_2735.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912509/archived-events/Indias-Independence-Day-The-India-House/IMG_2741.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912507/archived-events/Indias-Independence-Day-The-India-House/IMG_2742.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912508/archived-events/Indias-Independence-Day-The-India-House/IMG_2743.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912511/archived-events/Indias-Independence-Day-The-India-House/IMG_2744.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912487/archived-events/Indias-Independence-Day-The-India-House/IMG_2763.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912488/archived-events/Indias-Independence-Day-The-India-House/IMG_2765.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912510/archived-events/Indias-Independence-Day-The-India-House/IMG_2778.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/Indias-Independence-Day-The-India-House/"
-  },
-  {
-    "event_id": "2439",
-    "event_name": "Lalaland Event: The Magic of India @Zaandam",
-    "event_date": "2023-10-29",
-    "cloudinary_folder": "Lalaland-Event-The-Magic-of-India-Zaandam",
-    "photo_count": 35,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912651/archived-events/Lalaland-Event-The-Magic-of-India-Zaandam/347438899_238157012378093_5176727651330189349_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912617/archived-events/Lalaland-Event-The-Magic-of-India-Zaandam/347444227_238153325711795_8449355290703759864_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912625/archived-events/Lalaland-Event-The-Magic-of-India-Zaandam/347448319_238153492378445_2192526126491043859_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912647/archived-events/Lalaland-Event-The-Magic-of-India-Zaandam/347449989_238154295711698_5737364509315337567_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912627/archived-events/Lalaland-Event-The-Magic-of-India-Zaandam/347450556_238314229029038_1323906689834264516_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912616/archived-events/Lalaland-Event-The-Magic-of-India-Zaandam/347551438_238153709045090_4980833602562729657_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912652/archived-events/Lalaland-Event-The-Magic-of-India-Zaandam/347553731_238153339045127_7626563059170033319_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912644/archived-events/Lalaland-Event-The-Magic-of-India-Zaandam/347554344_238153662378428_1574189436357823709_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912638/archived-events/Lalaland-Event-The-Magic-of-India-Zaandam/347557722_238153555711772_8754140905436229063_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912620/archived-events/Lalaland-Event-The-Magic-of-India-Zaandam/347558291_238153559045105_8686333982563770137_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912628/archived-events/Lalaland-Event-The-Magic-of-India-Zaandam/347558983_238154252378369_7710887159767178968_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912620/archived-events/Lalaland-Event-The-Magic-of-India-Zaandam/347566527_238153985711729_8123496205253206207_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912626/archived-events/Lalaland-Event-The-Magic-of-India-Zaandam/347583839_238153872378407_7186916017363866344_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912630/archived-events/Lalaland-Event-The-Magic-of-India-Zaandam/347584469_238153482378446_6623332322240330858_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912614/archived-events/Lalaland-Event-The-Magic-of-India-Zaandam/347587485_238153355711792_2383107514375703005_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912619/archived-events/Lalaland-Event-The-Magic-of-India-Zaandam/347587514_238153512378443_3406426959562798474_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912637/archived-events/Lalaland-Event-The-Magic-of-India-Zaandam/347588855_238154055711722_2749399178730548207_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912618/archived-events/Lalaland-Event-The-Magic-of-India-Zaandam/347592458_238157002378094_1450989245897940362_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912618/archived-events/Lalaland-Event-The-Magic-of-India-Zaandam/347597944_238153359045125_6782757215610814003_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912652/archived-events/Lalaland-Event-The-Magic-of-India-Zaandam/347597944_238153359045125_6782757215610814003_n-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912621/archived-events/Lalaland-Event-The-Magic-of-India-Zaandam/347624731_238153335711794_7481559435976732251_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912643/archived-events/Lalaland-Event-The-Magic-of-India-Zaandam/348274235_238153499045111_9072630050566566669_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912641/archived-events/Lalaland-Event-The-Magic-of-India-Zaandam/348296182_238153752378419_1936922434822007888_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912638/archived-events/Lalaland-Event-The-Magic-of-India-Zaandam/348316734_238153982378396_8323998340904753826_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912624/archived-events/Lalaland-Event-The-Magic-of-India-Zaandam/348641700_238153665711761_3971788235005186609_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912645/archived-events/Lalaland-Event-The-Magic-of-India-Zaandam/348651588_238153845711743_6131933026163724318_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912623/archived-events/Lalaland-Event-The-Magic-of-India-Zaandam/348856080_238154049045056_4526592928302857335_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912615/archived-events/Lalaland-Event-The-Magic-of-India-Zaandam/357091857_238311839029277_200956315142706829_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912629/archived-events/Lalaland-Event-The-Magic-of-India-Zaandam/357124279_238311682362626_6102842557448927179_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912653/archived-events/Lalaland-Event-The-Magic-of-India-Zaandam/357478268_238311865695941_2265090043093861387_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912628/archived-events/Lalaland-Event-The-Magic-of-India-Zaandam/357514679_238311789029282_7339864571609600483_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912631/archived-events/Lalaland-Event-The-Magic-of-India-Zaandam/357747772_238311745695953_3055476400841351435_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912648/archived-events/Lalaland-Event-The-Magic-of-India-Zaandam/359363181_238311339029327_4487869318913428505_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912633/archived-events/Lalaland-Event-The-Magic-of-India-Zaandam/359465937_238311492362645_6702715293057118526_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912622/archived-events/Lalaland-Event-The-Magic-of-India-Zaandam/IMG_1418.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/Lalaland-Event-The-Magic-of-India-Zaandam/"
-  },
-  {
-    "event_id": "2413",
-    "event_name": "Malini Awasthi Ji @The Gandhi Centre",
-    "event_date": "2023-10-29",
-    "cloudinary_folder": "Malini-Awasthi-Ji-The-Gandhi-Centre",
-    "photo_count": 13,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912704/archived-events/Malini-Awasthi-Ji-The-Gandhi-Centre/5cd7c56d-52a3-4c5a-b885-651a2502f7c4.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912708/archived-events/Malini-Awasthi-Ji-The-Gandhi-Centre/IMG_0392.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912700/archived-events/Malini-Awasthi-Ji-The-Gandhi-Centre/IMG_0414.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912702/archived-events/Malini-Awasthi-Ji-The-Gandhi-Centre/IMG_0504.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912705/archived-events/Malini-Awasthi-Ji-The-Gandhi-Centre/IMG_0511.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912701/archived-events/Malini-Awasthi-Ji-The-Gandhi-Centre/IMG_0513.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912706/archived-events/Malini-Awasthi-Ji-The-Gandhi-Centre/IMG_0528.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912706/archived-events/Malini-Awasthi-Ji-The-Gandhi-Centre/IMG_0530.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912707/archived-events/Malini-Awasthi-Ji-The-Gandhi-Centre/IMG_0535.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912704/archived-events/Malini-Awasthi-Ji-The-Gandhi-Centre/IMG_0539.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912710/archived-events/Malini-Awasthi-Ji-The-Gandhi-Centre/IMG_0542.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912708/archived-events/Malini-Awasthi-Ji-The-Gandhi-Centre/IMG_0545.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912699/archived-events/Malini-Awasthi-Ji-The-Gandhi-Centre/IMG_0549.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/Malini-Awasthi-Ji-The-Gandhi-Centre/"
-  },
-  {
-    "event_id": "2373",
-    "event_name": "International Yoga Day @Eindhoven",
-    "event_date": "2023-10-29",
-    "cloudinary_folder": "International-Yoga-Day-Eindhoven",
-    "photo_count": 38,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912557/archived-events/International-Yoga-Day-Eindhoven/346079767_220566557470472_5026897058414864679_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912557/archived-events/International-Yoga-Day-Eindhoven/346079767_220566557470472_5026897058414864679_n-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912545/archived-events/International-Yoga-Day-Eindhoven/346080135_220566410803820_3548338448813827601_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912553/archived-events/International-Yoga-Day-Eindhoven/346083287_220566450803816_4913666199316382310_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912558/archived-events/International-Yoga-Day-Eindhoven/346088495_220566354137159_2669034159846741453_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912547/archived-events/International-Yoga-Day-Eindhoven/346501939_220566504137144_3853617969735853919_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912548/archived-events/International-Yoga-Day-Eindhoven/346607362_220566257470502_7501682103413604790_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912569/archived-events/International-Yoga-Day-Eindhoven/346632991_220566274137167_5181154547723674165_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912543/archived-events/International-Yoga-Day-Eindhoven/346833296_220566324137162_4950772759554259621_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912552/archived-events/International-Yoga-Day-Eindhoven/346833296_220566324137162_4950772759554259621_n-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912559/archived-events/International-Yoga-Day-Eindhoven/346862196_220566304137164_8443819731549218761_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912563/archived-events/International-Yoga-Day-Eindhoven/346879385_220566404137154_807868920737677804_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912565/archived-events/International-Yoga-Day-Eindhoven/347020067_220566374137157_3917400891969218515_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912570/archived-events/International-Yoga-Day-Eindhoven/347023893_220566350803826_6573252310770016618_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912560/archived-events/International-Yoga-Day-Eindhoven/347026821_220566290803832_7727910189243447928_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912551/archived-events/International-Yoga-Day-Eindhoven/347144516_220566617470466_5555577700973641491_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912554/archived-events/International-Yoga-Day-Eindhoven/347635846_220566480803813_1096900615762567963_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912544/archived-events/International-Yoga-Day-Eindhoven/347637906_220566584137136_8245828787312941873_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912565/archived-events/International-Yoga-Day-Eindhoven/348327717_220566314137163_8413962381858008628_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912559/archived-events/International-Yoga-Day-Eindhoven/348573301_220566630803798_5047243087907473265_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912561/archived-events/International-Yoga-Day-Eindhoven/348604764_220566497470478_1197542754591062743_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912570/archived-events/International-Yoga-Day-Eindhoven/349185272_220566590803802_7894468511167979680_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912572/archived-events/International-Yoga-Day-Eindhoven/349976486_220566637470464_5513205880805373974_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912571/archived-events/International-Yoga-Day-Eindhoven/349976486_220566637470464_5513205880805373974_n-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912555/archived-events/International-Yoga-Day-Eindhoven/350130528_220566444137150_5363432750059611671_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912568/archived-events/International-Yoga-Day-Eindhoven/350137631_220566610803800_5712664023713027429_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912562/archived-events/International-Yoga-Day-Eindhoven/350504273_220566380803823_4294456928827424368_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912564/archived-events/International-Yoga-Day-Eindhoven/350512201_220566470803814_2674311511563382773_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912546/archived-events/International-Yoga-Day-Eindhoven/352404546_220566227470505_4198183622536844604_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912550/archived-events/International-Yoga-Day-Eindhoven/353019648_220559497471178_4087530849625699446_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912555/archived-events/International-Yoga-Day-Eindhoven/353021970_220559570804504_2389773301586484612_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912549/archived-events/International-Yoga-Day-Eindhoven/353022972_220559437471184_1593583537268759476_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912551/archived-events/International-Yoga-Day-Eindhoven/353049270_220559470804514_7517686945926914403_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912550/archived-events/International-Yoga-Day-Eindhoven/353055264_220559167471211_851622975771447318_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912567/archived-events/International-Yoga-Day-Eindhoven/353059206_220559410804520_7952281120228903482_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912566/archived-events/International-Yoga-Day-Eindhoven/353394303_220559594137835_2800280151013566126_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912547/archived-events/International-Yoga-Day-Eindhoven/353407025_220559547471173_1287675721467027676_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912556/archived-events/International-Yoga-Day-Eindhoven/353458901_220559387471189_3139777126378916286_n.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/International-Yoga-Day-Eindhoven/"
-  },
-  {
-    "event_id": "2310",
-    "event_name": "India Day Zaanstad @Zaandam",
-    "event_date": "2023-10-29",
-    "cloudinary_folder": "India-Day-Zaanstad-Zaandam",
-    "photo_count": 61,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912463/archived-events/India-Day-Zaanstad-Zaandam/345048523_171005435939405_5129585299390620500_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912465/archived-events/India-Day-Zaanstad-Zaandam/345068561_1527155988054361_7077844927871982496_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912475/archived-events/India-Day-Zaanstad-Zaandam/345235276_797933594923982_1414700164236273812_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912439/archived-events/India-Day-Zaanstad-Zaandam/345452463_573955331292109_1900909450140029334_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912437/archived-events/India-Day-Zaanstad-Zaandam/346852146_210855048478839_4164324218460385810_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912458/archived-events/India-Day-Zaanstad-Zaandam/347025546_780995526762048_2893235644154295603_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912453/archived-events/India-Day-Zaanstad-Zaandam/347232095_5940950336032136_6831313002911834609_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912449/archived-events/India-Day-Zaanstad-Zaandam/347233298_735623738358974_5127315430241988376_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912442/archived-events/India-Day-Zaanstad-Zaandam/348648948_1078451683112755_6699966456378921287_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912447/archived-events/India-Day-Zaanstad-Zaandam/348679029_267560579086947_4283308095940178773_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912455/archived-events/India-Day-Zaanstad-Zaandam/348819814_781363570055010_8263806357308661081_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912471/archived-events/India-Day-Zaanstad-Zaandam/348950267_1306990220248379_7361590415020005022_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912438/archived-events/India-Day-Zaanstad-Zaandam/348950508_801832818312460_8158283178901312927_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912456/archived-events/India-Day-Zaanstad-Zaandam/348983426_636056381723087_2226931973265547838_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912454/archived-events/India-Day-Zaanstad-Zaandam/349020205_946935176554915_1836390122526318760_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912469/archived-events/India-Day-Zaanstad-Zaandam/349180918_795620968558574_9183085699143276424_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912454/archived-events/India-Day-Zaanstad-Zaandam/349188066_961978898272476_7172510640329290908_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912441/archived-events/India-Day-Zaanstad-Zaandam/349304781_724191202837924_3512514527011980230_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912459/archived-events/India-Day-Zaanstad-Zaandam/349319297_909010966835312_2548454557715241387_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912435/archived-events/India-Day-Zaanstad-Zaandam/349337525_933523951253344_4743068825275418234_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912472/archived-events/India-Day-Zaanstad-Zaandam/349340852_2037056356647391_565776981474614334_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912455/archived-events/India-Day-Zaanstad-Zaandam/349363083_1440945503389772_1115033474483094864_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912464/archived-events/India-Day-Zaanstad-Zaandam/349504276_722381469662957_5486970252856863058_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912445/archived-events/India-Day-Zaanstad-Zaandam/349516305_1424640955022097_4627734008041335847_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912462/archived-events/India-Day-Zaanstad-Zaandam/349534377_6256532431127952_5119983983795201862_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912450/archived-events/India-Day-Zaanstad-Zaandam/349548314_801058118404493_7212784787481033710_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912437/archived-events/India-Day-Zaanstad-Zaandam/349597596_1179773316036153_248024008672925636_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912444/archived-events/India-Day-Zaanstad-Zaandam/349680606_127666480329814_7558540998766244127_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912472/archived-events/India-Day-Zaanstad-Zaandam/349687351_636296974800367_8095129594887733589_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912438/archived-events/India-Day-Zaanstad-Zaandam/349690314_235441175850500_4600128017643493337_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912457/archived-events/India-Day-Zaanstad-Zaandam/349690314_235441175850500_4600128017643493337_n-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912449/archived-events/India-Day-Zaanstad-Zaandam/349832598_2521342571337775_5805786574879820802_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912461/archived-events/India-Day-Zaanstad-Zaandam/349867803_774651757492916_2485438203407627440_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912450/archived-events/India-Day-Zaanstad-Zaandam/349912785_188405787495874_8453780244599398999_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912436/archived-events/India-Day-Zaanstad-Zaandam/349992040_1670309606727181_9209303321889767673_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912443/archived-events/India-Day-Zaanstad-Zaandam/350011861_792132195684149_3037899550376575030_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912476/archived-events/India-Day-Zaanstad-Zaandam/350039669_1002357951142930_3002171373818215461_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912448/archived-events/India-Day-Zaanstad-Zaandam/350039669_1002357951142930_3002171373818215461_n-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912435/archived-events/India-Day-Zaanstad-Zaandam/350045989_3457378037855479_8957702792305935313_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912444/archived-events/India-Day-Zaanstad-Zaandam/350104488_754464356148752_2499171820560938023_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912473/archived-events/India-Day-Zaanstad-Zaandam/350112764_706288387965605_1070852231142939105_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912434/archived-events/India-Day-Zaanstad-Zaandam/350127803_266092859213263_8786021391471500209_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912466/archived-events/India-Day-Zaanstad-Zaandam/350133674_1671642263264555_8180068207246772944_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912446/archived-events/India-Day-Zaanstad-Zaandam/350136859_1039388627445037_8118399381980361862_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912473/archived-events/India-Day-Zaanstad-Zaandam/350272985_3416185015263670_8423469742812509640_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912456/archived-events/India-Day-Zaanstad-Zaandam/350297443_973734863644798_7922786962594538021_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912475/archived-events/India-Day-Zaanstad-Zaandam/350304126_172065072454849_4225913463157817985_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912471/archived-events/India-Day-Zaanstad-Zaandam/350313840_3406116496317844_5306080312000916051_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912447/archived-events/India-Day-Zaanstad-Zaandam/350323700_158173987088953_1740075366946330107_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912445/archived-events/India-Day-Zaanstad-Zaandam/350330443_918842432682022_373856588796668643_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912462/archived-events/India-Day-Zaanstad-Zaandam/350343994_759026162617463_8551249950135791899_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912467/archived-events/India-Day-Zaanstad-Zaandam/350345213_255743457116074_6966104730195047909_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912440/archived-events/India-Day-Zaanstad-Zaandam/350352142_6319117871499747_3120953738102517163_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912440/archived-events/India-Day-Zaanstad-Zaandam/350359492_252097244159059_9160658639124189479_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912441/archived-events/India-Day-Zaanstad-Zaandam/350457292_1016718243038699_3863900632578509395_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912460/archived-events/India-Day-Zaanstad-Zaandam/350468210_6211519375605677_8107403869255468167_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912463/archived-events/India-Day-Zaanstad-Zaandam/350511937_593563992867817_2807617326197194106_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912468/archived-events/India-Day-Zaanstad-Zaandam/350529674_982470776108856_1405125089047938995_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912469/archived-events/India-Day-Zaanstad-Zaandam/350643020_239697708783922_5507752490966559908_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912474/archived-events/India-Day-Zaanstad-Zaandam/350658600_815922979488807_2269780472255691568_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912442/archived-events/India-Day-Zaanstad-Zaandam/350685532_605036211592036_4408706032350822538_n.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/India-Day-Zaanstad-Zaandam/"
-  },
-  {
-    "event_id": "2246",
-    "event_name": "Holi Milan Samaroh @The Gandhi Centre",
-    "event_date": "2023-10-29",
-    "cloudinary_folder": "Holi-Milan-Samaroh-The-Gandhi-Centre",
-    "photo_count": 60,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912399/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/329367876_226371809845021_6977291878201370680_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912396/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/329724936_571840098214309_4662149668485259822_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912372/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/329786796_753929496034322_499650683464426321_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912398/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/329789120_599804241595220_1896363102394265806_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912381/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/329797545_1268488764064308_8678360970313078444_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912373/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/329839962_605657547661083_5815536654721834273_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912368/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/329839965_733159148274764_7026055718633527062_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912367/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/329885735_733988511618440_6787659495946774978_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912399/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/330111784_529311875993497_3245659986271547922_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912387/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/330219855_727490665532259_6585710865592411194_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912362/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/330291000_157645790469110_5490497903722205548_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912392/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/330293632_941799436816018_2250981914274285615_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912369/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/330328943_574442874724999_4991104055829194590_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912401/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/330363459_600557791535652_8356552827632509093_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912400/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/330374751_737685781283819_711198282767772626_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912395/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/330374935_233184995798146_82548105313564457_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912355/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/330375730_594156378963409_7792925297759780903_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912386/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/330379091_1471200230078366_8336819028488015325_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912371/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/330391793_753851739375780_7744516955879361808_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912360/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/330391793_753851739375780_7744516955879361808_n-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912356/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/330391793_753851739375780_7744516955879361808_n-2.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912395/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/330392091_3102667410026687_4507317123149978371_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912391/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/330441791_912259953256384_8359568528702786434_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912382/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/330459319_222636796812843_2164624880027932783_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912389/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/330498233_1231296717824481_7576378699558961897_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912398/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/330519574_506589358326511_52483953544466112_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912366/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/330519574_506589358326511_52483953544466112_n-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912357/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/330593235_2213368592203711_2279944100846072006_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912391/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/330906788_681070000457859_2107122412910554181_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912363/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/330919667_518116106926108_8883588970241134958_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912376/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/331077031_587992566547556_3738759810938222906_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912358/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/331077031_587992566547556_3738759810938222906_n-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912359/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/331399330_734767158045052_5567546614283290818_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912366/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/331436387_1605458419916888_6785037473013541367_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912383/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/331489041_585833990097872_7488396576441013105_n-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912369/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/331537071_872361880507721_6977746876033473_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912389/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/331551385_149939420947736_5416339646948371632_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912364/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/331569835_244459757908540_7285801202575019801_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912393/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/331579126_909830910349105_697997944257476073_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912361/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/331593454_1260095361212788_6999753754115503846_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912363/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/331618326_737331711428694_8152783535756624708_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912394/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/331704665_948742559634510_6987489203197644858_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912379/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/331705082_765879171626650_7073026521811678420_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912373/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/331771152_579451084219048_7802118939428399908_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912375/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/331771240_939250150591489_8472108478671105622_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912375/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/331772893_1229148294356179_1725261529280590602_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912390/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/331775829_152601140996520_2098229262264890661_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912374/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/331776168_1452113785596967_3192332058289272515_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912396/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/331780950_965997284346910_7926989111361530816_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912377/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/331788905_1402145147225070_3592625535541992937_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912397/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/331789287_902251274424351_4658262628527893118_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912371/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/331851450_927373791784673_1714146986140539235_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912365/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/331851459_751878239715953_8278100385636679048_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912380/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/331917353_176288335159120_7999086004625655905_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912387/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/333023315_233358859114535_2413946420697932287_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912370/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/334553396_1165026547352486_6695928204876511756_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912380/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/IMG_5888.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912385/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/IMG_5896.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912384/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/IMG_5925.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912378/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/IMG_5929.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/Holi-Milan-Samaroh-The-Gandhi-Centre/"
-  },
-  {
-    "event_id": "2211",
-    "event_name": "Sur India @Utrecht",
-    "event_date": "2023-10-29",
-    "cloudinary_folder": "Sur-India-Utrecht",
-    "photo_count": 33,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912844/archived-events/Sur-India-Utrecht/0d1ce5d8-da85-41ba-b331-3a9c6bb9bf0c.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912831/archived-events/Sur-India-Utrecht/21e5bbf7-58fa-48cc-82d0-062eba12590e.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912842/archived-events/Sur-India-Utrecht/332100724_591676925826706_1470628847584916179_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912835/archived-events/Sur-India-Utrecht/39e979c8-55d6-4f11-be8a-b5fdbad8212f.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912842/archived-events/Sur-India-Utrecht/78981443-1587-418f-9df6-77831f185b68.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912833/archived-events/Sur-India-Utrecht/a0327127-4afd-4229-b57f-ce8fdd0b1db1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912839/archived-events/Sur-India-Utrecht/IMG_6166.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912838/archived-events/Sur-India-Utrecht/IMG_6172.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912836/archived-events/Sur-India-Utrecht/IMG_6173.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912845/archived-events/Sur-India-Utrecht/IMG_6190.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912844/archived-events/Sur-India-Utrecht/IMG_6193.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912840/archived-events/Sur-India-Utrecht/IMG_6199.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912838/archived-events/Sur-India-Utrecht/IMG_6204.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912841/archived-events/Sur-India-Utrecht/IMG_6208.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912837/archived-events/Sur-India-Utrecht/IMG_6211.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912835/archived-events/Sur-India-Utrecht/IMG_6216.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912843/archived-events/Sur-India-Utrecht/IMG_6218-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912850/archived-events/Sur-India-Utrecht/IMG_6246.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912848/archived-events/Sur-India-Utrecht/IMG_6251.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912847/archived-events/Sur-India-Utrecht/IMG_6254.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912831/archived-events/Sur-India-Utrecht/IMG_6259.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912832/archived-events/Sur-India-Utrecht/IMG_6264.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912829/archived-events/Sur-India-Utrecht/IMG_6328.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912846/archived-events/Sur-India-Utrecht/IMG_6336.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912836/archived-events/Sur-India-Utrecht/IMG_6417.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912846/archived-events/Sur-India-Utrecht/IMG_6453.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912849/archived-events/Sur-India-Utrecht/IMG_6455.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912834/archived-events/Sur-India-Utrecht/IMG_6460.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912834/archived-events/Sur-India-Utrecht/IMG_6461.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912828/archived-events/Sur-India-Utrecht/IMG_6465.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912829/archived-events/Sur-India-Utrecht/IMG_6467.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912849/archived-events/Sur-India-Utrecht/IMG_6469.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912828/archived-events/Sur-India-Utrecht/IMG_6470.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/Sur-India-Utrecht/"
-  },
-  {
-    "event_id": "2520",
-    "event_name": "Ek Shaam Dinkar ke Naam (Hindi Diwas) @The Gandhi Centre",
-    "event_date": "2023-10-29",
-    "cloudinary_folder": "Ek-Shaam-Dinkar-ke-Naam-Hindi-Diwas-The-Gandhi-Centre",
-    "photo_count": 15,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911927/archived-events/Ek-Shaam-Dinkar-ke-Naam-Hindi-Diwas-The-Gandhi-Centre/182f6adf-f8b5-433a-bad1-f3052d47a26f.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911929/archived-events/Ek-Shaam-Dinkar-ke-Naam-Hindi-Diwas-The-Gandhi-Centre/20230915_175046.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911935/archived-events/Ek-Shaam-Dinkar-ke-Naam-Hindi-Diwas-The-Gandhi-Centre/20230915_175706.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911931/archived-events/Ek-Shaam-Dinkar-ke-Naam-Hindi-Diwas-The-Gandhi-Centre/20230915_200343.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911936/archived-events/Ek-Shaam-Dinkar-ke-Naam-Hindi-Diwas-The-Gandhi-Centre/20230915_201410.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911934/archived-events/Ek-Shaam-Dinkar-ke-Naam-Hindi-Diwas-The-Gandhi-Centre/20230915_201850.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911925/archived-events/Ek-Shaam-Dinkar-ke-Naam-Hindi-Diwas-The-Gandhi-Centre/5fc8ee16-9588-429e-8e3b-2d952bd03350.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911930/archived-events/Ek-Shaam-Dinkar-ke-Naam-Hindi-Diwas-The-Gandhi-Centre/760f7952-2306-407f-afbf-5271bb221076.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911931/archived-events/Ek-Shaam-Dinkar-ke-Naam-Hindi-Diwas-The-Gandhi-Centre/8947b228-edb9-45e9-8990-b483920bb152.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911929/archived-events/Ek-Shaam-Dinkar-ke-Naam-Hindi-Diwas-The-Gandhi-Centre/a7843a82-9564-468c-b29d-676e758819ac.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911926/archived-events/Ek-Shaam-Dinkar-ke-Naam-Hindi-Diwas-The-Gandhi-Centre/c125c493-cbcd-41cf-89e5-9876147e2318.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911926/archived-events/Ek-Shaam-Dinkar-ke-Naam-Hindi-Diwas-The-Gandhi-Centre/f2a8b720-e61f-4594-b932-98d97f0e1233.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911932/archived-events/Ek-Shaam-Dinkar-ke-Naam-Hindi-Diwas-The-Gandhi-Centre/IMG_2848.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911933/archived-events/Ek-Shaam-Dinkar-ke-Naam-Hindi-Diwas-The-Gandhi-Centre/IMG_3404.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911928/archived-events/Ek-Shaam-Dinkar-ke-Naam-Hindi-Diwas-The-Gandhi-Centre/IMG_3523.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/Ek-Shaam-Dinkar-ke-Naam-Hindi-Diwas-The-Gandhi-Centre/"
-  },
-  {
-    "event_id": "2201",
-    "event_name": "Shivaji Jayanti Celebrations @The Gandhi Centre",
-    "event_date": "2023-10-28",
-    "cloudinary_folder": "Shivaji-Jayanti-Celebrations-The-Gandhi-Centre",
-    "photo_count": 8,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912767/archived-events/Shivaji-Jayanti-Celebrations-The-Gandhi-Centre/150f5328-22f3-4e1d-bfc4-5e4e299b141a.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912766/archived-events/Shivaji-Jayanti-Celebrations-The-Gandhi-Centre/bbca8b67-1956-4190-80e8-396e4b857be0.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912765/archived-events/Shivaji-Jayanti-Celebrations-The-Gandhi-Centre/IMG_6116.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912767/archived-events/Shivaji-Jayanti-Celebrations-The-Gandhi-Centre/IMG_6121.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912769/archived-events/Shivaji-Jayanti-Celebrations-The-Gandhi-Centre/IMG_6122.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912769/archived-events/Shivaji-Jayanti-Celebrations-The-Gandhi-Centre/IMG_6126.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912764/archived-events/Shivaji-Jayanti-Celebrations-The-Gandhi-Centre/IMG_6128.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912770/archived-events/Shivaji-Jayanti-Celebrations-The-Gandhi-Centre/IMG_6130.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/Shivaji-Jayanti-Celebrations-The-Gandhi-Centre/"
-  },
-  {
-    "event_id": "2187",
-    "event_name": "First-ever Embassy Counsellor Camp @Eindhoven",
-    "event_date": "2023-10-28",
-    "cloudinary_folder": "First-ever-Embassy-Counsellor-Camp-Eindhoven",
-    "photo_count": 12,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911980/archived-events/First-ever-Embassy-Counsellor-Camp-Eindhoven/327115638_971993930444945_1877992544544745540_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911982/archived-events/First-ever-Embassy-Counsellor-Camp-Eindhoven/327438525_909983293344627_1745163139702312186_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911977/archived-events/First-ever-Embassy-Counsellor-Camp-Eindhoven/327443978_2261704124011251_9113975301978553033_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911979/archived-events/First-ever-Embassy-Counsellor-Camp-Eindhoven/327453301_1407141350081214_1716241155749682033_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911976/archived-events/First-ever-Embassy-Counsellor-Camp-Eindhoven/327453436_835680960834460_2598011997762147158_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911973/archived-events/First-ever-Embassy-Counsellor-Camp-Eindhoven/327549040_862645728276751_7068645486726457221_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911983/archived-events/First-ever-Embassy-Counsellor-Camp-Eindhoven/327562175_673568637783812_251045053218699051_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911979/archived-events/First-ever-Embassy-Counsellor-Camp-Eindhoven/327564055_1873282193009778_3338597534016386087_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911974/archived-events/First-ever-Embassy-Counsellor-Camp-Eindhoven/347249322_6199887880106774_7741407431382431857_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911978/archived-events/First-ever-Embassy-Counsellor-Camp-Eindhoven/347423575_6199887856773443_7253664513299258852_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911981/archived-events/First-ever-Embassy-Counsellor-Camp-Eindhoven/347427956_6199888023440093_6252345690103083538_n-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911976/archived-events/First-ever-Embassy-Counsellor-Camp-Eindhoven/347434910_6199888033440092_8178835191161090655_n.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/First-ever-Embassy-Counsellor-Camp-Eindhoven/"
-  },
-  {
-    "event_id": "2172",
-    "event_name": "President of Suriname, Mr. Chan Santokhi @Hoofddorp",
-    "event_date": "2023-10-28",
-    "cloudinary_folder": "President-of-Suriname-Mr-Chan-Santokhi-Hoofddorp",
-    "photo_count": 13,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912748/archived-events/President-of-Suriname-Mr-Chan-Santokhi-Hoofddorp/6C9E7063-1A29-4F5E-9206-2DF6B58F7EF3.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912753/archived-events/President-of-Suriname-Mr-Chan-Santokhi-Hoofddorp/7F21C8CF-173B-42AB-AA03-DF508583D489.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912751/archived-events/President-of-Suriname-Mr-Chan-Santokhi-Hoofddorp/9fb13e2b-7809-4df5-b146-86b9bf0977f2.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912752/archived-events/President-of-Suriname-Mr-Chan-Santokhi-Hoofddorp/9ffc10e2-1dbf-4c68-ac13-75419e95865e.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912748/archived-events/President-of-Suriname-Mr-Chan-Santokhi-Hoofddorp/b28863c0-a93e-4076-ae9d-d377128bcd75.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912751/archived-events/President-of-Suriname-Mr-Chan-Santokhi-Hoofddorp/DSC_5166_Original.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912747/archived-events/President-of-Suriname-Mr-Chan-Santokhi-Hoofddorp/DSC_5184_Original.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912756/archived-events/President-of-Suriname-Mr-Chan-Santokhi-Hoofddorp/DSC_5185.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912755/archived-events/President-of-Suriname-Mr-Chan-Santokhi-Hoofddorp/DSC_5226_Original.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912749/archived-events/President-of-Suriname-Mr-Chan-Santokhi-Hoofddorp/DSC_5229_Original.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912746/archived-events/President-of-Suriname-Mr-Chan-Santokhi-Hoofddorp/DSC_5246_Original.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912754/archived-events/President-of-Suriname-Mr-Chan-Santokhi-Hoofddorp/DSC_5248_Original.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912755/archived-events/President-of-Suriname-Mr-Chan-Santokhi-Hoofddorp/IMG_5239.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/President-of-Suriname-Mr-Chan-Santokhi-Hoofddorp/"
-  },
-  {
-    "event_id": "2155",
-    "event_name": "World Hindi Day  @The Gandhi Centre",
-    "event_date": "2023-10-28",
-    "cloudinary_folder": "World-Hindi-Day-The-Gandhi-Centre",
-    "photo_count": 15,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913505/archived-events/World-Hindi-Day-The-Gandhi-Centre/324555650_506618091553836_7759651884764348650_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913509/archived-events/World-Hindi-Day-The-Gandhi-Centre/324566705_582148673248573_3505950887803665813_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913513/archived-events/World-Hindi-Day-The-Gandhi-Centre/324661028_1514812775698411_318959024073724252_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913514/archived-events/World-Hindi-Day-The-Gandhi-Centre/324838720_5859329430826101_615207186060108087_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913515/archived-events/World-Hindi-Day-The-Gandhi-Centre/325218386_908614623482320_4295587608237084407_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913503/archived-events/World-Hindi-Day-The-Gandhi-Centre/325224524_852987979151043_3231550429450720651_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913511/archived-events/World-Hindi-Day-The-Gandhi-Centre/325238465_1804721969895272_7946677546932156876_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913508/archived-events/World-Hindi-Day-The-Gandhi-Centre/325239220_567896274873249_8286648667245594399_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913505/archived-events/World-Hindi-Day-The-Gandhi-Centre/325257134_512798060983957_2935130044127856469_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913507/archived-events/World-Hindi-Day-The-Gandhi-Centre/325271881_868268907846704_1336896430650842419_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913512/archived-events/World-Hindi-Day-The-Gandhi-Centre/325289571_709922900754694_1428640096438885439_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913516/archived-events/World-Hindi-Day-The-Gandhi-Centre/325295186_532131052017779_7031044337083955943_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913502/archived-events/World-Hindi-Day-The-Gandhi-Centre/325296369_854899412295508_8916393894632957826_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913510/archived-events/World-Hindi-Day-The-Gandhi-Centre/325313142_1444960749365446_2885633390364364979_n.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913510/archived-events/World-Hindi-Day-The-Gandhi-Centre/325362115_874754003840768_2983476981658488556_n-2.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/World-Hindi-Day-The-Gandhi-Centre/"
-  },
-  {
-    "event_id": "2140",
-    "event_name": "UP CM & Indian Diaspora @Amsterdam",
-    "event_date": "2023-10-28",
-    "cloudinary_folder": "UP-CM-Indian-Diaspora-Amsterdam",
-    "photo_count": 6,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913051/archived-events/UP-CM-Indian-Diaspora-Amsterdam/2023-10-28_22-50-41.png",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913049/archived-events/UP-CM-Indian-Diaspora-Amsterdam/2023-10-28_22-51-40.png",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913049/archived-events/UP-CM-Indian-Diaspora-Amsterdam/2bf5e5c3-9ec3-46e9-9930-8c9e45df350f.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913050/archived-events/UP-CM-Indian-Diaspora-Amsterdam/54d20541-9b3f-4a96-97cf-51b86be4ddaf.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913048/archived-events/UP-CM-Indian-Diaspora-Amsterdam/e8219a65-fbb3-4a73-b547-0c7f60c83076.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765913050/archived-events/UP-CM-Indian-Diaspora-Amsterdam/f2359fb3-42b7-4791-8737-6804b1ea9148.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/UP-CM-Indian-Diaspora-Amsterdam/"
-  },
-  {
-    "event_id": "2125",
-    "event_name": "Remembering Lachit Borphukan @The Gandhi Centre",
-    "event_date": "2023-10-26",
-    "cloudinary_folder": "Remembering-Lachit-Borphukan-The-Gandhi-Centre",
-    "photo_count": 12,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912757/archived-events/Remembering-Lachit-Borphukan-The-Gandhi-Centre/IMG_3536.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912759/archived-events/Remembering-Lachit-Borphukan-The-Gandhi-Centre/IMG_3541.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912758/archived-events/Remembering-Lachit-Borphukan-The-Gandhi-Centre/IMG_3543.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912760/archived-events/Remembering-Lachit-Borphukan-The-Gandhi-Centre/IMG_3554.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912758/archived-events/Remembering-Lachit-Borphukan-The-Gandhi-Centre/IMG_3555.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912762/archived-events/Remembering-Lachit-Borphukan-The-Gandhi-Centre/IMG_3560.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912762/archived-events/Remembering-Lachit-Borphukan-The-Gandhi-Centre/IMG_3561.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912761/archived-events/Remembering-Lachit-Borphukan-The-Gandhi-Centre/IMG_3562.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912761/archived-events/Remembering-Lachit-Borphukan-The-Gandhi-Centre/IMG_3563.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912763/archived-events/Remembering-Lachit-Borphukan-The-Gandhi-Centre/IMG_3564.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912763/archived-events/Remembering-Lachit-Borphukan-The-Gandhi-Centre/IMG_3565.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912764/archived-events/Remembering-Lachit-Borphukan-The-Gandhi-Centre/IMG_3572.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/Remembering-Lachit-Borphukan-The-Gandhi-Centre/"
-  },
-  {
-    "event_id": "2114",
-    "event_name": "Desi Holland Day @Eindhoven",
-    "event_date": "2023-10-26",
-    "cloudinary_folder": "Desi-Holland-Day-Eindhoven",
-    "photo_count": 12,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911917/archived-events/Desi-Holland-Day-Eindhoven/IMG_1608.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911920/archived-events/Desi-Holland-Day-Eindhoven/IMG_1608-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911918/archived-events/Desi-Holland-Day-Eindhoven/IMG_1612.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911915/archived-events/Desi-Holland-Day-Eindhoven/IMG_1618.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911914/archived-events/Desi-Holland-Day-Eindhoven/IMG_1625.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911916/archived-events/Desi-Holland-Day-Eindhoven/IMG_1634.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911913/archived-events/Desi-Holland-Day-Eindhoven/IMG_1650.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911924/archived-events/Desi-Holland-Day-Eindhoven/IMG_1677.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911922/archived-events/Desi-Holland-Day-Eindhoven/IMG_20220918_143032.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911923/archived-events/Desi-Holland-Day-Eindhoven/IMG_20220918_143221.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911919/archived-events/Desi-Holland-Day-Eindhoven/IMG_20220918_164149.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911921/archived-events/Desi-Holland-Day-Eindhoven/IMG_20220918_164149-1.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/Desi-Holland-Day-Eindhoven/"
-  },
-  {
-    "event_id": "2052",
-    "event_name": "Gandhi Jayanti Kavya Goshthi @The Gandhi Centre",
-    "event_date": "2023-10-24",
-    "cloudinary_folder": "Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre",
-    "photo_count": 43,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911994/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0368.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912013/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0370_Original.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912003/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0370_Original-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912011/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0372.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912008/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0373.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912013/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0377_Original.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912002/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0378_Original-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912006/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0382_Original.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911993/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0383.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911988/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0384.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912001/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0386_Original.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911991/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0387.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911987/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0390.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911983/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0391.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912002/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0393_Original.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911998/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0394.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911992/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0397.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912007/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0401.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912012/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0402.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912014/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0403.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911990/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0403-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911991/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0404_Original_Original-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912016/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0406.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911986/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0408.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912017/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0410.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912015/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0413.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912010/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0414.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912000/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0418.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911998/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0419.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911989/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0422.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911988/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0423.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911997/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0427.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912009/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0428.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911999/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0430.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911995/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0432.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911984/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0434.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912017/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0438.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912007/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0459.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912004/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0461.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912012/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0462_Original.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911996/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0462_Original_Original-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912005/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0464.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911996/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/DSC_0467_Original.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/Gandhi-Jayanti-Kavya-Goshthi-The-Gandhi-Centre/"
-  },
-  {
-    "event_id": "2020",
-    "event_name": "National Day @Almere",
-    "event_date": "2023-10-24",
-    "cloudinary_folder": "National-Day-Almere",
-    "photo_count": 14,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912722/archived-events/National-Day-Almere/331addf9-8e54-4c7b-bd08-f97398fcf64b.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912733/archived-events/National-Day-Almere/d006e312-4e41-457d-9e2e-e6ebd199bea4-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912729/archived-events/National-Day-Almere/d3570789-4d50-4eb7-9342-03834d58d1ac.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912733/archived-events/National-Day-Almere/ec4115a8-a160-4c9b-80b6-634f46c46f97.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912724/archived-events/National-Day-Almere/fb5c5aae-6e3f-409c-aba4-134d950a7144.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912727/archived-events/National-Day-Almere/IMG_0847.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912728/archived-events/National-Day-Almere/IMG_0852.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912724/archived-events/National-Day-Almere/IMG_0857.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912731/archived-events/National-Day-Almere/IMG_0858.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912729/archived-events/National-Day-Almere/IMG_0863.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912732/archived-events/National-Day-Almere/IMG_0872.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912726/archived-events/National-Day-Almere/IMG_0882.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912727/archived-events/National-Day-Almere/IMG_0892.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912723/archived-events/National-Day-Almere/IMG_0954.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/National-Day-Almere/"
-  },
-  {
-    "event_id": "2011",
-    "event_name": "International Indian Diaspora Conference @Wassenaar",
-    "event_date": "2023-10-24",
-    "cloudinary_folder": "International-Indian-Diaspora-Conference-Wassenaar",
-    "photo_count": 6,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912525/archived-events/International-Indian-Diaspora-Conference-Wassenaar/38802046-1ce9-440c-83e9-e357975ff391.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912527/archived-events/International-Indian-Diaspora-Conference-Wassenaar/7fb2e971-cf11-4fad-a224-3de651b2e7c8.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912527/archived-events/International-Indian-Diaspora-Conference-Wassenaar/8c8b8cdf-1509-44df-9514-aa9c7e415224.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912529/archived-events/International-Indian-Diaspora-Conference-Wassenaar/b6caf076-0449-4c40-bdec-0445b7508ff1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912526/archived-events/International-Indian-Diaspora-Conference-Wassenaar/ffb276ea-ab6a-4335-aa69-5df647a1194a.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912528/archived-events/International-Indian-Diaspora-Conference-Wassenaar/IMG_1429.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/International-Indian-Diaspora-Conference-Wassenaar/"
-  },
-  {
-    "event_id": "2573",
-    "event_name": "India Day 2023 @Eindhoven",
-    "event_date": "2023-10-02",
-    "cloudinary_folder": "India-Day-2023-Eindhoven",
-    "photo_count": 45,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912406/archived-events/India-Day-2023-Eindhoven/20231202_133854.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912407/archived-events/India-Day-2023-Eindhoven/20231202_174538.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912423/archived-events/India-Day-2023-Eindhoven/20231202_175130_Original.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912403/archived-events/India-Day-2023-Eindhoven/20231202_175832_Original.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912412/archived-events/India-Day-2023-Eindhoven/20231202_183105.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912418/archived-events/India-Day-2023-Eindhoven/20231202_205529.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912432/archived-events/India-Day-2023-Eindhoven/20231202_212430.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912419/archived-events/India-Day-2023-Eindhoven/20231202_221705_Original.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912414/archived-events/India-Day-2023-Eindhoven/20231202_221723.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912415/archived-events/India-Day-2023-Eindhoven/232ac756-e0e6-4e2e-a8a9-06b273986abd.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912425/archived-events/India-Day-2023-Eindhoven/58443de9-39e5-4bb9-8101-5758ad98c14d.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912424/archived-events/India-Day-2023-Eindhoven/7c0e62f3-57ab-4eae-a15f-e93368d7467d.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912427/archived-events/India-Day-2023-Eindhoven/c52d0c65-9c68-437a-8a9b-ec11ea463cbf.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912416/archived-events/India-Day-2023-Eindhoven/concert-2527495_1280.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912413/archived-events/India-Day-2023-Eindhoven/dba9fd68-3cad-42f5-b91c-837e208936e1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912405/archived-events/India-Day-2023-Eindhoven/e36b9cfb-9701-4d70-ab34-011f82a69cbd.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912422/archived-events/India-Day-2023-Eindhoven/f9aef566-69a6-4139-838a-bdc37dfb29e9.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912431/archived-events/India-Day-2023-Eindhoven/fa5c54d4-8775-4e26-9e41-dd8baaed1e27.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912414/archived-events/India-Day-2023-Eindhoven/facebook_1701593618269_7137000919482285259.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912412/archived-events/India-Day-2023-Eindhoven/facebook_1701626273600_7137137885865776292.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912401/archived-events/India-Day-2023-Eindhoven/facebook_1701729041147_7137568924201352103.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912429/archived-events/India-Day-2023-Eindhoven/facebook_1701761812512_7137706377268549533.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912411/archived-events/India-Day-2023-Eindhoven/facebook_1701761889299_7137706699338056721.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912415/archived-events/India-Day-2023-Eindhoven/facebook_1701761900756_7137706747388974732.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912404/archived-events/India-Day-2023-Eindhoven/IMG_5634.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912408/archived-events/India-Day-2023-Eindhoven/IMG_5634-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912423/archived-events/India-Day-2023-Eindhoven/IMG_5979.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912431/archived-events/India-Day-2023-Eindhoven/IMG_5981.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912421/archived-events/India-Day-2023-Eindhoven/IMG_6032.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912427/archived-events/India-Day-2023-Eindhoven/IMG_6042.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912428/archived-events/India-Day-2023-Eindhoven/IMG_6136.png",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912409/archived-events/India-Day-2023-Eindhoven/IMG_6138.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912417/archived-events/India-Day-2023-Eindhoven/IMG_6141.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912416/archived-events/India-Day-2023-Eindhoven/IMG_6142.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912420/archived-events/India-Day-2023-Eindhoven/IMG_6146.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912426/archived-events/India-Day-2023-Eindhoven/Screenshot_20231203-152214_WhatsApp.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912433/archived-events/India-Day-2023-Eindhoven/Screenshot_20231203-190253_Photos.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912410/archived-events/India-Day-2023-Eindhoven/Screenshot_20231204-233441_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912410/archived-events/India-Day-2023-Eindhoven/Screenshot_20231204-233500_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912422/archived-events/India-Day-2023-Eindhoven/Screenshot_20231205-091713_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912420/archived-events/India-Day-2023-Eindhoven/Screenshot_20231205-091759_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912408/archived-events/India-Day-2023-Eindhoven/Screenshot_20231205-091832_Facebook.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912403/archived-events/India-Day-2023-Eindhoven/ticket-2974645_1280.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912418/archived-events/India-Day-2023-Eindhoven/woman-2178480_1280.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912430/archived-events/India-Day-2023-Eindhoven/woman-2178480_1280-1.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/India-Day-2023-Eindhoven/"
-  },
-  {
-    "event_id": "518",
-    "event_name": "Indian Women Olympics Hockey Coach, Sjoerd Marijne Felicitation @Tilburg",
-    "event_date": "2021-03-17",
-    "cloudinary_folder": "Indian-Women-Olympics-Hockey-Coach-Sjoerd-Marijne-Felicitation-Tilburg",
-    "photo_count": 11,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912486/archived-events/Indian-Women-Olympics-Hockey-Coach-Sjoerd-Marijne-Felicitation-Tilburg/20210926_162501.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912480/archived-events/Indian-Women-Olympics-Hockey-Coach-Sjoerd-Marijne-Felicitation-Tilburg/20210926_162501-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912478/archived-events/Indian-Women-Olympics-Hockey-Coach-Sjoerd-Marijne-Felicitation-Tilburg/20210926_162645.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912484/archived-events/Indian-Women-Olympics-Hockey-Coach-Sjoerd-Marijne-Felicitation-Tilburg/20210926_163120.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912477/archived-events/Indian-Women-Olympics-Hockey-Coach-Sjoerd-Marijne-Felicitation-Tilburg/20210926_164036.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912482/archived-events/Indian-Women-Olympics-Hockey-Coach-Sjoerd-Marijne-Felicitation-Tilburg/20210926_164036-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912481/archived-events/Indian-Women-Olympics-Hockey-Coach-Sjoerd-Marijne-Felicitation-Tilburg/20210926_164036-Copy.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912485/archived-events/Indian-Women-Olympics-Hockey-Coach-Sjoerd-Marijne-Felicitation-Tilburg/20210926_164036-Copy-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912483/archived-events/Indian-Women-Olympics-Hockey-Coach-Sjoerd-Marijne-Felicitation-Tilburg/2023-10-23_22-28-26.png",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912485/archived-events/Indian-Women-Olympics-Hockey-Coach-Sjoerd-Marijne-Felicitation-Tilburg/3ae63fa5-1533-4830-b34b-0853823f40b9.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912480/archived-events/Indian-Women-Olympics-Hockey-Coach-Sjoerd-Marijne-Felicitation-Tilburg/5eaf459c-4e1e-4a04-819c-4e85a672fc8f.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/Indian-Women-Olympics-Hockey-Coach-Sjoerd-Marijne-Felicitation-Tilburg/"
-  },
-  {
-    "event_id": "515",
-    "event_name": "HE Ram Nath Kovind, President of India Visit @Amsterdam",
-    "event_date": "2021-03-17",
-    "cloudinary_folder": "HE-Ram-Nath-Kovind-President-of-India-Visit-Amsterdam",
-    "photo_count": 27,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912140/archived-events/HE-Ram-Nath-Kovind-President-of-India-Visit-Amsterdam/20220406_172332.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912130/archived-events/HE-Ram-Nath-Kovind-President-of-India-Visit-Amsterdam/20220406_182650.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912136/archived-events/HE-Ram-Nath-Kovind-President-of-India-Visit-Amsterdam/20220406_182843.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912131/archived-events/HE-Ram-Nath-Kovind-President-of-India-Visit-Amsterdam/2023-10-23_22-17-03.png",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912127/archived-events/HE-Ram-Nath-Kovind-President-of-India-Visit-Amsterdam/3cea263f-85bb-4ddc-9891-ffbf9cacec52.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912138/archived-events/HE-Ram-Nath-Kovind-President-of-India-Visit-Amsterdam/549edd1b-854a-40a2-ac2a-38b010674015.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912141/archived-events/HE-Ram-Nath-Kovind-President-of-India-Visit-Amsterdam/6aa03d90-8a0b-4224-aed4-25babf9ef166.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912135/archived-events/HE-Ram-Nath-Kovind-President-of-India-Visit-Amsterdam/84f9f326-1a37-4e31-acba-d00830cc2891.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912141/archived-events/HE-Ram-Nath-Kovind-President-of-India-Visit-Amsterdam/9372ca7c-79c5-4fea-95d5-50f8c52a04b4.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912124/archived-events/HE-Ram-Nath-Kovind-President-of-India-Visit-Amsterdam/a0c9af34-33e6-4a73-bfcd-0076f47d4ea7.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912133/archived-events/HE-Ram-Nath-Kovind-President-of-India-Visit-Amsterdam/c04cf685-5e57-4b0f-8a0e-2abda6586c73.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912128/archived-events/HE-Ram-Nath-Kovind-President-of-India-Visit-Amsterdam/ce8ba04b-c977-49b1-9f56-b034726038db.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912124/archived-events/HE-Ram-Nath-Kovind-President-of-India-Visit-Amsterdam/dff65b16-101a-4652-a929-896b4104a074.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912134/archived-events/HE-Ram-Nath-Kovind-President-of-India-Visit-Amsterdam/event-5.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912135/archived-events/HE-Ram-Nath-Kovind-President-of-India-Visit-Amsterdam/event-6.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912138/archived-events/HE-Ram-Nath-Kovind-President-of-India-Visit-Amsterdam/f059b1ec-ab71-4785-9123-6dc90fb15ea3.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912132/archived-events/HE-Ram-Nath-Kovind-President-of-India-Visit-Amsterdam/f106680d-b373-4f5e-97ed-55e980d3d31b.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912144/archived-events/HE-Ram-Nath-Kovind-President-of-India-Visit-Amsterdam/IMG_5983.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912137/archived-events/HE-Ram-Nath-Kovind-President-of-India-Visit-Amsterdam/IMG_5987.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912139/archived-events/HE-Ram-Nath-Kovind-President-of-India-Visit-Amsterdam/IMG_5994.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912143/archived-events/HE-Ram-Nath-Kovind-President-of-India-Visit-Amsterdam/IMG_5996.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912129/archived-events/HE-Ram-Nath-Kovind-President-of-India-Visit-Amsterdam/IMG_6004.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912128/archived-events/HE-Ram-Nath-Kovind-President-of-India-Visit-Amsterdam/IMG_6015.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912125/archived-events/HE-Ram-Nath-Kovind-President-of-India-Visit-Amsterdam/IMG_6016.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912144/archived-events/HE-Ram-Nath-Kovind-President-of-India-Visit-Amsterdam/IMG_6087.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912142/archived-events/HE-Ram-Nath-Kovind-President-of-India-Visit-Amsterdam/President-of-India-NL-Visit.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912133/archived-events/HE-Ram-Nath-Kovind-President-of-India-Visit-Amsterdam/President-of-India-NL-Visit-1.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/HE-Ram-Nath-Kovind-President-of-India-Visit-Amsterdam/"
-  },
-  {
-    "event_id": "447",
-    "event_name": "Bollywood Musician, Singer Piyush Mishra\u2019s @Amsterdam",
-    "event_date": "2021-03-04",
-    "cloudinary_folder": "Bollywood-Musician-Singer-Piyush-Mishras-Amsterdam",
-    "photo_count": 12,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911425/archived-events/Bollywood-Musician-Singer-Piyush-Mishras-Amsterdam/20220820_192332.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911430/archived-events/Bollywood-Musician-Singer-Piyush-Mishras-Amsterdam/C57F229A-A265-4CF9-969B-9EEB221D99F9.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911432/archived-events/Bollywood-Musician-Singer-Piyush-Mishras-Amsterdam/EB93C3A6-1500-4414-8A54-78F92E5BF509.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911428/archived-events/Bollywood-Musician-Singer-Piyush-Mishras-Amsterdam/IMG_1009.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911426/archived-events/Bollywood-Musician-Singer-Piyush-Mishras-Amsterdam/IMG_1022.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911429/archived-events/Bollywood-Musician-Singer-Piyush-Mishras-Amsterdam/IMG_1026.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911429/archived-events/Bollywood-Musician-Singer-Piyush-Mishras-Amsterdam/IMG_1151.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911427/archived-events/Bollywood-Musician-Singer-Piyush-Mishras-Amsterdam/IMG_1154.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911427/archived-events/Bollywood-Musician-Singer-Piyush-Mishras-Amsterdam/IMG_1156.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911431/archived-events/Bollywood-Musician-Singer-Piyush-Mishras-Amsterdam/IMG_1158.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911432/archived-events/Bollywood-Musician-Singer-Piyush-Mishras-Amsterdam/IMG_1166.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911425/archived-events/Bollywood-Musician-Singer-Piyush-Mishras-Amsterdam/IMG_1180.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/Bollywood-Musician-Singer-Piyush-Mishras-Amsterdam/"
-  },
-  {
-    "event_id": "446",
-    "event_name": "Azadi ka Amrit Mahotsav Poetry @The Gandhi Centre",
-    "event_date": "2021-03-04",
-    "cloudinary_folder": "Azadi-ka-Amrit-Mahotsav-Poetry-The-Gandhi-Centre",
-    "photo_count": 8,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911423/archived-events/Azadi-ka-Amrit-Mahotsav-Poetry-The-Gandhi-Centre/20220904_191610_Original.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911420/archived-events/Azadi-ka-Amrit-Mahotsav-Poetry-The-Gandhi-Centre/event-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911418/archived-events/Azadi-ka-Amrit-Mahotsav-Poetry-The-Gandhi-Centre/event-2.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911419/archived-events/Azadi-ka-Amrit-Mahotsav-Poetry-The-Gandhi-Centre/event-3.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911424/archived-events/Azadi-ka-Amrit-Mahotsav-Poetry-The-Gandhi-Centre/event-4.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911421/archived-events/Azadi-ka-Amrit-Mahotsav-Poetry-The-Gandhi-Centre/IMG_9676.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911421/archived-events/Azadi-ka-Amrit-Mahotsav-Poetry-The-Gandhi-Centre/IMG_9699.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765911419/archived-events/Azadi-ka-Amrit-Mahotsav-Poetry-The-Gandhi-Centre/IMG_9703.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/Azadi-ka-Amrit-Mahotsav-Poetry-The-Gandhi-Centre/"
-  },
-  {
-    "event_id": "440",
-    "event_name": "Meet & Greet, Lok Sabha Speaker, Sh. Om Birla @India House",
-    "event_date": "2021-03-04",
-    "cloudinary_folder": "Meet-Greet-Lok-Sabha-Speaker-Sh-Om-Birla-India-House",
-    "photo_count": 14,
-    "cloudinary_urls": [
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912713/archived-events/Meet-Greet-Lok-Sabha-Speaker-Sh-Om-Birla-India-House/0cf08cb4-e33b-4a7b-85e6-d0d372226b4b.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912717/archived-events/Meet-Greet-Lok-Sabha-Speaker-Sh-Om-Birla-India-House/0d0322aa-1827-46cf-9c63-8d3f90d9bbe5.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912719/archived-events/Meet-Greet-Lok-Sabha-Speaker-Sh-Om-Birla-India-House/2e40d848-d896-4b8d-8042-8f2aac92df6d.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912715/archived-events/Meet-Greet-Lok-Sabha-Speaker-Sh-Om-Birla-India-House/46250ecd-1dea-4cf5-82f3-330635c4759e.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912719/archived-events/Meet-Greet-Lok-Sabha-Speaker-Sh-Om-Birla-India-House/61c4d822-243e-4133-a2a2-feb3a3ee0f5e.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912721/archived-events/Meet-Greet-Lok-Sabha-Speaker-Sh-Om-Birla-India-House/6e7acb5a-98f1-46d1-baaa-db658975aa97.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912718/archived-events/Meet-Greet-Lok-Sabha-Speaker-Sh-Om-Birla-India-House/79f708c1-4306-4407-b28e-45f4b3f34f56.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912714/archived-events/Meet-Greet-Lok-Sabha-Speaker-Sh-Om-Birla-India-House/7f198c03-9532-4892-9880-d6fefc00e78b_Original.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912714/archived-events/Meet-Greet-Lok-Sabha-Speaker-Sh-Om-Birla-India-House/d4f43d5a-b708-48ae-a09c-0bba467b6d1e.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912717/archived-events/Meet-Greet-Lok-Sabha-Speaker-Sh-Om-Birla-India-House/d4f43d5a-b708-48ae-a09c-0bba467b6d1e-1.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912711/archived-events/Meet-Greet-Lok-Sabha-Speaker-Sh-Om-Birla-India-House/IMG_1041.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912715/archived-events/Meet-Greet-Lok-Sabha-Speaker-Sh-Om-Birla-India-House/IMG_1046.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912712/archived-events/Meet-Greet-Lok-Sabha-Speaker-Sh-Om-Birla-India-House/IMG_1069.jpg",
-      "https://res.cloudinary.com/du0lumtob/image/upload/v1765912721/archived-events/Meet-Greet-Lok-Sabha-Speaker-Sh-Om-Birla-India-House/IMG_1077.jpg"
-    ],
-    "folder_url": "https://res.cloudinary.com/du0lumtob/image/upload/archived-events/Meet-Greet-Lok-Sabha-Speaker-Sh-Om-Birla-India-House/"
-  }
-];
-
-// Get URL parameters
+function presetWidths(name, sourceWidth) {
+const preset = IMAGE_PRESETS[name];
+const widths = preset.widths;
+if (!preset.limit || !sourceWidth || sourceWidth >= widths[widths.length - 1]) return widths;
+return widths.filter(width => width < sourceWidth).concat(sourceWidth);
+}
+function presetSrcset(url, name, sourceWidth) {
+return presetWidths(name, sourceWidth)
+.map(width => `${presetUrl(url, name, width)} ${width}w`)
+.join(', ');
+}
+const GALLERY_DATA_DIR = 'gallery-data';
 const urlParams = new URLSearchParams(window.location.search);
 const folderName = urlParams.get('folder');
 const eventName = urlParams.get('name');
 const eventDate = urlParams.get('date');
-
-// Find event in mapping
-const eventData = EVENT_MAPPING.find(e => e.cloudinary_folder === folderName);
-
-if (!eventData) {
-    document.getElementById('gallery-grid').innerHTML = '<div class="loading">Event not found</div>';
+let eventData = null;
+function showNotFound() {
+document.getElementById('event-title').textContent = 'Event not found';
+document.getElementById('gallery-grid').innerHTML = '<div class="loading">Event not found</div>';
+}
+function renderGallery() {
+document.getElementById('event-title').textContent = eventData.event_name;
+document.getElementById('event-date').textContent = `📅 ${formatDate(eventData.event_date)}`;
+document.getElementById('photo-count').textContent = `📷 ${eventData.photo_count} photos`;
+document.title = `${eventData.event_name} - Gallery`;
+galleryGrid.innerHTML = '';
+mountGalleryItems();
+}
+const VIRTUAL_GRID_MIN_PHOTOS = 60;
+let virtualGrid = null;
+function createGalleryItem() {
+const item = document.createElement('div');
+item.className = 'gallery-item';
+const img = document.createElement('img');
+img.sizes = IMAGE_PRESETS.thumb.sizes;
+img.width = IMAGE_PRESETS.thumb.width;
+img.height = IMAGE_PRESETS.thumb.height;
+img.loading = 'lazy';
+item.appendChild(img);
+return item;
+}
+function updateGalleryItem(item, index) {
+const url = photoUrl(index);
+const img = item.querySelector('img');
+item.dataset.index = index;
+item.style.backgroundColor = photoDetails(index).color || '';
+img.dataset.index = index;
+img.dataset.full = url;
+img.alt = `Photo ${index + 1}`;
+img.srcset = presetSrcset(url, 'thumb');
+img.src = presetUrl(url, 'thumb');
+}
+function mountGalleryItems() {
+const count = eventData.photos.length;
+if (count >= VIRTUAL_GRID_MIN_PHOTOS && typeof createVirtualGrid === 'function') {
+virtualGrid = createVirtualGrid(galleryGrid, {
+count,
+create: createGalleryItem,
+update: updateGalleryItem
+});
+return;
+}
+const fragment = document.createDocumentFragment();
+for (let index = 0; index < count; index++) {
+const item = createGalleryItem();
+updateGalleryItem(item, index);
+fragment.appendChild(item);
+}
+galleryGrid.appendChild(fragment);
+}
+const galleryGrid = document.getElementById('gallery-grid');
+galleryGrid.addEventListener('click', (e) => {
+const item = e.target.closest('.gallery-item');
+if (item) openLightbox(Number(item.dataset.index));
+});
+if (galleryGrid.hasAttribute('data-prerendered')) {
+const images = Array.from(galleryGrid.querySelectorAll('.gallery-item img'));
+eventData = {
+photos: images.map(img => img.dataset.full),
+details: images.map(img => ({
+width: Number(img.dataset.width) || undefined,
+height: Number(img.dataset.height) || undefined,
+color: img.parentElement.style.backgroundColor || undefined
+}))
+};
+if (eventData.photos.length >= VIRTUAL_GRID_MIN_PHOTOS) {
+mountGalleryItems();
+}
+} else if (!folderName) {
+showNotFound();
 } else {
-    // Update header with formatted date
-    document.getElementById('event-title').textContent = eventData.event_name;
-    document.getElementById('event-date').textContent = `📅 ${formatDate(eventData.event_date)}`;
-    document.getElementById('photo-count').textContent = `📷 ${eventData.photo_count} photos`;
-    
-    // Set page title
-    document.title = `${eventData.event_name} - Gallery`;
-    
-    // Generate gallery
-    const galleryGrid = document.getElementById('gallery-grid');
-    galleryGrid.innerHTML = '';
-    
-    eventData.cloudinary_urls.forEach((url, index) => {
-        // Create responsive thumbnail URL with smart cropping (c_fill,g_auto)
-        const thumbnailUrl = url.replace(
-            '/upload/',
-            '/upload/w_350,h_260,c_fill,g_auto,q_auto,f_auto/'
-        );
-        
-        const item = document.createElement('div');
-        item.className = 'gallery-item';
-        item.innerHTML = `<img src="${thumbnailUrl}" alt="Photo ${index + 1}" loading="lazy" data-full="${url}" data-index="${index}">`;
-        
-        item.addEventListener('click', () => openLightbox(index));
-        
-        galleryGrid.appendChild(item);
-    });
+fetch(`${GALLERY_DATA_DIR}/${encodeURIComponent(folderName)}.json`)
+.then(response => {
+if (!response.ok) throw new Error(`HTTP ${response.status}`);
+return response.json();
+})
+.then(data => {
+eventData = data;
+renderGallery();
+})
+.catch(showNotFound);
 }
-
-// Lightbox functionality
 let currentIndex = 0;
 const lightbox = document.getElementById('lightbox');
 const lightboxImg = document.getElementById('lightbox-img');
-
 function openLightbox(index) {
-    currentIndex = index;
-    showImage(index);
-    lightbox.classList.add('active');
-    document.body.style.overflow = 'hidden';
+currentIndex = index;
+showImage(index);
+lightbox.classList.add('active');
+document.body.style.overflow = 'hidden';
 }
-
 function closeLightbox() {
-    lightbox.classList.remove('active');
-    document.body.style.overflow = 'auto';
+lightbox.classList.remove('active');
+document.body.style.overflow = 'auto';
+cancelPrefetch();
+}
+function setLightboxSource(img, index) {
+const url = photoUrl(index);
+const { width, height, color } = photoDetails(index);
+if (width && height) {
+img.width = IMAGE_PRESETS.lightbox.width;
+img.height = Math.round(IMAGE_PRESETS.lightbox.width * height / width);
+} else {
+img.removeAttribute('width');
+img.removeAttribute('height');
+}
+img.style.backgroundColor = color || '';
+img.sizes = IMAGE_PRESETS.lightbox.sizes;
+img.srcset = presetSrcset(url, 'lightbox', width);
+img.src = presetUrl(url, 'lightbox');
 }
-
 function showImage(index) {
-    if (!eventData || index < 0 || index >= eventData.cloudinary_urls.length) return;
-    
-    // Use high-quality version for lightbox without any cropping
-    const fullUrl = eventData.cloudinary_urls[index].replace(
-        '/upload/',
-        '/upload/w_1920,q_auto:good,f_auto/'
-    );
-    
-    lightboxImg.src = fullUrl;
-    document.querySelector('.lightbox-caption').textContent = `${index + 1} / ${eventData.cloudinary_urls.length}`;
+if (!eventData || index < 0 || index >= eventData.photos.length) return;
+setLightboxSource(lightboxImg, index);
+document.querySelector('.lightbox-caption').textContent = `${index + 1} / ${eventData.photos.length}`;
+const ready = lightboxImg.decode ? lightboxImg.decode() : Promise.resolve();
+ready.catch(() => {}).then(() => {
+if (index === currentIndex) lightboxImg.style.backgroundColor = '';
+if (index === currentIndex && lightbox.classList.contains('active')) {
+prefetchAround(index);
+}
+});
+}
+const PREFETCH_DISTANCE = 2;
+const prefetched = new Map(); // photo index -> Image
+function prefetchDistance() {
+const connection = navigator.connection;
+if (!connection) return PREFETCH_DISTANCE;
+if (connection.saveData) return 0;
+if (connection.effectiveType === 'slow-2g' || connection.effectiveType === '2g') return 0;
+if (connection.effectiveType === '3g') return 1;
+return PREFETCH_DISTANCE;
+}
+function cancelPrefetch(keep = new Set()) {
+prefetched.forEach((img, i) => {
+if (keep.has(i)) return;
+img.removeAttribute('srcset');
+img.removeAttribute('src');
+prefetched.delete(i);
+});
+}
+function prefetchAround(index) {
+const count = eventData.photos.length;
+const wanted = new Set();
+for (let offset = 1; offset <= prefetchDistance(); offset++) {
+wanted.add((index + offset) % count);
+wanted.add((index - offset + count) % count);
+}
+wanted.delete(index);
+cancelPrefetch(new Set([...wanted, index]));
+wanted.forEach(i => {
+if (prefetched.has(i)) return;
+const img = new Image();
+setLightboxSource(img, i);
+if (img.decode) img.decode().catch(() => {});
+prefetched.set(i, img);
+});
 }
-
 function nextImage() {
-    currentIndex = (currentIndex + 1) % eventData.cloudinary_urls.length;
-    showImage(currentIndex);
+currentIndex = (currentIndex + 1) % eventData.photos.length;
+showImage(currentIndex);
 }
-
 function prevImage() {
-    currentIndex = (currentIndex - 1 + eventData.cloudinary_urls.length) % eventData.cloudinary_urls.length;
-    showImage(currentIndex);
+currentIndex = (currentIndex - 1 + eventData.photos.length) % eventData.photos.length;
+showImage(currentIndex);
 }
-
-// Event listeners
 document.querySelector('.lightbox-close').addEventListener('click', closeLightbox);
 document.querySelector('.lightbox-next').addEventListener('click', nextImage);
 document.querySelector('.lightbox-prev').addEventListener('click', prevImage);
-
-// Keyboard navigation
 document.addEventListener('keydown', (e) => {
-    if (!lightbox.classList.contains('active')) return;
-    
-    if (e.key === 'Escape') closeLightbox();
-    if (e.key === 'ArrowRight') nextImage();
-    if (e.key === 'ArrowLeft') prevImage();
+if (!lightbox.classList.contains('active')) return;
+if (e.key === 'Escape') closeLightbox();
+if (e.key === 'ArrowRight') nextImage();
+if (e.key === 'ArrowLeft') prevImage();
 });
-
-// Close on background click
 lightbox.addEventListener('click', (e) => {
-    if (e.target === lightbox) closeLightbox();
-});
+if (e.target === lightbox) closeLightbox();
+});
\ No newline at end of file
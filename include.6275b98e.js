@@ -0,0 +1,188 @@
+if ('serviceWorker' in navigator && document.currentScript) {
+const serviceWorkerUrl = new URL('sw.js', document.currentScript.src);
+window.addEventListener('load', () => {
+navigator.serviceWorker.register(serviceWorkerUrl).catch(() => {});
+});
+}
+function loadComponents(pageTitle, activePage) {
+const headerPath = 'header.html';
+const footerPath = 'footer.html';
+document.title = pageTitle;
+const headerPlaceholder = document.getElementById('header-placeholder');
+if (headerPlaceholder) {
+fetch(headerPath)
+.then(response => {
+if (!response.ok) throw new Error(`HTTP error! status: ${response.status}`);
+return response.text();
+})
+.then(headerContent => {
+headerPlaceholder.outerHTML = headerContent;
+markActiveLinks(activePage);
+initHeader();
+})
+.catch(error => console.error('Error loading header. Please check the file path and local server setup:', error));
+} else {
+initHeader();
+}
+const footerPlaceholder = document.getElementById('footer-placeholder');
+if (footerPlaceholder) {
+fetch(footerPath)
+.then(response => {
+if (!response.ok) throw new Error(`HTTP error! status: ${response.status}`);
+return response.text();
+})
+.then(footerContent => {
+footerPlaceholder.outerHTML = footerContent;
+})
+.catch(error => console.error('Error loading footer. Please check the file path and local server setup:', error));
+}
+}
+function markActiveLinks(activePage) {
+const navLinksContainer = document.getElementById('main-nav-links');
+if (!navLinksContainer) return;
+navLinksContainer.querySelectorAll('a[href]:not(.btn-donate)').forEach(a => {
+if (a.getAttribute('href') === activePage) {
+a.classList.add('active');
+}
+});
+navLinksContainer.querySelectorAll('.has-dropdown').forEach(li => {
+if (li.querySelector('.dropdown-menu .active')) {
+li.firstElementChild.classList.add('active');
+}
+});
+}
+function initHeader() {
+const navLinksContainer = document.getElementById('main-nav-links');
+if (navLinksContainer) {
+function redistributeMenu() {
+if (window.innerWidth <= 900) return;
+const nav = navLinksContainer;
+const more = nav.querySelector('.more');
+const moreList = more.querySelector('.more-list');
+const donate = nav.querySelector('.donate-li') || document.querySelector('.donate-li');
+const navbar = document.querySelector('.navbar');
+const logo = document.querySelector('.logo');
+if (!nav || !more || !navbar) return;
+while (moreList.firstChild) {
+nav.insertBefore(moreList.firstChild, more);
+}
+const navbarWidth = navbar.clientWidth;
+const logoWidth = logo ? logo.offsetWidth : 0;
+const donateWidth = donate ? donate.offsetWidth : 0;
+const buffer = 86; // breathing room to avoid edge-case wrapping
+try {
+if (window.innerWidth >= 992 && donateWidth > 0) {
+const reserve = donateWidth + 40;
+nav.style.maxWidth = (navbarWidth - reserve - logoWidth) + 'px';
+} else {
+nav.style.maxWidth = '';
+}
+} catch (e) {}
+const available = navbarWidth - (logoWidth + donateWidth + buffer);
+let gap = 18; // default
+try {
+const cs = window.getComputedStyle(nav);
+const g = cs.getPropertyValue('gap') || cs.getPropertyValue('column-gap');
+if (g) gap = parseFloat(g);
+} catch (e) {}
+let items = Array.from(nav.children).filter(ch => !ch.classList.contains('more') && !ch.classList.contains('donate-li'));
+let used = items.reduce((sum, el) => sum + el.offsetWidth, 0);
+if (items.length > 1) used += gap * (items.length - 1);
+while (used > available && items.length > 0) {
+const last = items.pop();
+used -= last.offsetWidth;
+if (items.length >= 1) used -= gap; // removed one gap
+moreList.insertBefore(last, moreList.firstChild);
+}
+items = Array.from(nav.children).filter(ch => !ch.classList.contains('more') && !ch.classList.contains('donate-li'));
+if (items.length === 0 && moreList.children.length > 0) {
+const firstFromMore = moreList.removeChild(moreList.firstChild);
+nav.insertBefore(firstFromMore, more);
+}
+const moreToggle = more.querySelector('.more-toggle');
+const moreCount = moreToggle ? moreToggle.querySelector('.more-count') : null;
+const count = moreList.children.length;
+if (moreCount) moreCount.textContent = count > 0 ? `(${count})` : '';
+if (count === 0) {
+more.style.display = 'none';
+if (moreList.classList.contains('open')) {
+moreList.classList.remove('open');
+moreToggle && moreToggle.setAttribute('aria-expanded', 'false');
+moreList.setAttribute('aria-hidden', 'true');
+}
+} else {
+more.style.display = 'block';
+}
+}
+const moreToggleBtn = navLinksContainer.querySelector('.more-toggle');
+const moreContainer = navLinksContainer.querySelector('.more');
+const moreListEl = moreContainer ? moreContainer.querySelector('.more-list') : null;
+if (moreToggleBtn && moreListEl) {
+moreToggleBtn.addEventListener('click', (e) => {
+e.stopPropagation();
+const isOpen = moreListEl.classList.toggle('open');
+moreToggleBtn.setAttribute('aria-expanded', isOpen);
+moreListEl.setAttribute('aria-hidden', !isOpen);
+});
+document.addEventListener('click', (ev) => {
+if (!moreContainer.contains(ev.target) && moreListEl.classList.contains('open')) {
+moreListEl.classList.remove('open');
+moreToggleBtn.setAttribute('aria-expanded', 'false');
+moreListEl.setAttribute('aria-hidden', 'true');
+}
+});
+document.addEventListener('keydown', (ev) => {
+if (ev.key === 'Escape' && moreListEl.classList.contains('open')) {
+moreListEl.classList.remove('open');
+moreToggleBtn.setAttribute('aria-expanded', 'false');
+moreListEl.setAttribute('aria-hidden', 'true');
+}
+});
+}
+let _redistributeTimer = null;
+window.addEventListener('resize', () => {
+clearTimeout(_redistributeTimer);
+_redistributeTimer = setTimeout(redistributeMenu, 120);
+});
+setTimeout(redistributeMenu, 250);
+function checkLongMenu() {
+const nav = document.getElementById('main-nav-links');
+const navbar = document.querySelector('.navbar');
+const logo = document.querySelector('.logo');
+const donate = document.querySelector('.btn-donate');
+if (!nav || !navbar) return;
+const navbarWidth = navbar.clientWidth;
+const logoWidth = logo ? logo.offsetWidth : 0;
+const donateWidth = donate ? donate.offsetWidth : 0;
+const buffer = 80; // breathing room for gaps/padding
+const available = navbarWidth - (logoWidth + donateWidth + buffer);
+let linksWidth = 0;
+Array.from(nav.children).forEach(li => {
+linksWidth += li.offsetWidth;
+});
+if (linksWidth > available) {
+nav.classList.add('long-menu');
+} else {
+nav.classList.remove('long-menu');
+}
+}
+let _menuResizeTimer = null;
+window.addEventListener('resize', () => {
+clearTimeout(_menuResizeTimer);
+_menuResizeTimer = setTimeout(checkLongMenu, 120);
+});
+setTimeout(checkLongMenu, 200);
+}
+const toggleButton = document.querySelector('.menu-toggle');
+const navLinks = document.getElementById('main-nav-links');
+if (toggleButton && navLinks) {
+toggleButton.addEventListener('click', () => {
+navLinks.classList.toggle('open');
+const isExpanded = navLinks.classList.contains('open');
+toggleButton.setAttribute('aria-expanded', isExpanded);
+const icon = toggleButton.querySelector('i');
+icon.classList.toggle('fa-bars');
+icon.classList.toggle('fa-times');
+});
+}
+}
\ No newline at end of file
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Component Inliner
+
+Copies header.html and footer.html into every top-level page that loads
+them through include.js, so the navigation is part of the page itself
+instead of arriving after two extra fetches. The page's active link (the
+second argument of its loadComponents() call) is marked in the inlined
+navigation, the same way include.js marks it for pages that are not
+inlined.
+
+The inlined markup sits between marker comments, so running the script
+again after editing header.html or footer.html replaces it. Run it after
+update_website.py, which writes events.html with placeholders.
+
+    python inline_components.py
+"""
+
+import argparse
+import html
+import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "scripts"))
+from build_manifest import BUILD_MANIFEST_FILE, load_manifest, refresh_outputs, save_manifest
+from site_render import open_output
+
+# Components, by the id of the placeholder they replace
+COMPONENTS = {
+    "header": "header.html",
+    "footer": "footer.html",
+}
+
+PLACEHOLDER_TEMPLATE = '<div id="{name}-placeholder"></div>'
+INLINED_TEMPLATE = '<!-- inline:{path} -->\n{markup}\n<!-- /inline:{path} -->'
+
+LOAD_COMPONENTS_PATTERN = re.compile(
+    r"""loadComponents\(\s*(['"])(?:(?!\1).)*\1\s*,\s*(['"])([^'"]*)\2\s*\)"""
+)
+NAV_START = 'id="main-nav-links">'
+DROPDOWN_PATTERN = re.compile(
+    r'(<li class="has-dropdown"><a href="[^"]*"(?: class="active")?>)(.*?</ul>)', re.DOTALL
+)
+ACTIVE_CLASS = ' class="active"'
+
+
+def inlined_pattern(name, path):
+    """Match a component inlined by an earlier run, or its placeholder."""
+    return re.compile(
+        re.escape(PLACEHOLDER_TEMPLATE.format(name=name))
+        + '|'
+        + re.escape(f'<!-- inline:{path} -->') + r'.*?' + re.escape(f'<!-- /inline:{path} -->'),
+        re.DOTALL
+    )
+
+
+def mark_active_links(header, active_page):
+    """Mark the nav links to active_page, and the dropdown holding them."""
+    head, start, nav = header.partition(NAV_START)
+    if not start:
+        return header
+
+    link = f'<a href="{html.escape(active_page)}">'
+    nav = nav.replace(link, link[:-1] + ACTIVE_CLASS + '>')
+
+    def mark_parent(match):
+        parent, menu = match.groups()
+        if ACTIVE_CLASS in menu and ACTIVE_CLASS not in parent:
+            parent = parent[:-1] + ACTIVE_CLASS + '>'
+        return parent + menu
+
+    return head + start + DROPDOWN_PATTERN.sub(mark_parent, nav)
+
+
+def active_page(text):
+    """Return the active page passed to loadComponents(), or None."""
+    match = LOAD_COMPONENTS_PATTERN.search(text)
+    return match.group(3) if match else None
+
+
+def inline_page(text, components):
+    """Inline the components into one page. Pages without loadComponents() are returned as-is."""
+    page = active_page(text)
+    if page is None:
+        return text
+
+    for name, path in COMPONENTS.items():
+        markup = components[path]
+        if name == "header":
+            markup = mark_active_links(markup, page)
+        block = INLINED_TEMPLATE.format(path=path, markup=markup.rstrip('\n'))
+        text = inlined_pattern(name, path).sub(lambda match: block, text, count=1)
+    return text
+
+
+def load_components():
+    """Read the component files."""
+    return {
+        path: Path(path).read_text(encoding='utf-8')
+        for path in COMPONENTS.values()
+    }
+
+
+def inline_pages(components, check=False):
+    """Inline the components into every top-level page. Returns the pages that changed."""
+    changed = []
+    for page in sorted(Path('.').glob('*.html')):
+        if str(page) in COMPONENTS.values():
+            continue
+        text = page.read_text(encoding='utf-8')
+        inlined = inline_page(text, components)
+        if inlined == text:
+            continue
+        changed.append(page)
+        if not check:
+            with open_output(page) as f:
+                f.write(inlined)
+    return changed
+
+
+def refresh_manifest(pages):
+    """Record the inlined content of generated pages, so update_website.py keeps them."""
+    manifest = load_manifest(BUILD_MANIFEST_FILE)
+    if refresh_outputs(manifest, pages):
+        save_manifest(manifest, BUILD_MANIFEST_FILE)
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description="Inline header.html and footer.html into the site's pages.")
+    parser.add_argument(
+        '--check',
+        action='store_true',
+        help="only report pages that are not up to date, and exit with status 1 if there are any"
+    )
+    args = parser.parse_args()
+
+    print("🧩 Inlining header and footer...\n")
+
+    changed = inline_pages(load_components(), check=args.check)
+
+    if args.check:
+        for page in changed:
+            print(f"   ❌ {page} is not up to date")
+        if changed:
+            print("\n   Run: python inline_components.py")
+            sys.exit(1)
+        print("   ✅ All pages are up to date")
+        return
+
+    refresh_manifest(changed)
+    for page in changed:
+        print(f"   ✅ Updated {page}")
+    print(f"\n✨ {len(changed)} page(s) updated")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+"""
+Image Optimizer
+
+Resizes every photo in images/ to WebP (and AVIF, when Pillow supports
+it) at several widths in images/optimized/, with EXIF/XMP metadata
+stripped, and points the site's pages at them: <img> tags are wrapped in
+a <picture> with one <source> per format, and hero backgrounds (both
+background-image and background: shorthands, gradient layers included)
+get an image-set() of the largest variant.
+
+Each <source> reuses the <img>'s sizes attribute when it has one (set
+it for images shown much narrower than the screen, like the logo), or
+falls back to its width attribute, or 100vw.
+
+Images are converted in parallel across all cores. The mtime, size and
+hash of each source are kept in .image-cache.json, so unchanged images
+are skipped on the next run (also when only their mtime changed, via
+the hash).
+
+    pip install Pillow
+    python optimize_images.py
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+try:
+    from PIL import Image, ImageOps, features
+except ImportError:  # Only needed when images have to be converted
+    Image = None
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "scripts"))
+from build_manifest import (
+    BUILD_MANIFEST_FILE,
+    hash_file,
+    hash_inputs,
+    load_manifest,
+    refresh_outputs,
+    save_manifest,
+)
+from site_render import open_output
+
+# Paths
+IMAGE_DIR = "images"
+OUTPUT_DIR = "images/optimized"
+CACHE_FILE = ".image-cache.json"
+CACHE_VERSION = 1
+
+SOURCE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+
+# Widths offered through srcset; never upscaled past the original
+VARIANT_WIDTHS = (480, 960, 1440, 1920)
+
+# Output formats, best first (the browser takes the first it supports)
+FORMATS = {
+    "avif": {"mime": "image/avif", "quality": 55},
+    "webp": {"mime": "image/webp", "quality": 80},
+}
+
+# MIME type of the original, kept as the last image-set() candidate
+SOURCE_MIME_TYPES = {'.jpg': "image/jpeg", '.jpeg': "image/jpeg", '.png': "image/png"}
+
+# <picture> wrappers written by this script, unwrapped again on re-runs
+PICTURE_PATTERN = re.compile(
+    r'<picture data-optimized>(?:<source[^>]*>)*(<img\b[^>]*>)</picture>'
+)
+IMG_PATTERN = re.compile(r'<img\b[^>]*\bsrc="(images/[^"]+)"[^>]*>')
+BACKGROUND_PATTERN = re.compile(
+    r"""background-image:\s*url\((['"]?)(images/[^'")]+)\1\)"""
+    r"""(?:;\s*background-image:\s*image-set\([^;"]*\))?"""
+)
+# background: shorthands with a local image among their layers (such as
+# a gradient over a hero image), in style attributes and <style> blocks;
+# group 1 and 4 are the declaration around the url()
+SHORTHAND_PATTERN = re.compile(
+    r"""background:\s*([^;"{}]*?)url\((['"]?)(images/[^'")]+)\2\)([^;"{}]*)"""
+    r"""(?:;\s*background:[^;"{}]*image-set\([^;"{}]*)?"""
+)
+ATTRIBUTE_PATTERN = r'\b{}="([^"]*)"'
+
+
+def available_formats():
+    """Return the output formats this Pillow build can write."""
+    return [name for name in FORMATS if features.check(name)]
+
+
+def variant_widths(width):
+    """Return the widths to render for an image that is width pixels wide."""
+    widths = [w for w in VARIANT_WIDTHS if w < width]
+    widths.append(min(width, VARIANT_WIDTHS[-1]))
+    return sorted(set(widths))
+
+
+def variant_path(source, width, file_format):
+    """Return the path of one rendition of a source image."""
+    return f"{OUTPUT_DIR}/{Path(source).stem}-{width}.{file_format}"
+
+
+def settings_hash(formats):
+    """Hash the conversion settings; changing them rebuilds every image."""
+    return hash_inputs(VARIANT_WIDTHS, FORMATS, formats)
+
+
+def optimize_image(source, formats):
+    """Write every variant of one image. Runs in a worker process.
+
+    Returns the cache entry fields describing the variants.
+    """
+    with Image.open(source) as original:
+        # Apply the EXIF rotation before the metadata is dropped
+        image = ImageOps.exif_transpose(original)
+        icc_profile = original.info.get('icc_profile')
+
+    if image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGBA' if 'A' in image.getbands() or image.mode == 'P' else 'RGB')
+        # The profile described the old colour space (CMYK, greyscale)
+        icc_profile = None
+
+    variants = {file_format: [] for file_format in formats}
+    for width in variant_widths(image.width):
+        height = max(1, round(image.height * width / image.width))
+        resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+
+        for file_format in formats:
+            path = variant_path(source, width, file_format)
+            resized.save(
+                path,
+                file_format.upper(),
+                quality=FORMATS[file_format]['quality'],
+                icc_profile=icc_profile,
+            )
+            variants[file_format].append([width, path])
+
+    return {"width": image.width, "height": image.height, "variants": variants}
+
+
+def load_cache(path=CACHE_FILE):
+    """Load the conversion cache, or start an empty one."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        cache = {}
+
+    if cache.get('version') != CACHE_VERSION:
+        cache = {"version": CACHE_VERSION, "images": {}}
+    return cache
+
+
+def save_cache(cache, path=CACHE_FILE):
+    """Write the conversion cache with sorted keys so diffs stay small."""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def outputs_exist(entry):
+    """Check whether every variant recorded in a cache entry is on disk."""
+    return all(
+        Path(path).exists()
+        for variants in entry['variants'].values()
+        for _, path in variants
+    )
+
+
+def is_cached(entry, source, settings):
+    """Check whether a source image still matches its cache entry.
+
+    The mtime and size are compared first; only when they differ is the
+    file hashed, so a touched but unchanged image is not reconverted.
+    """
+    if not entry or entry.get('settings') != settings or not outputs_exist(entry):
+        return False
+
+    stat = os.stat(source)
+    if entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+        return True
+
+    if entry['sha256'] != hash_file(source):
+        return False
+
+    entry['mtime_ns'] = stat.st_mtime_ns
+    entry['size'] = stat.st_size
+    return True
+
+
+def source_images():
+    """Return the source image paths, sorted."""
+    return sorted(
+        path.as_posix() for path in Path(IMAGE_DIR).iterdir()
+        if path.is_file() and path.suffix.lower() in SOURCE_EXTENSIONS
+    )
+
+
+def optimize_images(cache, sources, formats, workers=None, force=False):
+    """Convert the sources that changed since the last run.
+
+    Returns (converted, skipped, failed) lists of source paths.
+    """
+    settings = settings_hash(formats)
+    images = cache['images']
+
+    for source in list(images):
+        if source not in sources:
+            del images[source]
+
+    pending = [
+        source for source in sources
+        if force or not is_cached(images.get(source), source, settings)
+    ]
+    skipped = [source for source in sources if source not in pending]
+    converted = []
+    failed = []
+
+    if not pending:
+        return converted, skipped, failed
+
+    Path(OUTPUT_DIR).mkdir(parents=True, exist_ok=True)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(optimize_image, source, formats): source for source in pending}
+        for future in as_completed(futures):
+            source = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"   ❌ {source}: {str(e)}")
+                images.pop(source, None)
+                failed.append(source)
+                continue
+
+            stat = os.stat(source)
+            images[source] = dict(
+                result,
+                mtime_ns=stat.st_mtime_ns,
+                size=stat.st_size,
+                sha256=hash_file(source),
+                settings=settings,
+            )
+            converted.append(source)
+
+    return sorted(converted), skipped, sorted(failed)
+
+
+def remove_stale_variants(cache):
+    """Delete files in the output directory that no cache entry refers to."""
+    current = {
+        path
+        for entry in cache['images'].values()
+        for variants in entry['variants'].values()
+        for _, path in variants
+    }
+
+    removed = []
+    for path in Path(OUTPUT_DIR).glob('*'):
+        if path.is_file() and path.as_posix() not in current:
+            path.unlink()
+            removed.append(path)
+
+    return removed
+
+
+def srcset(variants):
+    """Build a srcset attribute value from [width, path] pairs."""
+    return ', '.join(f"{path} {width}w" for width, path in variants)
+
+
+def image_sizes(img_tag):
+    """Pick the sizes attribute for an <img>, from its own sizes or width."""
+    sizes = re.search(ATTRIBUTE_PATTERN.format('sizes'), img_tag)
+    if sizes:
+        return sizes.group(1)
+
+    width = re.search(ATTRIBUTE_PATTERN.format('width'), img_tag)
+    if width and width.group(1).isdigit():
+        return f"(max-width: {width.group(1)}px) 100vw, {width.group(1)}px"
+    return "100vw"
+
+
+def picture_markup(img_tag, entry):
+    """Wrap an <img> in a <picture> offering every optimized format."""
+    sizes = image_sizes(img_tag)
+    sources = ''.join(
+        f'<source type="{FORMATS[file_format]["mime"]}" '
+        f'srcset="{srcset(variants)}" sizes="{sizes}">'
+        for file_format, variants in entry['variants'].items()
+    )
+    return f'<picture data-optimized>{sources}{img_tag}</picture>'
+
+
+def image_set(source, entry):
+    """Return an image-set() of the largest variant of each format and the original."""
+    candidates = [
+        f"url('{variants[-1][1]}') type('{FORMATS[file_format]['mime']}')"
+        for file_format, variants in entry['variants'].items()
+    ]
+    mime = SOURCE_MIME_TYPES[Path(source).suffix.lower()]
+    candidates.append(f"url('{source}') type('{mime}')")
+    return f"image-set({', '.join(candidates)})"
+
+
+def background_markup(source, entry):
+    """Return background-image declarations with an image-set() of variants."""
+    return f"background-image: url('{source}'); background-image: {image_set(source, entry)}"
+
+
+def shorthand_markup(before, source, after, entry):
+    """Return background declarations with the image layer as an image-set().
+
+    The first declaration keeps the plain url() for browsers without
+    image-set(); the other layers (gradients) and values are repeated.
+    """
+    fallback = f"background: {before}url('{source}'){after}"
+    if not entry:
+        return fallback
+    return f"{fallback}; background: {before}{image_set(source, entry)}{after}"
+
+
+def rewrite_page(text, images):
+    """Point a page's local images at their optimized variants."""
+    # Start from the original markup, so re-runs pick up new variants
+    text = PICTURE_PATTERN.sub(r'\1', text)
+
+    def replace_img(match):
+        entry = images.get(match.group(1))
+        return picture_markup(match.group(0), entry) if entry else match.group(0)
+
+    def replace_background(match):
+        source = match.group(2)
+        entry = images.get(source)
+        if not entry:
+            return f"background-image: url('{source}')"
+        return background_markup(source, entry)
+
+    def replace_shorthand(match):
+        before, _, source, after = match.groups()
+        return shorthand_markup(before, source, after, images.get(source))
+
+    text = IMG_PATTERN.sub(replace_img, text)
+    text = BACKGROUND_PATTERN.sub(replace_background, text)
+    return SHORTHAND_PATTERN.sub(replace_shorthand, text)
+
+
+def rewrite_pages(images):
+    """Rewrite every top-level HTML page. Returns the pages that changed."""
+    changed = []
+    for page in sorted(Path('.').glob('*.html')):
+        text = page.read_text(encoding='utf-8')
+        rewritten = rewrite_page(text, images)
+        if rewritten != text:
+            with open_output(page) as f:
+                f.write(rewritten)
+            changed.append(page)
+    return changed
+
+
+def refresh_manifest(pages):
+    """Record the rewritten content of generated pages, so update_website.py keeps them."""
+    manifest = load_manifest(BUILD_MANIFEST_FILE)
+    if refresh_outputs(manifest, pages):
+        save_manifest(manifest, BUILD_MANIFEST_FILE)
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description=f"Create optimized variants of the images in {IMAGE_DIR}/.")
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help=f"convert every image, ignoring {CACHE_FILE}"
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        metavar='N',
+        help="number of worker processes (default: one per core)"
+    )
+    parser.add_argument(
+        '--no-rewrite',
+        action='store_true',
+        help="only convert images, leave the HTML pages unchanged"
+    )
+    args = parser.parse_args()
+
+    if Image is None:
+        print("❌ The Pillow package is not installed")
+        print("   Run: pip install Pillow")
+        sys.exit(1)
+
+    formats = available_formats()
+    if not formats:
+        print("❌ This Pillow build cannot write WebP or AVIF")
+        sys.exit(1)
+
+    print("🖼️  Optimizing images...\n")
+    print(f"   Formats: {', '.join(formats)}")
+    print(f"   Widths:  {', '.join(str(w) for w in VARIANT_WIDTHS)}\n")
+
+    cache = load_cache(CACHE_FILE)
+    sources = source_images()
+
+    converted, skipped, failed = optimize_images(cache, sources, formats, args.workers, args.force)
+    removed = remove_stale_variants(cache)
+    save_cache(cache, CACHE_FILE)
+
+    print(f"   ✅ Converted {len(converted)} image(s), skipped {len(skipped)} unchanged")
+    if removed:
+        print(f"   🗑️  Removed {len(removed)} stale variant(s)")
+    if failed:
+        print(f"   ❌ {len(failed)} image(s) failed")
+
+    original_size = sum(os.path.getsize(source) for source in sources)
+    variant_size = sum(path.stat().st_size for path in Path(OUTPUT_DIR).glob('*'))
+    print(f"   📉 {IMAGE_DIR}/: {original_size / 1e6:.1f} MB, "
+          f"{OUTPUT_DIR}/ (all widths and formats): {variant_size / 1e6:.1f} MB")
+
+    if not args.no_rewrite:
+        print("\n📝 Pointing pages at the optimized images...")
+        changed = rewrite_pages(cache['images'])
+        refresh_manifest(changed)
+        print(f"   ✅ Updated {len(changed)} page(s)")
+        for page in changed:
+            print(f"   📄 {page}")
+
+    print(f"\n   🧾 Cache: {CACHE_FILE}")
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
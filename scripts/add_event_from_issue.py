@@ -4,40 +4,83 @@ Add Event from GitHub Issue
 
 This script parses a GitHub issue to extract event details,
 fetches photos from Cloudinary, and updates the event mapping files.
+
+Several issues can be added in one run with --issue-file; their folders
+are fetched concurrently. Folder listings are cached in
+.cloudinary-cache.json so re-runs barely touch the API quota (--no-cache
+skips it). --fake-api runs everything offline against a local stand-in
+for the Cloudinary API.
+
+Each photo's width and height are stored from the folder listing, along
+with its average color as a placeholder (fetched once per new photo,
+see placeholders.py; --no-placeholders skips it).
 """
 
+import argparse
 import json
 import os
 import re
 import sys
+import time
+from contextlib import closing
 from datetime import datetime
-import cloudinary
-import cloudinary.api
+from pathlib import Path
+
+try:
+    import cloudinary
+    import cloudinary.api
+    import cloudinary.uploader
+except ImportError:  # Only needed when talking to the real API
+    cloudinary = None
+
+from cloudinary_client import FolderFetchError, fetch_folders, list_folder
+from derived_images import warm_events
+from event_store import (
+    event_total,
+    export_shards,
+    iter_events,
+    open_store,
+    store_cloud_name,
+    store_events,
+)
+from event_mapping import (
+    empty_mapping,
+    event_base_path,
+    load_mapping,
+    photo_entry,
+    save_mapping,
+    upload_url,
+    upsert_events,
+)
+from fake_cloudinary import FakeCloudinaryAPI
+from gallery_data import GALLERY_DATA_DIR, GALLERY_INDEX_FILE, write_folder_shards
+from instrumentation import count, instrumented, phase
+from listing_cache import CACHE_FILE, fetch_folders_cached, load_cache, save_cache
+from placeholders import fetch_colors, known_colors
 
 # Configuration
 CLOUDINARY_CLOUD_NAME = os.environ.get('CLOUDINARY_CLOUD_NAME', 'du0lumtob')
 MAPPING_FILE = "cloudinary_event_mapping.json"
-GALLERY_JS_FILE = "gallery.js"
 
 
 def parse_issue_body(issue_body):
     """Parse the GitHub issue body to extract event details."""
     print("📋 Parsing issue body...")
     
-    # Patterns to match form fields
+    # Patterns to match form fields (one line each, except the video links)
     patterns = {
         'event_name': r'### Event Name\s*\n\s*(.+)',
         'location': r'### Location\s*\n\s*(.+)',
         'event_date': r'### Event Date\s*\n\s*(.+)',
         'cloudinary_folder': r'### Cloudinary Folder Name\s*\n\s*(.+)',
         'photo_count': r'### Number of Photos\s*\n\s*(.+)',
-        'video_links': r'### Video Links \(Optional\)\s*\n\s*(.+?)(?=\n###|\Z)',
+        'video_links': r'### Video Links \(Optional\)\s*\n\s*((?s:.+?))(?=\n###|\Z)',
     }
     
     event_data = {}
     
     for key, pattern in patterns.items():
-        match = re.search(pattern, issue_body, re.MULTILINE | re.DOTALL)
+        match = re.search(pattern, issue_body, re.MULTILINE)
         if match:
             value = match.group(1).strip()
             # Handle "No response" or "_No response_" placeholders
@@ -65,9 +108,17 @@ def parse_issue_body(issue_body):
 
 
 def connect_cloudinary():
-    """Initialize Cloudinary connection using environment variables."""
+    """Initialize Cloudinary connection using environment variables.
+    
+    Returns the cloudinary.api module to list folders with.
+    """
     print("\n🔌 Connecting to Cloudinary...")
     
+    if cloudinary is None:
+        print("❌ The cloudinary package is not installed")
+        print("   Run: pip install cloudinary")
+        sys.exit(1)
+    
     api_key = os.environ.get('CLOUDINARY_API_KEY')
     api_secret = os.environ.get('CLOUDINARY_API_SECRET')
     
@@ -84,49 +135,125 @@ def connect_cloudinary():
     )
     
     print(f"   ✅ Connected to Cloudinary (Cloud: {CLOUDINARY_CLOUD_NAME})")
+    
+    return cloudinary.api
 
 
-def fetch_cloudinary_photos(folder_name):
-    """Fetch all photos from the specified Cloudinary folder."""
+def connect_fake_cloudinary(resources_file=None):
+    """Create the offline fake Cloudinary API.
+    
+    Serves the resources listed in resources_file, or every photo already
+    in the mapping file when no file is given.
+    """
+    print("\n🧪 Using the offline fake Cloudinary API...")
+    
+    if resources_file:
+        api = FakeCloudinaryAPI.from_file(resources_file)
+    else:
+        api = FakeCloudinaryAPI.from_mapping(load_mapping(MAPPING_FILE))
+    
+    print(f"   ✅ Serving {len(api)} photos")
+    
+    return api
+
+
+def fetch_cloudinary_photos(folder_name, api, cache=None):
+    """Fetch all photos from the specified Cloudinary folder.
+    
+    Returns (resources, folder_path). Uses and updates the listing cache
+    when one is given.
+    """
     print(f"\n📸 Fetching photos from Cloudinary folder...")
     
     # Add archived-events prefix
-    full_folder_path = f"archived-events/{folder_name}"
+    full_folder_path = event_base_path(folder_name)
     
     try:
-        # Fetch resources from folder with pagination
-        resources = []
-        next_cursor = None
-        
-        while True:
-            result = cloudinary.api.resources(
-                type="upload",
-                prefix=full_folder_path,
-                max_results=500,
-                next_cursor=next_cursor
-            )
-            
-            resources.extend(result.get('resources', []))
-            next_cursor = result.get('next_cursor')
-            
-            if not next_cursor:
-                break
-        
-        if not resources:
-            print(f"❌ No photos found in folder: {full_folder_path}")
-            print(f"   Please verify the folder exists in Cloudinary")
-            sys.exit(1)
-        
-        # Extract secure URLs
-        photo_urls = [resource['secure_url'] for resource in resources]
-        
-        print(f"   ✅ Found {len(photo_urls)} photos in {full_folder_path}")
+        # Fetch resources from folder with pagination (retrying rate limits)
+        if cache is None:
+            resources = list_folder(api, folder_name)
+        else:
+            results, errors = fetch_folders_cached(api, [folder_name], cache)
+            if folder_name in errors:
+                raise errors[folder_name]
+            resources = results[folder_name]
+    except FolderFetchError as e:
+        print(f"❌ Error fetching photos from Cloudinary: {str(e.error)}")
+        sys.exit(1)
+    
+    if not resources:
+        print(f"❌ No photos found in folder: {full_folder_path}")
+        print(f"   Please verify the folder exists in Cloudinary")
+        sys.exit(1)
+    
+    print(f"   ✅ Found {len(resources)} photos in {full_folder_path}")
+    
+    return resources, full_folder_path
+
+
+def fetch_cloudinary_photos_batch(folder_names, api, cache=None):
+    """Fetch the photos of several folders concurrently.
+    
+    Returns a dict mapping each folder to (resources, folder_path).
+    Exits if any folder fails or is empty, so a batch is all-or-nothing.
+    Uses and updates the listing cache when one is given.
+    """
+    print(f"\n📸 Fetching photos from {len(folder_names)} Cloudinary folders...")
+    
+    started = time.monotonic()
+    if cache is None:
+        results, errors = fetch_folders(api, folder_names)
+    else:
+        results, errors = fetch_folders_cached(api, folder_names, cache)
+    elapsed = time.monotonic() - started
+    
+    photos = {}
+    failed = False
+    
+    for folder_name in dict.fromkeys(folder_names):
+        full_folder_path = event_base_path(folder_name)
         
-        return photo_urls, full_folder_path
+        if folder_name in errors:
+            print(f"   ❌ {full_folder_path}: {str(errors[folder_name].error)}")
+            failed = True
+        elif not results[folder_name]:
+            print(f"   ❌ No photos found in folder: {full_folder_path}")
+            failed = True
+        else:
+            photos[folder_name] = (results[folder_name], full_folder_path)
+            print(f"   ✅ Found {len(results[folder_name])} photos in {full_folder_path}")
+    
+    print(f"   ⏱️  Fetched in {elapsed:.1f}s")
     
-    except Exception as e:
-        print(f"❌ Error fetching photos from Cloudinary: {str(e)}")
+    if failed:
+        print("❌ Some folders could not be fetched - no events were added")
         sys.exit(1)
+    
+    return photos
+
+
+def fetch_placeholder_colors(photos):
+    """Fetch the placeholder colors of the listed photos.
+    
+    photos maps each folder to its (resources, folder_path). Photos
+    already in the mapping keep the color found when they were added, so
+    only new photos (and re-uploads) are fetched. Returns {url: color}.
+    """
+    print("\n🎨 Finding placeholder colors...")
+    
+    try:
+        colors = known_colors(load_mapping(MAPPING_FILE))
+    except (FileNotFoundError, json.JSONDecodeError, ValueError):
+        colors = {}
+    
+    urls = [resource['secure_url'] for resources, _ in photos.values() for resource in resources]
+    missing = [url for url in urls if url not in colors]
+    colors.update(fetch_colors(missing))
+    
+    found = sum(url in colors for url in urls)
+    print(f"   ✅ {found} of {len(urls)} photos have a placeholder ({len(missing)} fetched)")
+    
+    return colors
 
 
 def parse_video_links(video_text):
@@ -146,28 +273,37 @@ def parse_video_links(video_text):
     return valid_links
 
 
-def create_event_entry(event_data, photo_urls, folder_path):
-    """Create a new event entry for the mapping file."""
+def create_event_entry(event_data, resources, folder_path, event_id=None, colors=None):
+    """Create a new event entry for the mapping file.
+    
+    colors maps photo URLs to their placeholder colors.
+    """
     print("\n🆕 Creating event entry...")
     
     # Generate unique event ID based on timestamp
-    event_id = str(int(datetime.now().timestamp()))
+    if event_id is None:
+        event_id = str(int(datetime.now().timestamp()))
     
     # Parse video links
     video_links = parse_video_links(event_data.get('video_links'))
     
-    # Build folder URL
-    folder_url = f"https://res.cloudinary.com/{CLOUDINARY_CLOUD_NAME}/image/upload/{folder_path}/"
+    colors = colors or {}
+    base_url = upload_url(CLOUDINARY_CLOUD_NAME)
     
-    # Create event entry
+    # Create event entry, storing photos as [version, filename, width,
+    # height, color] entries
     event_entry = {
         "event_id": event_id,
         "event_name": event_data['event_name'],
         "event_date": event_data['event_date'],
+        "location": event_data['location'],
         "cloudinary_folder": event_data['cloudinary_folder'],
-        "photo_count": len(photo_urls),
-        "cloudinary_urls": photo_urls,
-        "folder_url": folder_url
+        "photo_count": len(resources),
+        "base_path": folder_path,
+        "photos": [
+            photo_entry(resource, base_url, folder_path, colors.get(resource['secure_url']))
+            for resource in resources
+        ],
     }
     
     # Add video links if present
@@ -176,88 +312,202 @@ def create_event_entry(event_data, photo_urls, folder_path):
         print(f"   ✅ Added {len(video_links)} video link(s)")
     
     print(f"   ✅ Event ID: {event_id}")
-    print(f"   ✅ Photo Count: {len(photo_urls)}")
+    print(f"   ✅ Photo Count: {len(resources)}")
     
     return event_entry
 
 
-def update_mapping_file(new_event):
-    """Update the cloudinary_event_mapping.json file with the new event."""
+def update_mapping_file(new_events):
+    """Update the cloudinary_event_mapping.json file with the new events.
+    
+    Returns the updated mapping. An event for a folder that is already
+    mapped is merged into the existing entry instead of duplicated. Older
+    mapping files are migrated to the compact schema on load and saved in
+    it.
+    """
     print(f"\n📝 Updating {MAPPING_FILE}...")
     
     # Load existing mapping
     try:
-        with open(MAPPING_FILE, 'r', encoding='utf-8') as f:
-            events = json.load(f)
-        print(f"   ✅ Loaded {len(events)} existing events")
+        with phase("load_mapping"):
+            mapping = load_mapping(MAPPING_FILE)
+        print(f"   ✅ Loaded {len(mapping['events'])} existing events")
     except FileNotFoundError:
         print(f"   ⚠️  {MAPPING_FILE} not found, creating new file")
-        events = []
-    except json.JSONDecodeError as e:
+        mapping = empty_mapping(CLOUDINARY_CLOUD_NAME)
+    except (json.JSONDecodeError, ValueError) as e:
         print(f"❌ Error parsing {MAPPING_FILE}: {str(e)}")
         sys.exit(1)
     
-    # Add new event
-    events.append(new_event)
+    # Add new events, merging any whose folder is already in the mapping
+    with phase("upsert_events"):
+        merged = upsert_events(mapping, new_events)
+    if merged:
+        print(f"   🔁 Merged {merged} event(s) into existing entries for the same folder")
+    
+    events = mapping['events']
     
     # Sort events by date (newest first)
     # Note: Dates are in YYYY-MM-DD format which sorts correctly as strings
-    events.sort(key=lambda x: x['event_date'], reverse=True)
+    with phase("sort_events"):
+        events.sort(key=lambda x: x['event_date'], reverse=True)
     print(f"   ✅ Events sorted by date (newest first)")
     
     # Save updated mapping
-    with open(MAPPING_FILE, 'w', encoding='utf-8') as f:
-        json.dump(events, f, indent=2, ensure_ascii=False)
+    with phase("save_mapping"):
+        save_mapping(mapping, MAPPING_FILE)
     
     print(f"   ✅ Saved {len(events)} events to {MAPPING_FILE}")
+    
+    return mapping
 
 
-def update_gallery_js(events):
-    """Update gallery.js with the new event mapping.
+def update_event_store(conn, new_events):
+    """Add the new events to the SQLite event store.
     
-    This function finds the EVENT_MAPPING constant and replaces its value.
-    The pattern expects: const EVENT_MAPPING = [...];
+    Only the rows of the new events and photos are written; the mapping
+    file is exported from the store by update_website.py --store.
     """
-    print(f"\n⚡ Updating {GALLERY_JS_FILE}...")
+    print("\n📝 Updating the event store...")
     
-    try:
-        with open(GALLERY_JS_FILE, 'r', encoding='utf-8') as f:
-            js_content = f.read()
-    except FileNotFoundError:
-        print(f"❌ {GALLERY_JS_FILE} not found")
-        sys.exit(1)
+    with phase("upsert_events"):
+        merged = store_events(conn, new_events)
+    if merged:
+        print(f"   🔁 Merged {merged} event(s) into existing entries for the same folder")
+    
+    print(f"   ✅ Stored {len(new_events)} event(s), {event_total(conn)} in total")
+
+
+def update_store_gallery_data(conn, new_events):
+    """Write the new events' gallery data shards from the event store."""
+    print(f"\n⚡ Updating {GALLERY_DATA_DIR}/ shards...")
+    
+    shard_count = export_shards(conn, {event['cloudinary_folder'] for event in new_events}, GALLERY_DATA_DIR)
+    
+    print(f"   ✅ Wrote {shard_count} shard(s) and {GALLERY_INDEX_FILE}")
+
+
+def update_gallery_data(mapping, new_events):
+    """Update the data shards that gallery.js loads for the new events.
     
-    # Find the EVENT_MAPPING constant and replace its value
-    # Pattern matches: const EVENT_MAPPING = [...];
-    # Note: This assumes the constant is declared in this exact format
-    pattern = r'(const EVENT_MAPPING = )\[.*?\];'
-    
-    # Create the new mapping value
-    new_mapping = json.dumps(events, indent=2)
-    replacement = f'\\1{new_mapping};'
-    
-    # Replace in the file
-    updated_content = re.sub(
-        pattern,
-        replacement,
-        js_content,
-        flags=re.DOTALL
+    gallery.js fetches gallery-data/<folder>.json for the requested
+    gallery, so only the shards of the added (or merged) folders and the
+    index are rewritten; gallery.js itself is never touched.
+    """
+    print(f"\n⚡ Updating {GALLERY_DATA_DIR}/ shards...")
+    
+    folders = {event['cloudinary_folder'] for event in new_events}
+    shard_count = write_folder_shards(
+        mapping['events'],
+        upload_url(mapping['cloud_name']),
+        folders,
+        GALLERY_DATA_DIR
     )
     
-    if updated_content == js_content:
-        print(f"   ⚠️  EVENT_MAPPING constant not found in {GALLERY_JS_FILE}")
-        print(f"   The file may need manual update")
-    else:
-        with open(GALLERY_JS_FILE, 'w', encoding='utf-8') as f:
-            f.write(updated_content)
-        print(f"   ✅ Updated EVENT_MAPPING in {GALLERY_JS_FILE}")
+    print(f"   ✅ Wrote {shard_count} shard(s) and {GALLERY_INDEX_FILE}")
 
 
-def main():
-    """Main execution function."""
-    print("="*70)
-    print("🚀 Add Event from GitHub Issue")
-    print("="*70)
+def warm_derived_images(uploader, events, base_url):
+    """Ask Cloudinary to render the added events' photos in every preset.
+    
+    events are the stored entries of the added folders, so a merged
+    event's cover is the photo its card shows. Failures are reported but
+    do not stop the run: those photos are rendered on first view instead.
+    """
+    print("\n🔥 Warming derived images...")
+    
+    warmed, errors = warm_events(uploader, events, base_url)
+    
+    print(f"   ✅ Queued {warmed} photo(s) for eager generation")
+    if errors:
+        public_id, error = next(iter(errors.items()))
+        print(f"   ⚠️  {len(errors)} photo(s) could not be warmed ({public_id}: {error})")
+
+
+def parse_args():
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Add events to the gallery from GitHub issues.")
+    parser.add_argument(
+        '--issue-file',
+        action='append',
+        default=[],
+        metavar='PATH',
+        help="read an issue body from a file instead of ISSUE_BODY; "
+             "repeat to add several events in one run"
+    )
+    parser.add_argument(
+        '--fake-api',
+        nargs='?',
+        const='',
+        metavar='RESOURCES_JSON',
+        help="use the offline fake Cloudinary API, serving the photos already "
+             "in the mapping or the resources listed in RESOURCES_JSON"
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help=f"list every folder from the API without reading or updating {CACHE_FILE}"
+    )
+    parser.add_argument(
+        '--cache-file',
+        metavar='PATH',
+        help=f"listing cache to use instead of {CACHE_FILE} "
+             "(the fake API only uses a cache when this is given)"
+    )
+    parser.add_argument(
+        '--no-placeholders',
+        action='store_true',
+        help="do not fetch the photos' placeholder colors (never fetched with --fake-api)"
+    )
+    parser.add_argument(
+        '--no-warm',
+        action='store_true',
+        help="do not ask Cloudinary to pre-render the new photos in every image preset"
+    )
+    parser.add_argument(
+        '--store',
+        metavar='PATH',
+        help=f"add the events to this SQLite event store instead of rewriting {MAPPING_FILE} "
+             "(update_website.py --store exports the mapping from it)"
+    )
+    parser.add_argument(
+        '--metrics',
+        metavar='FILE',
+        help="save per-phase timings, counters (such as API pages) and peak memory as JSON"
+    )
+    parser.add_argument(
+        '--profile',
+        metavar='FILE',
+        help="profile the run with cProfile and dump the stats to FILE"
+    )
+    args = parser.parse_args()
+    
+    if args.store and not Path(args.store).exists():
+        parser.error(f"{args.store} does not exist - create it with: python scripts/event_store.py import")
+    
+    return args
+
+
+def listing_cache_file(args):
+    """Return the listing cache path to use, or None to skip the cache."""
+    if args.no_cache:
+        return None
+    if args.cache_file:
+        return args.cache_file
+    if args.fake_api is not None:
+        # Keep offline runs out of the real cache
+        return None
+    return CACHE_FILE
+
+
+def read_issue_bodies(issue_files):
+    """Return the issue bodies to process, from files or ISSUE_BODY."""
+    if issue_files:
+        bodies = []
+        for path in issue_files:
+            with open(path, 'r', encoding='utf-8') as f:
+                bodies.append(f.read())
+        return bodies
     
     # Get issue body from environment variable (set by GitHub Actions)
     issue_body = os.environ.get('ISSUE_BODY', '')
@@ -267,47 +517,124 @@ def main():
         print("   This script should be run by GitHub Actions")
         sys.exit(1)
     
-    # Parse issue
-    event_data = parse_issue_body(issue_body)
+    return [issue_body]
+
+
+def print_event_details(event):
+    """Print a summary of an added event."""
+    print(f"\nEvent Details:")
+    print(f"   📌 Event: {event['event_name']}")
+    print(f"   📅 Date: {event['event_date']}")
+    print(f"   📷 Photos: {event['photo_count']}")
+    print(f"   🆔 ID: {event['event_id']}")
     
-    # Connect to Cloudinary
-    connect_cloudinary()
+    if 'video_links' in event:
+        print(f"   🎥 Videos: {len(event['video_links'])}")
+
+
+def add_events(args):
+    """Add the events described by the issues to the mapping and shards."""
+    print("="*70)
+    print("🚀 Add Event from GitHub Issue")
+    print("="*70)
     
-    # Fetch photos
-    photo_urls, folder_path = fetch_cloudinary_photos(event_data['cloudinary_folder'])
+    # Parse issues
+    with phase("parse_issues"):
+        issues = [parse_issue_body(body) for body in read_issue_bodies(args.issue_file)]
     
-    # Create event entry
-    new_event = create_event_entry(event_data, photo_urls, folder_path)
+    # Connect to Cloudinary (or the offline stand-in)
+    with phase("connect"):
+        if args.fake_api is None:
+            api = connect_cloudinary()
+        else:
+            api = connect_fake_cloudinary(args.fake_api)
     
-    # Update mapping file
-    update_mapping_file(new_event)
+    # Fetch photos, through the listing cache unless it is disabled
+    cache_file = listing_cache_file(args)
+    with phase("load_cache"):
+        cache = load_cache(cache_file) if cache_file else None
     
-    # Load updated events for gallery.js
-    with open(MAPPING_FILE, 'r', encoding='utf-8') as f:
-        all_events = json.load(f)
+    with phase("fetch_photos"):
+        if len(issues) == 1:
+            folder_name = issues[0]['cloudinary_folder']
+            photos = {folder_name: fetch_cloudinary_photos(folder_name, api, cache)}
+        else:
+            photos = fetch_cloudinary_photos_batch(
+                [event_data['cloudinary_folder'] for event_data in issues], api, cache
+            )
     
-    # Update gallery.js
-    update_gallery_js(all_events)
+    if cache is not None:
+        with phase("save_cache"):
+            save_cache(cache, cache_file)
+    
+    # Placeholder colors come from the CDN, which offline runs cannot reach
+    colors = {}
+    if args.fake_api is None and not args.no_placeholders:
+        with phase("placeholder_colors"):
+            colors = fetch_placeholder_colors(photos)
+    
+    # Create event entries (consecutive IDs so a batch never collides)
+    first_id = int(datetime.now().timestamp())
+    new_events = []
+    with phase("create_entries"):
+        for offset, event_data in enumerate(issues):
+            resources, folder_path = photos[event_data['cloudinary_folder']]
+            new_events.append(
+                create_event_entry(event_data, resources, folder_path, str(first_id + offset), colors)
+            )
+    count("events", len(new_events))
+    count("photos", sum(event['photo_count'] for event in new_events))
+    
+    folders = {event['cloudinary_folder'] for event in new_events}
+    if args.store:
+        # Update the event store and the new events' shards from it
+        with closing(open_store(args.store)) as conn:
+            update_event_store(conn, new_events)
+            with phase("gallery_data"):
+                update_store_gallery_data(conn, new_events)
+            added = list(iter_events(conn, folders))
+            base_url = upload_url(store_cloud_name(conn))
+    else:
+        # Update mapping file
+        mapping = update_mapping_file(new_events)
+        
+        # Update the gallery data shards of the new events
+        with phase("gallery_data"):
+            update_gallery_data(mapping, new_events)
+        added = list({
+            event['cloudinary_folder']: event
+            for event in reversed(mapping['events'])
+            if event['cloudinary_folder'] in folders
+        }.values())
+        base_url = upload_url(mapping['cloud_name'])
+    
+    # Render every image preset now rather than for the first visitor
+    if not args.no_warm:
+        uploader = cloudinary.uploader if args.fake_api is None else api
+        with phase("warm_derived"):
+            warm_derived_images(uploader, added, base_url)
     
     print("\n" + "="*70)
-    print("✅ Event added successfully!")
+    print(f"✅ {'Event' if len(new_events) == 1 else f'{len(new_events)} events'} added successfully!")
     print("="*70)
-    print(f"\nEvent Details:")
-    print(f"   📌 Event: {new_event['event_name']}")
-    print(f"   📅 Date: {new_event['event_date']}")
-    print(f"   📷 Photos: {new_event['photo_count']}")
-    print(f"   🆔 ID: {new_event['event_id']}")
     
-    if 'video_links' in new_event:
-        print(f"   🎥 Videos: {len(new_event['video_links'])}")
+    for new_event in new_events:
+        print_event_details(new_event)
     
     print("\n📁 Files Updated:")
-    print(f"   • {MAPPING_FILE}")
-    print(f"   • {GALLERY_JS_FILE}")
+    print(f"   • {args.store or MAPPING_FILE}")
+    print(f"   • {GALLERY_DATA_DIR}/")
     
     print("\n🎉 Ready to commit and create PR!")
     print("="*70)
 
 
+def main():
+    """Main execution function."""
+    args = parse_args()
+    with instrumented("add_event_from_issue.py", args.metrics, args.profile):
+        add_events(args)
+
+
 if __name__ == "__main__":
     main()
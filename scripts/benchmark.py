@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+Pipeline Benchmark
+
+Times the stages of update_website.py and add_event_from_issue.py on
+synthetic mappings of increasing size, so a regression shows up before
+the real archive grows into it:
+
+    python scripts/benchmark.py --output benchmark.json
+    python scripts/benchmark.py --events 500 --photos 100000 --repeat 5
+
+Every combination of --events and --photos is one scenario: a mapping in
+the cloudinary_event_mapping.json schema with the photos spread evenly
+over the events, built in a temporary directory. Each stage runs --repeat
+times and the fastest run is kept. Peak memory comes from one more run
+under tracemalloc, which would slow down the timed runs. Output sizes are
+the bytes a stage wrote.
+"""
+
+import argparse
+import contextlib
+import copy
+import io
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import update_website
+from add_event_from_issue import update_gallery_data, update_mapping_file
+from event_mapping import (
+    DEFAULT_CLOUD_NAME,
+    MAPPING_FILE,
+    SCHEMA_VERSION,
+    event_base_path,
+    load_mapping,
+    save_mapping,
+    upload_url,
+    upsert_events,
+)
+from event_store import (
+    CSV_FILE,
+    STORE_FILE,
+    export_csv,
+    export_mapping,
+    export_shards,
+    import_mapping,
+    open_store,
+    store_events,
+)
+from gallery_data import GALLERY_DATA_DIR, write_gallery_data, write_json
+from search_index import SEARCH_INDEX_FILE, build_search_index
+
+# Default scenario grid
+EVENT_COUNTS = (50, 500, 5000)
+PHOTO_COUNTS = (10, 1000, 100000)
+REPEAT = 3
+
+# Synthetic data
+SEED = 42
+FIRST_EVENT_DATE = date(2015, 1, 1)
+PHOTO_VERSION = 1765921977
+PHOTO_WIDTH = 1600
+PHOTO_HEIGHT = 1200
+PHOTO_COLOR = "#8a7b6c"
+
+
+def synthetic_event(number, photo_count, event_date):
+    """Build one event in the mapping schema."""
+    folder = f"{event_date:%Y-%m}-Synthetic-Event-{number:05d}"
+    return {
+        "event_id": str(number),
+        "event_name": f"Synthetic Event {number}",
+        "event_date": event_date.isoformat(),
+        "cloudinary_folder": folder,
+        "photo_count": photo_count,
+        "base_path": event_base_path(folder),
+        "photos": [
+            [PHOTO_VERSION + index, f"IMG-{number:05d}-{index:06d}.jpg", PHOTO_WIDTH, PHOTO_HEIGHT, PHOTO_COLOR]
+            for index in range(photo_count)
+        ],
+    }
+
+
+def synthetic_mapping(event_count, photo_count, seed=SEED):
+    """Build a mapping with photo_count photos spread over event_count events.
+
+    Events are listed in shuffled date order, so the sorting stages have
+    real work to do.
+    """
+    per_event, extra = divmod(photo_count, event_count)
+    events = [
+        synthetic_event(
+            number,
+            per_event + (1 if number <= extra else 0),
+            FIRST_EVENT_DATE + timedelta(days=number * 3),
+        )
+        for number in range(1, event_count + 1)
+    ]
+    random.Random(seed).shuffle(events)
+    return {"schema_version": SCHEMA_VERSION, "cloud_name": DEFAULT_CLOUD_NAME, "events": events}
+
+
+def new_photos_for(event, count=10):
+    """Return an update to event with count new photos, as an issue would add."""
+    update = copy.deepcopy(event)
+    update['photos'] = [
+        [PHOTO_VERSION, f"IMG-NEW-{index:06d}.jpg", PHOTO_WIDTH, PHOTO_HEIGHT, PHOTO_COLOR]
+        for index in range(count)
+    ]
+    update['photo_count'] = count
+    return update
+
+
+def output_size(paths):
+    """Return the total size in bytes of files and directories."""
+    total = 0
+    for path in map(Path, paths):
+        if path.is_dir():
+            total += sum(f.stat().st_size for f in path.rglob('*') if f.is_file())
+        elif path.exists():
+            total += path.stat().st_size
+    return total
+
+
+def run_update_website(*flags):
+    """Run update_website.py's main() with flags, silencing its output."""
+    argv = sys.argv
+    sys.argv = ["update_website.py", *flags]
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            update_website.main()
+    finally:
+        sys.argv = argv
+
+
+# Stages: (name, prepare, run, outputs). prepare(mapping) runs untimed and
+# returns the argument for run(); outputs are the paths measured afterwards.
+def prepare_mapping_file(mapping):
+    """Write the mapping file the stage reads."""
+    save_mapping(mapping, MAPPING_FILE)
+    return mapping
+
+
+def prepare_upsert(mapping):
+    """Copy the mapping, so the stage can change it, and build an update."""
+    mapping = copy.deepcopy(mapping)
+    return mapping, [new_photos_for(mapping['events'][0])]
+
+
+def prepare_add_event(mapping):
+    """Reset the mapping file and return an issue's update to an event."""
+    save_mapping(mapping, MAPPING_FILE)
+    return [new_photos_for(mapping['events'][0])]
+
+
+def run_add_event(new_events):
+    """Do what add_event_from_issue.py does once the photos are fetched."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        update_gallery_data(update_mapping_file(new_events), new_events)
+
+
+def prepare_store(mapping):
+    """Load the mapping into a fresh event store."""
+    if os.path.exists(STORE_FILE):
+        os.remove(STORE_FILE)
+    with contextlib.closing(open_store(STORE_FILE)) as conn:
+        import_mapping(conn, mapping)
+    return mapping
+
+
+def prepare_store_add_event(mapping):
+    """Reset the event store and return an issue's update to an event."""
+    prepare_store(mapping)
+    return [new_photos_for(mapping['events'][0])]
+
+
+def run_store_add_event(new_events):
+    """Do what add_event_from_issue.py --store does once the photos are fetched."""
+    with contextlib.closing(open_store(STORE_FILE)) as conn:
+        store_events(conn, new_events)
+        export_shards(conn, {event['cloudinary_folder'] for event in new_events})
+
+
+def run_store_export(_):
+    """Export the mapping and CSV from the event store."""
+    with contextlib.closing(open_store(STORE_FILE)) as conn:
+        export_mapping(conn, MAPPING_FILE)
+        export_csv(conn, CSV_FILE)
+
+
+def run_gallery_data(mapping):
+    """Write every gallery data shard and the index."""
+    write_gallery_data(mapping['events'], upload_url(mapping['cloud_name']))
+
+
+def run_events_html(mapping):
+    """Sort the events and stream events.html."""
+    events = update_website.card_events(mapping['events'])
+    base_url = upload_url(mapping['cloud_name'])
+    update_website.write_events_html(
+        update_website.EVENTS_HTML, update_website.iter_card_fields(events, base_url)
+    )
+
+
+def run_search_index(mapping):
+    """Build and write the events search index."""
+    events = update_website.card_events(mapping['events'])
+    base_url = upload_url(mapping['cloud_name'])
+    rows = [update_website.virtual_card_row(event, base_url) for event in events]
+    write_json(SEARCH_INDEX_FILE, build_search_index(events, rows))
+
+
+def run_static_galleries(mapping):
+    """Write a static gallery page for every event."""
+    base_url = upload_url(mapping['cloud_name'])
+    Path(update_website.GALLERY_PAGE_DIR).mkdir(exist_ok=True)
+    for event in update_website.unique_events_by_folder(mapping['events']):
+        page_path = update_website.gallery_page_path(event['cloudinary_folder'])
+        update_website.write_gallery_page(page_path, event, base_url)
+
+
+def prepare_noop_build(mapping):
+    """Build everything once, so the timed build has nothing to do."""
+    save_mapping(mapping, MAPPING_FILE)
+    run_update_website()
+    return None
+
+
+STAGES = [
+    ("save_mapping", lambda mapping: mapping, lambda mapping: save_mapping(mapping, MAPPING_FILE),
+     [MAPPING_FILE]),
+    ("load_mapping", prepare_mapping_file, lambda mapping: load_mapping(MAPPING_FILE), []),
+    ("sort_events", lambda mapping: mapping['events'], update_website.card_events, []),
+    ("upsert_event", prepare_upsert, lambda argument: upsert_events(*argument), []),
+    ("events_html", lambda mapping: mapping, run_events_html, [update_website.EVENTS_HTML]),
+    ("gallery_data", lambda mapping: mapping, run_gallery_data, [GALLERY_DATA_DIR]),
+    ("search_index", lambda mapping: mapping, run_search_index, [SEARCH_INDEX_FILE]),
+    ("add_event", prepare_add_event, run_add_event, [MAPPING_FILE, GALLERY_DATA_DIR]),
+    ("store_add_event", prepare_store_add_event, run_store_add_event, [STORE_FILE, GALLERY_DATA_DIR]),
+    ("store_export", prepare_store, run_store_export, [MAPPING_FILE, CSV_FILE]),
+    ("static_galleries", lambda mapping: mapping, run_static_galleries, [update_website.GALLERY_PAGE_DIR]),
+    ("update_website", prepare_mapping_file, lambda _: run_update_website('--force'),
+     [update_website.EVENTS_HTML, update_website.GALLERY_HTML, update_website.GALLERY_CSS,
+      update_website.GALLERY_JS, update_website.VIRTUAL_GRID_JS, SEARCH_INDEX_FILE, GALLERY_DATA_DIR]),
+    ("update_website_noop", prepare_noop_build, lambda _: run_update_website(), []),
+]
+
+
+def time_stage(prepare, run, mapping, repeat):
+    """Return the fastest wall time of run() over repeat runs, in seconds."""
+    best = None
+    for _ in range(repeat):
+        argument = prepare(mapping)
+        start = time.perf_counter()
+        run(argument)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def peak_memory(prepare, run, mapping):
+    """Return the peak memory allocated during one run(), in bytes."""
+    argument = prepare(mapping)
+    tracemalloc.start()
+    try:
+        run(argument)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_scenario(event_count, photo_count, repeat, stage_names=None):
+    """Benchmark every stage on one synthetic mapping."""
+    mapping = synthetic_mapping(event_count, photo_count)
+    result = {"events": event_count, "photos": photo_count, "stages": {}}
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as work_dir:
+        os.chdir(work_dir)
+        try:
+            for name, prepare, run, outputs in STAGES:
+                if stage_names and name not in stage_names:
+                    continue
+                seconds = time_stage(prepare, run, mapping, repeat)
+                result['stages'][name] = {
+                    "seconds": round(seconds, 6),
+                    "peak_bytes": peak_memory(prepare, run, mapping),
+                    "output_bytes": output_size(outputs),
+                }
+        finally:
+            os.chdir(cwd)
+
+    return result
+
+
+def print_scenario(result):
+    """Print one scenario's results as a table."""
+    print(f"\n📊 {result['events']} events, {result['photos']} photos")
+    for name, stage in result['stages'].items():
+        print(
+            f"   {name:<20} {stage['seconds'] * 1000:>10.1f} ms"
+            f" {stage['peak_bytes'] / 1024:>10.0f} KiB peak"
+            f" {stage['output_bytes'] / 1024:>10.0f} KiB written"
+        )
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description="Benchmark the site generator on synthetic mappings.")
+    parser.add_argument(
+        '--events',
+        type=int,
+        nargs='+',
+        default=list(EVENT_COUNTS),
+        metavar='N',
+        help=f"event counts to test (default: {' '.join(map(str, EVENT_COUNTS))})"
+    )
+    parser.add_argument(
+        '--photos',
+        type=int,
+        nargs='+',
+        default=list(PHOTO_COUNTS),
+        metavar='N',
+        help=f"total photo counts to test (default: {' '.join(map(str, PHOTO_COUNTS))})"
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=REPEAT,
+        metavar='N',
+        help=f"timed runs per stage, the fastest is kept (default: {REPEAT})"
+    )
+    parser.add_argument(
+        '--stage',
+        action='append',
+        choices=[name for name, *_ in STAGES],
+        help="only run this stage (can be repeated)"
+    )
+    parser.add_argument(
+        '--output',
+        metavar='FILE',
+        help="save the results as JSON"
+    )
+    args = parser.parse_args()
+
+    if args.repeat < 1 or min(args.events) < 1 or min(args.photos) < 0:
+        parser.error("--repeat and --events must be at least 1, --photos at least 0")
+
+    print("⏱️  Benchmarking the site generator...")
+
+    results = []
+    for event_count in args.events:
+        for photo_count in args.photos:
+            result = run_scenario(event_count, photo_count, args.repeat, args.stage)
+            print_scenario(result)
+            results.append(result)
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "scenarios": results,
+    }
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+        print(f"\n✅ Results saved to {args.output}")
+    else:
+        print()
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Build Manifest
+
+Records, for every generated file, a hash of the inputs it was built from
+(mapping entry plus template) and a hash of the file itself. Outputs whose
+inputs did not change, and which were not edited by hand, can be skipped.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+from instrumentation import record_write
+
+BUILD_MANIFEST_FILE = ".build-manifest.json"
+MANIFEST_VERSION = 1
+HASH_BLOCK_SIZE = 1 << 16
+
+
+def hash_inputs(*parts):
+    """Return a stable SHA-256 hex digest for strings and JSON-able data."""
+    return hash_input_stream(parts)
+
+
+def hash_input_stream(parts):
+    """Like hash_inputs, but for any iterable, consumed one part at a time."""
+    digest = hashlib.sha256()
+    for part in parts:
+        if not isinstance(part, str):
+            part = json.dumps(part, sort_keys=True, ensure_ascii=False)
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def hash_file(path):
+    """Return the SHA-256 hex digest of a file, or None if it is missing."""
+    digest = hashlib.sha256()
+    try:
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+                digest.update(block)
+    except FileNotFoundError:
+        return None
+    return digest.hexdigest()
+
+
+def load_manifest(path=BUILD_MANIFEST_FILE):
+    """Load the manifest, starting fresh if it is missing or outdated."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        manifest = {}
+
+    if manifest.get('version') != MANIFEST_VERSION:
+        manifest = {"version": MANIFEST_VERSION, "outputs": {}}
+
+    return manifest
+
+
+def save_manifest(manifest, path=BUILD_MANIFEST_FILE):
+    """Write the manifest with sorted keys so diffs stay small."""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write('\n')
+    record_write(path)
+
+
+def is_up_to_date(manifest, output, input_hash):
+    """Check whether output was built from input_hash and is unmodified."""
+    entry = manifest['outputs'].get(str(output))
+    if not entry or entry.get('input_hash') != input_hash:
+        return False
+    return hash_file(output) == entry.get('output_hash')
+
+
+def record_output(manifest, output, input_hash):
+    """Record the inputs and current content hash of a freshly built output."""
+    manifest['outputs'][str(output)] = {
+        "input_hash": input_hash,
+        "output_hash": hash_file(output),
+    }
+
+
+def refresh_outputs(manifest, outputs):
+    """Re-record outputs rewritten by a later build step, keeping their input hashes.
+
+    Returns True if any of them are in the manifest.
+    """
+    refreshed = False
+    for output in outputs:
+        entry = manifest['outputs'].get(str(output))
+        if entry:
+            record_output(manifest, output, entry['input_hash'])
+            refreshed = True
+    return refreshed
+
+
+def forget_missing_outputs(manifest):
+    """Drop entries for outputs that no longer exist on disk."""
+    for output in list(manifest['outputs']):
+        if not Path(output).exists():
+            del manifest['outputs'][output]
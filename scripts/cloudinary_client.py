@@ -0,0 +1,140 @@
+"""
+Cloudinary Folder Listing
+
+Lists the photos in archived-events folders through the Cloudinary Admin
+API. Rate-limited calls are retried with exponential backoff, and batches
+of folders are fetched concurrently through a bounded thread pool.
+
+Every function takes the API object as a parameter: pass cloudinary.api
+for the real service or a FakeCloudinaryAPI (fake_cloudinary.py) to run
+offline.
+"""
+
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from instrumentation import count
+
+BASE_FOLDER = "archived-events"
+MAX_RESULTS = 500
+MAX_WORKERS = 8
+MAX_RETRIES = 5
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 60.0
+
+# HTTP status codes Cloudinary uses for "slow down"
+RATE_LIMIT_STATUS_CODES = (420, 429)
+
+
+class FolderFetchError(Exception):
+    """Raised when a folder cannot be listed after all retries."""
+
+    def __init__(self, folder, error):
+        super().__init__(f"{folder}: {error}")
+        self.folder = folder
+        self.error = error
+
+
+def folder_prefix(folder_name):
+    """Return the resource prefix for an event folder.
+
+    The trailing slash keeps 'Holi' from also matching 'Holi-2024'.
+    """
+    return f"{BASE_FOLDER}/{folder_name}/"
+
+
+def is_rate_limited(error):
+    """Check whether an API error means the rate limit was hit."""
+    if type(error).__name__ == 'RateLimited':
+        return True
+    return getattr(error, 'http_code', None) in RATE_LIMIT_STATUS_CODES
+
+
+def is_retryable(error):
+    """Check whether an API error is worth retrying."""
+    return is_rate_limited(error) or isinstance(error, (ConnectionError, TimeoutError))
+
+
+def backoff_delay(attempt, base=BACKOFF_BASE_SECONDS, maximum=BACKOFF_MAX_SECONDS):
+    """Return the sleep before retry number attempt (exponential, full jitter)."""
+    return random.uniform(0, min(maximum, base * (2 ** attempt)))
+
+
+def call_with_backoff(func, *args, retries=MAX_RETRIES, sleep=time.sleep, **kwargs):
+    """Call func, retrying rate-limit and connection errors with backoff."""
+    attempt = 0
+    while True:
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            if attempt >= retries or not is_retryable(e):
+                raise
+            count("api_retries")
+            sleep(backoff_delay(attempt))
+            attempt += 1
+
+
+def list_resources(api, prefix, retries=MAX_RETRIES, sleep=time.sleep, **options):
+    """Return every upload resource under prefix, following next_cursor.
+
+    A prefix of None lists every upload in the cloud. Extra options (such
+    as start_at and direction, which only work without a prefix) are
+    passed to api.resources.
+    """
+    if prefix is not None:
+        options['prefix'] = prefix
+
+    resources = []
+    next_cursor = None
+
+    while True:
+        result = call_with_backoff(
+            api.resources,
+            type="upload",
+            max_results=MAX_RESULTS,
+            next_cursor=next_cursor,
+            retries=retries,
+            sleep=sleep,
+            **options
+        )
+
+        count("api_pages")
+        resources.extend(result.get('resources', []))
+        next_cursor = result.get('next_cursor')
+
+        if not next_cursor:
+            return resources
+
+
+def list_folder(api, folder_name, retries=MAX_RETRIES, sleep=time.sleep):
+    """Return every resource in an event folder."""
+    try:
+        return list_resources(api, folder_prefix(folder_name), retries, sleep)
+    except Exception as e:
+        raise FolderFetchError(folder_name, e) from e
+
+
+def fetch_folders(api, folder_names, max_workers=MAX_WORKERS,
+                  retries=MAX_RETRIES, sleep=time.sleep):
+    """List several folders concurrently.
+
+    Returns (results, errors): results maps folder name to its resources,
+    errors maps folder name to the FolderFetchError that stopped it.
+    """
+    results = {}
+    errors = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(list_folder, api, folder, retries, sleep): folder
+            for folder in dict.fromkeys(folder_names)
+        }
+        for future in as_completed(futures):
+            folder = futures[future]
+            try:
+                results[folder] = future.result()
+            except FolderFetchError as e:
+                errors[folder] = e
+
+    return results, errors
@@ -0,0 +1,126 @@
+"""
+Critical CSS
+
+Picks the rules of a stylesheet that a page needs for its first paint, so
+they can be inlined in a <style> block while the full stylesheet loads
+without blocking rendering.
+
+A rule is critical when one of its selectors only uses tags, classes and
+ids that occur in the page's markup (pseudo-classes and attribute
+selectors are ignored). Rules for elements created by scripts are found
+by passing their templates as extra markup. @media and @supports blocks
+are filtered the same way; other at-rules (@font-face, @keyframes, ...)
+are always kept.
+"""
+
+import re
+
+from minify import minify_css
+
+TAG_PATTERN = re.compile(r'<([a-zA-Z][\w-]*)')
+CLASS_ATTRIBUTE_PATTERN = re.compile(r'\bclass="([^"]*)"')
+ID_ATTRIBUTE_PATTERN = re.compile(r'\bid="([^"]*)"')
+
+# Parts of a selector that name something the markup must contain
+SELECTOR_STRIP_PATTERN = re.compile(r'\[[^\]]*\]|::?[\w-]+(?:\([^)]*\))?')
+SELECTOR_CLASS_PATTERN = re.compile(r'\.([\w-]+)')
+SELECTOR_ID_PATTERN = re.compile(r'#([\w-]+)')
+SELECTOR_TAG_PATTERN = re.compile(r'(?:^|[\s>+~])([a-zA-Z][\w-]*)')
+
+CONDITIONAL_AT_RULES = ('@media', '@supports')
+
+STYLESHEET_LINK_TEMPLATE = '<link rel="stylesheet" href="{href}">'
+ASYNC_STYLESHEET_TEMPLATE = (
+    '<style>{critical}</style>\n'
+    '<link rel="preload" href="{href}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">\n'
+    '<noscript><link rel="stylesheet" href="{href}"></noscript>'
+)
+
+
+def markup_names(markup):
+    """Return the tags, classes and ids used in markup."""
+    names = {'tags': set(), 'classes': set(), 'ids': set()}
+    names['tags'].update(tag.lower() for tag in TAG_PATTERN.findall(markup))
+    for value in CLASS_ATTRIBUTE_PATTERN.findall(markup):
+        names['classes'].update(value.split())
+    names['ids'].update(ID_ATTRIBUTE_PATTERN.findall(markup))
+    return names
+
+
+def selector_matches(selector, names):
+    """Check whether everything selector names occurs in the markup."""
+    selector = SELECTOR_STRIP_PATTERN.sub('', selector)
+    return (
+        all(name in names['classes'] for name in SELECTOR_CLASS_PATTERN.findall(selector))
+        and all(name in names['ids'] for name in SELECTOR_ID_PATTERN.findall(selector))
+        and all(tag.lower() in names['tags'] for tag in SELECTOR_TAG_PATTERN.findall(selector))
+    )
+
+
+def split_rules(css):
+    """Split minified CSS into top-level (prelude, body) pairs.
+
+    Statement at-rules like @import have a body of None.
+    """
+    rules = []
+    position = 0
+    while position < len(css):
+        brace = css.find('{', position)
+        semicolon = css.find(';', position)
+        if semicolon != -1 and (brace == -1 or semicolon < brace):
+            rules.append((css[position:semicolon], None))
+            position = semicolon + 1
+            continue
+        if brace == -1:
+            break
+
+        depth = 0
+        for end in range(brace, len(css)):
+            if css[end] == '{':
+                depth += 1
+            elif css[end] == '}':
+                depth -= 1
+                if depth == 0:
+                    break
+        rules.append((css[position:brace], css[brace + 1:end]))
+        position = end + 1
+    return rules
+
+
+def filter_rules(css, names):
+    """Keep the rules of minified CSS that the markup needs."""
+    kept = []
+    for prelude, body in split_rules(css):
+        if body is None:
+            kept.append(prelude + ';')
+        elif prelude.startswith(CONDITIONAL_AT_RULES):
+            inner = filter_rules(body, names)
+            if inner:
+                kept.append(f"{prelude}{{{inner}}}")
+        elif prelude.startswith('@'):
+            kept.append(f"{prelude}{{{body}}}")
+        else:
+            selectors = [s for s in prelude.split(',') if selector_matches(s, names)]
+            if selectors:
+                kept.append(f"{','.join(selectors)}{{{body}}}")
+    return ''.join(kept)
+
+
+def critical_css(css, markup):
+    """Return the minified rules of css that markup uses."""
+    return filter_rules(minify_css(css), markup_names(markup))
+
+
+def inline_critical_css(page, href, css, extra_markup=''):
+    """Inline the critical part of the stylesheet linked as href, and load the rest asynchronously.
+
+    Pages that do not link href are returned unchanged.
+    """
+    link = STYLESHEET_LINK_TEMPLATE.format(href=href)
+    if link not in page:
+        return page
+
+    critical = critical_css(css, page + extra_markup)
+    # Keep "</style>" in a CSS string from closing the block
+    critical = critical.replace('</', '<\\/')
+    return page.replace(link, ASYNC_STYLESHEET_TEMPLATE.format(href=href, critical=critical), 1)
@@ -0,0 +1,86 @@
+"""
+Derived Image Warming
+
+The site requests every Cloudinary image through a transformation from
+image_presets.py, which Cloudinary renders the first time it is asked
+for. Without warming, the first visitor to a new gallery waits for every
+thumbnail to be rendered. warm_events() asks Cloudinary to generate them
+up front instead, with one explicit call per photo listing the photo's
+eager transformations: every width of each preset that applies to it.
+The calls return once the work is queued (eager_async), run through a
+bounded thread pool and are retried with backoff when rate-limited.
+
+    warmed, errors = warm_events(cloudinary.uploader, new_events, base_url)
+
+Like cloudinary_client.py, the uploader is a parameter: cloudinary.uploader
+for the real service, or a FakeCloudinaryAPI to run offline.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from cloudinary_client import MAX_RETRIES, MAX_WORKERS, call_with_backoff
+from event_mapping import photo_public_id, photo_size
+from image_presets import IMAGE_PRESETS, preset_transformations
+from instrumentation import count
+
+
+def eager_transformations(cover=False, source_width=None):
+    """Return the transformations to generate for a photo.
+
+    The cover is the event's first photo, which its card shows. With the
+    photo's source_width, "limit" presets skip the widths above it, as
+    the browser is never offered them.
+    """
+    transformations = []
+    for name, preset in IMAGE_PRESETS.items():
+        if preset.get('eager') == 'all' or (cover and preset.get('eager') == 'cover'):
+            transformations.extend(preset_transformations(name, source_width))
+    return transformations
+
+
+def warm_photo(uploader, public_id, transformations, retries=MAX_RETRIES, sleep=time.sleep):
+    """Queue the generation of a photo's derived images."""
+    count("eager_requests")
+    count("eager_transformations", len(transformations))
+    return call_with_backoff(
+        uploader.explicit,
+        public_id,
+        type="upload",
+        eager=[{"raw_transformation": transformation} for transformation in transformations],
+        eager_async=True,
+        retries=retries,
+        sleep=sleep,
+    )
+
+
+def warm_events(uploader, events, base_url, max_workers=MAX_WORKERS,
+                retries=MAX_RETRIES, sleep=time.sleep):
+    """Warm every preset of the photos of events, concurrently.
+
+    Returns (warmed, errors): the number of photos queued, and a dict
+    mapping the public_id of each photo that failed to its error. A
+    failure only means that photo is rendered on first view as before.
+    """
+    jobs = {}
+    for event in events:
+        for index, photo in enumerate(event['photos']):
+            public_id = photo_public_id(photo, base_url, event['base_path'])
+            size = photo_size(photo)
+            jobs.setdefault(public_id, eager_transformations(index == 0, size and size[0]))
+
+    warmed = 0
+    errors = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(warm_photo, uploader, public_id, transformations, retries, sleep): public_id
+            for public_id, transformations in jobs.items()
+        }
+        for future in as_completed(futures):
+            try:
+                future.result()
+                warmed += 1
+            except Exception as e:
+                errors[futures[future]] = e
+
+    return warmed, errors
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Event Mapping Storage
+
+Reads and writes cloudinary_event_mapping.json.
+
+Schema version 2 stores each photo as [version, filename] under a
+per-event base path instead of repeating the full Cloudinary URL:
+
+    {
+      "schema_version": 2,
+      "cloud_name": "du0lumtob",
+      "events": [
+        {
+          "event_id": "6124",
+          ...
+          "base_path": "archived-events/<folder>",
+          "photos": [[1765921977, "IMG-20250429-WA0047.jpg", 1600, 1200, "#8a7b6c"], ...]
+        }
+      ]
+    }
+
+After the version and filename, a photo may list its width and height
+in pixels and then its placeholder color (the photo's average color,
+see placeholders.py), for pages to reserve its space and paint it while
+it loads. Photos added before those were recorded have just the first
+two. Photos whose URL does not fit the pattern are kept as full URL
+strings.
+Version 1 files (a plain list of events with cloudinary_urls) are
+migrated automatically when loaded. Run this file directly to rewrite a
+mapping in the current schema, adding --dedupe to merge events that
+share a Cloudinary folder.
+
+Events are unique by cloudinary_folder and photos by public_id:
+upsert_events() merges new events into existing ones instead of
+appending duplicates.
+"""
+
+import argparse
+import json
+import re
+import textwrap
+
+from instrumentation import record_write
+
+MAPPING_FILE = "cloudinary_event_mapping.json"
+SCHEMA_VERSION = 2
+DEFAULT_CLOUD_NAME = 'du0lumtob'
+BASE_FOLDER = "archived-events"
+
+# Collapses [version, "filename", width, height, "#color"] entries onto
+# one line when saving
+PHOTO_ENTRY_PATTERN = re.compile(
+    r'\[\s*(\d+),\s*("(?:[^"\\]|\\.)*")((?:,\s*(?:\d+|"#[0-9a-f]{6}"))*)\s*\]'
+)
+PHOTO_DETAIL_SEPARATOR = re.compile(r',\s*')
+
+# Version segment and file extension around a public_id in a photo URL
+PUBLIC_ID_PATTERN = re.compile(r'/upload/(?:v\d+/)?(.+?)(?:\.[^./]+)?$')
+
+
+def upload_url(cloud_name):
+    """Return the Cloudinary image upload URL for a cloud."""
+    return f"https://res.cloudinary.com/{cloud_name}/image/upload"
+
+
+def event_base_path(folder_name):
+    """Return the Cloudinary path holding an event's photos."""
+    return f"{BASE_FOLDER}/{folder_name}"
+
+
+def split_photo_url(url, base_url, base_path):
+    """Split a full photo URL into [version, filename].
+
+    Returns the URL unchanged if it does not live directly under
+    base_url/v<version>/base_path/.
+    """
+    match = re.fullmatch(
+        re.escape(base_url) + r'/v(\d+)/' + re.escape(base_path) + r'/([^/]+)',
+        url
+    )
+    if not match:
+        return url
+    return [int(match.group(1)), match.group(2)]
+
+
+def photo_url(photo, base_url, base_path):
+    """Expand a compact photo entry into its full Cloudinary URL."""
+    if isinstance(photo, str):
+        return photo
+    return f"{base_url}/v{photo[0]}/{base_path}/{photo[1]}"
+
+
+def photo_entry(resource, base_url, base_path, color=None):
+    """Build a compact photo entry from an Admin API resource.
+
+    The width and height the API reports are kept, followed by the
+    placeholder color when one is given.
+    """
+    photo = split_photo_url(resource['secure_url'], base_url, base_path)
+    if isinstance(photo, str) or not resource.get('width') or not resource.get('height'):
+        return photo
+    photo += [resource['width'], resource['height']]
+    if color:
+        photo.append(color)
+    return photo
+
+
+def photo_size(photo):
+    """Return a photo's (width, height), or None if it was not recorded."""
+    if isinstance(photo, str) or len(photo) < 4:
+        return None
+    return photo[2], photo[3]
+
+
+def photo_color(photo):
+    """Return a photo's placeholder color, or None."""
+    if isinstance(photo, str) or len(photo) < 5:
+        return None
+    return photo[4]
+
+
+def photo_urls(event, base_url):
+    """Lazily yield the full URL of every photo in an event."""
+    for photo in event['photos']:
+        yield photo_url(photo, base_url, event['base_path'])
+
+
+def first_photo_url(event, base_url):
+    """Return the full URL of an event's first photo."""
+    return photo_url(event['photos'][0], base_url, event['base_path'])
+
+
+def photo_public_id(photo, base_url, base_path):
+    """Return the Cloudinary public_id of a compact photo entry."""
+    url = photo_url(photo, base_url, base_path)
+    match = PUBLIC_ID_PATTERN.search(url)
+    return match.group(1) if match else url
+
+
+def merge_photos(photos, new_photos, base_url, base_path):
+    """Merge photo lists by public_id.
+
+    Photos already present keep their position and the newest asset
+    version (a re-upload), or for the same version the entry with the
+    most details; unseen photos are appended.
+    """
+    merged = {}
+    for photo in list(photos) + list(new_photos):
+        public_id = photo_public_id(photo, base_url, base_path)
+        existing = merged.get(public_id)
+        if existing is None or isinstance(existing, str) or isinstance(photo, str):
+            merged[public_id] = photo
+        elif photo[0] > existing[0] or (photo[0] == existing[0] and len(photo) > len(existing)):
+            merged[public_id] = photo
+    return list(merged.values())
+
+
+def merge_event(event, other, base_url, overwrite=True):
+    """Merge another event for the same folder into event, in place.
+
+    With overwrite, other's name, date and other fields replace event's;
+    otherwise event's fields win. The event_id is always kept, photos are
+    merged by public_id and video links are combined.
+    """
+    for key, value in other.items():
+        if key in ('event_id', 'photos', 'photo_count', 'video_links'):
+            continue
+        if overwrite or key not in event:
+            event[key] = value
+
+    event['photos'] = merge_photos(event['photos'], other['photos'], base_url, event['base_path'])
+    event['photo_count'] = len(event['photos'])
+
+    video_links = list(dict.fromkeys(event.get('video_links', []) + other.get('video_links', [])))
+    if video_links:
+        event['video_links'] = video_links
+
+
+def upsert_events(mapping, new_events):
+    """Add events to the mapping, merging any whose folder already exists.
+
+    Returns the number of new events merged into existing ones.
+    """
+    base_url = upload_url(mapping['cloud_name'])
+    by_folder = {event['cloudinary_folder']: event for event in reversed(mapping['events'])}
+
+    merged = 0
+    for new_event in new_events:
+        existing = by_folder.get(new_event['cloudinary_folder'])
+        if existing is None:
+            mapping['events'].append(new_event)
+            by_folder[new_event['cloudinary_folder']] = new_event
+        else:
+            merge_event(existing, new_event, base_url)
+            merged += 1
+    return merged
+
+
+def dedupe_mapping(mapping):
+    """Merge events that share a folder into the first one listed.
+
+    Returns the event_ids of the removed duplicates.
+    """
+    base_url = upload_url(mapping['cloud_name'])
+    by_folder = {}
+    events = []
+    removed = []
+
+    for event in mapping['events']:
+        existing = by_folder.get(event['cloudinary_folder'])
+        if existing is None:
+            by_folder[event['cloudinary_folder']] = event
+            events.append(event)
+        else:
+            merge_event(existing, event, base_url, overwrite=False)
+            removed.append(event['event_id'])
+
+    for event in events:
+        # Also drops repeated photos within an event
+        event['photos'] = merge_photos([], event['photos'], base_url, event['base_path'])
+        event['photo_count'] = len(event['photos'])
+
+    mapping['events'] = events
+    return removed
+
+
+def compact_event(event, base_url, base_path=None):
+    """Convert a version 1 event (with cloudinary_urls) to version 2."""
+    if base_path is None:
+        base_path = event_base_path(event['cloudinary_folder'])
+
+    compacted = {}
+    for key, value in event.items():
+        if key in ('cloudinary_urls', 'folder_url'):
+            continue
+        compacted[key] = value
+
+    compacted['base_path'] = base_path
+    compacted['photos'] = [
+        split_photo_url(url, base_url, base_path)
+        for url in event.get('cloudinary_urls', [])
+    ]
+    return compacted
+
+
+def migrate_mapping(data, cloud_name=DEFAULT_CLOUD_NAME):
+    """Return mapping data in the current schema, migrating older files."""
+    if isinstance(data, list):
+        base_url = upload_url(cloud_name)
+        return {
+            "schema_version": SCHEMA_VERSION,
+            "cloud_name": cloud_name,
+            "events": [compact_event(event, base_url) for event in data],
+        }
+
+    version = data.get('schema_version')
+    if version != SCHEMA_VERSION:
+        raise ValueError(f"Unsupported mapping schema version: {version}")
+
+    return data
+
+
+def load_mapping(path=MAPPING_FILE):
+    """Load the event mapping, migrating older schema versions."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return migrate_mapping(json.load(f))
+
+
+def empty_mapping(cloud_name=DEFAULT_CLOUD_NAME):
+    """Return a mapping with no events."""
+    return {"schema_version": SCHEMA_VERSION, "cloud_name": cloud_name, "events": []}
+
+
+def dumps_mapping(mapping):
+    """Serialise a mapping with one photo per line."""
+    text = json.dumps(mapping, indent=2, ensure_ascii=False)
+    return PHOTO_ENTRY_PATTERN.sub(_collapse_photo_entry, text) + '\n'
+
+
+def write_mapping(out, cloud_name, events):
+    """Stream a mapping to a text file one event at a time.
+
+    The output is the same as dumps_mapping(), without holding the whole
+    document in memory.
+    """
+    out.write('{\n')
+    out.write(f'  "schema_version": {SCHEMA_VERSION},\n')
+    out.write(f'  "cloud_name": {json.dumps(cloud_name, ensure_ascii=False)},\n')
+    out.write('  "events": [')
+    separator = '\n'
+    for event in events:
+        text = textwrap.indent(json.dumps(event, indent=2, ensure_ascii=False), '    ')
+        out.write(separator + PHOTO_ENTRY_PATTERN.sub(_collapse_photo_entry, text))
+        separator = ',\n'
+    out.write('\n  ]\n}\n' if separator != '\n' else ']\n}\n')
+
+
+def _collapse_photo_entry(match):
+    """Put a photo entry matched by PHOTO_ENTRY_PATTERN on one line."""
+    version, filename, details = match.groups()
+    return f"[{version}, {filename}{PHOTO_DETAIL_SEPARATOR.sub(', ', details)}]"
+
+
+def save_mapping(mapping, path=MAPPING_FILE):
+    """Write the event mapping in the current schema."""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(dumps_mapping(mapping))
+    record_write(path)
+
+
+def main():
+    """Rewrite a mapping file in the current schema."""
+    parser = argparse.ArgumentParser(description="Rewrite an event mapping in the current schema.")
+    parser.add_argument('path', nargs='?', default=MAPPING_FILE, help="mapping file to rewrite")
+    parser.add_argument(
+        '--dedupe',
+        action='store_true',
+        help="merge events that share a Cloudinary folder into the first one"
+    )
+    args = parser.parse_args()
+    path = args.path
+
+    mapping = load_mapping(path)
+    if args.dedupe:
+        for event_id in dedupe_mapping(mapping):
+            print(f"🔁 Merged duplicate event {event_id}")
+    save_mapping(mapping, path)
+    print(f"✅ Saved {len(mapping['events'])} events to {path} (schema v{SCHEMA_VERSION})")
+
+
+if __name__ == "__main__":
+    main()
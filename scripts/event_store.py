@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""
+SQLite Event Store
+
+An optional alternative to editing cloudinary_event_mapping.json in
+place: events and their photos live in an SQLite database (events.db),
+indexed by date, folder and event_id, and the JSON mapping, the CSV and
+the gallery data shards are exported from it.
+
+    events (id, event_id, cloudinary_folder, event_name, event_date,
+            base_path, details)
+    photos (event, public_id, position, version, filename, width, height,
+            color, url)
+
+Adding an event or photo is an indexed upsert that touches only its own
+rows, instead of loading, re-sorting and rewriting the whole mapping, and
+the exporters stream one event at a time, so the data layer keeps up with
+tens of thousands of photos. Events come out newest first (ties in the
+order they were added), photos in the order they were added, exactly as
+cloudinary_event_mapping.json lists them.
+
+    python scripts/event_store.py import    # load the JSON mapping into events.db
+    python scripts/event_store.py export    # write the JSON mapping and CSV from it
+
+add_event_from_issue.py and update_website.py use the store when given
+--store.
+"""
+
+import argparse
+import csv
+import json
+import sqlite3
+import sys
+from contextlib import closing
+
+from event_mapping import (
+    DEFAULT_CLOUD_NAME,
+    MAPPING_FILE,
+    SCHEMA_VERSION,
+    first_photo_url,
+    load_mapping,
+    photo_public_id,
+    upload_url,
+    write_mapping,
+)
+from gallery_data import GALLERY_DATA_DIR, write_event_shard, write_gallery_index
+from instrumentation import count
+from site_render import open_output
+
+STORE_FILE = "events.db"
+STORE_VERSION = 1
+CSV_FILE = "cloudinary_event_mapping.csv"
+CSV_HEADER = ["Event ID", "Event Name", "Event Date", "Cloudinary Folder", "Photo Count", "First Image URL"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS settings (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    event_id TEXT NOT NULL,
+    cloudinary_folder TEXT NOT NULL UNIQUE,
+    event_name TEXT NOT NULL,
+    event_date TEXT NOT NULL,
+    base_path TEXT NOT NULL,
+    details TEXT NOT NULL DEFAULT '{}'
+);
+CREATE INDEX IF NOT EXISTS events_by_date ON events (event_date DESC, id);
+CREATE INDEX IF NOT EXISTS events_by_event_id ON events (event_id);
+
+CREATE TABLE IF NOT EXISTS photos (
+    event INTEGER NOT NULL REFERENCES events (id) ON DELETE CASCADE,
+    public_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    version INTEGER,
+    filename TEXT,
+    width INTEGER,
+    height INTEGER,
+    color TEXT,
+    url TEXT,
+    PRIMARY KEY (event, public_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS photos_by_position ON photos (event, position);
+"""
+
+# Mapping fields with a column of their own; the rest (location,
+# video_links, ...) are kept as JSON in events.details
+EVENT_COLUMNS = ('event_id', 'cloudinary_folder', 'event_name', 'event_date', 'base_path')
+DERIVED_FIELDS = ('photo_count', 'photos')
+
+# Field order of an exported event, as create_event_entry() builds it
+EVENT_FIELD_ORDER = (
+    'event_id', 'event_name', 'event_date', 'location', 'cloudinary_folder',
+    'photo_count', 'base_path', 'photos', 'video_links',
+)
+
+
+def open_store(path=STORE_FILE):
+    """Open (creating if needed) an event store."""
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executescript(SCHEMA)
+    version = get_setting(conn, 'store_version')
+    if version is None:
+        set_setting(conn, 'store_version', str(STORE_VERSION))
+        conn.commit()
+    elif int(version) != STORE_VERSION:
+        raise ValueError(f"Unsupported event store version: {version}")
+    return conn
+
+
+def get_setting(conn, key, default=None):
+    """Return a stored setting."""
+    row = conn.execute("SELECT value FROM settings WHERE key = ?", (key,)).fetchone()
+    return row['value'] if row else default
+
+
+def set_setting(conn, key, value):
+    """Store a setting."""
+    conn.execute(
+        "INSERT INTO settings (key, value) VALUES (?, ?) "
+        "ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+        (key, value)
+    )
+
+
+def store_cloud_name(conn):
+    """Return the Cloudinary cloud the store's photos live in."""
+    return get_setting(conn, 'cloud_name', DEFAULT_CLOUD_NAME)
+
+
+def photo_columns(photo):
+    """Split a compact photo entry into (version, filename, width, height, color, url)."""
+    if isinstance(photo, str):
+        return None, None, None, None, None, photo
+    details = list(photo[2:]) + [None] * (3 - len(photo[2:]))
+    return photo[0], photo[1], details[0], details[1], details[2], None
+
+
+def photo_from_row(row):
+    """Rebuild a compact photo entry from its row."""
+    if row['url'] is not None:
+        return row['url']
+    photo = [row['version'], row['filename']]
+    if row['width'] and row['height']:
+        photo += [row['width'], row['height']]
+        if row['color']:
+            photo.append(row['color'])
+    return photo
+
+
+def is_newer_photo(photo, row):
+    """Check whether photo should replace the stored row for the same public_id.
+
+    Like merge_photos(): a newer version (a re-upload) wins, and for the
+    same version the entry with the most details.
+    """
+    stored = photo_from_row(row)
+    if isinstance(stored, str) or isinstance(photo, str):
+        return True
+    return photo[0] > stored[0] or (photo[0] == stored[0] and len(photo) > len(stored))
+
+
+def upsert_photos(conn, event_rowid, photos, base_url, base_path):
+    """Merge photos into an event by public_id. Returns how many were added."""
+    next_position = conn.execute(
+        "SELECT COALESCE(MAX(position) + 1, 0) FROM photos WHERE event = ?", (event_rowid,)
+    ).fetchone()[0]
+
+    added = 0
+    for photo in photos:
+        public_id = photo_public_id(photo, base_url, base_path)
+        row = conn.execute(
+            "SELECT * FROM photos WHERE event = ? AND public_id = ?", (event_rowid, public_id)
+        ).fetchone()
+        if row is None:
+            conn.execute(
+                "INSERT INTO photos (event, public_id, position, version, filename, width, height, color, url) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (event_rowid, public_id, next_position, *photo_columns(photo))
+            )
+            next_position += 1
+            added += 1
+        elif is_newer_photo(photo, row):
+            conn.execute(
+                "UPDATE photos SET version = ?, filename = ?, width = ?, height = ?, color = ?, url = ? "
+                "WHERE event = ? AND public_id = ?",
+                (*photo_columns(photo), event_rowid, public_id)
+            )
+    count("photos_upserted", len(photos))
+    return added
+
+
+def event_details(event):
+    """Return the fields of an event that have no column of their own."""
+    return {
+        key: value for key, value in event.items()
+        if key not in EVENT_COLUMNS and key not in DERIVED_FIELDS
+    }
+
+
+def upsert_event(conn, event, base_url, overwrite=True):
+    """Add an event, or merge it into the stored event for its folder.
+
+    Merging follows merge_event(): with overwrite the new name, date and
+    other fields win (otherwise the stored ones do), the stored event_id
+    is kept, photos are merged by public_id and video links combined.
+    Returns True if the event was merged into an existing one.
+    """
+    row = conn.execute(
+        "SELECT * FROM events WHERE cloudinary_folder = ?", (event['cloudinary_folder'],)
+    ).fetchone()
+
+    if row is None:
+        cursor = conn.execute(
+            "INSERT INTO events (event_id, cloudinary_folder, event_name, event_date, base_path, details) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (*(event[column] for column in EVENT_COLUMNS),
+             json.dumps(event_details(event), ensure_ascii=False))
+        )
+        upsert_photos(conn, cursor.lastrowid, event['photos'], base_url, event['base_path'])
+        return False
+
+    stored = {column: row[column] for column in EVENT_COLUMNS}
+    details = json.loads(row['details'])
+    new_details = event_details(event)
+
+    video_links = list(dict.fromkeys(details.get('video_links', []) + new_details.get('video_links', [])))
+    for column in EVENT_COLUMNS:
+        if column != 'event_id' and overwrite:
+            stored[column] = event[column]
+    for key, value in new_details.items():
+        if overwrite or key not in details:
+            details[key] = value
+    if video_links:
+        details['video_links'] = video_links
+
+    conn.execute(
+        "UPDATE events SET event_name = ?, event_date = ?, base_path = ?, details = ? WHERE id = ?",
+        (stored['event_name'], stored['event_date'], stored['base_path'],
+         json.dumps(details, ensure_ascii=False), row['id'])
+    )
+    upsert_photos(conn, row['id'], event['photos'], base_url, stored['base_path'])
+    return True
+
+
+def store_events(conn, new_events):
+    """Add events to the store in one transaction, merging by folder.
+
+    Returns the number of new events merged into existing ones.
+    """
+    base_url = upload_url(store_cloud_name(conn))
+    with conn:
+        return sum(upsert_event(conn, event, base_url) for event in new_events)
+
+
+def replace_event_photos(conn, events):
+    """Replace the stored photos of events with theirs, in one transaction.
+
+    Unlike store_events(), photos missing from an event's list are dropped
+    and the stored order becomes the list's, as resync_events.py needs for
+    folders whose photos were removed or re-uploaded. Each event must
+    already be stored under its folder.
+    """
+    base_url = upload_url(store_cloud_name(conn))
+    with conn:
+        for event in events:
+            row = conn.execute(
+                "SELECT id, base_path FROM events WHERE cloudinary_folder = ?", (event['cloudinary_folder'],)
+            ).fetchone()
+            conn.execute("DELETE FROM photos WHERE event = ?", (row['id'],))
+            upsert_photos(conn, row['id'], event['photos'], base_url, row['base_path'])
+
+
+def import_mapping(conn, mapping):
+    """Replace the store's contents with a mapping.
+
+    Events sharing a folder are merged into the first one, like
+    event_mapping.py --dedupe. Returns the number of events stored.
+    """
+    base_url = upload_url(mapping['cloud_name'])
+    with conn:
+        conn.execute("DELETE FROM photos")
+        conn.execute("DELETE FROM events")
+        set_setting(conn, 'cloud_name', mapping['cloud_name'])
+        for event in mapping['events']:
+            upsert_event(conn, event, base_url, overwrite=False)
+    return event_total(conn)
+
+
+def event_from_row(conn, row, with_photos=True):
+    """Rebuild a mapping-schema event from its row."""
+    fields = {column: row[column] for column in EVENT_COLUMNS}
+    fields.update(json.loads(row['details']))
+    fields['photo_count'] = row['photo_count']
+    if with_photos:
+        fields['photos'] = [
+            photo_from_row(photo)
+            for photo in conn.execute(
+                "SELECT * FROM photos WHERE event = ? ORDER BY position", (row['id'],)
+            )
+        ]
+
+    ordered = {key: fields.pop(key) for key in EVENT_FIELD_ORDER if key in fields}
+    ordered.update(fields)
+    return ordered
+
+
+def iter_events(conn, folders=None, with_photos=True):
+    """Lazily yield stored events in mapping order (newest first).
+
+    folders limits the events to those Cloudinary folders. Without
+    photos, events still have their photo_count.
+    """
+    query = (
+        "SELECT events.*, (SELECT COUNT(*) FROM photos WHERE photos.event = events.id) AS photo_count "
+        "FROM events"
+    )
+    params = ()
+    if folders is not None:
+        folders = list(folders)
+        query += f" WHERE cloudinary_folder IN ({', '.join('?' * len(folders))})"
+        params = tuple(folders)
+    query += " ORDER BY event_date DESC, id"
+
+    # A separate cursor, so the photo queries do not disturb the event rows
+    for row in conn.cursor().execute(query, params):
+        yield event_from_row(conn, row, with_photos)
+
+
+def event_total(conn):
+    """Return the number of stored events."""
+    return conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+
+def load_store_mapping(conn):
+    """Return the whole store as a mapping, like load_mapping()."""
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "cloud_name": store_cloud_name(conn),
+        "events": list(iter_events(conn)),
+    }
+
+
+def export_mapping(conn, path=MAPPING_FILE):
+    """Stream the store to the JSON mapping file."""
+    with open_output(path) as out:
+        write_mapping(out, store_cloud_name(conn), iter_events(conn))
+
+
+def export_csv(conn, path=CSV_FILE):
+    """Stream the store's events to the CSV summary."""
+    base_url = upload_url(store_cloud_name(conn))
+    with open_output(path) as out:
+        writer = csv.writer(out, lineterminator='\n')
+        writer.writerow(CSV_HEADER)
+        for event in iter_events(conn):
+            writer.writerow([
+                event['event_id'],
+                event['event_name'],
+                event['event_date'],
+                event['cloudinary_folder'],
+                event['photo_count'],
+                first_photo_url(event, base_url) if event['photos'] else '',
+            ])
+
+
+def export_shards(conn, folders, data_dir=GALLERY_DATA_DIR):
+    """Write the gallery data shards of some folders plus the index.
+
+    Returns the number of shards written.
+    """
+    base_url = upload_url(store_cloud_name(conn))
+    shard_count = 0
+    for event in iter_events(conn, folders):
+        write_event_shard(event, base_url, data_dir)
+        shard_count += 1
+    write_gallery_index(list(iter_events(conn, with_photos=False)), data_dir)
+    return shard_count
+
+
+def main():
+    """Import the JSON mapping into the store, or export from it."""
+    parser = argparse.ArgumentParser(description="Keep the events in an SQLite store.")
+    parser.add_argument(
+        'command',
+        choices=['import', 'export'],
+        help=f"import: replace the store's contents with {MAPPING_FILE}; "
+             f"export: write {MAPPING_FILE} and {CSV_FILE} from the store"
+    )
+    parser.add_argument('--store', default=STORE_FILE, metavar='PATH', help=f"store to use (default: {STORE_FILE})")
+    parser.add_argument('--mapping', default=MAPPING_FILE, metavar='PATH', help=f"mapping file (default: {MAPPING_FILE})")
+    parser.add_argument('--csv', default=CSV_FILE, metavar='PATH', help=f"CSV summary to export (default: {CSV_FILE})")
+    args = parser.parse_args()
+
+    with closing(open_store(args.store)) as conn:
+        if args.command == 'import':
+            try:
+                mapping = load_mapping(args.mapping)
+            except (FileNotFoundError, json.JSONDecodeError, ValueError) as e:
+                print(f"❌ Cannot load {args.mapping}: {e}")
+                sys.exit(1)
+            stored = import_mapping(conn, mapping)
+            print(f"✅ Imported {stored} events from {args.mapping} into {args.store}")
+        else:
+            export_mapping(conn, args.mapping)
+            export_csv(conn, args.csv)
+            print(f"✅ Exported {args.store} to {args.mapping} and {args.csv}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Fake Cloudinary API
+
+An in-memory stand-in for cloudinary.api, so folder listing can be run
+and timed offline. It serves resources built from the event mapping (or
+from a JSON file of resources), pages them like the Admin API, and can
+inject rate-limit errors and per-call latency. It also stands in for
+cloudinary.uploader's explicit(), recording the eager transformations
+requested for each photo in derived.
+
+    api = FakeCloudinaryAPI.from_mapping(load_mapping(), rate_limit_every=5)
+    results, errors = fetch_folders(api, ['World-Hindi-Day-Eindhoven'])
+"""
+
+import json
+import threading
+import time
+from datetime import datetime, timezone
+
+from event_mapping import photo_size, photo_url, upload_url
+
+
+class RateLimited(Exception):
+    """Mirrors cloudinary.exceptions.RateLimited."""
+
+    http_code = 420
+
+
+class NotFound(Exception):
+    """Mirrors cloudinary.exceptions.NotFound."""
+
+    http_code = 404
+
+
+def resource_from_url(url, base_url, size=None):
+    """Build an Admin API style resource dict from a photo URL.
+
+    size is the photo's (width, height), when known.
+    """
+    path = url[len(base_url) + 1:] if url.startswith(base_url + '/') else url
+    version = 0
+    if path.startswith('v') and '/' in path:
+        version_part, path = path.split('/', 1)
+        version = int(version_part[1:]) if version_part[1:].isdigit() else 0
+
+    public_id, _, file_format = path.rpartition('.')
+    created_at = datetime.fromtimestamp(version, tz=timezone.utc)
+
+    resource = {
+        "public_id": public_id,
+        "format": file_format,
+        "version": version,
+        "resource_type": "image",
+        "type": "upload",
+        "created_at": created_at.strftime('%Y-%m-%dT%H:%M:%SZ'),
+        "secure_url": url,
+    }
+    if size:
+        resource['width'], resource['height'] = size
+    return resource
+
+
+class FakeCloudinaryAPI:
+    """Serves resources(...) calls from memory.
+
+    rate_limit_every: raise RateLimited on every Nth call (0 disables).
+    latency: seconds to sleep per call, to make concurrency measurable.
+    """
+
+    def __init__(self, resources, rate_limit_every=0, latency=0.0):
+        # Served in the given order, which for a mapping is the order the
+        # real API returned them in when the event was added
+        self._resources = list(resources)
+        self._by_public_id = {r['public_id']: r for r in self._resources}
+        self.rate_limit_every = rate_limit_every
+        self.latency = latency
+        self.calls = 0
+        self.rate_limited = 0
+        self.derived = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._resources)
+
+    @classmethod
+    def from_mapping(cls, mapping, **options):
+        """Build a fake API serving every photo in an event mapping."""
+        base_url = upload_url(mapping['cloud_name'])
+        resources = [
+            resource_from_url(photo_url(photo, base_url, event['base_path']), base_url, photo_size(photo))
+            for event in mapping['events']
+            for photo in event['photos']
+        ]
+        # Duplicate events share photos; keep one resource per public_id
+        unique = {resource['public_id']: resource for resource in resources}
+        return cls(list(unique.values()), **options)
+
+    @classmethod
+    def from_file(cls, path, **options):
+        """Build a fake API from a JSON list of resource dicts."""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f), **options)
+
+    def _count_call(self):
+        with self._lock:
+            self.calls += 1
+            limited = self.rate_limit_every and self.calls % self.rate_limit_every == 0
+            if limited:
+                self.rate_limited += 1
+        if self.latency:
+            time.sleep(self.latency)
+        if limited:
+            raise RateLimited("Rate Limit Exceeded")
+
+    def resources(self, type="upload", prefix="", max_results=10,
+                  next_cursor=None, start_at=None, direction="desc", **options):
+        """Page through stored resources like cloudinary.api.resources.
+
+        Like the real API, a prefix listing ignores start_at and created_at
+        ordering.
+        """
+        self._count_call()
+
+        matches = [r for r in self._resources if r['public_id'].startswith(prefix)]
+        if not prefix:
+            if start_at:
+                matches = [r for r in matches if r['created_at'] >= start_at]
+            matches.sort(key=lambda r: r['created_at'], reverse=direction != "asc")
+
+        start = int(next_cursor) if next_cursor else 0
+        end = start + max_results
+        result = {"resources": [dict(r) for r in matches[start:end]]}
+        if end < len(matches):
+            result['next_cursor'] = str(end)
+        return result
+
+    def explicit(self, public_id, type="upload", eager=None, eager_async=False, **options):
+        """Record eager transformations like cloudinary.uploader.explicit."""
+        self._count_call()
+
+        resource = self._by_public_id.get(public_id)
+        if resource is None:
+            raise NotFound(f"Resource not found - {public_id}")
+
+        transformations = [item['raw_transformation'] for item in eager or []]
+        with self._lock:
+            self.derived.setdefault(public_id, set()).update(transformations)
+
+        status = "processing" if eager_async else "complete"
+        return dict(resource, eager=[
+            {"transformation": transformation, "status": status} for transformation in transformations
+        ])
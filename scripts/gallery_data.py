@@ -0,0 +1,147 @@
+"""
+Gallery Data Shards
+
+Writes one compact JSON shard per Cloudinary folder plus a small index,
+so gallery.js only downloads the photos of the event it is showing
+instead of the whole event mapping.
+"""
+
+import json
+from pathlib import Path
+
+from site_render import open_output
+
+GALLERY_DATA_DIR = "gallery-data"
+GALLERY_INDEX_FILE = "index.json"
+
+# Fields copied from the mapping into each shard
+SHARD_FIELDS = [
+    'event_id',
+    'event_name',
+    'event_date',
+    'cloudinary_folder',
+    'photo_count',
+    'base_path',
+    'photos',
+    'video_links',
+]
+
+
+def shard_filename(folder_name):
+    """Return the shard file name for a Cloudinary folder."""
+    return f"{folder_name}.json"
+
+
+def unique_events_by_folder(events):
+    """Yield the first event for every Cloudinary folder.
+
+    gallery.js used to pick the first matching event from the mapping,
+    so duplicates later in the list never had a gallery of their own.
+    """
+    seen = set()
+    for event in events:
+        folder = event['cloudinary_folder']
+        if folder in seen:
+            continue
+        seen.add(folder)
+        yield event
+
+
+def build_shard(event, base_url):
+    """Build the shard payload for a single event.
+
+    Photos stay in the compact [version, filename] form; gallery.js
+    expands them against base_url and base_path when it needs a URL.
+    """
+    shard = {key: event[key] for key in SHARD_FIELDS if key in event}
+    shard['base_url'] = base_url
+    return shard
+
+
+def build_index(events):
+    """Build the index of all shards (one entry per folder)."""
+    return {
+        "events": [
+            {
+                "folder": event['cloudinary_folder'],
+                "event_name": event['event_name'],
+                "event_date": event['event_date'],
+                "photo_count": event['photo_count'],
+                "shard": shard_filename(event['cloudinary_folder']),
+            }
+            for event in unique_events_by_folder(events)
+        ]
+    }
+
+
+def write_json(path, data):
+    """Write compact JSON (no indentation) to path, atomically."""
+    with open_output(path) as f:
+        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        f.write('\n')
+
+
+def write_event_shard(event, base_url, data_dir=GALLERY_DATA_DIR):
+    """Write the shard for a single event and return its path."""
+    Path(data_dir).mkdir(parents=True, exist_ok=True)
+    path = Path(data_dir) / shard_filename(event['cloudinary_folder'])
+    write_json(path, build_shard(event, base_url))
+    return path
+
+
+def write_gallery_index(events, data_dir=GALLERY_DATA_DIR):
+    """Write the shard index and return its path."""
+    Path(data_dir).mkdir(parents=True, exist_ok=True)
+    path = Path(data_dir) / GALLERY_INDEX_FILE
+    write_json(path, build_index(events))
+    return path
+
+
+def remove_stale_shards(events, data_dir=GALLERY_DATA_DIR):
+    """Delete shards whose folder is no longer in the mapping.
+
+    Returns the list of removed paths.
+    """
+    current = {shard_filename(event['cloudinary_folder']) for event in events}
+    current.add(GALLERY_INDEX_FILE)
+
+    removed = []
+    for path in Path(data_dir).glob('*.json'):
+        if path.name not in current:
+            path.unlink()
+            removed.append(path)
+
+    return removed
+
+
+def write_folder_shards(events, base_url, folders, data_dir=GALLERY_DATA_DIR):
+    """Write the shards of the given folders plus the index.
+
+    Adding or refreshing a few events then costs a few shard writes
+    instead of rewriting every shard. Returns the number of shards written.
+    """
+    count = 0
+    for event in unique_events_by_folder(events):
+        if event['cloudinary_folder'] in folders:
+            write_event_shard(event, base_url, data_dir)
+            count += 1
+
+    write_gallery_index(events, data_dir)
+
+    return count
+
+
+def write_gallery_data(events, base_url, data_dir=GALLERY_DATA_DIR):
+    """Write every shard plus the index, removing shards of deleted folders.
+
+    Returns the number of shards written.
+    """
+    count = 0
+    for event in unique_events_by_folder(events):
+        write_event_shard(event, base_url, data_dir)
+        count += 1
+
+    write_gallery_index(events, data_dir)
+    remove_stale_shards(events, data_dir)
+
+    return count
@@ -0,0 +1,110 @@
+"""
+Responsive Image Presets
+
+Breakpoint table for every Cloudinary image the site renders. Each preset
+keeps the transformation the site has always used at its default width and
+lists the extra widths offered through srcset, so phones fetch small files
+and high-density screens get sharp ones.
+
+The table is embedded in gallery.js and event-cards.js, and derived_images.py
+warms it: "eager" says which photos of a new event get every width of the
+preset generated ahead of the first visitor, "cover" (the event card's
+photo) or "all".
+
+To tune image sizes, edit IMAGE_PRESETS and re-run update_website.py.
+"""
+
+import json
+
+IMAGE_PRESETS = {
+    # Event cards on events.html (220px tall, one to four columns)
+    "card": {
+        "width": 400,
+        "height": 300,
+        "params": "c_fit,q_auto,f_auto,b_white",
+        "widths": [300, 400, 600, 800],
+        "sizes": "(max-width: 700px) 90vw, (max-width: 1100px) 45vw, 400px",
+        "eager": "cover",
+    },
+    # Gallery grid thumbnails (two columns on phones)
+    "thumb": {
+        "width": 350,
+        "height": 260,
+        "params": "c_fill,g_auto,q_auto,f_auto",
+        "widths": [175, 350, 525, 700],
+        "sizes": "(max-width: 768px) 50vw, 350px",
+        "eager": "all",
+    },
+    # Full-size lightbox image, never cropped or upscaled: "limit" drops
+    # the widths above a photo's own width (c_limit would only serve the
+    # original under their names)
+    "lightbox": {
+        "width": 1920,
+        "height": None,
+        "params": "c_limit,q_auto:good,f_auto",
+        "widths": [640, 960, 1280, 1920, 2560],
+        "sizes": "90vw",
+        "eager": "all",
+        "limit": True,
+    },
+}
+
+
+def preset_transformation(name, width=None):
+    """Return the Cloudinary transformation string for a preset width."""
+    preset = IMAGE_PRESETS[name]
+    width = width or preset['width']
+
+    parts = [f"w_{width}"]
+    if preset['height']:
+        # Round half up, like Math.round() in gallery.js
+        height = int(width * preset['height'] / preset['width'] + 0.5)
+        parts.append(f"h_{height}")
+    parts.append(preset['params'])
+    return ','.join(parts)
+
+
+def preset_widths(name, source_width=None):
+    """Return the widths of a preset to offer for a photo.
+
+    For a "limit" preset and a photo source_width pixels wide, the widths
+    above it are replaced by the photo's own width, like presetWidths()
+    in gallery.js.
+    """
+    widths = IMAGE_PRESETS[name]['widths']
+    if not IMAGE_PRESETS[name].get('limit') or not source_width or source_width >= widths[-1]:
+        return list(widths)
+    return [width for width in widths if width < source_width] + [source_width]
+
+
+def preset_transformations(name, source_width=None):
+    """Return the transformation string of every width of a preset."""
+    return [preset_transformation(name, width) for width in preset_widths(name, source_width)]
+
+
+def transform_url(url, transformation):
+    """Insert a transformation after /upload/ in a Cloudinary URL."""
+    return url.replace('/upload/', f'/upload/{transformation}/', 1)
+
+
+def preset_url(url, name, width=None):
+    """Return the URL of an image rendered with a preset."""
+    return transform_url(url, preset_transformation(name, width))
+
+
+def preset_srcset(url, name, source_width=None):
+    """Return a srcset attribute value covering every preset width."""
+    return ', '.join(
+        f"{preset_url(url, name, width)} {width}w"
+        for width in preset_widths(name, source_width)
+    )
+
+
+def preset_sizes(name):
+    """Return the sizes attribute value for a preset."""
+    return IMAGE_PRESETS[name]['sizes']
+
+
+def presets_json():
+    """Serialise the preset table for embedding in gallery.js."""
+    return json.dumps(IMAGE_PRESETS, indent=4)
@@ -0,0 +1,162 @@
+"""
+Build Instrumentation
+
+Times the phases of a script run and counts what it did (events, photo
+URLs, API pages, files and bytes written), so a slow workflow run shows
+at a glance whether the time went on Cloudinary pagination, loading the
+mapping, sorting or writing files:
+
+    with instrumented("update_website.py", metrics_path, profile_path):
+        with phase("load_mapping"):
+            mapping = load_mapping()
+        count("events", len(mapping['events']))
+
+Library code calls phase(), count() and record_write() unconditionally;
+outside an instrumented() block they do nothing. The JSON report lists
+each phase's total time, how often it ran and the process's peak memory
+(resident set size) when it ended, then the counters. With a profile
+path the whole run is also profiled with cProfile, for
+
+    python -m pstats build.prof
+"""
+
+import cProfile
+import json
+import os
+import platform
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows; peak memory is left out there
+    resource = None
+
+METRICS_VERSION = 1
+
+_lock = threading.Lock()
+_run = None
+
+
+def peak_memory_bytes():
+    """Return the process's peak resident set size in bytes, or None."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+@contextmanager
+def phase(name):
+    """Time a block as the named phase (time adds up if it runs again)."""
+    if _run is None:
+        yield
+        return
+
+    with _lock:
+        entry = _run['phases'].setdefault(name, {"seconds": 0.0, "calls": 0, "peak_memory_bytes": None})
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        with _lock:
+            entry['seconds'] += elapsed
+            entry['calls'] += 1
+            entry['peak_memory_bytes'] = peak_memory_bytes()
+
+
+def count(name, amount=1):
+    """Add amount to a counter. Safe to call from worker threads."""
+    if _run is None:
+        return
+    with _lock:
+        _run['counters'][name] = _run['counters'].get(name, 0) + amount
+
+
+def record_write(path):
+    """Count a file the run wrote, and its size."""
+    if _run is None:
+        return
+    count("files_written")
+    count("bytes_written", os.path.getsize(path))
+
+
+def build_report(script, started_at, wall_seconds, cpu_seconds, status):
+    """Return the metrics report of the current run."""
+    return {
+        "version": METRICS_VERSION,
+        "script": script,
+        "started_at": started_at.isoformat(timespec='seconds'),
+        "status": status,
+        "python": platform.python_version(),
+        "wall_seconds": round(wall_seconds, 6),
+        "cpu_seconds": round(cpu_seconds, 6),
+        "peak_memory_bytes": peak_memory_bytes(),
+        "phases": [
+            {"name": name, **entry, "seconds": round(entry['seconds'], 6)}
+            for name, entry in _run['phases'].items()
+        ],
+        "counters": dict(sorted(_run['counters'].items())),
+    }
+
+
+def print_report(report):
+    """Print the phases of a report, slowest first, and its counters."""
+    print(f"\n⏱️  {report['script']} took {report['wall_seconds']:.2f}s "
+          f"({report['cpu_seconds']:.2f}s CPU)")
+    total = report['wall_seconds'] or 1
+    for entry in sorted(report['phases'], key=lambda entry: entry['seconds'], reverse=True):
+        print(f"   {entry['name']:<24} {entry['seconds'] * 1000:>10.1f} ms {entry['seconds'] / total:>6.1%}")
+    for name, value in report['counters'].items():
+        print(f"   {name:<24} {value:>10}")
+
+
+@contextmanager
+def instrumented(script, metrics_path=None, profile_path=None):
+    """Record the phases and counters of the enclosed run.
+
+    The report is printed and saved to metrics_path when one is given,
+    also when the run fails, with status "failed". With profile_path the
+    run is profiled and the cProfile stats are dumped there.
+    """
+    global _run
+    _run = {"phases": {}, "counters": {}}
+    started_at = datetime.now(timezone.utc)
+    started = time.perf_counter()
+    cpu_started = time.process_time()
+    profiler = cProfile.Profile() if profile_path else None
+    status = "failed"
+
+    if profiler:
+        profiler.enable()
+    try:
+        yield
+        status = "ok"
+    except SystemExit as e:
+        if e.code in (None, 0):
+            status = "ok"
+        raise
+    finally:
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(profile_path)
+
+        report = build_report(
+            script, started_at, time.perf_counter() - started, time.process_time() - cpu_started, status
+        )
+        _run = None
+
+        if metrics_path:
+            with open(metrics_path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+                f.write('\n')
+            print_report(report)
+            print(f"   📈 Metrics saved to {metrics_path}")
+        if profile_path:
+            print(f"   🔬 Profile saved to {profile_path} (python -m pstats {profile_path})")
@@ -0,0 +1,189 @@
+"""
+Cloudinary Listing Cache
+
+Keeps the resource listing of every fetched folder on disk, so re-running
+the automation for the same folders (re-labelled issues, retried
+workflows) costs almost no Admin API quota.
+
+The Admin API has no ETags, and a prefix listing cannot be limited to new
+uploads (start_at only works without a prefix). Instead, each cached
+folder records the time up to which its listing is known to be complete.
+Before cached folders are served, one start_at listing of the whole cloud
+fetches every upload since the oldest of those marks and merges the ones
+that belong to cached folders. Deleted photos do not show up in that
+listing, so a folder is listed in full again once its cache entry is
+older than MAX_AGE.
+
+    cache = load_cache()
+    results, errors = fetch_folders_cached(api, ['Holi-2024'], cache)
+    save_cache(cache)
+"""
+
+import json
+import time
+from datetime import datetime, timedelta, timezone
+
+from cloudinary_client import (
+    MAX_RETRIES,
+    MAX_WORKERS,
+    fetch_folders,
+    folder_prefix,
+    list_resources,
+)
+from instrumentation import count, record_write
+
+CACHE_FILE = ".cloudinary-cache.json"
+CACHE_VERSION = 2
+
+# Cached folders are listed in full again after this long
+MAX_AGE = timedelta(days=7)
+
+# start_at looks back this much further, to allow for clock skew and
+# uploads still being processed when the last listing ran
+SYNC_OVERLAP = timedelta(minutes=15)
+
+# Fields kept for each cached resource
+RESOURCE_FIELDS = ("public_id", "format", "version", "created_at", "secure_url", "width", "height")
+
+TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
+
+def format_timestamp(moment):
+    """Format a datetime like the Admin API's created_at."""
+    return moment.astimezone(timezone.utc).strftime(TIMESTAMP_FORMAT)
+
+
+def parse_timestamp(text):
+    """Parse a created_at style timestamp."""
+    return datetime.strptime(text, TIMESTAMP_FORMAT).replace(tzinfo=timezone.utc)
+
+
+def empty_cache():
+    """Return a cache with no folders."""
+    return {"version": CACHE_VERSION, "folders": {}}
+
+
+def load_cache(path=CACHE_FILE):
+    """Load the listing cache, or start an empty one."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return empty_cache()
+
+    if cache.get('version') != CACHE_VERSION:
+        return empty_cache()
+    return cache
+
+
+def save_cache(cache, path=CACHE_FILE):
+    """Write the listing cache."""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, separators=(',', ':'))
+    record_write(path)
+
+
+def slim_resource(resource):
+    """Keep only the resource fields the automation uses."""
+    return {key: resource[key] for key in RESOURCE_FIELDS if key in resource}
+
+
+def is_fresh(entry, now):
+    """Check whether a cached folder can be served without a full listing."""
+    return now - parse_timestamp(entry['listed_at']) < MAX_AGE
+
+
+def store_folder(cache, folder_name, resources, started):
+    """Cache a full folder listing that began at started."""
+    cache['folders'][folder_prefix(folder_name)] = {
+        "listed_at": format_timestamp(started),
+        "synced_at": format_timestamp(started - SYNC_OVERLAP),
+        "resources": [slim_resource(r) for r in resources],
+    }
+
+
+def merge_new_resources(entries, resources):
+    """Merge newly uploaded resources into the cached folders they belong to.
+
+    Re-uploads replace the cached resource in place; new photos are
+    appended. Returns the number of resources merged.
+    """
+    merged = 0
+    for resource in resources:
+        for prefix, entry in entries.items():
+            if not resource['public_id'].startswith(prefix):
+                continue
+
+            cached = entry['resources']
+            for index, existing in enumerate(cached):
+                if existing['public_id'] == resource['public_id']:
+                    cached[index] = slim_resource(resource)
+                    break
+            else:
+                cached.append(slim_resource(resource))
+            merged += 1
+            break
+    return merged
+
+
+def sync_cached_folders(api, entries, started, retries=MAX_RETRIES, sleep=time.sleep):
+    """Bring cached folders up to date with a single start_at listing.
+
+    Returns the number of new or re-uploaded resources merged.
+    """
+    since = min(parse_timestamp(entry['synced_at']) for entry in entries.values())
+    resources = list_resources(
+        api,
+        None,
+        retries,
+        sleep,
+        start_at=format_timestamp(since),
+        direction="asc",
+    )
+
+    merged = merge_new_resources(entries, resources)
+    synced_at = format_timestamp(started - SYNC_OVERLAP)
+    for entry in entries.values():
+        entry['synced_at'] = synced_at
+    return merged
+
+
+def fetch_folders_cached(api, folder_names, cache, max_workers=MAX_WORKERS,
+                         retries=MAX_RETRIES, sleep=time.sleep, now=None):
+    """List several folders like fetch_folders, using and updating the cache.
+
+    Fresh cached folders cost one shared start_at listing; the rest are
+    listed in full and cached. Returns (results, errors).
+    """
+    started = now or datetime.now(timezone.utc)
+    folder_names = list(dict.fromkeys(folder_names))
+
+    cached = {}
+    for folder_name in folder_names:
+        entry = cache['folders'].get(folder_prefix(folder_name))
+        if entry and is_fresh(entry, started):
+            cached[folder_name] = entry
+
+    if cached:
+        try:
+            sync_cached_folders(
+                api,
+                {folder_prefix(name): entry for name, entry in cached.items()},
+                started,
+                retries,
+                sleep,
+            )
+        except Exception:
+            # Fall back to listing those folders in full
+            cached = {}
+
+    to_list = [name for name in folder_names if name not in cached]
+    count("cached_folders", len(cached))
+    results, errors = fetch_folders(api, to_list, max_workers, retries, sleep)
+
+    for folder_name, resources in results.items():
+        store_folder(cache, folder_name, resources, started)
+    for folder_name, entry in cached.items():
+        results[folder_name] = list(entry['resources'])
+
+    return results, errors
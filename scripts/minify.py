@@ -0,0 +1,100 @@
+"""
+Minifier
+
+Conservative minifiers for the generated CSS, JS and HTML. They only drop
+what cannot change behaviour (comments, indentation, blank lines and the
+whitespace around CSS punctuation), so no parser is needed and the output
+stays readable enough to debug.
+"""
+
+import re
+
+# Strings are copied verbatim; comments are dropped
+CSS_TOKEN_PATTERN = re.compile(r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'|/\*.*?\*/', re.DOTALL)
+CSS_PUNCTUATION_PATTERN = re.compile(r'\s*([{};,>])\s*')
+CSS_COLON_PATTERN = re.compile(r':\s+')
+
+JS_BLOCK_COMMENT_PATTERN = re.compile(r'^\s*/\*(?:(?!\*/).)*\*/\s*$', re.DOTALL | re.MULTILINE)
+
+HTML_COMMENT_PATTERN = re.compile(r'<!--(?!\[if).*?-->', re.DOTALL)
+HTML_BLOCK_PATTERN = re.compile(
+    r'(<(style|script)\b[^>]*>)(.*?)(</\2>)', re.DOTALL | re.IGNORECASE
+)
+SCRIPT_TYPE_PATTERN = re.compile(r'\btype="([^"]*)"')
+JS_TYPES = ('', 'text/javascript', 'module')
+
+
+def minify_css(css):
+    """Strip comments and the whitespace CSS does not need."""
+    parts = []
+    position = 0
+    for match in CSS_TOKEN_PATTERN.finditer(css):
+        parts.append(_squeeze_css(css[position:match.start()]))
+        if not match.group(0).startswith('/*'):
+            parts.append(match.group(0))
+        position = match.end()
+    parts.append(_squeeze_css(css[position:]))
+    return ''.join(parts).strip()
+
+
+def _squeeze_css(css):
+    """Collapse whitespace in CSS that holds no strings or comments."""
+    css = ' '.join(css.split())
+    css = CSS_PUNCTUATION_PATTERN.sub(r'\1', css)
+    # Only after colons: a space before one is a descendant selector (a :hover)
+    css = CSS_COLON_PATTERN.sub(':', css)
+    return css.replace(';}', '}')
+
+
+def minify_js(js):
+    """Strip comment lines, indentation and blank lines.
+
+    Line breaks are kept, so automatic semicolon insertion still sees the
+    same statements, and comments after code are left alone, since telling
+    them apart from '//' inside strings would need a tokenizer.
+    """
+    js = JS_BLOCK_COMMENT_PATTERN.sub('', js)
+    lines = (line.strip() for line in js.splitlines())
+    return '\n'.join(line for line in lines if line and not line.startswith('//'))
+
+
+def minify_html(page):
+    """Strip comments, indentation and blank lines, and minify inline CSS/JS.
+
+    Runs of whitespace are replaced by a single line break, never removed,
+    so the spacing between inline elements is unchanged.
+    """
+    parts = []
+    position = 0
+    for match in HTML_BLOCK_PATTERN.finditer(page):
+        parts.append(_squeeze_html(page[position:match.start()]))
+        opening, tag, body, closing = match.groups()
+        if tag.lower() == 'style':
+            body = minify_css(body)
+        elif _is_javascript(opening):
+            body = minify_js(body)
+        parts.append(_squeeze_html(opening) + body + closing)
+        position = match.end()
+    parts.append(_squeeze_html(page[position:]))
+    return ''.join(parts).strip() + '\n'
+
+
+def _squeeze_html(markup):
+    """Drop comments, indentation and blank lines from markup."""
+    markup = HTML_COMMENT_PATTERN.sub('', markup)
+    lines = (line.strip() for line in markup.splitlines())
+    squeezed = '\n'.join(line for line in lines if line)
+    if not squeezed:
+        return '\n' if markup[:1].isspace() else ''
+    # Keep a break where whitespace met a neighbouring <style>/<script> block
+    if markup[:1].isspace():
+        squeezed = '\n' + squeezed
+    if markup[-1:].isspace():
+        squeezed += '\n'
+    return squeezed
+
+
+def _is_javascript(opening_tag):
+    """Check whether a <script> tag holds JavaScript (not JSON data)."""
+    match = SCRIPT_TYPE_PATTERN.search(opening_tag)
+    return (match.group(1) if match else '').lower() in JS_TYPES
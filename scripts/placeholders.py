@@ -0,0 +1,129 @@
+"""
+Photo Placeholder Colors
+
+Finds the average color of each photo, so pages can paint a photo's box
+in that color while the photo loads. The Admin API listing has no colors,
+so every photo is fetched once through the delivery CDN scaled down to a
+single PNG pixel (a transformation, which costs no Admin API quota), and
+the pixel is decoded here without an image library.
+
+    colors = fetch_colors(urls)    # {url: '#8a7b6c'}
+"""
+
+import http.client
+import struct
+import urllib.request
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+from cloudinary_client import MAX_WORKERS
+from event_mapping import photo_color, photo_url, upload_url
+from image_presets import transform_url
+from instrumentation import count
+
+PLACEHOLDER_TRANSFORMATION = "w_1,h_1,c_scale,f_png"
+FETCH_TIMEOUT_SECONDS = 10
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+PNG_PALETTE = 3
+PNG_GRAY_TYPES = (0, 4)
+
+
+def placeholder_url(url):
+    """Return the URL of a photo scaled down to one PNG pixel."""
+    return transform_url(url, PLACEHOLDER_TRANSFORMATION)
+
+
+def png_color(data):
+    """Return the color of a PNG's top-left pixel as #rrggbb, or None.
+
+    Every PNG filter stores the first pixel of the first row unchanged,
+    so it can be read without unfiltering the image.
+    """
+    if not data.startswith(PNG_SIGNATURE):
+        return None
+
+    header = None
+    palette = b''
+    compressed = []
+    position = len(PNG_SIGNATURE)
+    while position + 8 <= len(data):
+        length, kind = struct.unpack('>I4s', data[position:position + 8])
+        chunk = data[position + 8:position + 8 + length]
+        position += length + 12
+        if kind == b'IHDR':
+            header = struct.unpack('>IIBB', chunk[:10])
+        elif kind == b'PLTE':
+            palette = chunk
+        elif kind == b'IDAT':
+            compressed.append(chunk)
+        elif kind == b'IEND':
+            break
+
+    if header is None or not compressed:
+        return None
+    _, _, depth, color_type = header
+
+    try:
+        # The row's filter byte plus at most four 16-bit samples
+        row = zlib.decompressobj().decompress(b''.join(compressed), 9)
+    except zlib.error:
+        return None
+    pixel = row[1:]
+    if not pixel:
+        return None
+
+    step = 2 if depth == 16 else 1
+    if color_type == PNG_PALETTE:
+        index = pixel[0] >> (8 - depth)
+        rgb = palette[index * 3:index * 3 + 3]
+    elif color_type in PNG_GRAY_TYPES:
+        gray = pixel[0] if depth >= 8 else (pixel[0] >> (8 - depth)) * 255 // (2 ** depth - 1)
+        rgb = bytes([gray] * 3)
+    else:
+        rgb = pixel[0:3 * step:step]
+
+    if len(rgb) != 3:
+        return None
+    return '#' + rgb.hex()
+
+
+def fetch_color(url, timeout=FETCH_TIMEOUT_SECONDS):
+    """Return a photo's average color, or None if it cannot be fetched."""
+    try:
+        with urllib.request.urlopen(placeholder_url(url), timeout=timeout) as response:
+            return png_color(response.read())
+    except (OSError, ValueError, http.client.HTTPException, struct.error):
+        # Includes truncated responses (IncompleteRead) and PNGs: a photo
+        # without a color just has no placeholder
+        return None
+
+
+def fetch_colors(urls, max_workers=MAX_WORKERS, fetch=fetch_color):
+    """Fetch the colors of several photos concurrently.
+
+    Returns {url: color} for the photos whose color was found; the
+    others simply have no placeholder.
+    """
+    urls = list(dict.fromkeys(urls))
+    if not urls:
+        return {}
+    count("placeholder_fetches", len(urls))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        colors = dict(zip(urls, pool.map(fetch, urls)))
+    return {url: color for url, color in colors.items() if color}
+
+
+def known_colors(mapping):
+    """Return {url: color} for every photo in the mapping that has one.
+
+    Keyed by the versioned URL, so a re-uploaded photo is fetched again.
+    """
+    base_url = upload_url(mapping['cloud_name'])
+    return {
+        photo_url(photo, base_url, event['base_path']): photo_color(photo)
+        for event in mapping['events']
+        for photo in event['photos']
+        if photo_color(photo)
+    }
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Resync Events with Cloudinary
+
+Lists every photo under archived-events/ once, compares each event's
+folder with its entry in the mapping, and rewrites only the entries whose
+photos were added, removed or re-uploaded, or are missing their size or
+placeholder color (which fills those in for events added before they
+were recorded). Prints a diff report and can save it as JSON.
+
+    python scripts/resync_events.py --dry-run --report resync-report.json
+
+With --store the events are read from and written back to the SQLite
+event store; update_website.py --store then exports the mapping from it.
+"""
+
+import argparse
+import json
+import re
+import sys
+from collections import OrderedDict
+from contextlib import closing
+from pathlib import Path
+
+from add_event_from_issue import (
+    MAPPING_FILE,
+    connect_cloudinary,
+    connect_fake_cloudinary,
+)
+from cloudinary_client import BASE_FOLDER, list_resources
+from event_mapping import (
+    load_mapping,
+    photo_color,
+    photo_entry,
+    photo_size,
+    photo_url,
+    save_mapping,
+    upload_url,
+)
+from event_store import export_shards, load_store_mapping, open_store, replace_event_photos
+from gallery_data import GALLERY_DATA_DIR, write_folder_shards
+from placeholders import fetch_colors, known_colors
+
+VERSION_SEGMENT = re.compile(r'/v\d+/')
+
+
+def photo_key(url):
+    """Identify a photo by its URL without the version segment."""
+    return VERSION_SEGMENT.sub('/', url, count=1)
+
+
+def list_archive(api):
+    """List every archived-events resource once, grouped by folder.
+
+    Returns an OrderedDict of folder name -> list of resources, in the
+    order the API returned them.
+    """
+    print(f"\n📸 Listing every photo under {BASE_FOLDER}/...")
+
+    folders = OrderedDict()
+    for resource in list_resources(api, f"{BASE_FOLDER}/"):
+        folder_path = resource['public_id'].rpartition('/')[0]
+        folder_name = folder_path[len(BASE_FOLDER) + 1:]
+        folders.setdefault(folder_name, []).append(resource)
+
+    total = sum(len(resources) for resources in folders.values())
+    print(f"   ✅ Found {total} photos in {len(folders)} folders")
+
+    return folders
+
+
+def is_incomplete(photo, resource, with_colors=False):
+    """Check whether a photo entry lacks its size, or its color if with_colors."""
+    if photo_size(photo) is None and resource.get('width'):
+        return True
+    return with_colors and photo_color(photo) is None
+
+
+def diff_event(event, remote_resources, base_url, with_colors=False):
+    """Compare an event's photos with the folder contents on Cloudinary.
+
+    Returns a dict with the added, removed and updated (re-uploaded with
+    a new version) photo URLs, and the unchanged photos that are missing
+    their size (or placeholder color, with_colors).
+    """
+    local = {}
+    for photo in event['photos']:
+        url = photo_url(photo, base_url, event['base_path'])
+        local[photo_key(url)] = (url, photo)
+    remote = {photo_key(resource['secure_url']): resource for resource in remote_resources}
+
+    return {
+        "added": [remote[key]['secure_url'] for key in remote if key not in local],
+        "removed": [local[key][0] for key in local if key not in remote],
+        "updated": [
+            remote[key]['secure_url'] for key in remote
+            if key in local and remote[key]['secure_url'] != local[key][0]
+        ],
+        "incomplete": [
+            local[key][0] for key in remote
+            if key in local and remote[key]['secure_url'] == local[key][0]
+            and is_incomplete(local[key][1], remote[key], with_colors)
+        ],
+    }
+
+
+def apply_remote_photos(event, remote_resources, base_url, colors):
+    """Replace an event's photos with the folder contents on Cloudinary."""
+    event['photos'] = [
+        photo_entry(resource, base_url, event['base_path'], colors.get(resource['secure_url']))
+        for resource in remote_resources
+    ]
+    event['photo_count'] = len(event['photos'])
+
+
+def resync(mapping, folders, fetch=None):
+    """Update the mapping in place from the listed folders.
+
+    fetch, if given, is called with the URLs of the photos in changed
+    events that have no placeholder color yet, and returns {url: color}
+    (see placeholders.fetch_colors). Returns the diff report.
+    """
+    base_url = upload_url(mapping['cloud_name'])
+    colors = known_colors(mapping)
+    report = {"changed": [], "missing_folders": [], "untracked_folders": []}
+
+    changed = []
+    known_folders = set()
+    for event in mapping['events']:
+        folder_name = event['cloudinary_folder']
+        known_folders.add(folder_name)
+
+        if folder_name not in folders:
+            report['missing_folders'].append(folder_name)
+            continue
+
+        diff = diff_event(event, folders[folder_name], base_url, with_colors=fetch is not None)
+        if any(diff.values()):
+            changed.append((event, diff))
+
+    if fetch:
+        missing = [
+            resource['secure_url']
+            for event, _ in changed
+            for resource in folders[event['cloudinary_folder']]
+            if resource['secure_url'] not in colors
+        ]
+        colors.update(fetch(missing))
+
+    for event, diff in changed:
+        folder_name = event['cloudinary_folder']
+        photos = event['photos']
+        apply_remote_photos(event, folders[folder_name], base_url, colors)
+        # Colors that could not be fetched leave nothing to update
+        if event['photos'] == photos:
+            continue
+        report['changed'].append({
+            "event_id": event['event_id'],
+            "event_name": event['event_name'],
+            "cloudinary_folder": folder_name,
+            "photo_count": event['photo_count'],
+            **diff,
+        })
+
+    report['missing_folders'] = sorted(set(report['missing_folders']))
+    report['untracked_folders'] = sorted(set(folders) - known_folders)
+    return report
+
+
+def print_report(report):
+    """Print the diff report."""
+    print("\n📊 Resync report:")
+
+    if not report['changed']:
+        print("   ✅ All events match Cloudinary")
+
+    for change in report['changed']:
+        print(
+            f"   ✏️  {change['cloudinary_folder']} ({change['event_id']}): "
+            f"+{len(change['added'])} -{len(change['removed'])} "
+            f"~{len(change['updated'])} -> {change['photo_count']} photos"
+            + (f" ({len(change['incomplete'])} filled in)" if change['incomplete'] else "")
+        )
+
+    for folder_name in report['missing_folders']:
+        print(f"   ⚠️  {BASE_FOLDER}/{folder_name} not found on Cloudinary - left unchanged")
+
+    for folder_name in report['untracked_folders']:
+        print(f"   ℹ️  {BASE_FOLDER}/{folder_name} has no event - add it with an issue")
+
+
+def changed_folders(report):
+    """Return the Cloudinary folders of the events a resync changed."""
+    return {change['cloudinary_folder'] for change in report['changed']}
+
+
+def update_changed_shards(mapping, report):
+    """Rewrite the gallery shards of changed events and the index."""
+    write_folder_shards(
+        mapping['events'], upload_url(mapping['cloud_name']), changed_folders(report), GALLERY_DATA_DIR
+    )
+
+
+def load_events(store):
+    """Load the events from the mapping file, or from the event store."""
+    if store:
+        with closing(open_store(store)) as conn:
+            return load_store_mapping(conn)
+    return load_mapping(MAPPING_FILE)
+
+
+def update_event_store(store, mapping, report):
+    """Write the changed events' photos and gallery shards from the event store."""
+    folders = changed_folders(report)
+    with closing(open_store(store)) as conn:
+        replace_event_photos(conn, [
+            event for event in mapping['events'] if event['cloudinary_folder'] in folders
+        ])
+        export_shards(conn, folders, GALLERY_DATA_DIR)
+
+
+def parse_args():
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Refresh every event's photos from Cloudinary.")
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help="report the differences without writing any files"
+    )
+    parser.add_argument(
+        '--report',
+        metavar='PATH',
+        help="also save the diff report as JSON"
+    )
+    parser.add_argument(
+        '--fake-api',
+        nargs='?',
+        const='',
+        metavar='RESOURCES_JSON',
+        help="use the offline fake Cloudinary API (see add_event_from_issue.py)"
+    )
+    parser.add_argument(
+        '--no-placeholders',
+        action='store_true',
+        help="do not fetch placeholder colors (never fetched with --fake-api)"
+    )
+    parser.add_argument(
+        '--store',
+        metavar='PATH',
+        help="read and update the events in this SQLite event store instead of the mapping file"
+    )
+    args = parser.parse_args()
+
+    if args.store and not Path(args.store).exists():
+        parser.error(f"{args.store} does not exist - create it with: python scripts/event_store.py import")
+
+    return args
+
+
+def main():
+    """Main execution function."""
+    args = parse_args()
+
+    print("="*70)
+    print("🔄 Resync Events with Cloudinary")
+    print("="*70)
+
+    try:
+        mapping = load_events(args.store)
+    except (FileNotFoundError, json.JSONDecodeError, ValueError) as e:
+        print(f"❌ Error loading {args.store or MAPPING_FILE}: {str(e)}")
+        sys.exit(1)
+
+    if args.fake_api is None:
+        api = connect_cloudinary()
+    else:
+        api = connect_fake_cloudinary(args.fake_api)
+
+    try:
+        folders = list_archive(api)
+    except Exception as e:
+        print(f"❌ Error listing photos from Cloudinary: {str(e)}")
+        sys.exit(1)
+
+    # Placeholder colors come from the CDN, which offline runs cannot reach
+    fetch = None
+    if args.fake_api is None and not args.no_placeholders:
+        fetch = fetch_colors
+
+    report = resync(mapping, folders, fetch)
+    print_report(report)
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\n   🧾 Report saved to {args.report}")
+
+    if args.dry_run or not report['changed']:
+        print("\n✅ No files changed")
+        return
+
+    if args.store:
+        update_event_store(args.store, mapping, report)
+    else:
+        save_mapping(mapping, MAPPING_FILE)
+        update_changed_shards(mapping, report)
+
+    print("\n" + "="*70)
+    print(f"✅ Updated {len(report['changed'])} event(s)")
+    print("="*70)
+    print("\n📁 Files Updated:")
+    print(f"   • {args.store or MAPPING_FILE}")
+    print(f"   • {GALLERY_DATA_DIR}/")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Events Search Index
+
+Builds search-index.json for the search box on events.html: an inverted
+index from every word of an event's name, location, date and Cloudinary
+folder to the events containing it. Terms are sorted, so events-search.js
+finds all terms starting with a typed word by binary search, and the event
+lists are delta-encoded, so the file stays small and gzips well even with
+thousands of events. The browser only downloads it once the search box is
+used.
+"""
+
+import re
+import unicodedata
+from datetime import datetime
+
+SEARCH_INDEX_FILE = "search-index.json"
+SEARCH_INDEX_VERSION = 1
+
+WORD_PATTERN = re.compile(r'[^\W_]+')
+
+# Month names an event's date is found by, in Dutch and English
+MONTH_NAMES = (
+    ("januari", "January"),
+    ("februari", "February"),
+    ("maart", "March"),
+    ("april", "April"),
+    ("mei", "May"),
+    ("juni", "June"),
+    ("juli", "July"),
+    ("augustus", "August"),
+    ("september", "September"),
+    ("oktober", "October"),
+    ("november", "November"),
+    ("december", "December"),
+)
+
+
+def tokenize(text):
+    """Split text into lowercase words without accents, like searchWords() in events-search.js."""
+    text = unicodedata.normalize('NFKD', text or '')
+    text = ''.join(char for char in text if not unicodedata.category(char).startswith('M'))
+    return WORD_PATTERN.findall(text.lower())
+
+
+def event_location(event):
+    """Return the event's location.
+
+    Events added since the issue's Location field was stored have it;
+    older ones name the place after an '@' in the event name.
+    """
+    if event.get('location'):
+        return event['location']
+    _, at, place = event['event_name'].rpartition('@')
+    return place if at else ''
+
+
+def date_words(date_str):
+    """Return the words a date is searched by: 2025-06-09 -> '2025 25 juni June'.
+
+    Month names come from MONTH_NAMES rather than strftime('%B'), so the
+    index does not depend on the locale of the machine that builds it.
+    """
+    try:
+        date = datetime.strptime(date_str, '%Y-%m-%d')
+    except (ValueError, TypeError):
+        return date_str or ''
+    return ' '.join([date.strftime('%Y %y'), *MONTH_NAMES[date.month - 1]])
+
+
+def event_terms(event):
+    """Return the set of terms an event is found by."""
+    return set(tokenize(' '.join([
+        event['event_name'],
+        event_location(event),
+        date_words(event['event_date']),
+        event['cloudinary_folder'],
+    ])))
+
+
+def delta_encode(numbers):
+    """Store ascending numbers as the differences between neighbours."""
+    previous = 0
+    deltas = []
+    for number in numbers:
+        deltas.append(number - previous)
+        previous = number
+    return deltas
+
+
+def build_search_index(events, rows):
+    """Build the search index.
+
+    rows are what a search result shows for each event (the card rows
+    events-archive.js also uses), in the same order as events; matches
+    are reported as positions in that list.
+    """
+    postings = {}
+    for number, event in enumerate(events):
+        for term in event_terms(event):
+            postings.setdefault(term, []).append(number)
+
+    terms = sorted(postings)
+    return {
+        "version": SEARCH_INDEX_VERSION,
+        "events": rows,
+        "terms": terms,
+        "postings": [delta_encode(postings[term]) for term in terms],
+    }
@@ -0,0 +1,77 @@
+"""
+Streaming Page Renderer
+
+Compiles str.format style templates once and writes them straight to a
+file handle, so pages are rendered in one linear pass without building
+the whole document in memory.
+
+    CARD = compile_template(EVENT_CARD_TEMPLATE)
+    with open_output('events.html') as out:
+        for fields in cards:
+            render_to(out, CARD, fields)
+
+A field value may be a callable taking the output stream, which lets a
+page template stream a nested list (such as gallery items) into a slot.
+"""
+
+import io
+import os
+from contextlib import contextmanager
+from string import Formatter
+
+from instrumentation import record_write
+
+
+def compile_template(template):
+    """Split a template into (literal, field_name) pairs.
+
+    Only plain {name} fields are supported; literal braces are written
+    as {{ and }} like in str.format.
+    """
+    parts = []
+    for literal, field, format_spec, conversion in Formatter().parse(template):
+        if format_spec or conversion:
+            raise ValueError(f"Unsupported template field: {{{field}!{conversion}:{format_spec}}}")
+        parts.append((literal, field))
+    return tuple(parts)
+
+
+def render_to(out, compiled, fields):
+    """Write a compiled template to a text stream."""
+    for literal, field in compiled:
+        if literal:
+            out.write(literal)
+        if field is None:
+            continue
+
+        value = fields[field]
+        if callable(value):
+            value(out)
+        else:
+            out.write(str(value))
+
+
+def render_string(compiled, fields):
+    """Render a compiled template to a string."""
+    out = io.StringIO()
+    render_to(out, compiled, fields)
+    return out.getvalue()
+
+
+@contextmanager
+def open_output(path):
+    """Open a text file for streaming writes.
+
+    Writes go to a temporary file that replaces path only once the block
+    finishes, so a failed render never leaves a half-written page behind.
+    """
+    temp_path = f"{path}.tmp"
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as out:
+            yield out
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    os.replace(temp_path, path)
+    record_write(path)
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Service Worker Generator
+
+Writes sw.js, which lets repeat visits and recently viewed galleries load
+from the browser's caches, even offline:
+
+- The shell (the main pages, header.html, footer.html and the hashed CSS
+  and JS listed in asset-manifest.json) is precached when the worker
+  installs. Its cache is named after a hash of those files, so a deploy
+  that changes any of them installs a fresh copy and drops the old one.
+- Pages are fetched from the network first and served from the cache
+  when offline.
+- Gallery data shards and the search index are served from the cache
+  while a fresh copy is fetched for next time.
+- Cloudinary card and gallery thumbnails are cached on first view.
+
+Runtime caches are bounded: once one holds more than its limit, the least
+recently used entries are evicted (their last use is kept in IndexedDB). include.js and gallery.js register the
+worker. Run the script after fingerprint_assets.py:
+
+    python service_worker.py
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "scripts"))
+from fingerprint_assets import HASH_LENGTH, load_asset_manifest
+from gallery_data import GALLERY_DATA_DIR
+from image_presets import IMAGE_PRESETS
+from search_index import SEARCH_INDEX_FILE
+from site_render import open_output
+
+SERVICE_WORKER_FILE = "sw.js"
+CACHE_PREFIX = "sanskriti-"
+
+# Precached pages, besides the hashed assets ("./" is index.html)
+SHELL_PAGES = ("./", "index.html", "events.html", "gallery.html", "header.html", "footer.html")
+
+# Entry limits of the runtime caches
+MAX_PAGES = 30
+MAX_DATA_FILES = 50
+MAX_THUMBNAILS = 400
+
+# Image presets whose Cloudinary URLs are cached (lightbox images are too
+# large to keep)
+THUMBNAIL_PRESETS = ("card", "thumb")
+
+SERVICE_WORKER_TEMPLATE = """
+const SHELL_CACHE = `${CACHE_PREFIX}shell-${CACHE_VERSION}`;
+const PAGE_CACHE = `${CACHE_PREFIX}pages`;
+const DATA_CACHE = `${CACHE_PREFIX}data`;
+const IMAGE_CACHE = `${CACHE_PREFIX}images`;
+
+const PRECACHE_URLS = new Set(PRECACHE.map(path => new URL(path, self.location).href));
+
+self.addEventListener('install', event => {
+    event.waitUntil(
+        caches.open(SHELL_CACHE)
+            .then(cache => cache.addAll(PRECACHE))
+            .then(() => self.skipWaiting())
+    );
+});
+
+// Drop the shells of earlier deploys
+self.addEventListener('activate', event => {
+    event.waitUntil(
+        caches.keys()
+            .then(names => Promise.all(names
+                .filter(name => name.startsWith(`${CACHE_PREFIX}shell-`) && name !== SHELL_CACHE)
+                .map(name => caches.delete(name))))
+            .then(() => self.clients.claim())
+    );
+});
+
+self.addEventListener('fetch', event => {
+    const request = event.request;
+    if (request.method !== 'GET') return;
+    const url = new URL(request.url);
+
+    if (request.mode === 'navigate') {
+        event.respondWith(networkFirst(event, PAGE_CACHE, MAX_PAGES));
+    } else if (PRECACHE_URLS.has(url.href)) {
+        event.respondWith(caches.match(request).then(cached => cached || fetch(request)));
+    } else if (url.origin === self.location.origin && isDataFile(url)) {
+        event.respondWith(staleWhileRevalidate(event, DATA_CACHE, MAX_DATA_FILES));
+    } else if (isThumbnail(url)) {
+        event.respondWith(cachedThumbnail(event));
+    }
+});
+
+function isDataFile(url) {
+    const scope = new URL(self.registration.scope);
+    const path = url.pathname.slice(scope.pathname.length);
+    return path === SEARCH_INDEX_FILE || path.startsWith(`${GALLERY_DATA_DIR}/`);
+}
+
+function isThumbnail(url) {
+    return url.hostname === 'res.cloudinary.com'
+        && THUMBNAIL_PARAMS.some(params => url.pathname.includes(`,${params}/`));
+}
+
+// Bounded caches: the last use of each entry is kept in IndexedDB, so a
+// cache hit only writes a timestamp, and the least recently used entries
+// are evicted (in the order they were stored when IndexedDB is not
+// available). Trims of one cache run one after another.
+let usageDb;
+
+function openUsage() {
+    usageDb = usageDb || new Promise((resolve, reject) => {
+        const open = indexedDB.open(`${CACHE_PREFIX}usage`, 1);
+        open.onupgradeneeded = () => open.result.createObjectStore('used');
+        open.onsuccess = () => resolve(open.result);
+        open.onerror = () => reject(open.error);
+    });
+    return usageDb;
+}
+
+function withUsage(mode, action) {
+    return openUsage().then(db => new Promise((resolve, reject) => {
+        const transaction = db.transaction('used', mode);
+        const result = action(transaction.objectStore('used'));
+        transaction.oncomplete = () => resolve(result);
+        transaction.onerror = () => reject(transaction.error);
+    }));
+}
+
+function usageKey(cacheName, url) {
+    return `${cacheName} ${url}`;
+}
+
+function touch(cacheName, url) {
+    return withUsage('readwrite', store => { store.put(Date.now(), usageKey(cacheName, url)); })
+        .catch(() => {});
+}
+
+function lastUsed(cacheName, urls) {
+    return withUsage('readonly', store => urls.map(url => store.get(usageKey(cacheName, url))))
+        .then(requests => requests.map(request => request.result || 0))
+        .catch(() => urls.map(() => 0));
+}
+
+const trimQueues = {};
+
+function trimCache(name, maxEntries) {
+    trimQueues[name] = (trimQueues[name] || Promise.resolve())
+        .then(() => caches.open(name))
+        .then(cache => cache.keys().then(keys => {
+            if (keys.length <= maxEntries) return;
+            const urls = keys.map(key => key.url);
+            return lastUsed(name, urls).then(used => {
+                const stale = urls
+                    .map((url, index) => ({ url, used: used[index] }))
+                    .sort((a, b) => a.used - b.used)
+                    .slice(0, keys.length - maxEntries)
+                    .map(entry => entry.url);
+                return Promise.all(stale.map(url => cache.delete(url)))
+                    .then(() => withUsage('readwrite', store => {
+                        stale.forEach(url => store.delete(usageKey(name, url)));
+                    }))
+                    .catch(() => {});
+            });
+        }))
+        .catch(() => {});
+    return trimQueues[name];
+}
+
+function remember(cacheName, maxEntries, request, response) {
+    const url = typeof request === 'string' ? request : request.url;
+    return caches.open(cacheName)
+        .then(cache => cache.put(request, response))
+        .then(() => touch(cacheName, url))
+        .then(() => trimCache(cacheName, maxEntries))
+        .catch(() => {});
+}
+
+// Pages: fresh from the network, cached copy when offline (gallery.html
+// serves every ?folder=, so the query is ignored as a last resort)
+async function networkFirst(event, cacheName, maxEntries) {
+    const request = event.request;
+    try {
+        const response = await fetch(request);
+        if (response.ok) event.waitUntil(remember(cacheName, maxEntries, request, response.clone()));
+        return response;
+    } catch (error) {
+        const cached = await caches.match(request) || await caches.match(request, { ignoreSearch: true });
+        if (cached) return cached;
+        throw error;
+    }
+}
+
+// Data: cached copy at once, refreshed in the background
+async function staleWhileRevalidate(event, cacheName, maxEntries) {
+    const request = event.request;
+    const cached = await caches.match(request, { cacheName });
+    const network = fetch(request).then(response => {
+        if (response.ok) return remember(cacheName, maxEntries, request, response.clone()).then(() => response);
+        return response;
+    });
+    if (!cached) return network;
+    event.waitUntil(network.catch(() => {}));
+    return cached;
+}
+
+// Thumbnails never change under a URL, so a cached copy is always used.
+// They are fetched with CORS (Cloudinary allows it), as opaque responses
+// take up far more storage quota than their size. The request is copied
+// with its Accept header, which f_auto picks the WebP/AVIF format from.
+async function cachedThumbnail(event) {
+    const request = event.request;
+    const cache = await caches.open(IMAGE_CACHE);
+    const cached = await cache.match(request.url);
+    if (cached) {
+        event.waitUntil(touch(IMAGE_CACHE, request.url));
+        return cached;
+    }
+
+    let response;
+    try {
+        response = await fetch(new Request(request, { mode: 'cors', credentials: 'omit' }));
+    } catch (error) {
+        return fetch(request);
+    }
+    if (response.ok) event.waitUntil(remember(IMAGE_CACHE, MAX_THUMBNAILS, request.url, response.clone()));
+    return response;
+}
+"""
+
+
+def shell_files(asset_names):
+    """Return the precached URLs, relative to the site root."""
+    files = [page for page in SHELL_PAGES if page == "./" or Path(page).exists()]
+    files += sorted(name for name in asset_names.values() if Path(name).exists())
+    return files
+
+
+def shell_version(files):
+    """Hash the contents of the shell, to name its cache."""
+    digest = hashlib.sha256()
+    for path in files:
+        digest.update(path.encode('utf-8') + b'\0')
+        if path != "./":
+            digest.update(Path(path).read_bytes())
+    return digest.hexdigest()[:HASH_LENGTH]
+
+
+def render_service_worker(files):
+    """Return the service worker script for a shell."""
+    settings = {
+        "CACHE_PREFIX": CACHE_PREFIX,
+        "CACHE_VERSION": shell_version(files),
+        "PRECACHE": files,
+        "GALLERY_DATA_DIR": GALLERY_DATA_DIR,
+        "SEARCH_INDEX_FILE": SEARCH_INDEX_FILE,
+        "THUMBNAIL_PARAMS": [IMAGE_PRESETS[name]['params'] for name in THUMBNAIL_PRESETS],
+        "MAX_PAGES": MAX_PAGES,
+        "MAX_DATA_FILES": MAX_DATA_FILES,
+        "MAX_THUMBNAILS": MAX_THUMBNAILS,
+    }
+    lines = ["// Generated by service_worker.py - do not edit by hand"]
+    lines += [f"const {name} = {json.dumps(value)};" for name, value in settings.items()]
+    return '\n'.join(lines) + '\n' + SERVICE_WORKER_TEMPLATE
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description="Generate the site's service worker.")
+    parser.add_argument(
+        '--check',
+        action='store_true',
+        help="only report whether sw.js is up to date, and exit with status 1 if it is not"
+    )
+    args = parser.parse_args()
+
+    print("📦 Generating service worker...\n")
+
+    files = shell_files(load_asset_manifest())
+    script = render_service_worker(files)
+    path = Path(SERVICE_WORKER_FILE)
+    current = path.read_text(encoding='utf-8') if path.exists() else None
+
+    if args.check:
+        if current != script:
+            print(f"   ❌ {SERVICE_WORKER_FILE} is not up to date")
+            print("\n   Run: python service_worker.py")
+            sys.exit(1)
+        print(f"   ✅ {SERVICE_WORKER_FILE} is up to date")
+        return
+
+    for name in files:
+        print(f"   {name}")
+
+    if current == script:
+        print(f"\n✨ {SERVICE_WORKER_FILE} is up to date ({len(files)} files precached)")
+        return
+
+    with open_output(SERVICE_WORKER_FILE) as f:
+        f.write(script)
+    print(f"\n✨ Wrote {SERVICE_WORKER_FILE} ({len(files)} files precached)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+// Generated by service_worker.py - do not edit by hand
+const CACHE_PREFIX = "sanskriti-";
+const CACHE_VERSION = "bee88ee2";
+const PRECACHE = ["./", "index.html", "events.html", "gallery.html", "header.html", "footer.html", "event-cards.b601ff7b.js", "events-search.809309d2.js", "gallery.00c2b6cd.css", "gallery.380f0eed.js", "include.6275b98e.js", "style.3951925d.css", "virtual-grid.98268e82.js"];
+const GALLERY_DATA_DIR = "gallery-data";
+const SEARCH_INDEX_FILE = "search-index.json";
+const THUMBNAIL_PARAMS = ["c_fit,q_auto,f_auto,b_white", "c_fill,g_auto,q_auto,f_auto"];
+const MAX_PAGES = 30;
+const MAX_DATA_FILES = 50;
+const MAX_THUMBNAILS = 400;
+
+const SHELL_CACHE = `${CACHE_PREFIX}shell-${CACHE_VERSION}`;
+const PAGE_CACHE = `${CACHE_PREFIX}pages`;
+const DATA_CACHE = `${CACHE_PREFIX}data`;
+const IMAGE_CACHE = `${CACHE_PREFIX}images`;
+
+const PRECACHE_URLS = new Set(PRECACHE.map(path => new URL(path, self.location).href));
+
+self.addEventListener('install', event => {
+    event.waitUntil(
+        caches.open(SHELL_CACHE)
+            .then(cache => cache.addAll(PRECACHE))
+            .then(() => self.skipWaiting())
+    );
+});
+
+// Drop the shells of earlier deploys
+self.addEventListener('activate', event => {
+    event.waitUntil(
+        caches.keys()
+            .then(names => Promise.all(names
+                .filter(name => name.startsWith(`${CACHE_PREFIX}shell-`) && name !== SHELL_CACHE)
+                .map(name => caches.delete(name))))
+            .then(() => self.clients.claim())
+    );
+});
+
+self.addEventListener('fetch', event => {
+    const request = event.request;
+    if (request.method !== 'GET') return;
+    const url = new URL(request.url);
+
+    if (request.mode === 'navigate') {
+        event.respondWith(networkFirst(event, PAGE_CACHE, MAX_PAGES));
+    } else if (PRECACHE_URLS.has(url.href)) {
+        event.respondWith(caches.match(request).then(cached => cached || fetch(request)));
+    } else if (url.origin === self.location.origin && isDataFile(url)) {
+        event.respondWith(staleWhileRevalidate(event, DATA_CACHE, MAX_DATA_FILES));
+    } else if (isThumbnail(url)) {
+        event.respondWith(cachedThumbnail(event));
+    }
+});
+
+function isDataFile(url) {
+    const scope = new URL(self.registration.scope);
+    const path = url.pathname.slice(scope.pathname.length);
+    return path === SEARCH_INDEX_FILE || path.startsWith(`${GALLERY_DATA_DIR}/`);
+}
+
+function isThumbnail(url) {
+    return url.hostname === 'res.cloudinary.com'
+        && THUMBNAIL_PARAMS.some(params => url.pathname.includes(`,${params}/`));
+}
+
+// Bounded caches: the last use of each entry is kept in IndexedDB, so a
+// cache hit only writes a timestamp, and the least recently used entries
+// are evicted (in the order they were stored when IndexedDB is not
+// available). Trims of one cache run one after another.
+let usageDb;
+
+function openUsage() {
+    usageDb = usageDb || new Promise((resolve, reject) => {
+        const open = indexedDB.open(`${CACHE_PREFIX}usage`, 1);
+        open.onupgradeneeded = () => open.result.createObjectStore('used');
+        open.onsuccess = () => resolve(open.result);
+        open.onerror = () => reject(open.error);
+    });
+    return usageDb;
+}
+
+function withUsage(mode, action) {
+    return openUsage().then(db => new Promise((resolve, reject) => {
+        const transaction = db.transaction('used', mode);
+        const result = action(transaction.objectStore('used'));
+        transaction.oncomplete = () => resolve(result);
+        transaction.onerror = () => reject(transaction.error);
+    }));
+}
+
+function usageKey(cacheName, url) {
+    return `${cacheName} ${url}`;
+}
+
+function touch(cacheName, url) {
+    return withUsage('readwrite', store => { store.put(Date.now(), usageKey(cacheName, url)); })
+        .catch(() => {});
+}
+
+function lastUsed(cacheName, urls) {
+    return withUsage('readonly', store => urls.map(url => store.get(usageKey(cacheName, url))))
+        .then(requests => requests.map(request => request.result || 0))
+        .catch(() => urls.map(() => 0));
+}
+
+const trimQueues = {};
+
+function trimCache(name, maxEntries) {
+    trimQueues[name] = (trimQueues[name] || Promise.resolve())
+        .then(() => caches.open(name))
+        .then(cache => cache.keys().then(keys => {
+            if (keys.length <= maxEntries) return;
+            const urls = keys.map(key => key.url);
+            return lastUsed(name, urls).then(used => {
+                const stale = urls
+                    .map((url, index) => ({ url, used: used[index] }))
+                    .sort((a, b) => a.used - b.used)
+                    .slice(0, keys.length - maxEntries)
+                    .map(entry => entry.url);
+                return Promise.all(stale.map(url => cache.delete(url)))
+                    .then(() => withUsage('readwrite', store => {
+                        stale.forEach(url => store.delete(usageKey(name, url)));
+                    }))
+                    .catch(() => {});
+            });
+        }))
+        .catch(() => {});
+    return trimQueues[name];
+}
+
+function remember(cacheName, maxEntries, request, response) {
+    const url = typeof request === 'string' ? request : request.url;
+    return caches.open(cacheName)
+        .then(cache => cache.put(request, response))
+        .then(() => touch(cacheName, url))
+        .then(() => trimCache(cacheName, maxEntries))
+        .catch(() => {});
+}
+
+// Pages: fresh from the network, cached copy when offline (gallery.html
+// serves every ?folder=, so the query is ignored as a last resort)
+async function networkFirst(event, cacheName, maxEntries) {
+    const request = event.request;
+    try {
+        const response = await fetch(request);
+        if (response.ok) event.waitUntil(remember(cacheName, maxEntries, request, response.clone()));
+        return response;
+    } catch (error) {
+        const cached = await caches.match(request) || await caches.match(request, { ignoreSearch: true });
+        if (cached) return cached;
+        throw error;
+    }
+}
+
+// Data: cached copy at once, refreshed in the background
+async function staleWhileRevalidate(event, cacheName, maxEntries) {
+    const request = event.request;
+    const cached = await caches.match(request, { cacheName });
+    const network = fetch(request).then(response => {
+        if (response.ok) return remember(cacheName, maxEntries, request, response.clone()).then(() => response);
+        return response;
+    });
+    if (!cached) return network;
+    event.waitUntil(network.catch(() => {}));
+    return cached;
+}
+
+// Thumbnails never change under a URL, so a cached copy is always used.
+// They are fetched with CORS (Cloudinary allows it), as opaque responses
+// take up far more storage quota than their size. The request is copied
+// with its Accept header, which f_auto picks the WebP/AVIF format from.
+async function cachedThumbnail(event) {
+    const request = event.request;
+    const cache = await caches.open(IMAGE_CACHE);
+    const cached = await cache.match(request.url);
+    if (cached) {
+        event.waitUntil(touch(IMAGE_CACHE, request.url));
+        return cached;
+    }
+
+    let response;
+    try {
+        response = await fetch(new Request(request, { mode: 'cors', credentials: 'omit' }));
+    } catch (error) {
+        return fetch(request);
+    }
+    if (response.ok) event.waitUntil(remember(IMAGE_CACHE, MAX_THUMBNAILS, request.url, response.clone()));
+    return response;
+}
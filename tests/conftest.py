@@ -0,0 +1,9 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# The scripts import each other by module name, as when run from scripts/,
+# and the build steps at the top level are imported as modules
+sys.path.insert(0, str(ROOT / "scripts"))
+sys.path.insert(0, str(ROOT))
@@ -0,0 +1,98 @@
+"""Folder listing against FakeCloudinaryAPI: pagination and backoff."""
+
+import pytest
+
+from cloudinary_client import (
+    BASE_FOLDER,
+    MAX_RESULTS,
+    MAX_RETRIES,
+    FolderFetchError,
+    fetch_folders,
+    list_folder,
+)
+from event_mapping import upload_url
+from fake_cloudinary import FakeCloudinaryAPI, RateLimited, resource_from_url
+
+BASE_URL = upload_url("test-cloud")
+
+
+def folder_resources(folder, count):
+    return [
+        resource_from_url(f"{BASE_URL}/v{i + 1}/{BASE_FOLDER}/{folder}/photo-{i}.jpg", BASE_URL)
+        for i in range(count)
+    ]
+
+
+def public_ids(resources):
+    return [resource['public_id'] for resource in resources]
+
+
+class Sleeps(list):
+    """Records the backoff delays instead of sleeping."""
+
+    def __call__(self, seconds):
+        self.append(seconds)
+
+
+def test_list_folder_follows_next_cursor():
+    photos = folder_resources("Holi", MAX_RESULTS * 2 + 3)
+    api = FakeCloudinaryAPI(photos + folder_resources("Holi-2024", 5))
+
+    resources = list_folder(api, "Holi", sleep=Sleeps())
+
+    assert public_ids(resources) == public_ids(photos)
+    assert api.calls == 3
+
+
+def test_list_folder_retries_rate_limited_pages():
+    photos = folder_resources("Holi", MAX_RESULTS * 3)
+    api = FakeCloudinaryAPI(photos, rate_limit_every=2)
+    sleeps = Sleeps()
+
+    resources = list_folder(api, "Holi", sleep=sleeps)
+
+    assert public_ids(resources) == public_ids(photos)
+    # Calls 2 and 4 are rate-limited, then pages 2 and 3 succeed on retry
+    assert api.rate_limited == 2
+    assert len(sleeps) == 2
+    assert api.calls == 5
+
+
+def test_list_folder_gives_up_after_max_retries():
+    api = FakeCloudinaryAPI(folder_resources("Holi", 3), rate_limit_every=1)
+    sleeps = Sleeps()
+
+    with pytest.raises(FolderFetchError) as raised:
+        list_folder(api, "Holi", sleep=sleeps)
+
+    assert raised.value.folder == "Holi"
+    assert isinstance(raised.value.error, RateLimited)
+    assert api.calls == MAX_RETRIES + 1
+    assert len(sleeps) == MAX_RETRIES
+
+
+def test_fetch_folders_collects_every_folder():
+    folders = {name: folder_resources(name, MAX_RESULTS + 10) for name in ("Diwali", "Holi", "Navratri")}
+    api = FakeCloudinaryAPI(
+        [resource for resources in folders.values() for resource in resources],
+        rate_limit_every=4,
+    )
+
+    results, errors = fetch_folders(api, list(folders) + ["Holi"], max_workers=3, sleep=Sleeps())
+
+    assert errors == {}
+    assert {name: public_ids(resources) for name, resources in results.items()} == {
+        name: public_ids(resources) for name, resources in folders.items()
+    }
+    assert api.rate_limited > 0
+
+
+def test_fetch_folders_reports_folders_that_keep_failing():
+    api = FakeCloudinaryAPI(folder_resources("Holi", 3), rate_limit_every=1)
+
+    results, errors = fetch_folders(api, ["Holi", "Diwali"], retries=2, sleep=Sleeps())
+
+    assert results == {}
+    assert sorted(errors) == ["Diwali", "Holi"]
+    assert all(isinstance(error.error, RateLimited) for error in errors.values())
+    assert api.calls == 2 * 3
@@ -0,0 +1,104 @@
+"""Derived image warming against FakeCloudinaryAPI.explicit."""
+
+from derived_images import eager_transformations, warm_events
+from event_mapping import event_base_path, upload_url
+from fake_cloudinary import FakeCloudinaryAPI, NotFound, RateLimited, resource_from_url
+from image_presets import preset_transformations
+
+BASE_URL = upload_url("test-cloud")
+
+
+def event(folder, filenames):
+    return {
+        "cloudinary_folder": folder,
+        "base_path": event_base_path(folder),
+        "photos": [[1, filename] for filename in filenames],
+    }
+
+
+def fake_api(events, **options):
+    resources = [
+        resource_from_url(f"{BASE_URL}/v{photo[0]}/{event['base_path']}/{photo[1]}", BASE_URL)
+        for event in events
+        for photo in event['photos']
+    ]
+    unique = {resource['public_id']: resource for resource in resources}
+    return FakeCloudinaryAPI(list(unique.values()), **options)
+
+
+def no_sleep(seconds):
+    pass
+
+
+def test_cover_gets_the_card_preset():
+    cover = eager_transformations(cover=True)
+    other = eager_transformations()
+
+    assert set(preset_transformations("card")) <= set(cover)
+    assert not set(preset_transformations("card")) & set(other)
+    assert set(other) <= set(cover)
+
+
+def test_warm_events_requests_each_photos_presets_once():
+    holi = event("Holi", ["a.jpg", "b.jpg", "c.jpg"])
+    # A second entry for the same folder shares its photos
+    duplicate = event("Holi", ["b.jpg", "a.jpg"])
+    diwali = event("Diwali", ["d.jpg", "e.jpg"])
+    api = fake_api([holi, diwali])
+
+    warmed, errors = warm_events(api, [holi, duplicate, diwali], BASE_URL, sleep=no_sleep)
+
+    assert errors == {}
+    assert warmed == 5
+    assert api.calls == 5
+    cover = set(eager_transformations(cover=True))
+    other = set(eager_transformations())
+    assert api.derived == {
+        "archived-events/Holi/a": cover,
+        "archived-events/Holi/b": other,
+        "archived-events/Holi/c": other,
+        "archived-events/Diwali/d": cover,
+        "archived-events/Diwali/e": other,
+    }
+
+
+def test_warm_events_collects_errors_by_public_id():
+    holi = event("Holi", ["a.jpg", "b.jpg"])
+    api = fake_api([holi])
+    holi['photos'].append([1, "missing.jpg"])
+
+    warmed, errors = warm_events(api, [holi], BASE_URL, sleep=no_sleep)
+
+    assert warmed == 2
+    assert list(errors) == ["archived-events/Holi/missing"]
+    assert isinstance(errors["archived-events/Holi/missing"], NotFound)
+
+
+def test_warm_events_gives_up_on_rate_limited_photos():
+    holi = event("Holi", ["a.jpg", "b.jpg"])
+    api = fake_api([holi], rate_limit_every=1)
+
+    warmed, errors = warm_events(api, [holi], BASE_URL, retries=2, sleep=no_sleep)
+
+    assert warmed == 0
+    assert sorted(errors) == ["archived-events/Holi/a", "archived-events/Holi/b"]
+    assert all(isinstance(error, RateLimited) for error in errors.values())
+    assert api.calls == 2 * 3
+    assert api.derived == {}
+
+
+def test_warm_events_skips_lightbox_widths_above_the_photo():
+    holi = event("Holi", ["a.jpg", "b.jpg"])
+    holi['photos'][1] += [1600, 1200]
+    api = fake_api([holi])
+
+    warm_events(api, [holi], BASE_URL, sleep=no_sleep)
+
+    lightbox = {t for t in api.derived["archived-events/Holi/b"] if t.startswith("w_") and "c_limit" in t}
+    assert lightbox == {
+        "w_640,c_limit,q_auto:good,f_auto",
+        "w_960,c_limit,q_auto:good,f_auto",
+        "w_1280,c_limit,q_auto:good,f_auto",
+        "w_1600,c_limit,q_auto:good,f_auto",
+    }
+    assert "w_2560,c_limit,q_auto:good,f_auto" in api.derived["archived-events/Holi/a"]
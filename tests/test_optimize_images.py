@@ -0,0 +1,64 @@
+"""Page rewriting of optimize_images.py (no Pillow needed)."""
+
+from pathlib import Path
+
+from optimize_images import rewrite_page
+
+ROOT = Path(__file__).resolve().parent.parent
+
+HERO = "images/hero_slide_1.png"
+ENTRY = {
+    "width": 1920,
+    "height": 1080,
+    "variants": {
+        "avif": [[960, "images/optimized/hero_slide_1-960.avif"], [1920, "images/optimized/hero_slide_1-1920.avif"]],
+        "webp": [[960, "images/optimized/hero_slide_1-960.webp"], [1920, "images/optimized/hero_slide_1-1920.webp"]],
+    },
+}
+IMAGE_SET = (
+    "image-set(url('images/optimized/hero_slide_1-1920.avif') type('image/avif'), "
+    "url('images/optimized/hero_slide_1-1920.webp') type('image/webp'), "
+    "url('images/hero_slide_1.png') type('image/png'))"
+)
+GRADIENT = "linear-gradient(rgba(15, 62, 68, 0.8), rgba(15, 62, 68, 0.8))"
+
+
+def test_shorthand_keeps_gradient_layer():
+    # The page header rule of about.html
+    css = f"background: {GRADIENT}, url('{HERO}');"
+
+    assert rewrite_page(css, {HERO: ENTRY}) == (
+        f"background: {GRADIENT}, url('{HERO}'); background: {GRADIENT}, {IMAGE_SET};"
+    )
+
+
+def test_shorthand_in_about_html_is_rewritten():
+    text = (ROOT / "about.html").read_text(encoding='utf-8')
+
+    rewritten = rewrite_page(text, {HERO: ENTRY})
+
+    assert f"background: {GRADIENT}, {IMAGE_SET};" in rewritten
+    assert rewrite_page(rewritten, {HERO: ENTRY}) == rewritten
+
+
+def test_shorthand_keeps_values_after_the_image():
+    css = f'<div style="background: url({HERO}) no-repeat center / cover;">'
+
+    assert rewrite_page(css, {HERO: ENTRY}) == (
+        f"<div style=\"background: url('{HERO}') no-repeat center / cover; "
+        f"background: {IMAGE_SET} no-repeat center / cover;\">"
+    )
+
+
+def test_rewrite_is_undone_without_variants():
+    css = f"background: {GRADIENT}, url('{HERO}');"
+
+    assert rewrite_page(rewrite_page(css, {HERO: ENTRY}), {}) == css
+
+
+def test_background_image_gets_image_set():
+    style = f"style=\"background-image: url('{HERO}');\""
+
+    assert rewrite_page(style, {HERO: ENTRY}) == (
+        f"style=\"background-image: url('{HERO}'); background-image: {IMAGE_SET};\""
+    )
@@ -0,0 +1,40 @@
+"""Event card rendering of update_website.py."""
+
+from urllib.parse import parse_qs, urlparse
+
+from event_mapping import upload_url
+from site_render import compile_template, render_string
+from update_website import EVENT_CARD_TEMPLATE, event_card_fields, virtual_card_row
+
+BASE_URL = upload_url("test-cloud")
+EVENT = {
+    "event_id": "1",
+    "event_name": 'Meet & "Greet" <Holi> @Uithoorn',
+    "event_date": "2025-06-09",
+    "cloudinary_folder": "Meet-Greet",
+    "photo_count": 1,
+    "base_path": "archived-events/Meet-Greet",
+    "photos": [[1, "a.jpg"]],
+}
+
+
+def test_card_escapes_event_name():
+    card = render_string(compile_template(EVENT_CARD_TEMPLATE), event_card_fields(EVENT, BASE_URL))
+
+    assert 'alt="Meet &amp; &quot;Greet&quot; &lt;Holi&gt; @Uithoorn"' in card
+    assert '<h3>Meet &amp; "Greet" &lt;Holi&gt; @Uithoorn</h3>' in card
+    assert "<Holi>" not in card
+
+
+def test_gallery_link_keeps_the_whole_name():
+    link = virtual_card_row(EVENT, BASE_URL)[0]
+
+    assert parse_qs(urlparse(link).query) == {
+        "folder": ["Meet-Greet"],
+        "name": [EVENT['event_name']],
+        "date": ["2025-06-09"],
+    }
+
+
+def test_card_row_is_not_html_escaped():
+    assert virtual_card_row(EVENT, BASE_URL)[3] == EVENT['event_name']
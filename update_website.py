@@ -1,7 +1,43 @@
+import argparse
+import html
 import json
 import shutil
+import sys
+from contextlib import closing
+from itertools import chain
 from pathlib import Path
 from datetime import datetime
+from urllib.parse import quote, urlencode
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "scripts"))
+from build_manifest import (
+    BUILD_MANIFEST_FILE,
+    forget_missing_outputs,
+    hash_input_stream,
+    hash_inputs,
+    is_up_to_date,
+    load_manifest,
+    record_output,
+    save_manifest,
+)
+from critical_css import inline_critical_css
+from event_mapping import first_photo_url, load_mapping, photo_color, photo_size, photo_url, upload_url
+from event_store import CSV_FILE, export_csv, export_mapping, load_store_mapping, open_store
+from image_presets import IMAGE_PRESETS, preset_sizes, preset_srcset, preset_url, presets_json
+from instrumentation import count, instrumented, phase
+from minify import minify_css, minify_html, minify_js
+from search_index import SEARCH_INDEX_FILE, build_search_index
+from site_render import compile_template, open_output, render_string, render_to
+from gallery_data import (
+    GALLERY_DATA_DIR,
+    GALLERY_INDEX_FILE,
+    build_index,
+    build_shard,
+    remove_stale_shards,
+    shard_filename,
+    unique_events_by_folder,
+    write_json,
+)
 
 # Paths
 MAPPING_FILE = "cloudinary_event_mapping.json"
@@ -10,36 +46,28 @@ EVENTS_BACKUP = "events-backup.html"
 GALLERY_HTML = "gallery.html"
 GALLERY_CSS = "gallery.css"
 GALLERY_JS = "gallery.js"
+GALLERY_PAGE_DIR = "gallery"
+VIRTUAL_GRID_JS = "virtual-grid.js"
+EVENTS_ARCHIVE_JS = "events-archive.js"
+EVENT_CARDS_JS = "event-cards.js"
+EVENTS_SEARCH_JS = "events-search.js"
 
-def format_date(date_str):
-    """
-    Convert date from YYYY-MM-DD to MMM'YY format
-    Example: 2025-06-09 -> Jun'25
-    """
-    try:
-        date_obj = datetime.strptime(date_str, '%Y-%m-%d')
-        return date_obj.strftime("%b'%y")
-    except (ValueError, TypeError):
-        return date_str
-
-# Load mapping
-with open(MAPPING_FILE, 'r', encoding='utf-8') as f:
-    events = json.load(f)
+# Hand-written files the generated pages use (for --critical-css)
+STYLE_CSS = "style.css"
+COMPONENT_FILES = ("header.html", "footer.html")
 
-print("🔄 Updating website files.. .\n")
+# Archive pagination: later pages are events-page-<n>.html or events-<year>.html
+ARCHIVE_PAGE_SIZE = 24
+ARCHIVE_PAGE_PATTERNS = ("events-page-*.html", "events-[0-9][0-9][0-9][0-9].html")
 
-# Step 1: Backup existing events.html
-print("📋 Step 1: Backing up events.html...")
-if Path(EVENTS_HTML).exists():
-    shutil.copy2(EVENTS_HTML, EVENTS_BACKUP)
-    print(f"   ✅ Backed up to: {EVENTS_BACKUP}\n")
-else:
-    print(f"   ⚠️  {EVENTS_HTML} not found - will create new file\n")
+# Cards rendered into the HTML of a virtualized archive, for the first paint
+VIRTUAL_INITIAL_CARDS = 12
 
-# Step 2: Generate updated events.html
-print("📝 Step 2: Generating updated events.html...")
+# Number of thumbnails loaded eagerly at the top of a static gallery page
+EAGER_THUMBNAILS = 8
 
-events_html = """<!DOCTYPE html>
+# Templates
+EVENTS_PAGE_HEAD = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -129,6 +157,44 @@ events_html = """<!DOCTYPE html>
         .event-meta { margin-top: auto; color: var(--text-light); font-size: 0.9rem; border-top: 1px solid #eee; padding-top: 10px; }
         .event-meta div { display: flex; align-items: center; gap: 8px; margin-top: 5px; }
 
+        /* --- ARCHIVE PAGES --- */
+        .archive-pagination {
+            display: flex;
+            flex-wrap: wrap;
+            justify-content: center;
+            align-items: center;
+            gap: 10px;
+            margin-top: 40px;
+        }
+        .archive-pagination ul { display: flex; flex-wrap: wrap; gap: 6px; list-style: none; padding: 0; margin: 0; }
+        .archive-pagination a,
+        .archive-pagination span {
+            display: inline-block;
+            padding: 6px 14px;
+            border-radius: 20px;
+            text-decoration: none;
+            color: var(--secondary-color);
+            background: var(--white);
+            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
+        }
+        .archive-pagination span[aria-current] { background: var(--secondary-color); color: var(--white); }
+        .archive-pagination .disabled { opacity: 0.4; box-shadow: none; }
+        .archive-noscript { text-align: center; margin-top: 30px; }
+
+        /* --- SEARCH --- */
+        .events-search { max-width: 600px; margin: 0 auto 40px; text-align: center; }
+        .events-search input {
+            width: 100%;
+            padding: 12px 20px;
+            border: 1px solid #ddd;
+            border-radius: 25px;
+            font-family: inherit;
+            font-size: 1rem;
+        }
+        .events-search input:focus { outline: none; border-color: var(--secondary-color); }
+        .events-search-status { min-height: 1.4em; margin-top: 10px; color: var(--text-light); font-size: 0.9rem; }
+        .events-container [hidden] { display: none; }
+
         @media (max-width: 768px) {
             .card-content h3 { min-height: unset; }
         }
@@ -146,50 +212,67 @@ events_html = """<!DOCTYPE html>
     </div>
 
     <section class="events-container">
-        <div class="events-grid">
+        <div class="events-search" id="events-search" role="search" hidden>
+            <input type="search" id="events-search-input" placeholder="Search by event, place or year" aria-label="Search events" autocomplete="off">
+            <p class="events-search-status" id="events-search-status" aria-live="polite"></p>
+        </div>
 """
 
-# Sort events by date (newest first)
-sorted_events = sorted(events, key=lambda x: x['event_date'], reverse=True)
+EVENTS_GRID_OPEN = """        <div class="events-grid">
+"""
 
-for event in sorted_events:
-    if event['photo_count'] > 0:
-        # Get first image URL and create thumbnail version
-        first_image = event['cloudinary_urls'][0]
-        
-        # Cloudinary transformation for thumbnail: width=400, height=300, crop=fit with white background to avoid cropping
-        thumbnail_url = first_image.replace(
-            '/upload/',
-            '/upload/w_400,h_300,c_fit,q_auto,f_auto,b_white/'
-        )
-        
-        # Format date to MMM'YY style
-        formatted_date = format_date(event['event_date'])
-        
-        # Create gallery link with URL parameters
-        gallery_link = f"gallery.html?folder={event['cloudinary_folder']}&name={event['event_name']}&date={event['event_date']}"
-        
-        events_html += f"""
+EVENT_CARD_TEMPLATE = """
             <a href="{gallery_link}" class="event-card">
-                <div class="card-image">
+                <div class="card-image"{placeholder_style}>
                     <span class="date-badge">{formatted_date}</span>
                     <img 
                         src="{thumbnail_url}" 
-                        alt="{event['event_name']}"
+                        srcset="{thumbnail_srcset}"
+                        sizes="{thumbnail_sizes}"
+                        width="{thumbnail_width}"
+                        height="{thumbnail_height}"
+                        alt="{event_alt}"
                         loading="lazy"
                     >
                 </div>
                 <div class="card-content">
-                    <h3>{event['event_name']}</h3>
+                    <h3>{event_name}</h3>
                     <div class="event-meta">
-                        <div><i class="fas fa-calendar-alt"></i> {event['photo_count']} photos</div>
+                        <div><i class="fas fa-calendar-alt"></i> {photo_count} photos</div>
                     </div>
                 </div>
             </a>
 """
 
-events_html += """
+EVENTS_GRID_CLOSE = """
         </div>
+"""
+
+ARCHIVE_NAV_TEMPLATE = """
+        <nav class="archive-pagination" aria-label="Archive pages">
+            {prev_link}
+            <ul>
+{page_links}
+            </ul>
+            {next_link}
+        </nav>
+"""
+
+ARCHIVE_PAGE_LINK_TEMPLATE = """                <li><a href="{path}">{label}</a></li>"""
+
+ARCHIVE_CURRENT_PAGE_TEMPLATE = """                <li><span aria-current="page">{label}</span></li>"""
+
+# Virtualized archive: the card data and the scripts that mount it
+VIRTUAL_ARCHIVE_HEAD = """
+        <noscript><p class="archive-noscript">Enable JavaScript to browse all {card_count} events.</p></noscript>
+        <script type="application/json" id="event-cards">"""
+
+VIRTUAL_ARCHIVE_FOOT = """</script>
+        <script src="virtual-grid.js"></script>
+        <script src="events-archive.js"></script>
+"""
+
+EVENTS_PAGE_FOOT = """        <div class="events-grid" id="events-search-results" hidden></div>
     </section>
 </main>
 
@@ -197,6 +280,8 @@ events_html += """
 <div id="footer-placeholder"></div>
 
 <!-- 3. INCLUDE JAVASCRIPT -->
+<script src="event-cards.js"></script>
+<script src="events-search.js"></script>
 <script src="include.js"></script>
 <script>
     document.addEventListener('DOMContentLoaded', () => {
@@ -207,22 +292,13 @@ events_html += """
 </html>
 """
 
-# Save events.html
-with open(EVENTS_HTML, 'w', encoding='utf-8') as f:
-    f.write(events_html)
-
-print(f"   ✅ Created {EVENTS_HTML} with {len([e for e in events if e['photo_count'] > 0])} events\n")
-
-# Step 3: Generate gallery.html
-print("📝 Step 3: Generating gallery.html...")
-
-gallery_html = """<!DOCTYPE html>
+GALLERY_HTML_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Event Gallery</title>
-    <link rel="stylesheet" href="gallery. css">
+    <link rel="stylesheet" href="gallery.css">
 </head>
 <body>
     <div class="gallery-container">
@@ -247,20 +323,52 @@ gallery_html = """<!DOCTYPE html>
         <div class="lightbox-caption"></div>
     </div>
     
+    <script src="virtual-grid.js"></script>
     <script src="gallery.js"></script>
 </body>
 </html>
 """
 
-with open(GALLERY_HTML, 'w', encoding='utf-8') as f:
-    f.write(gallery_html)
-
-print(f"   ✅ Created {GALLERY_HTML}\n")
+GALLERY_PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{event_name} - Gallery</title>
+    <link rel="stylesheet" href="../gallery.css">
+</head>
+<body>
+    <div class="gallery-container">
+        <header class="gallery-header">
+            <a href="../events.html" class="back-button">← Back to Events</a>
+            <h1 id="event-title">{event_name}</h1>
+            <p id="event-date">📅 {formatted_date}</p>
+            <p id="photo-count">📷 {photo_count} photos</p>
+        </header>
+        
+        <div id="gallery-grid" class="gallery-grid" data-prerendered>
+{items}
+        </div>
+    </div>
+    
+    <!-- Lightbox -->
+    <div id="lightbox" class="lightbox">
+        <span class="lightbox-close">&times;</span>
+        <span class="lightbox-prev">&#10094;</span>
+        <span class="lightbox-next">&#10095;</span>
+        <img id="lightbox-img" src="" alt="">
+        <div class="lightbox-caption"></div>
+    </div>
+    
+    <script src="../virtual-grid.js"></script>
+    <script src="../gallery.js"></script>
+</body>
+</html>
+"""
 
-# Step 4: Generate gallery.css
-print("📝 Step 4: Generating gallery.css...")
+GALLERY_ITEM_TEMPLATE = """            <div class="gallery-item" data-index="{index}"{placeholder_style}><img src="{thumbnail_url}" srcset="{thumbnail_srcset}" sizes="{thumbnail_sizes}" width="{thumbnail_width}" height="{thumbnail_height}" alt="Photo {number}" loading="{loading}" data-full="{url}"{size_data}></div>"""
 
-gallery_css = """* {
+GALLERY_CSS_TEMPLATE = """* {
     margin: 0;
     padding: 0;
     box-sizing: border-box;
@@ -460,15 +568,16 @@ body {
 }
 """
 
-with open(GALLERY_CSS, 'w', encoding='utf-8') as f:
-    f.write(gallery_css)
-
-print(f"   ✅ Created {GALLERY_CSS}\n")
-
-# Step 5: Generate gallery.js
-print("📝 Step 5: Generating gallery.js...")
+GALLERY_JS_TEMPLATE = """// Offline support: register the service worker (sw.js, written by
+// service_worker.py) that sits next to this script
+if ('serviceWorker' in navigator && document.currentScript) {
+    const serviceWorkerUrl = new URL('sw.js', document.currentScript.src);
+    window.addEventListener('load', () => {
+        navigator.serviceWorker.register(serviceWorkerUrl).catch(() => {});
+    });
+}
 
-gallery_js = """// Cloudinary configuration
+// Cloudinary configuration
 const CLOUDINARY_CLOUD_NAME = 'du0lumtob';
 const CLOUDINARY_BASE_URL = `https://res.cloudinary.com/${CLOUDINARY_CLOUD_NAME}/image/upload`;
 
@@ -485,8 +594,54 @@ function formatDate(dateStr) {
     }
 }
 
-// Event mapping data
-const EVENT_MAPPING = """ + json.dumps(events, indent=2) + """;
+// Expand a compact [version, filename] photo entry into its full URL
+function photoUrl(index) {
+    const photo = eventData.photos[index];
+    if (typeof photo === 'string') return photo;
+    return `${eventData.base_url}/v${photo[0]}/${eventData.base_path}/${photo[1]}`;
+}
+
+// Width, height and placeholder color of a photo ([version, filename,
+// width, height, color] entries), where the mapping has them
+function photoDetails(index) {
+    const photo = eventData.photos[index];
+    if (Array.isArray(photo)) return { width: photo[2], height: photo[3], color: photo[4] };
+    return (eventData.details && eventData.details[index]) || {};
+}
+
+// Responsive image presets (breakpoint table from scripts/image_presets.py)
+const IMAGE_PRESETS = """ + presets_json() + """;
+
+// Build the Cloudinary URL of an image rendered with a preset
+function presetUrl(url, name, width) {
+    const preset = IMAGE_PRESETS[name];
+    width = width || preset.width;
+    const parts = [`w_${width}`];
+    if (preset.height) {
+        parts.push(`h_${Math.round(width * preset.height / preset.width)}`);
+    }
+    parts.push(preset.params);
+    return url.replace('/upload/', `/upload/${parts.join(',')}/`);
+}
+
+// Widths of a preset to offer for a photo; a "limit" preset never goes
+// past the photo's own width (like preset_widths() in image_presets.py)
+function presetWidths(name, sourceWidth) {
+    const preset = IMAGE_PRESETS[name];
+    const widths = preset.widths;
+    if (!preset.limit || !sourceWidth || sourceWidth >= widths[widths.length - 1]) return widths;
+    return widths.filter(width => width < sourceWidth).concat(sourceWidth);
+}
+
+// Build a srcset attribute value covering every preset width
+function presetSrcset(url, name, sourceWidth) {
+    return presetWidths(name, sourceWidth)
+        .map(width => `${presetUrl(url, name, width)} ${width}w`)
+        .join(', ');
+}
+
+// Per-event data shards written by update_website.py
+const GALLERY_DATA_DIR = '""" + GALLERY_DATA_DIR + """';
 
 // Get URL parameters
 const urlParams = new URLSearchParams(window.location.search);
@@ -494,12 +649,15 @@ const folderName = urlParams.get('folder');
 const eventName = urlParams.get('name');
 const eventDate = urlParams.get('date');
 
-// Find event in mapping
-const eventData = EVENT_MAPPING.find(e => e.cloudinary_folder === folderName);
+// Event data for the current gallery (loaded from its shard)
+let eventData = null;
 
-if (!eventData) {
+function showNotFound() {
+    document.getElementById('event-title').textContent = 'Event not found';
     document.getElementById('gallery-grid').innerHTML = '<div class="loading">Event not found</div>';
-} else {
+}
+
+function renderGallery() {
     // Update header with formatted date
     document.getElementById('event-title').textContent = eventData.event_name;
     document.getElementById('event-date').textContent = `📅 ${formatDate(eventData.event_date)}`;
@@ -509,24 +667,104 @@ if (!eventData) {
     document.title = `${eventData.event_name} - Gallery`;
     
     // Generate gallery
-    const galleryGrid = document.getElementById('gallery-grid');
     galleryGrid.innerHTML = '';
+    mountGalleryItems();
+}
+
+// Events with at least this many photos keep only the visible rows in
+// the DOM (virtual-grid.js), recycling the thumbnails while scrolling
+const VIRTUAL_GRID_MIN_PHOTOS = 60;
+let virtualGrid = null;
+
+function createGalleryItem() {
+    const item = document.createElement('div');
+    item.className = 'gallery-item';
     
-    eventData.cloudinary_urls.forEach((url, index) => {
-        // Create responsive thumbnail URL with smart cropping (c_fill,g_auto)
-        const thumbnailUrl = url.replace(
-            '/upload/',
-            '/upload/w_350,h_260,c_fill,g_auto,q_auto,f_auto/'
-        );
-        
-        const item = document.createElement('div');
-        item.className = 'gallery-item';
-        item.innerHTML = `<img src="${thumbnailUrl}" alt="Photo ${index + 1}" loading="lazy" data-full="${url}" data-index="${index}">`;
-        
-        item.addEventListener('click', () => openLightbox(index));
-        
-        galleryGrid.appendChild(item);
-    });
+    const img = document.createElement('img');
+    img.sizes = IMAGE_PRESETS.thumb.sizes;
+    img.width = IMAGE_PRESETS.thumb.width;
+    img.height = IMAGE_PRESETS.thumb.height;
+    img.loading = 'lazy';
+    item.appendChild(img);
+    
+    return item;
+}
+
+// Point a (new or recycled) gallery item at a photo
+function updateGalleryItem(item, index) {
+    const url = photoUrl(index);
+    const img = item.querySelector('img');
+    
+    item.dataset.index = index;
+    item.style.backgroundColor = photoDetails(index).color || '';
+    img.dataset.index = index;
+    img.dataset.full = url;
+    img.alt = `Photo ${index + 1}`;
+    
+    // Create responsive thumbnail URLs with smart cropping (c_fill,g_auto)
+    img.srcset = presetSrcset(url, 'thumb');
+    img.src = presetUrl(url, 'thumb');
+}
+
+function mountGalleryItems() {
+    const count = eventData.photos.length;
+    
+    if (count >= VIRTUAL_GRID_MIN_PHOTOS && typeof createVirtualGrid === 'function') {
+        virtualGrid = createVirtualGrid(galleryGrid, {
+            count,
+            create: createGalleryItem,
+            update: updateGalleryItem
+        });
+        return;
+    }
+    
+    const fragment = document.createDocumentFragment();
+    for (let index = 0; index < count; index++) {
+        const item = createGalleryItem();
+        updateGalleryItem(item, index);
+        fragment.appendChild(item);
+    }
+    galleryGrid.appendChild(fragment);
+}
+
+// Open the lightbox from any thumbnail, whether rendered here or pre-rendered
+const galleryGrid = document.getElementById('gallery-grid');
+galleryGrid.addEventListener('click', (e) => {
+    const item = e.target.closest('.gallery-item');
+    if (item) openLightbox(Number(item.dataset.index));
+});
+
+if (galleryGrid.hasAttribute('data-prerendered')) {
+    // Static gallery page: thumbnails are already in the HTML, only the
+    // lightbox needs the full-size URLs, sizes and placeholder colors
+    const images = Array.from(galleryGrid.querySelectorAll('.gallery-item img'));
+    eventData = {
+        photos: images.map(img => img.dataset.full),
+        details: images.map(img => ({
+            width: Number(img.dataset.width) || undefined,
+            height: Number(img.dataset.height) || undefined,
+            color: img.parentElement.style.backgroundColor || undefined
+        }))
+    };
+    
+    // Large events hand their thumbnails over to the windowed grid
+    if (eventData.photos.length >= VIRTUAL_GRID_MIN_PHOTOS) {
+        mountGalleryItems();
+    }
+} else if (!folderName) {
+    showNotFound();
+} else {
+    // Fetch only the shard for the requested folder
+    fetch(`${GALLERY_DATA_DIR}/${encodeURIComponent(folderName)}.json`)
+        .then(response => {
+            if (!response.ok) throw new Error(`HTTP ${response.status}`);
+            return response.json();
+        })
+        .then(data => {
+            eventData = data;
+            renderGallery();
+        })
+        .catch(showNotFound);
 }
 
 // Lightbox functionality
@@ -544,28 +782,101 @@ function openLightbox(index) {
 function closeLightbox() {
     lightbox.classList.remove('active');
     document.body.style.overflow = 'auto';
+    cancelPrefetch();
+}
+
+// Point an image element at the full-size lightbox rendition of a photo
+function setLightboxSource(img, index) {
+    // Use high-quality version for lightbox without any cropping
+    const url = photoUrl(index);
+    const { width, height, color } = photoDetails(index);
+    
+    // Size the image before it arrives, on its placeholder color
+    if (width && height) {
+        img.width = IMAGE_PRESETS.lightbox.width;
+        img.height = Math.round(IMAGE_PRESETS.lightbox.width * height / width);
+    } else {
+        img.removeAttribute('width');
+        img.removeAttribute('height');
+    }
+    img.style.backgroundColor = color || '';
+    
+    img.sizes = IMAGE_PRESETS.lightbox.sizes;
+    img.srcset = presetSrcset(url, 'lightbox', width);
+    img.src = presetUrl(url, 'lightbox');
 }
 
 function showImage(index) {
-    if (!eventData || index < 0 || index >= eventData.cloudinary_urls.length) return;
+    if (!eventData || index < 0 || index >= eventData.photos.length) return;
     
-    // Use high-quality version for lightbox without any cropping
-    const fullUrl = eventData.cloudinary_urls[index].replace(
-        '/upload/',
-        '/upload/w_1920,q_auto:good,f_auto/'
-    );
+    setLightboxSource(lightboxImg, index);
+    document.querySelector('.lightbox-caption').textContent = `${index + 1} / ${eventData.photos.length}`;
     
-    lightboxImg.src = fullUrl;
-    document.querySelector('.lightbox-caption').textContent = `${index + 1} / ${eventData.cloudinary_urls.length}`;
+    // Warm the neighbours once the visible image is ready, so they never
+    // compete with it for bandwidth
+    const ready = lightboxImg.decode ? lightboxImg.decode() : Promise.resolve();
+    ready.catch(() => {}).then(() => {
+        // The photo may not fill its box, so drop the placeholder behind it
+        if (index === currentIndex) lightboxImg.style.backgroundColor = '';
+        if (index === currentIndex && lightbox.classList.contains('active')) {
+            prefetchAround(index);
+        }
+    });
+}
+
+// Lightbox prefetch: fetch and decode the next and previous images
+const PREFETCH_DISTANCE = 2;
+const prefetched = new Map(); // photo index -> Image
+
+// How many images to warm on each side, based on the connection hints
+function prefetchDistance() {
+    const connection = navigator.connection;
+    if (!connection) return PREFETCH_DISTANCE;
+    if (connection.saveData) return 0;
+    if (connection.effectiveType === 'slow-2g' || connection.effectiveType === '2g') return 0;
+    if (connection.effectiveType === '3g') return 1;
+    return PREFETCH_DISTANCE;
+}
+
+// Abort prefetches that are no longer next to the current image
+function cancelPrefetch(keep = new Set()) {
+    prefetched.forEach((img, i) => {
+        if (keep.has(i)) return;
+        img.removeAttribute('srcset');
+        img.removeAttribute('src');
+        prefetched.delete(i);
+    });
+}
+
+function prefetchAround(index) {
+    const count = eventData.photos.length;
+    
+    // Nearest neighbours first, alternating next and previous
+    const wanted = new Set();
+    for (let offset = 1; offset <= prefetchDistance(); offset++) {
+        wanted.add((index + offset) % count);
+        wanted.add((index - offset + count) % count);
+    }
+    wanted.delete(index);
+    
+    cancelPrefetch(new Set([...wanted, index]));
+    
+    wanted.forEach(i => {
+        if (prefetched.has(i)) return;
+        const img = new Image();
+        setLightboxSource(img, i);
+        if (img.decode) img.decode().catch(() => {});
+        prefetched.set(i, img);
+    });
 }
 
 function nextImage() {
-    currentIndex = (currentIndex + 1) % eventData.cloudinary_urls.length;
+    currentIndex = (currentIndex + 1) % eventData.photos.length;
     showImage(currentIndex);
 }
 
 function prevImage() {
-    currentIndex = (currentIndex - 1 + eventData.cloudinary_urls.length) % eventData.cloudinary_urls.length;
+    currentIndex = (currentIndex - 1 + eventData.photos.length) % eventData.photos.length;
     showImage(currentIndex);
 }
 
@@ -589,29 +900,989 @@ lightbox.addEventListener('click', (e) => {
 });
 """
 
-with open(GALLERY_JS, 'w', encoding='utf-8') as f:
-    f.write(gallery_js)
-
-print(f"   ✅ Created {GALLERY_JS}\n")
-
-print("="*70)
-print("✅ Website update complete!")
-print("\nFiles created/updated:")
-print(f"   📋 {EVENTS_BACKUP} (backup)")
-print(f"   📄 {EVENTS_HTML} (updated with thumbnails)")
-print(f"   📄 {GALLERY_HTML} (dynamic gallery page)")
-print(f"   🎨 {GALLERY_CSS} (gallery styles)")
-print(f"   ⚡ {GALLERY_JS} (gallery functionality)")
-print("="*70)
-print("\n🚀 Next steps:")
-print("   1. Test locally:  Open events.html in your browser")
-print("   2. Push to GitHub:")
-print("      git add events.html events-backup.html gallery.html gallery. css gallery.js")
-print("      git commit -m 'Update events gallery with Cloudinary integration'")
-print("      git push")
-print("\n📱 Features:")
-print("   ✅ Responsive thumbnails (optimized for mobile)")
-print("   ✅ Lazy loading for better performance")
-print("   ✅ Automatic image optimization via Cloudinary")
-print("   ✅ Full-screen lightbox with keyboard navigation")
-print("   ✅ Generic gallery. html works for all events")
+
+VIRTUAL_GRID_JS_TEMPLATE = """// Windowed grid renderer shared by events.html and gallery.html.
+// Keeps only the rows near the viewport in the DOM and recycles their
+// nodes while scrolling; the rows above and below are stood in for by
+// padding, so the grid keeps its CSS layout and scroll height.
+//
+//   createVirtualGrid(grid, {
+//       count: items.length,
+//       create: () => document.createElement('div'),
+//       update: (node, index) => { ... }
+//   });
+function createVirtualGrid(grid, options) {
+    const count = options.count;
+    const overscan = options.overscan === undefined ? 2 : options.overscan;
+    const mounted = new Map();
+    const pool = [];
+    let columns = 1;
+    let stride = 0;
+    let first = -1;
+    let last = -1;
+    let frame = 0;
+
+    function take(index) {
+        const node = pool.pop() || options.create();
+        options.update(node, index);
+        return node;
+    }
+
+    // Read the column count and row height from the live layout
+    function measure() {
+        const style = getComputedStyle(grid);
+        columns = Math.max(1, style.gridTemplateColumns.split(' ').filter(Boolean).length);
+        const rowGap = parseFloat(style.rowGap) || 0;
+
+        let sample = grid.firstElementChild;
+        if (!sample && count) {
+            sample = take(0);
+            mounted.set(0, sample);
+            grid.appendChild(sample);
+        }
+        const height = sample ? sample.getBoundingClientRect().height : 0;
+        stride = height + rowGap;
+    }
+
+    function render() {
+        frame = 0;
+        if (!stride) measure();
+        if (!stride) return;
+
+        const rows = Math.ceil(count / columns);
+        const top = grid.getBoundingClientRect().top;
+        const startRow = Math.min(rows, Math.max(0, Math.floor(-top / stride) - overscan));
+        const endRow = Math.min(rows, Math.max(startRow, Math.ceil((window.innerHeight - top) / stride) + overscan));
+        const from = startRow * columns;
+        const to = Math.min(count, endRow * columns);
+        if (from === first && to === last) return;
+
+        // Release the nodes that scrolled out, then reuse them for the new rows
+        for (const [index, node] of mounted) {
+            if (index < from || index >= to) {
+                mounted.delete(index);
+                pool.push(node);
+            }
+        }
+
+        const nodes = [];
+        for (let index = from; index < to; index++) {
+            let node = mounted.get(index);
+            if (!node) {
+                node = take(index);
+                mounted.set(index, node);
+            }
+            nodes.push(node);
+        }
+
+        grid.replaceChildren(...nodes);
+        grid.style.paddingTop = `${startRow * stride}px`;
+        grid.style.paddingBottom = `${(rows - endRow) * stride}px`;
+        first = from;
+        last = to;
+    }
+
+    function schedule() {
+        if (!frame) frame = requestAnimationFrame(render);
+    }
+
+    function refresh() {
+        stride = 0;
+        first = last = -1;
+        schedule();
+    }
+
+    window.addEventListener('scroll', schedule, { passive: true });
+    window.addEventListener('resize', refresh);
+    render();
+
+    return {
+        refresh,
+
+        // Scroll the page so the row holding index is at the top
+        scrollToIndex(index) {
+            if (!stride) measure();
+            const rowTop = Math.floor(index / columns) * stride;
+            window.scrollTo(0, window.scrollY + grid.getBoundingClientRect().top + rowTop);
+        },
+
+        destroy() {
+            window.removeEventListener('scroll', schedule);
+            window.removeEventListener('resize', refresh);
+            if (frame) cancelAnimationFrame(frame);
+        }
+    };
+}
+"""
+
+EVENT_CARDS_JS_TEMPLATE = """// Event cards built in the browser, by events-archive.js and events-search.js.
+// A card row is [link, date, image, name, photos, color], as
+// update_website.py writes them; color is the image's placeholder (or null).
+
+// Breakpoints of the 'card' preset in scripts/image_presets.py
+const CARD_PRESET = """ + json.dumps(IMAGE_PRESETS['card'], indent=4) + """;
+
+function cardUrl(url, width) {
+    const height = Math.round(width * CARD_PRESET.height / CARD_PRESET.width);
+    return url.replace('/upload/', `/upload/w_${width},h_${height},${CARD_PRESET.params}/`);
+}
+
+function createCard() {
+    const card = document.createElement('a');
+    card.className = 'event-card';
+    card.innerHTML = `
+        <div class="card-image">
+            <span class="date-badge"></span>
+            <img sizes="${CARD_PRESET.sizes}" width="${CARD_PRESET.width}" height="${CARD_PRESET.height}" loading="lazy">
+        </div>
+        <div class="card-content">
+            <h3></h3>
+            <div class="event-meta">
+                <div><i class="fas fa-calendar-alt"></i> <span class="photo-count"></span></div>
+            </div>
+        </div>`;
+    return card;
+}
+
+function updateCard(card, row) {
+    const [link, date, image, name, photos, color] = row;
+    const img = card.querySelector('img');
+    card.href = link;
+    card.querySelector('.card-image').style.backgroundColor = color || '';
+    card.querySelector('.date-badge').textContent = date;
+    card.querySelector('h3').textContent = name;
+    card.querySelector('.photo-count').textContent = `${photos} photos`;
+    img.alt = name;
+    img.srcset = CARD_PRESET.widths.map(width => `${cardUrl(image, width)} ${width}w`).join(', ');
+    img.src = cardUrl(image, CARD_PRESET.width);
+}
+"""
+
+EVENTS_ARCHIVE_JS_TEMPLATE = """// Virtualized events archive (update_website.py --virtual-archive).
+// events.html embeds every card row; only the cards near the viewport
+// are mounted, via virtual-grid.js.
+
+// event-cards.js is loaded at the end of the page
+document.addEventListener('DOMContentLoaded', () => {
+    const grid = document.querySelector('.events-grid');
+    const data = document.getElementById('event-cards');
+    if (!grid || !data) return;
+
+    const cards = JSON.parse(data.textContent);
+
+    createVirtualGrid(grid, {
+        count: cards.length,
+        create: createCard,
+        update: (card, index) => updateCard(card, cards[index])
+    });
+});
+"""
+
+EVENTS_SEARCH_JS_TEMPLATE = """// Events archive search. search-index.json maps every word of the events'
+// names, places, dates and folders to the events containing it; it is
+// only fetched once the search box is used. Every word typed must match
+// the start of one of an event's words.
+
+const SEARCH_INDEX_URL = '""" + SEARCH_INDEX_FILE + """';
+const SEARCH_RESULT_LIMIT = 60;
+
+// The same words as tokenize() in scripts/search_index.py
+function searchWords(text) {
+    return text.normalize('NFKD').replace(/\\p{M}/gu, '').toLowerCase().match(/[\\p{L}\\p{N}]+/gu) || [];
+}
+
+(function () {
+    const search = document.getElementById('events-search');
+    const input = document.getElementById('events-search-input');
+    const status = document.getElementById('events-search-status');
+    const results = document.getElementById('events-search-results');
+    if (!search || !input || !status || !results) return;
+
+    const archive = document.querySelectorAll('.events-grid:not(#events-search-results), .archive-pagination');
+    let index = null;
+    let loading = null;
+
+    function loadIndex() {
+        if (!loading) {
+            loading = fetch(SEARCH_INDEX_URL)
+                .then(response => {
+                    if (!response.ok) throw new Error(`HTTP ${response.status}`);
+                    return response.json();
+                })
+                .then(data => {
+                    // Undo the delta encoding of the event lists
+                    data.postings = data.postings.map(deltas => {
+                        let number = 0;
+                        return deltas.map(delta => (number += delta));
+                    });
+                    index = data;
+                })
+                .catch(error => {
+                    loading = null;
+                    throw error;
+                });
+        }
+        return loading;
+    }
+
+    // Position of the first term not sorted before word
+    function firstTerm(word) {
+        let low = 0;
+        let high = index.terms.length;
+        while (low < high) {
+            const middle = (low + high) >> 1;
+            if (index.terms[middle] < word) low = middle + 1;
+            else high = middle;
+        }
+        return low;
+    }
+
+    function eventsStartingWith(word) {
+        const found = new Set();
+        for (let i = firstTerm(word); i < index.terms.length && index.terms[i].startsWith(word); i++) {
+            index.postings[i].forEach(number => found.add(number));
+        }
+        return found;
+    }
+
+    // Events matching every word, newest first
+    function find(words) {
+        let matches = eventsStartingWith(words[0]);
+        for (const word of words.slice(1)) {
+            const found = eventsStartingWith(word);
+            matches = new Set([...matches].filter(number => found.has(number)));
+        }
+        return [...matches].sort((a, b) => a - b);
+    }
+
+    function showArchive(visible) {
+        archive.forEach(element => { element.hidden = !visible; });
+        results.hidden = visible;
+        // Let a virtualized archive measure its grid again
+        if (visible) window.dispatchEvent(new Event('resize'));
+    }
+
+    function render() {
+        const words = searchWords(input.value);
+        if (!words.length) {
+            status.textContent = '';
+            results.replaceChildren();
+            showArchive(true);
+            return;
+        }
+
+        const matches = find(words);
+        const shown = matches.slice(0, SEARCH_RESULT_LIMIT);
+        results.replaceChildren(...shown.map(number => {
+            const card = createCard();
+            updateCard(card, index.events[number]);
+            return card;
+        }));
+        if (matches.length > shown.length) {
+            status.textContent = `Showing the newest ${shown.length} of ${matches.length} matching events`;
+        } else {
+            status.textContent = `${matches.length} matching event${matches.length === 1 ? '' : 's'}`;
+        }
+        showArchive(false);
+    }
+
+    function update() {
+        if (index || !searchWords(input.value).length) {
+            render();
+            return;
+        }
+        status.textContent = 'Searching...';
+        loadIndex().then(render, () => {
+            status.textContent = 'Search is not available right now.';
+        });
+    }
+
+    // Start downloading the index as soon as the box is focused
+    input.addEventListener('focus', () => loadIndex().catch(() => {}), { once: true });
+    input.addEventListener('input', update);
+    search.hidden = false;
+})();
+"""
+
+
+# Templates compiled once and streamed to the output file
+EVENT_CARD = compile_template(EVENT_CARD_TEMPLATE)
+ARCHIVE_NAV = compile_template(ARCHIVE_NAV_TEMPLATE)
+ARCHIVE_PAGE_LINK = compile_template(ARCHIVE_PAGE_LINK_TEMPLATE)
+ARCHIVE_CURRENT_PAGE = compile_template(ARCHIVE_CURRENT_PAGE_TEMPLATE)
+VIRTUAL_ARCHIVE = compile_template(VIRTUAL_ARCHIVE_HEAD)
+GALLERY_PAGE = compile_template(GALLERY_PAGE_TEMPLATE)
+GALLERY_ITEM = compile_template(GALLERY_ITEM_TEMPLATE)
+
+
+def format_date(date_str):
+    """
+    Convert date from YYYY-MM-DD to MMM'YY format
+    Example: 2025-06-09 -> Jun'25
+    """
+    try:
+        date_obj = datetime.strptime(date_str, '%Y-%m-%d')
+        return date_obj.strftime("%b'%y")
+    except (ValueError, TypeError):
+        return date_str
+
+
+def placeholder_style(color):
+    """Return the style attribute painting a photo's placeholder color, or ''."""
+    return f' style="background-color: {html.escape(color)}"' if color else ''
+
+
+def size_data(size):
+    """Return data attributes holding a photo's (width, height), or ''."""
+    return f' data-width="{size[0]}" data-height="{size[1]}"' if size else ''
+
+
+def card_events(events):
+    """Return the events shown as cards, sorted by date (newest first)."""
+    sorted_events = sorted(events, key=lambda x: x['event_date'], reverse=True)
+    return [event for event in sorted_events if event['photo_count'] > 0]
+
+
+def gallery_page_path(folder_name):
+    """Return the path of an event's static gallery page."""
+    return f"{GALLERY_PAGE_DIR}/{folder_name}.html"
+
+
+def gallery_link(event, static_galleries=False):
+    """Return the URL of an event's gallery."""
+    if static_galleries:
+        # Link to the pre-rendered page for this event
+        return gallery_page_path(event['cloudinary_folder'])
+    
+    # Create gallery link with URL parameters (names may contain & or #)
+    return "gallery.html?" + urlencode({
+        "folder": event['cloudinary_folder'],
+        "name": event['event_name'],
+        "date": event['event_date'],
+    }, quote_via=quote)
+
+
+def event_card_fields(event, base_url, static_galleries=False):
+    """Collect the values substituted into EVENT_CARD_TEMPLATE.
+    
+    Event names come from issue bodies, so they are HTML-escaped like the
+    gallery page fields.
+    """
+    # Get first image URL and create thumbnail version
+    first_image = first_photo_url(event, base_url)
+    
+    # Cloudinary 'card' preset: crop=fit with white background to avoid cropping
+    thumbnail_url = preset_url(first_image, 'card')
+    
+    return {
+        "gallery_link": html.escape(gallery_link(event, static_galleries)),
+        # Format date to MMM'YY style
+        "formatted_date": format_date(event['event_date']),
+        "thumbnail_url": thumbnail_url,
+        "thumbnail_srcset": preset_srcset(first_image, 'card'),
+        "thumbnail_sizes": preset_sizes('card'),
+        # The image fills its box (object-fit: cover), so the preset's box
+        # is the size to reserve
+        "thumbnail_width": IMAGE_PRESETS['card']['width'],
+        "thumbnail_height": IMAGE_PRESETS['card']['height'],
+        "placeholder_style": placeholder_style(photo_color(event['photos'][0])),
+        "event_alt": html.escape(event['event_name'], quote=True),
+        "event_name": html.escape(event['event_name'], quote=False),
+        "photo_count": event['photo_count'],
+    }
+
+
+def iter_card_fields(events, base_url, static_galleries=False):
+    """Yield event_card_fields() for each event from card_events()."""
+    for event in events:
+        yield event_card_fields(event, base_url, static_galleries)
+
+
+def archive_pages(events, mode='single', page_size=ARCHIVE_PAGE_SIZE):
+    """Split the archive cards into pages.
+    
+    mode is 'single' (one page), 'year' (one page per year) or 'fixed'
+    (page_size cards per page). Returns a list of (path, label, events),
+    newest first; the first page is always events.html.
+    """
+    shown = card_events(events)
+    
+    if mode == 'year':
+        years = {}
+        for event in shown:
+            years.setdefault(event['event_date'][:4], []).append(event)
+        pages = [(f"events-{year}.html", year, group) for year, group in years.items()]
+    elif mode == 'fixed':
+        pages = [
+            (f"events-page-{number}.html", str(number), shown[start:start + page_size])
+            for number, start in enumerate(range(0, len(shown), page_size), 1)
+        ]
+    else:
+        pages = [(EVENTS_HTML, "1", shown)]
+    
+    if not pages:
+        return [(EVENTS_HTML, "1", [])]
+    return [(EVENTS_HTML,) + pages[0][1:]] + pages[1:]
+
+
+def pager_link(pages, index, text, rel):
+    """Return the link to a neighbouring archive page, or a disabled label."""
+    if 0 <= index < len(pages):
+        return f'<a href="{pages[index][0]}" rel="{rel}">{text}</a>'
+    return f'<span class="disabled">{text}</span>'
+
+
+def archive_nav_fields(pages, current):
+    """Collect the values substituted into ARCHIVE_NAV_TEMPLATE."""
+    links = []
+    for index, (path, label, _) in enumerate(pages):
+        template = ARCHIVE_CURRENT_PAGE if index == current else ARCHIVE_PAGE_LINK
+        links.append(render_string(template, {"path": path, "label": label}))
+    
+    return {
+        "prev_link": pager_link(pages, current - 1, "&larr; Newer", "prev"),
+        "next_link": pager_link(pages, current + 1, "Older &rarr;", "next"),
+        "page_links": '\n'.join(links),
+    }
+
+
+def virtual_card_row(event, base_url, static_galleries=False):
+    """Return the compact card entry that events-archive.js mounts.
+    
+    The browser sets these as DOM properties, so they are not HTML-escaped.
+    """
+    return [
+        gallery_link(event, static_galleries),
+        format_date(event['event_date']),
+        first_photo_url(event, base_url),
+        event['event_name'],
+        event['photo_count'],
+        photo_color(event['photos'][0]),
+    ]
+
+
+def write_virtual_cards(out, events, base_url, static_galleries=False):
+    """Stream the card data and scripts of a virtualized archive."""
+    render_to(out, VIRTUAL_ARCHIVE, {"card_count": len(events)})
+    out.write('[')
+    for index, event in enumerate(events):
+        row = json.dumps(virtual_card_row(event, base_url, static_galleries), ensure_ascii=False)
+        # Keep "</script>" in an event name from closing the data block
+        out.write(('\n' if index == 0 else ',\n') + row.replace('</', '<\\/'))
+    out.write('\n]')
+    out.write(VIRTUAL_ARCHIVE_FOOT)
+
+
+def gallery_page_fields(event, base_url):
+    """Collect the values substituted into GALLERY_PAGE_TEMPLATE, except items."""
+    return {
+        "event_name": html.escape(event['event_name'], quote=False),
+        "formatted_date": format_date(event['event_date']),
+        "photo_count": event['photo_count'],
+    }
+
+
+def iter_gallery_item_fields(event, base_url):
+    """Yield the values substituted into GALLERY_ITEM_TEMPLATE for each photo."""
+    for index, photo in enumerate(event['photos']):
+        url = photo_url(photo, base_url, event['base_path'])
+        yield {
+            "index": index,
+            "number": index + 1,
+            "url": html.escape(url),
+            "thumbnail_url": html.escape(preset_url(url, 'thumb')),
+            "thumbnail_srcset": html.escape(preset_srcset(url, 'thumb')),
+            "thumbnail_sizes": preset_sizes('thumb'),
+            "thumbnail_width": IMAGE_PRESETS['thumb']['width'],
+            "thumbnail_height": IMAGE_PRESETS['thumb']['height'],
+            "placeholder_style": placeholder_style(photo_color(photo)),
+            # Sizes the lightbox before the full image arrives
+            "size_data": size_data(photo_size(photo)),
+            "loading": "eager" if index < EAGER_THUMBNAILS else "lazy",
+        }
+
+
+def gallery_page_hash(event, base_url, options=()):
+    """Hash everything a static gallery page is rendered from."""
+    return hash_input_stream(chain(
+        (GALLERY_PAGE_TEMPLATE, GALLERY_ITEM_TEMPLATE, gallery_page_fields(event, base_url)) + tuple(options),
+        iter_gallery_item_fields(event, base_url),
+    ))
+
+
+def write_gallery_page(path, event, base_url):
+    """Stream a static gallery page for an event to path."""
+    def write_items(out):
+        for item in iter_gallery_item_fields(event, base_url):
+            if item['index']:
+                out.write('\n')
+            render_to(out, GALLERY_ITEM, item)
+    
+    fields = dict(gallery_page_fields(event, base_url), items=write_items)
+    with open_output(path) as out:
+        render_to(out, GALLERY_PAGE, fields)
+
+
+def remove_stale_gallery_pages(events):
+    """Delete static gallery pages whose folder is no longer in the mapping."""
+    current = {Path(gallery_page_path(event['cloudinary_folder'])).name for event in events}
+    
+    removed = []
+    for path in Path(GALLERY_PAGE_DIR).glob('*.html'):
+        if path.name not in current:
+            path.unlink()
+            removed.append(path)
+    
+    return removed
+
+
+def write_events_html(path, cards, after_grid=None):
+    """Stream an archive page to path from event_card_fields() dicts.
+    
+    after_grid, if given, is called with the output stream to add the
+    page navigation or virtualized card data below the grid.
+    """
+    with open_output(path) as out:
+        out.write(EVENTS_PAGE_HEAD)
+        out.write(EVENTS_GRID_OPEN)
+        for fields in cards:
+            render_to(out, EVENT_CARD, fields)
+        out.write(EVENTS_GRID_CLOSE)
+        if after_grid:
+            after_grid(out)
+        out.write(EVENTS_PAGE_FOOT)
+
+
+def remove_stale_archive_pages(pages):
+    """Delete archive pages that are no longer generated."""
+    current = {path for path, _, _ in pages}
+    
+    removed = []
+    for pattern in ARCHIVE_PAGE_PATTERNS:
+        for path in Path('.').glob(pattern):
+            if path.name not in current:
+                path.unlink()
+                removed.append(path)
+    
+    return removed
+
+
+def write_text(path, content):
+    """Write a generated text file."""
+    with open_output(path) as out:
+        out.write(content)
+
+
+def read_text(path):
+    """Read a hand-written text file, or return '' if it is missing."""
+    try:
+        return Path(path).read_text(encoding='utf-8')
+    except FileNotFoundError:
+        return ""
+
+
+def optimize_page(path, options, stylesheets=(), extra_markup=''):
+    """Inline the critical CSS of a generated page and/or minify it, in place.
+    
+    stylesheets are (href, css) pairs for the page's stylesheet links;
+    extra_markup holds templates of elements the page's scripts create.
+    """
+    if not any(options.values()):
+        return
+    
+    page = Path(path).read_text(encoding='utf-8')
+    if options['critical_css']:
+        for href, css in stylesheets:
+            page = inline_critical_css(page, href, css, extra_markup)
+    if options['minify']:
+        page = minify_html(page)
+    write_text(path, page)
+
+
+def asset_content(template, minifier, options):
+    """Return a generated CSS/JS file's content, minified with --minify."""
+    return minifier(template) if options['minify'] else template
+
+
+def build_output(manifest, report, output, input_hash, write, force=False):
+    """Run write() unless output is already built from input_hash.
+    
+    Returns True if the output was rebuilt.
+    """
+    if not force and is_up_to_date(manifest, output, input_hash):
+        report['skipped'].append(str(output))
+        return False
+    
+    write()
+    record_output(manifest, output, input_hash)
+    report['rebuilt'].append(str(output))
+    return True
+
+
+def load_store(path):
+    """Load every event from an SQLite event store as a mapping."""
+    with closing(open_store(path)) as conn:
+        return load_store_mapping(conn)
+
+
+def export_store(path, mapping, manifest, report, force=False):
+    """Export the mapping file and its CSV summary from the event store.
+    
+    Both are skipped while the store's contents are unchanged.
+    """
+    input_hash = hash_inputs(mapping)
+    with closing(open_store(path)) as conn:
+        for output, export in ((MAPPING_FILE, export_mapping), (CSV_FILE, export_csv)):
+            build_output(manifest, report, output, input_hash, lambda: export(conn, output), force)
+
+
+def backup_events_html():
+    """Copy the current events.html to events-backup.html."""
+    if Path(EVENTS_HTML).exists():
+        shutil.copy2(EVENTS_HTML, EVENTS_BACKUP)
+        print(f"   ✅ Backed up to: {EVENTS_BACKUP}")
+    else:
+        print(f"   ⚠️  {EVENTS_HTML} not found - will create new file")
+
+
+def print_step_result(rebuilt, path, message):
+    """Print whether a build step wrote its output or skipped it."""
+    if rebuilt:
+        print(f"   ✅ {message}\n")
+    else:
+        print(f"   ⏭️  {path} is up to date - skipped\n")
+
+
+def parse_args():
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Generate the events archive and gallery files.")
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help=f"rebuild every output, ignoring {BUILD_MANIFEST_FILE}"
+    )
+    parser.add_argument(
+        '--static-galleries',
+        action='store_true',
+        help=f"pre-render {GALLERY_PAGE_DIR}/<folder>.html for every event and link the cards to them"
+    )
+    parser.add_argument(
+        '--archive-pages',
+        choices=['single', 'year', 'fixed'],
+        default='single',
+        help="split the events archive into one page per year or pages of --page-size cards"
+    )
+    parser.add_argument(
+        '--page-size',
+        type=int,
+        default=ARCHIVE_PAGE_SIZE,
+        metavar='N',
+        help=f"cards per page with --archive-pages fixed (default: {ARCHIVE_PAGE_SIZE})"
+    )
+    parser.add_argument(
+        '--virtual-archive',
+        action='store_true',
+        help="keep events.html as one page but only mount the cards near the viewport"
+    )
+    parser.add_argument(
+        '--critical-css',
+        action='store_true',
+        help="inline the CSS rules each generated page uses and load the stylesheets asynchronously"
+    )
+    parser.add_argument(
+        '--minify',
+        action='store_true',
+        help="minify the generated HTML, CSS and JS"
+    )
+    parser.add_argument(
+        '--store',
+        metavar='PATH',
+        help=f"read the events from this SQLite event store and export {MAPPING_FILE} and {CSV_FILE} from it"
+    )
+    parser.add_argument(
+        '--metrics',
+        metavar='FILE',
+        help="save per-phase timings, counters and peak memory as JSON"
+    )
+    parser.add_argument(
+        '--profile',
+        metavar='FILE',
+        help="profile the build with cProfile and dump the stats to FILE"
+    )
+    args = parser.parse_args()
+    
+    if args.virtual_archive and args.archive_pages != 'single':
+        parser.error("--virtual-archive cannot be combined with --archive-pages")
+    if args.page_size < 1:
+        parser.error("--page-size must be at least 1")
+    if args.store and not Path(args.store).exists():
+        parser.error(f"{args.store} does not exist - create it with: python scripts/event_store.py import")
+    
+    return args
+
+
+def build_website(args):
+    """Generate every output, skipping the ones that are up to date."""
+    # Load mapping (or the event store it is exported from)
+    with phase("load_mapping"):
+        mapping = load_store(args.store) if args.store else load_mapping(MAPPING_FILE)
+    events = mapping['events']
+    base_url = upload_url(mapping['cloud_name'])
+    count("events", len(events))
+    count("photos", sum(len(event['photos']) for event in events))
+    
+    manifest = load_manifest(BUILD_MANIFEST_FILE)
+    report = {"rebuilt": [], "skipped": []}
+    
+    if args.store:
+        with phase("export_store"):
+            export_store(args.store, mapping, manifest, report, args.force)
+    
+    # Optimizations (and the files they read) are part of the input hashes
+    # of the outputs they affect, but only when enabled, so plain builds
+    # keep their hashes
+    optimize = {"critical_css": args.critical_css, "minify": args.minify}
+    page_options = gallery_options = (optimize,) if any(optimize.values()) else ()
+    asset_options = ("minify",) if args.minify else ()
+    
+    style_css = component_markup = ""
+    if args.critical_css:
+        style_css = read_text(STYLE_CSS)
+        component_markup = "".join(read_text(path) for path in COMPONENT_FILES)
+        page_options += (style_css, component_markup)
+        gallery_options += (GALLERY_CSS_TEMPLATE,)
+    
+    print("🔄 Updating website files.. .\n")
+    
+    # Step 1: Generate updated events.html (backing up the old one first)
+    print("📝 Step 1: Generating updated events.html...")
+    
+    with phase("events_html"):
+        pages = archive_pages(events, args.archive_pages, args.page_size)
+        page_templates = (
+            EVENTS_PAGE_HEAD, EVENTS_GRID_OPEN, EVENT_CARD_TEMPLATE, EVENTS_GRID_CLOSE, EVENTS_PAGE_FOOT
+        )
+        rebuilt_pages = 0
+    
+        for number, (page_path, _, page_events) in enumerate(pages):
+            cards = page_events
+            if args.virtual_archive:
+                cards = page_events[:VIRTUAL_INITIAL_CARDS]
+                extra = ('virtual', VIRTUAL_ARCHIVE_HEAD, VIRTUAL_ARCHIVE_FOOT, VIRTUAL_INITIAL_CARDS)
+                after_grid = (lambda out, page_events=page_events:
+                              write_virtual_cards(out, page_events, base_url, args.static_galleries))
+            elif len(pages) > 1:
+                nav_fields = archive_nav_fields(pages, number)
+                extra = ('pages', ARCHIVE_NAV_TEMPLATE, nav_fields)
+                after_grid = lambda out, nav_fields=nav_fields: render_to(out, ARCHIVE_NAV, nav_fields)
+            else:
+                extra = ()
+                after_grid = None
+        
+            # Cards (and the virtualized rows derived from the same events) are
+            # generated twice, once to hash and once to render, rather than
+            # held in memory
+            page_hash = hash_input_stream(chain(
+                page_templates + extra + page_options,
+                iter_card_fields(page_events, base_url, args.static_galleries),
+            ))
+        
+            def build_page(page_path=page_path, cards=cards, after_grid=after_grid):
+                if page_path == EVENTS_HTML:
+                    backup_events_html()
+                write_events_html(
+                    page_path, iter_card_fields(cards, base_url, args.static_galleries), after_grid
+                )
+                optimize_page(page_path, optimize, [(STYLE_CSS, style_css)], component_markup)
+        
+            rebuilt_pages += build_output(manifest, report, page_path, page_hash, build_page, args.force)
+    
+        if args.virtual_archive:
+            build_output(
+                manifest, report, EVENTS_ARCHIVE_JS, hash_inputs(EVENTS_ARCHIVE_JS_TEMPLATE, *asset_options),
+                lambda: write_text(EVENTS_ARCHIVE_JS, asset_content(EVENTS_ARCHIVE_JS_TEMPLATE, minify_js, optimize)),
+                args.force
+            )
+    
+    # The search box covers the cards of every archive page
+    with phase("search_index"):
+        shown = card_events(events)
+        search_index = build_search_index(
+            shown, [virtual_card_row(event, base_url, args.static_galleries) for event in shown]
+        )
+        build_output(
+            manifest, report, SEARCH_INDEX_FILE, hash_inputs(search_index),
+            lambda: write_json(SEARCH_INDEX_FILE, search_index), args.force
+        )
+        for script, template in ((EVENT_CARDS_JS, EVENT_CARDS_JS_TEMPLATE), (EVENTS_SEARCH_JS, EVENTS_SEARCH_JS_TEMPLATE)):
+            build_output(
+                manifest, report, script, hash_inputs(template, *asset_options),
+                lambda script=script, template=template: write_text(script, asset_content(template, minify_js, optimize)),
+                args.force
+            )
+    
+    removed = remove_stale_archive_pages(pages)
+    forget_missing_outputs(manifest)
+    
+    card_count = sum(len(page_events) for _, _, page_events in pages)
+    if removed:
+        print(f"   🗑️  Removed {len(removed)} stale archive page(s)")
+    print(f"   🔎 Search index: {len(search_index['terms'])} terms over {len(shown)} events")
+    if len(pages) == 1:
+        print_step_result(rebuilt_pages, EVENTS_HTML, f"Created {EVENTS_HTML} with {card_count} events")
+    else:
+        print(f"   ✅ {rebuilt_pages} of {len(pages)} archive pages rebuilt ({card_count} events)\n")
+    
+    # Step 2: Generate gallery.html
+    print("📝 Step 2: Generating gallery.html...")
+    
+    with phase("gallery_html"):
+        def build_gallery_html():
+            write_text(GALLERY_HTML, GALLERY_HTML_TEMPLATE)
+            optimize_page(GALLERY_HTML, optimize, [(GALLERY_CSS, GALLERY_CSS_TEMPLATE)], GALLERY_ITEM_TEMPLATE)
+    
+        rebuilt = build_output(
+            manifest, report, GALLERY_HTML,
+            hash_inputs(GALLERY_HTML_TEMPLATE, *gallery_options),
+            build_gallery_html, args.force
+        )
+    print_step_result(rebuilt, GALLERY_HTML, f"Created {GALLERY_HTML}")
+    
+    # Step 3: Generate gallery.css
+    print("📝 Step 3: Generating gallery.css...")
+    
+    with phase("gallery_css"):
+        rebuilt = build_output(
+            manifest, report, GALLERY_CSS, hash_inputs(GALLERY_CSS_TEMPLATE, *asset_options),
+            lambda: write_text(GALLERY_CSS, asset_content(GALLERY_CSS_TEMPLATE, minify_css, optimize)), args.force
+        )
+    print_step_result(rebuilt, GALLERY_CSS, f"Created {GALLERY_CSS}")
+    
+    # Step 4: Generate gallery.js and the windowed grid it uses
+    print("📝 Step 4: Generating gallery.js and virtual-grid.js...")
+    
+    with phase("gallery_js"):
+        rebuilt = build_output(
+            manifest, report, GALLERY_JS, hash_inputs(GALLERY_JS_TEMPLATE, *asset_options),
+            lambda: write_text(GALLERY_JS, asset_content(GALLERY_JS_TEMPLATE, minify_js, optimize)), args.force
+        )
+        print_step_result(rebuilt, GALLERY_JS, f"Created {GALLERY_JS}")
+    
+        rebuilt = build_output(
+            manifest, report, VIRTUAL_GRID_JS, hash_inputs(VIRTUAL_GRID_JS_TEMPLATE, *asset_options),
+            lambda: write_text(VIRTUAL_GRID_JS, asset_content(VIRTUAL_GRID_JS_TEMPLATE, minify_js, optimize)),
+            args.force
+        )
+    print_step_result(rebuilt, VIRTUAL_GRID_JS, f"Created {VIRTUAL_GRID_JS}")
+    
+    # Step 5: Generate per-event data shards for gallery.js
+    print("📝 Step 5: Generating gallery data shards...")
+    
+    with phase("gallery_data"):
+        Path(GALLERY_DATA_DIR).mkdir(parents=True, exist_ok=True)
+        shard_count = 0
+        rebuilt_count = 0
+    
+        for event in unique_events_by_folder(events):
+            shard = build_shard(event, base_url)
+            shard_path = Path(GALLERY_DATA_DIR) / shard_filename(event['cloudinary_folder'])
+            rebuilt_count += build_output(
+                manifest, report, shard_path.as_posix(), hash_inputs(shard),
+                lambda: write_json(shard_path, shard), args.force
+            )
+            shard_count += 1
+    
+        index = build_index(events)
+        index_path = Path(GALLERY_DATA_DIR) / GALLERY_INDEX_FILE
+        build_output(
+            manifest, report, index_path.as_posix(), hash_inputs(index),
+            lambda: write_json(index_path, index), args.force
+        )
+    
+        removed = remove_stale_shards(events, GALLERY_DATA_DIR)
+        forget_missing_outputs(manifest)
+    
+    print(f"   ✅ {rebuilt_count} of {shard_count} shards rebuilt in {GALLERY_DATA_DIR}/")
+    if removed:
+        print(f"   🗑️  Removed {len(removed)} stale shard(s)")
+    print()
+    
+    # Step 6: Pre-render static gallery pages (optional)
+    if args.static_galleries:
+        print("📝 Step 6: Generating static gallery pages...")
+        
+        with phase("static_galleries"):
+            Path(GALLERY_PAGE_DIR).mkdir(parents=True, exist_ok=True)
+            page_count = 0
+            rebuilt_count = 0
+        
+            for event in unique_events_by_folder(events):
+                page_path = gallery_page_path(event['cloudinary_folder'])
+            
+                def build_gallery_page(page_path=page_path, event=event):
+                    write_gallery_page(page_path, event, base_url)
+                    optimize_page(
+                        page_path, optimize, [(f"../{GALLERY_CSS}", GALLERY_CSS_TEMPLATE)], GALLERY_ITEM_TEMPLATE
+                    )
+            
+                rebuilt_count += build_output(
+                    manifest, report, page_path, gallery_page_hash(event, base_url, gallery_options),
+                    build_gallery_page, args.force
+                )
+                page_count += 1
+        
+            removed = remove_stale_gallery_pages(events)
+            forget_missing_outputs(manifest)
+        
+        print(f"   ✅ {rebuilt_count} of {page_count} pages rebuilt in {GALLERY_PAGE_DIR}/")
+        if removed:
+            print(f"   🗑️  Removed {len(removed)} stale page(s)")
+        print()
+    
+    count("outputs_rebuilt", len(report['rebuilt']))
+    count("outputs_skipped", len(report['skipped']))
+    with phase("save_manifest"):
+        save_manifest(manifest, BUILD_MANIFEST_FILE)
+    
+    print("="*70)
+    print("✅ Website update complete!")
+    print(f"\nRebuilt {len(report['rebuilt'])} file(s), skipped {len(report['skipped'])} unchanged:")
+    for path in report['rebuilt']:
+        print(f"   📄 {path}")
+    if EVENTS_HTML in report['rebuilt']:
+        print(f"   📋 {EVENTS_BACKUP} (backup)")
+    print(f"\n   🧾 Build manifest: {BUILD_MANIFEST_FILE}")
+    print("="*70)
+    print("\n🚀 Next steps:")
+    print("   1. Test locally:  Open events.html in your browser")
+    print("   2. Push to GitHub:")
+    print(f"      git add events.html events-backup.html {EVENT_CARDS_JS} {EVENTS_SEARCH_JS} {SEARCH_INDEX_FILE} gallery.html gallery.css gallery.js virtual-grid.js gallery-data {BUILD_MANIFEST_FILE}")
+    print("      git commit -m 'Update events gallery with Cloudinary integration'")
+    print("      git push")
+    print("\n📱 Features:")
+    print("   ✅ Responsive thumbnails (optimized for mobile)")
+    print("   ✅ Lazy loading for better performance")
+    print("   ✅ Automatic image optimization via Cloudinary")
+    print("   ✅ Full-screen lightbox with keyboard navigation")
+    print("   ✅ Generic gallery.html works for all events")
+    print("   ✅ Galleries load only their own event's photos")
+    print("   ✅ Events search (index loaded on first use)")
+    print("   ✅ Large galleries keep only the visible rows in the DOM")
+    print("   ✅ Unchanged files are skipped (use --force to rebuild all)")
+    if args.static_galleries:
+        print("   ✅ Pre-rendered gallery pages (no JS needed for thumbnails)")
+    if len(pages) > 1:
+        print(f"   ✅ Archive split into {len(pages)} pages")
+    if args.virtual_archive:
+        print("   ✅ Virtualized archive (only cards near the viewport are mounted)")
+
+
+def main():
+    """Main execution function."""
+    args = parse_args()
+    with instrumented("update_website.py", args.metrics, args.profile):
+        build_website(args)
+
+
+if __name__ == "__main__":
+    main()
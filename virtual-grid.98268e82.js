@@ -0,0 +1,85 @@
+function createVirtualGrid(grid, options) {
+const count = options.count;
+const overscan = options.overscan === undefined ? 2 : options.overscan;
+const mounted = new Map();
+const pool = [];
+let columns = 1;
+let stride = 0;
+let first = -1;
+let last = -1;
+let frame = 0;
+function take(index) {
+const node = pool.pop() || options.create();
+options.update(node, index);
+return node;
+}
+function measure() {
+const style = getComputedStyle(grid);
+columns = Math.max(1, style.gridTemplateColumns.split(' ').filter(Boolean).length);
+const rowGap = parseFloat(style.rowGap) || 0;
+let sample = grid.firstElementChild;
+if (!sample && count) {
+sample = take(0);
+mounted.set(0, sample);
+grid.appendChild(sample);
+}
+const height = sample ? sample.getBoundingClientRect().height : 0;
+stride = height + rowGap;
+}
+function render() {
+frame = 0;
+if (!stride) measure();
+if (!stride) return;
+const rows = Math.ceil(count / columns);
+const top = grid.getBoundingClientRect().top;
+const startRow = Math.min(rows, Math.max(0, Math.floor(-top / stride) - overscan));
+const endRow = Math.min(rows, Math.max(startRow, Math.ceil((window.innerHeight - top) / stride) + overscan));
+const from = startRow * columns;
+const to = Math.min(count, endRow * columns);
+if (from === first && to === last) return;
+for (const [index, node] of mounted) {
+if (index < from || index >= to) {
+mounted.delete(index);
+pool.push(node);
+}
+}
+const nodes = [];
+for (let index = from; index < to; index++) {
+let node = mounted.get(index);
+if (!node) {
+node = take(index);
+mounted.set(index, node);
+}
+nodes.push(node);
+}
+grid.replaceChildren(...nodes);
+grid.style.paddingTop = `${startRow * stride}px`;
+grid.style.paddingBottom = `${(rows - endRow) * stride}px`;
+first = from;
+last = to;
+}
+function schedule() {
+if (!frame) frame = requestAnimationFrame(render);
+}
+function refresh() {
+stride = 0;
+first = last = -1;
+schedule();
+}
+window.addEventListener('scroll', schedule, { passive: true });
+window.addEventListener('resize', refresh);
+render();
+return {
+refresh,
+scrollToIndex(index) {
+if (!stride) measure();
+const rowTop = Math.floor(index / columns) * stride;
+window.scrollTo(0, window.scrollY + grid.getBoundingClientRect().top + rowTop);
+},
+destroy() {
+window.removeEventListener('scroll', schedule);
+window.removeEventListener('resize', refresh);
+if (frame) cancelAnimationFrame(frame);
+}
+};
+}
\ No newline at end of file